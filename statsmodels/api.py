@@ -1,4 +1,4 @@
-__all__ = [
+__all__ = [  # noqa: F822, names are imported lazily
     "BayesGaussMI",
     "BinomialBayesMixedGLM",
     "ConditionalLogit",
@@ -72,73 +72,149 @@ __all__ = [
     "__version_info__"
 ]
 
-
-from . import datasets, distributions, iolib, regression, robust, tools
-from .__init__ import test
 from statsmodels._version import (
     version as __version__, version_tuple as __version_info__
 )
-from .discrete.conditional_models import (
-    ConditionalLogit,
-    ConditionalMNLogit,
-    ConditionalPoisson,
-)
-from .discrete.count_model import (
-    ZeroInflatedGeneralizedPoisson,
-    ZeroInflatedNegativeBinomialP,
-    ZeroInflatedPoisson,
-)
-from .discrete.discrete_model import (
-    GeneralizedPoisson,
-    Logit,
-    MNLogit,
-    NegativeBinomial,
-    NegativeBinomialP,
-    Poisson,
-    Probit,
-)
-from .discrete.truncated_model import (
-    TruncatedLFPoisson,
-    TruncatedLFNegativeBinomialP,
-    HurdleCountModel,
-    )
-from .duration import api as duration
-from .duration.hazard_regression import PHReg
-from .duration.survfunc import SurvfuncRight
-from .emplike import api as emplike
-from .formula import api as formula
-from .gam import api as gam
-from .gam.generalized_additive_model import GLMGam
-from .genmod import api as genmod
-from .genmod.api import (
-    GEE,
-    GLM,
-    BinomialBayesMixedGLM,
-    NominalGEE,
-    OrdinalGEE,
-    PoissonBayesMixedGLM,
-    cov_struct,
-    families,
-)
-from .graphics import api as graphics
-from .graphics.gofplots import ProbPlot, qqline, qqplot, qqplot_2samples
-from .imputation.bayes_mi import MI, BayesGaussMI
-from .imputation.mice import MICE, MICEData
-from .iolib.smpickle import load_pickle
-from .multivariate import api as multivariate
-from .multivariate.factor import Factor
-from .multivariate.manova import MANOVA
-from .multivariate.pca import PCA
-from .nonparametric import api as nonparametric
-from .regression.linear_model import GLS, GLSAR, OLS, WLS
-from .regression.mixed_linear_model import MixedLM
-from .regression.quantile_regression import QuantReg
-from .regression.recursive_ls import RecursiveLS
-from .robust.robust_linear_model import RLM
-from .stats import api as stats
-from .tools.print_version import show_versions
-from .tools.tools import add_constant, categorical
-from .tools.web import webdoc
-from .tsa import api as tsa
+from statsmodels.tools._lazy import lazy_imports
 
-load = load_pickle
+# The names are imported on first access, see statsmodels.tools._lazy
+__getattr__, __dir__ = lazy_imports(__name__, {
+    ".": [
+        "datasets",
+        "distributions",
+        "iolib",
+        "regression",
+        "robust",
+        "tools",
+        "test",
+    ],
+    ".discrete.conditional_models": [
+        "ConditionalLogit",
+        "ConditionalMNLogit",
+        "ConditionalPoisson",
+    ],
+    ".discrete.count_model": [
+        "ZeroInflatedGeneralizedPoisson",
+        "ZeroInflatedNegativeBinomialP",
+        "ZeroInflatedPoisson",
+    ],
+    ".discrete.discrete_model": [
+        "GeneralizedPoisson",
+        "Logit",
+        "MNLogit",
+        "NegativeBinomial",
+        "NegativeBinomialP",
+        "Poisson",
+        "Probit",
+    ],
+    ".discrete.truncated_model": [
+        "TruncatedLFPoisson",
+        "TruncatedLFNegativeBinomialP",
+        "HurdleCountModel",
+    ],
+    ".duration": [
+        "api as duration",
+    ],
+    ".duration.hazard_regression": [
+        "PHReg",
+    ],
+    ".duration.survfunc": [
+        "SurvfuncRight",
+    ],
+    ".emplike": [
+        "api as emplike",
+    ],
+    ".formula": [
+        "api as formula",
+    ],
+    ".gam": [
+        "api as gam",
+    ],
+    ".gam.generalized_additive_model": [
+        "GLMGam",
+    ],
+    ".genmod": [
+        "api as genmod",
+    ],
+    ".genmod.api": [
+        "GEE",
+        "GLM",
+        "BinomialBayesMixedGLM",
+        "NominalGEE",
+        "OrdinalGEE",
+        "PoissonBayesMixedGLM",
+        "cov_struct",
+        "families",
+    ],
+    ".graphics": [
+        "api as graphics",
+    ],
+    ".graphics.gofplots": [
+        "ProbPlot",
+        "qqline",
+        "qqplot",
+        "qqplot_2samples",
+    ],
+    ".imputation.bayes_mi": [
+        "MI",
+        "BayesGaussMI",
+    ],
+    ".imputation.mice": [
+        "MICE",
+        "MICEData",
+    ],
+    ".iolib.smpickle": [
+        "load_pickle",
+        "load_pickle as load",
+    ],
+    ".multivariate": [
+        "api as multivariate",
+    ],
+    ".multivariate.factor": [
+        "Factor",
+    ],
+    ".multivariate.manova": [
+        "MANOVA",
+    ],
+    ".multivariate.pca": [
+        "PCA",
+    ],
+    ".nonparametric": [
+        "api as nonparametric",
+    ],
+    ".regression.linear_model": [
+        "GLS",
+        "GLSAR",
+        "OLS",
+        "WLS",
+    ],
+    ".regression.mixed_linear_model": [
+        "MixedLM",
+    ],
+    ".regression.quantile_regression": [
+        "QuantReg",
+    ],
+    ".regression.recursive_ls": [
+        "RecursiveLS",
+    ],
+    ".robust.robust_linear_model": [
+        "RLM",
+    ],
+    ".stats": [
+        "api as stats",
+    ],
+    ".tools.print_version": [
+        "show_versions",
+    ],
+    ".tools.tools": [
+        "add_constant",
+        "categorical",
+    ],
+    ".tools.web": [
+        "webdoc",
+    ],
+    ".tsa": [
+        "api as tsa",
+    ],
+})
+del lazy_imports
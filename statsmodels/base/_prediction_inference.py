@@ -7,7 +7,7 @@ License: BSD-3
 """
 
 import numpy as np
-from scipy import stats
+from scipy import sparse, stats
 import pandas as pd
 
 
@@ -393,11 +393,14 @@ def _get_exog_predict(self, exog=None, transform=True, row_labels=None):
             if callable(row_labels):
                 row_labels = None
 
-        exog = np.asarray(exog)
-        if exog.ndim == 1 and (self.model.exog.ndim == 1 or
-                               self.model.exog.shape[1] == 1):
-            exog = exog[:, None]
-        exog = np.atleast_2d(exog)  # needed in count model shape[1]
+        if sparse.issparse(exog):
+            exog = sparse.csr_matrix(exog)
+        else:
+            exog = np.asarray(exog)
+            if exog.ndim == 1 and (self.model.exog.ndim == 1 or
+                                   self.model.exog.shape[1] == 1):
+                exog = exog[:, None]
+            exog = np.atleast_2d(exog)  # needed in count model shape[1]
     else:
         exog = self.model.exog
 
@@ -406,6 +409,25 @@ def _get_exog_predict(self, exog=None, transform=True, row_labels=None):
     return exog, row_labels
 
 
+def _var_linear_prediction(self, exog, column=None):
+    """
+    Variance of the linear prediction, the diagonal of exog cov_params exog'
+
+    For a sparse exog the covariance is not formed densely if the results
+    keep it factorized, as GLMResults do after a sparse IRLS fit.
+    """
+    if not sparse.issparse(exog):
+        covb = self.cov_params(column=column)
+        return (exog * np.dot(covb, exog.T).T).sum(1)
+
+    sparse_cov_params = getattr(self, "_sparse_cov_params", None)
+    cov = sparse_cov_params() if sparse_cov_params is not None else None
+    if cov is not None and cov.shape[0] == exog.shape[1]:
+        return cov.quad_form_rows(exog)
+    covb = self.cov_params(column=column)
+    return np.asarray(exog.multiply(exog @ covb).sum(1)).ravel()
+
+
 def get_prediction_glm(self, exog=None, transform=True,
                        row_labels=None, linpred=None, link=None,
                        pred_kwds=None):
@@ -457,10 +479,8 @@ def get_prediction_glm(self, exog=None, transform=True,
 
     predicted_mean = self.model.predict(self.params, exog, **pred_kwds)
 
-    covb = self.cov_params()
-
     link_deriv = self.model.family.link.inverse_deriv(linpred.predicted_mean)
-    var_pred_mean = link_deriv**2 * (exog * np.dot(covb, exog.T).T).sum(1)
+    var_pred_mean = link_deriv**2 * _var_linear_prediction(self, exog)
     var_resid = self.scale  # self.mse_resid / weights
 
     # TODO: check that we have correct scale, Refactor scale #???
@@ -528,8 +548,7 @@ def get_prediction_linear(self, exog=None, transform=True,
     else:
         index = None
     # get linear prediction and standard errors
-    covb = self.cov_params(column=index)
-    var_pred = (exog * np.dot(covb, exog.T).T).sum(1)
+    var_pred = _var_linear_prediction(self, exog, column=index)
     pred_kwds_linear = pred_kwds.copy()
     pred_kwds_linear["which"] = "linear"
     predicted = self.model.predict(self.params, exog, **pred_kwds_linear)
@@ -598,8 +617,7 @@ def get_prediction_monotonic(self, exog=None, transform=True,
     func_deriv = link.inverse_deriv
 
     # get linear prediction and standard errors
-    covb = self.cov_params(column=index)
-    linpred_var = (exog * np.dot(covb, exog.T).T).sum(1)
+    linpred_var = _var_linear_prediction(self, exog, column=index)
     pred_kwds_linear = pred_kwds.copy()
     pred_kwds_linear["which"] = "linear"
     linpred = self.model.predict(self.params, exog, **pred_kwds_linear)
@@ -121,7 +121,8 @@ def get_robustcov_results(self, cov_type='HC1', use_t=None, **kwds):
     - 'cluster': clustered covariance estimator
 
       ``groups`` : array_like[int], required :
-        Integer-valued index of clusters or groups.
+        Integer-valued index of clusters or groups. A 2-d array with one
+        column per cluster dimension gives multi-way clustering.
 
       ``use_correction``: bool, optional
         If True the sandwich covariance is calculated with a small
@@ -287,16 +288,14 @@ def get_robustcov_results(self, cov_type='HC1', use_t=None, **kwds):
             if adjust_df:
                 # need to find number of groups
                 # duplicate work
-                n_groups0 = len(np.unique(groups[:,0]))
-                n_groups1 = len(np.unique(groups[:, 1]))
-                self.n_groups = (n_groups0, n_groups1)
-                n_groups = min(n_groups0, n_groups1) # use for adjust_df
-
-            # Note: sw.cov_cluster_2groups has 3 returns
-            res.cov_params_default = sw.cov_cluster_2groups(self, groups,
-                                         use_correction=use_correction)[0]
+                self.n_groups = tuple(len(np.unique(groups[:, col]))
+                                      for col in range(groups.shape[1]))
+                n_groups = min(self.n_groups)  # use for adjust_df
+
+            res.cov_params_default = sw.cov_cluster_multiway(
+                self, groups, use_correction=use_correction)
         else:
-            raise ValueError('only two groups are supported')
+            raise ValueError('groups must be 1-d or 2-d')
         res.cov_kwds['description'] = descriptions['cluster']
 
     elif cov_type.lower() == 'hac-panel':
@@ -11,6 +11,7 @@ from functools import reduce
 
 import numpy as np
 from pandas import DataFrame, MultiIndex, Series, isnull
+from scipy import sparse
 
 import statsmodels.tools.data as data_util
 from statsmodels.tools.decorators import cache_readonly, cache_writable
@@ -54,6 +55,53 @@ def _nan_rows(*arrs):
     return reduce(_nan_row_maybe_two_inputs, arrs).squeeze()
 
 
+def _implicit_constant(xtx, xt1, nobs, rtol=1e-8):
+    """
+    Check whether a column of ones is in the column space of exog.
+
+    Parameters
+    ----------
+    xtx : ndarray
+        The k x k cross product exog' exog, or R' R from a QR
+        decomposition of exog.
+    xt1 : ndarray
+        The column sums of exog.
+    nobs : int
+        The number of observations.
+    rtol : float
+        The relative tolerance for the residual sum of squares.
+
+    Returns
+    -------
+    bool
+        True if the residual sum of squares of regressing a column of
+        ones on exog is zero up to ``rtol * nobs``.
+
+    Notes
+    -----
+    Only k x k matrices are used, so that the check is much cheaper than
+    comparing the ranks of exog and of exog augmented by a column of ones.
+    """
+    ssr = nobs - xt1 @ np.linalg.pinv(xtx, hermitian=True) @ xt1
+    return bool(abs(ssr) <= rtol * nobs)
+
+
+def _implicit_constant_sparse(exog, rtol=1e-8):
+    """
+    Check whether a column of ones is in the column space of a sparse exog.
+
+    The regression of a column of ones on exog is solved iteratively with
+    LSQR, so that neither exog nor the k x k cross product is densified.
+    """
+    from scipy.sparse.linalg import lsqr
+
+    nobs = exog.shape[0]
+    ones = np.ones(nobs)
+    params = lsqr(exog, ones, atol=1e-12, btol=1e-12)[0]
+    ssr = np.sum((ones - exog @ params) ** 2)
+    return bool(ssr <= rtol * nobs)
+
+
 class ModelData:
     """
     Class responsible for handling input data and extracting metadata into the
@@ -63,7 +111,19 @@ class ModelData:
     _param_names = None
     _cov_names = None
 
-    def __init__(self, endog, exog=None, missing="none", hasconst=None, **kwargs):
+    def __init__(
+        self,
+        endog,
+        exog=None,
+        missing="none",
+        hasconst=None,
+        data_checks="full",
+        **kwargs,
+    ):
+        if data_checks not in ("full", "trusted"):
+            raise ValueError("data_checks must be 'full' or 'trusted'")
+        if data_checks == "trusted" and missing != "none":
+            raise ValueError("data_checks='trusted' requires missing='none'")
         if data_util._is_recarray(endog) or data_util._is_recarray(exog):
             from statsmodels.tools.sm_exceptions import recarray_exception
 
@@ -72,6 +132,10 @@ class ModelData:
             self.design_info = kwargs.pop("design_info")
         if "formula" in kwargs:
             self.formula = kwargs.pop("formula")
+        if sparse.issparse(exog) and missing != "none":
+            raise NotImplementedError(
+                "missing='%s' is not supported with sparse exog" % missing
+            )
         if missing != "none":
             arrays, nan_idx = self.handle_missing(endog, exog, missing, **kwargs)
             self.missing_row_idx = nan_idx
@@ -87,7 +151,10 @@ class ModelData:
 
         self.const_idx = None
         self.k_constant = 0
-        self._handle_constant(hasconst)
+        if data_checks == "trusted":
+            self._handle_constant_trusted(hasconst)
+        else:
+            self._handle_constant(hasconst)
         self._check_integrity()
         self._cache = {}
 
@@ -134,6 +201,8 @@ class ModelData:
         else:
             # detect where the constant is
             check_implicit = False
+            if sparse.issparse(self.exog):
+                return self._handle_constant_sparse(hasconst)
             exog_max = np.max(self.exog, axis=0)
             if not np.isfinite(exog_max).all():
                 raise MissingDataError("exog contains inf or nans")
@@ -189,6 +258,53 @@ class ModelData:
                 # even if one is not found
                 self.k_constant = 1
 
+    def _handle_constant_sparse(self, hasconst):
+        # Same rules as the dense case, but never densify exog. The implicit
+        # constant check regresses a column of ones on exog instead of
+        # comparing the rank of the augmented nobs x (k + 1) matrix.
+        exog = self.exog
+        if not np.isfinite(exog.data).all():
+            raise MissingDataError("exog contains inf or nans")
+        exog_max = exog.max(axis=0).toarray().ravel()
+        exog_min = exog.min(axis=0).toarray().ravel()
+        const_idx = np.where((exog_max == exog_min) & (exog_max != 0))[0]
+        if const_idx.size:
+            ones = const_idx[exog_max[const_idx] == 1]
+            self.k_constant = 1
+            self.const_idx = int(ones[0] if ones.size else const_idx[0])
+        elif hasconst:
+            self.k_constant = 1
+        else:
+            self.k_constant = int(_implicit_constant_sparse(exog))
+            self.const_idx = None
+
+    def _handle_constant_trusted(self, hasconst):
+        # exog is assumed to be finite. Only the columns that are constant
+        # and nonzero in the first and last rows are scanned, and the
+        # implicit constant check uses X'X. exog is never copied.
+        exog = self.exog
+        if hasconst is False or exog is None:
+            self.k_constant = 0
+            self.const_idx = None
+            return
+        if sparse.issparse(exog):
+            return self._handle_constant_sparse(hasconst)
+        first, last = exog[0], exog[-1]
+        candidates = np.flatnonzero((first == last) & (first != 0))
+        const_idx = [
+            idx for idx in candidates if np.all(exog[:, idx] == first[idx])
+        ]
+        if const_idx:
+            ones = [idx for idx in const_idx if first[idx] == 1]
+            self.k_constant = 1
+            self.const_idx = int(ones[0] if ones else const_idx[0])
+        elif hasconst:
+            self.k_constant = 1
+        else:
+            xtx = exog.T @ exog
+            xt1 = exog.sum(axis=0)
+            self.k_constant = int(_implicit_constant(xtx, xt1, exog.shape[0]))
+
     @classmethod
     def _drop_nans(cls, x, nan_mask):
         return x[nan_mask]
@@ -435,13 +551,16 @@ class ModelData:
         return endog.squeeze()
 
     def _get_xarr(self, exog):
+        if sparse.issparse(exog):
+            # keep sparse designs sparse, row slicing and products need CSR
+            return sparse.csr_matrix(exog, dtype=np.float64)
         if data_util._is_structured_ndarray(exog):
             exog = data_util.struct_to_ndarray(exog)
         return np.asarray(exog)
 
     def _check_integrity(self):
         if self.exog is not None:
-            if len(self.exog) != len(self.endog):
+            if self.exog.shape[0] != len(self.endog):
                 raise ValueError("endog and exog matrices are different sizes")
 
     def wrap_output(self, obj, how="columns", names=None):
@@ -636,7 +755,11 @@ def _make_endog_names(endog):
 
 
 def _make_exog_names(exog):
-    exog_var = exog.var(0)
+    if sparse.issparse(exog):
+        # the range is zero exactly for the constant columns
+        exog_var = (exog.max(0) - exog.min(0)).toarray().ravel()
+    else:
+        exog_var = exog.var(0)
     if (exog_var == 0).any():
         # assumes one constant in first or last position
         # avoid exception if more than one constant
@@ -664,6 +787,8 @@ def handle_data_class_factory(endog, exog):
     """
     if data_util._is_using_ndarray_type(endog, exog):
         klass = ModelData
+    elif sparse.issparse(exog):
+        klass = ModelData
     elif data_util._is_using_pandas(endog, exog):
         klass = PandasData
     elif data_util._is_using_patsy(endog, exog):
@@ -678,7 +803,9 @@ def handle_data_class_factory(endog, exog):
     return klass
 
 
-def handle_data(endog, exog, missing="none", hasconst=None, **kwargs):
+def handle_data(
+    endog, exog, missing="none", hasconst=None, data_checks="full", **kwargs
+):
     # deal with lists and tuples up-front
     if isinstance(endog, (list, tuple)):
         endog = np.asarray(endog)
@@ -686,4 +813,11 @@ def handle_data(endog, exog, missing="none", hasconst=None, **kwargs):
         exog = np.asarray(exog)
 
     klass = handle_data_class_factory(endog, exog)
-    return klass(endog, exog=exog, missing=missing, hasconst=hasconst, **kwargs)
+    return klass(
+        endog,
+        exog=exog,
+        missing=missing,
+        hasconst=hasconst,
+        data_checks=data_checks,
+        **kwargs,
+    )
@@ -4,6 +4,9 @@ from statsmodels.stats.regularized_covariance import _calc_nodewise_row, \
 from statsmodels.base.model import LikelihoodModelResults
 from statsmodels.regression.linear_model import OLS
 import numpy as np
+import os
+import shutil
+import tempfile
 
 """
 Distributed estimation routines. Currently, we support several
@@ -19,6 +22,10 @@ methods of distribution
           - dask.distributed
           - yarn
           - ipyparallel
+    - with a local process pool and shared memory
+        The partitions are written once to memory-mapped files in
+        shared memory and only their descriptors are sent to the
+        worker processes, which avoids pickling the data.
 
 The framework is very general and allows for a variety of
 estimation methods.  Currently, these include
@@ -362,6 +369,56 @@ def _helper_fit_partition(self, pnum, endog, exog, fit_kwds,
     return results
 
 
+def _to_shared_memory(arr, dirname, name):
+    """writes arr to a memory-mapped file and returns its descriptor"""
+
+    arr = np.asarray(arr)
+    if arr.dtype.hasobject:
+        raise ValueError("parallel_method='shared_memory' requires numeric "
+                         "data")
+    path = os.path.join(dirname, name + ".npy")
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=arr.dtype,
+                                    shape=arr.shape)
+    out[...] = arr
+    out.flush()
+    del out
+    return path
+
+
+def _helper_fit_shared_partition(self, pnum, endog_path, exog_path, fit_kwds,
+                                 init_kwds_e={}):
+    """handles the model fitting for each worker process when the data
+    partitions are held in shared memory.
+
+    Parameters
+    ----------
+    self : DistributedModel class instance
+        An instance of DistributedModel.
+    pnum : scalar
+        index of current partition.
+    endog_path : str
+        path of the memory-mapped endog for the current partition.
+    exog_path : str
+        path of the memory-mapped exog for the current partition.
+    fit_kwds : dict-like
+        Keywords needed for the model fitting.
+    init_kwds_e : dict-like
+        Additional init_kwds to add for each partition.
+
+    Returns
+    -------
+    estimation_method result.  For the default,
+    _est_regularized_debiased, a tuple.
+    """
+
+    # copy-on-write so that models that modify their data in place only
+    # copy the pages they touch
+    endog = np.load(endog_path, mmap_mode="c")
+    exog = np.load(exog_path, mmap_mode="c")
+    return _helper_fit_partition(self, pnum, endog, exog, fit_kwds,
+                                 init_kwds_e)
+
+
 class DistributedModel:
     __doc__ = """
     Distributed model class
@@ -474,7 +531,7 @@ class DistributedModel:
             self.results_kwds = results_kwds
 
     def fit(self, data_generator, fit_kwds=None, parallel_method="sequential",
-            parallel_backend=None, init_kwds_generator=None):
+            parallel_backend=None, init_kwds_generator=None, n_jobs=None):
         """Performs the distributed estimation using the corresponding
         DistributedModel
 
@@ -488,7 +545,10 @@ class DistributedModel:
             Keywords needed for the model fitting.
         parallel_method : str
             type of distributed estimation to be used, currently
-            "sequential", "joblib" and "dask" are supported.
+            "sequential", "joblib", "shared_memory" and "dask" are
+            supported. "shared_memory" uses a local process pool where the
+            data partitions are placed in shared memory, so that only their
+            descriptors are passed to the workers.
         parallel_backend : None or joblib parallel_backend object
             used to allow support for more complicated backends,
             ex: dask.distributed
@@ -496,6 +556,10 @@ class DistributedModel:
             Additional keyword generator that produces model init_kwds
             that may vary based on data partition.  The current usecase
             is for WLS and GLS
+        n_jobs : int or None
+            Number of worker processes used with parallel_method
+            "shared_memory". If None, the smaller of the number of
+            partitions and the number of CPUs is used.
 
         Returns
         -------
@@ -515,6 +579,11 @@ class DistributedModel:
                                         parallel_backend,
                                         init_kwds_generator)
 
+        elif parallel_method == "shared_memory":
+            results_l = self.fit_shared_memory(data_generator, fit_kwds,
+                                               init_kwds_generator,
+                                               n_jobs=n_jobs)
+
         else:
             raise ValueError("parallel_method: %s is currently not supported"
                              % parallel_method)
@@ -633,6 +702,70 @@ class DistributedModel:
 
         return results_l
 
+    def fit_shared_memory(self, data_generator, fit_kwds,
+                          init_kwds_generator=None, n_jobs=None):
+        """Performs the distributed estimation in parallel using a local
+        process pool, with the data partitions held in shared memory
+
+        Parameters
+        ----------
+        data_generator : generator
+            A generator that produces a sequence of tuples where the first
+            element in the tuple corresponds to an endog array and the
+            element corresponds to an exog array.
+        fit_kwds : dict-like
+            Keywords needed for the model fitting.
+        init_kwds_generator : generator or None
+            Additional keyword generator that produces model init_kwds
+            that may vary based on data partition.  The current usecase
+            is for WLS and GLS
+        n_jobs : int or None
+            Number of worker processes. If None, the smaller of the number
+            of partitions and the number of CPUs is used.
+
+        Returns
+        -------
+        join_method result.  For the default, _join_debiased, it returns a
+        p length array.
+
+        Notes
+        -----
+        Each partition is written once to a memory-mapped file in a
+        shared memory backed temporary directory (``/dev/shm`` when
+        available), and the workers map the files instead of receiving
+        pickled copies of the data. The files are removed when the
+        estimation finishes.
+        """
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        if n_jobs is None:
+            n_jobs = min(self.partitions, os.cpu_count() or 1)
+
+        if init_kwds_generator is None:
+            tup_gen = ((data, {}) for data in data_generator)
+        else:
+            tup_gen = zip(data_generator, init_kwds_generator)
+
+        shm_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        dirname = tempfile.mkdtemp(prefix="sm_distributed_", dir=shm_dir)
+        try:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                futures = []
+                for pnum, ((endog, exog), init_kwds_e) in enumerate(tup_gen):
+                    endog_path = _to_shared_memory(endog, dirname,
+                                                   "endog_%d" % pnum)
+                    exog_path = _to_shared_memory(exog, dirname,
+                                                  "exog_%d" % pnum)
+                    futures.append(executor.submit(
+                        _helper_fit_shared_partition, self, pnum,
+                        endog_path, exog_path, fit_kwds, init_kwds_e))
+                results_l = [future.result() for future in futures]
+        finally:
+            shutil.rmtree(dirname, ignore_errors=True)
+
+        return results_l
+
 
 class DistributedResults(LikelihoodModelResults):
     """
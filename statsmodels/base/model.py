@@ -2,17 +2,18 @@ from __future__ import annotations
 
 from statsmodels.compat.python import lzip
 
+import copy
 from functools import reduce
 import warnings
 
 import numpy as np
 import pandas as pd
-from scipy import stats
+from scipy import sparse, stats
 
 from statsmodels.base.data import handle_data
 from statsmodels.base.optimizer import Optimizer
 import statsmodels.base.wrapper as wrap
-from statsmodels.formula import handle_formula_data
+from statsmodels.formula import FormulaDesign, handle_formula_data
 from statsmodels.stats.contrast import (
     ContrastResults,
     WaldTestResults,
@@ -55,6 +56,14 @@ _extra_param_doc = """
         a constant is not checked for and k_constant is set to 1 and all
         result statistics are calculated as if a constant is present. If
         False, a constant is not checked for and k_constant is set to 0.
+    data_checks : {"full", "trusted"}
+        The checks performed on the data. "trusted" skips the scans for
+        missing and non-finite values and does not copy the data. It is
+        meant for validated numeric input and requires missing="none". A
+        constant column is located from the columns that have equal nonzero
+        values in the first and last rows, and an implicit constant is
+        detected from exog' exog unless ``hasconst`` is given. Default is
+        "full".
     **kwargs
         Extra arguments that are used to set model properties when using the
         formula interface."""
@@ -87,13 +96,18 @@ class Model:
     # kwargs that are generically allowed, maybe not supported in all models
     _kwargs_allowed = [
         "missing", 'missing_idx', 'formula', 'design_info', "hasconst",
+        "data_checks",
         ]
 
     def __init__(self, endog, exog=None, **kwargs):
         missing = kwargs.pop('missing', 'none')
         hasconst = kwargs.pop('hasconst', None)
+        data_checks = kwargs.pop('data_checks', 'full')
+        data_kwargs = kwargs
+        if data_checks != 'full':
+            data_kwargs = dict(kwargs, data_checks=data_checks)
         self.data = self._handle_data(endog, exog, missing, hasconst,
-                                      **kwargs)
+                                      **data_kwargs)
         self.k_constant = self.data.k_constant
         self.exog = self.data.exog
         self.endog = self.data.endog
@@ -119,6 +133,7 @@ class Model:
 
         kwargs_allowed = [
             "missing", 'missing_idx', 'formula', 'design_info', "hasconst",
+            "data_checks",
             ]
         if keys_extra:
             kwargs_allowed.extend(keys_extra)
@@ -153,7 +168,9 @@ class Model:
         Parameters
         ----------
         formula : str or generic Formula object
-            The formula specifying the model.
+            The formula specifying the model. A
+            :class:`~statsmodels.formula.FormulaDesign` reuses a parsed
+            formula and its categorical levels, see Notes.
         data : array_like
             The data for the model. See Notes.
         subset : array_like
@@ -183,6 +200,12 @@ class Model:
         data must define __getitem__ with the keys in the formula terms
         args and kwargs are passed on to the model instantiation. E.g.,
         a numpy structured or rec array, a dictionary, or a pandas DataFrame.
+
+        When the same formula is used with many data sets, for example
+        slices of a larger data set, a ``FormulaDesign`` created once avoids
+        parsing the formula and discovering the categorical levels for every
+        model, and all models have the same exog columns. ``eval_env`` is
+        then taken from the design.
         """
         # TODO: provide a docs template for args/kwargs from child models
         # TODO: subset could use syntax. issue #469.
@@ -203,6 +226,8 @@ class Model:
         tmp = handle_formula_data(data, None, formula, depth=eval_env,
                                   missing=missing)
         ((endog, exog), missing_idx, design_info) = tmp
+        if isinstance(formula, FormulaDesign):
+            formula = formula.formula
         max_endog = cls._formula_max_endog
         if (max_endog is not None and
                 endog.ndim > 1 and endog.shape[1] > max_endog):
@@ -1116,7 +1141,9 @@ class Results:
                     exog = exog.reindex(exog_index)
             exog_index = exog.index
 
-        if exog is not None:
+        if exog is not None and sparse.issparse(exog):
+            exog = sparse.csr_matrix(exog)
+        elif exog is not None:
             exog = np.asarray(exog)
             if exog.ndim == 1 and (self.model.exog.ndim == 1 or
                                    self.model.exog.shape[1] == 1):
@@ -2365,6 +2392,117 @@ class LikelihoodModelResults(Results):
             except (AttributeError, KeyError):
                 pass
 
+    def _store_minimal(self, keep=(), extra_attr=(), required=None):
+        """
+        Detach the results from the data after computing summary statistics
+
+        Used by `fit(store="minimal")`. The statistics named in `keep` are
+        computed and remain in the cache. The results then refer to a shallow
+        copy of the model from which the data arrays are removed, so that
+        the user's model instance is not modified. `extra_attr` names
+        additional attributes to remove, in the format of `_data_attr`.
+        `required` lists the removed model keywords that `restore_data` needs,
+        by default all that are not None.
+        """
+        kept = {name: getattr(self, name) for name in keep}
+
+        # ynames and xnames are derived from the data arrays that are removed
+        # below, store them in the cache of the data before
+        data = self.model.data
+        data.ynames = data.ynames
+        data.xnames = data.xnames
+        self._data_attr = self._data_attr + list(extra_attr)
+        model = copy.copy(self.model)
+        model.data = copy.copy(model.data)
+        model.data._cache = {key: value for key, value
+                             in model.data._cache.items()
+                             if key != 'row_labels'}
+        # data keywords have to be supplied again in restore_data
+        removed = [key for key in model._init_keys
+                   if key in model._data_attr or 'model.' + key in extra_attr]
+        if required is None:
+            required = [key for key in removed
+                        if getattr(model, key, None) is not None]
+        self._removed_init_keys = (removed, list(required))
+        self.model = model
+        self.remove_data()
+        # statistics that do not need the data are computed again on demand
+        self._cache = {key: value for key, value in self._cache.items()
+                       if value is not None or key in self._data_in_cache}
+        self._cache.update(kept)
+
+    def restore_data(self, endog, exog=None, **kwargs):
+        """
+        Attach data to results that were estimated with `store="minimal"`
+
+        Statistics that depend on the data, like residuals, fitted values
+        and diagnostics, are computed again on demand from the supplied data
+        and the stored parameter estimates.
+
+        Parameters
+        ----------
+        endog : array_like
+            The endogenous data used in the estimation.
+        exog : array_like, optional
+            The exogenous data used in the estimation.
+        **kwargs
+            Additional data keywords of the model, for example `weights`,
+            `offset` or `exposure`. These are required if they were used in
+            the estimation.
+
+        Notes
+        -----
+        The data is not checked against the data used in the estimation,
+        other than the number of columns of `exog`.
+        """
+        removed = getattr(self, '_removed_init_keys', None)
+        if removed is None:
+            raise ValueError('restore_data can only be used with results '
+                             'estimated with store="minimal".')
+        removed, required = removed
+        missing = [key for key in required if key not in kwargs]
+        if missing:
+            raise ValueError('The following data keywords were used in '
+                             'the estimation and are required: '
+                             + ', '.join(missing))
+        model = self.model
+        init_kwds = {key: value for key, value
+                     in model._get_init_kwds().items() if key not in removed}
+        init_kwds.update(kwargs)
+        new_model = model.__class__(endog, exog, **init_kwds)
+        if new_model.exog.shape[1] != len(self.params):
+            raise ValueError('exog does not have the same number of columns '
+                             'as the estimated model.')
+        # Keep the estimation state, e.g. the normalized_cov_params
+        for key, value in model.__dict__.items():
+            if value is not None and new_model.__dict__.get(key) is None:
+                setattr(new_model, key, value)
+        self.model = new_model
+
+        cls = self.__class__
+        for name in dir(cls):
+            try:
+                attr = object.__getattribute__(cls, name)
+            except AttributeError:
+                continue
+            if isinstance(attr, cached_data):
+                self._cache.pop(name, None)
+        for key in self._data_in_cache:
+            self._cache.pop(key, None)
+        del self._removed_init_keys
+        self._restore_data()
+
+    def _restore_data(self):
+        """Hook to reattach result attributes that refer to model data"""
+        pass
+
+    def _check_data_attached(self, name):
+        """Raise if the data was removed with store="minimal" """
+        if getattr(self, '_removed_init_keys', None) is not None:
+            raise ValueError(
+                f'{name} requires the data, which is not stored with '
+                'store="minimal". Attach it with restore_data first.')
+
 
 class LikelihoodResultsWrapper(wrap.ResultsWrapper):
     _attrs = {
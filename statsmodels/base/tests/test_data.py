@@ -4,6 +4,8 @@ from statsmodels.compat.pandas import (
     make_dataframe,
 )
 
+from functools import partial
+
 import numpy as np
 from numpy.testing import assert_, assert_equal, assert_raises
 import pandas as pd
@@ -810,6 +812,15 @@ class TestHasConstantOLS(CheckHasConstant):
         cls.y = cls.y_c
 
 
+class TestHasConstantOLSTrusted(CheckHasConstant):
+
+    @classmethod
+    def _initialize(cls):
+
+        cls.mod = partial(OLS, data_checks="trusted")
+        cls.y = cls.y_c
+
+
 class TestHasConstantGLM(CheckHasConstant):
 
     @staticmethod
@@ -942,3 +953,70 @@ def test_raise_nonfinite_exog():
     assert_raises(MissingDataError, OLS, y, x)
     x[1, 1] = np.nan
     assert_raises(MissingDataError, OLS, y, x)
+
+
+def test_sparse_exog():
+    from scipy import sparse
+
+    rs = np.random.RandomState(0)
+    x = np.column_stack([np.ones(20), rs.standard_normal((20, 2))])
+    y = rs.standard_normal(20)
+    data = sm_data.handle_data(y, sparse.csc_matrix(x))
+    assert type(data) is sm_data.ModelData
+    assert sparse.isspmatrix_csr(data.exog)
+    assert data.k_constant == 1
+    assert data.const_idx == 0
+    assert data.xnames == ["const", "x1", "x2"]
+
+    # implicit constant from a full set of dummies
+    dummies = np.eye(2)[np.arange(20) % 2]
+    data = sm_data.handle_data(y, sparse.csr_matrix(dummies))
+    assert data.k_constant == 1
+    assert data.const_idx is None
+    data = sm_data.handle_data(y, sparse.csr_matrix(x[:, 1:]))
+    assert data.k_constant == 0
+
+    with pytest.raises(NotImplementedError, match="sparse"):
+        sm_data.handle_data(y, sparse.csr_matrix(x), missing="drop")
+    x[1, 1] = np.inf
+    with pytest.raises(sm_data.MissingDataError):
+        sm_data.handle_data(y, sparse.csr_matrix(x))
+
+
+def test_data_checks_trusted():
+    rs = np.random.RandomState(0)
+    x = np.column_stack([rs.standard_normal((20, 2)), np.ones(20)])
+    y = rs.standard_normal(20)
+    mod = OLS(y, x, data_checks="trusted")
+    assert mod.exog is x
+    assert mod.endog is y
+    assert mod.k_constant == 1
+    assert mod.data.const_idx == 2
+    assert "data_checks" not in mod._init_keys
+    res = mod.fit()
+    res_full = OLS(y, x).fit()
+    assert_equal(res.params, res_full.params)
+    assert_equal(res.rsquared, res_full.rsquared)
+
+    df = pd.DataFrame(x, columns=["a", "b", "c"])
+    mod = OLS(pd.Series(y), df, data_checks="trusted", hasconst=False)
+    assert mod.k_constant == 0
+    assert mod.exog_names == ["a", "b", "c"]
+
+    with pytest.raises(ValueError, match="missing='none'"):
+        OLS(y, x, missing="drop", data_checks="trusted")
+    with pytest.raises(ValueError, match="data_checks"):
+        sm_data.handle_data(y, x, data_checks="fast")
+
+
+def test_implicit_constant():
+    rs = np.random.RandomState(0)
+    dummies = np.eye(3)[np.arange(30) % 3]
+    x = np.column_stack([dummies, rs.standard_normal(30)])
+    for exog, expected in [(x, True), (x[:, 1:], False)]:
+        xtx = exog.T @ exog
+        xt1 = exog.sum(0)
+        assert sm_data._implicit_constant(xtx, xt1, 30) is expected
+        # R'R from a QR decomposition is equivalent
+        r = np.linalg.qr(exog, mode="r")
+        assert sm_data._implicit_constant(r.T @ r, xt1, 30) is expected
@@ -313,6 +313,51 @@ def test_fit_joblib():
                     atol=1e-6, rtol=0)
 
 
+def test_fit_shared_memory():
+
+    # tests that the shared memory backend matches the sequential fit for
+    # the debiased and naive joins, and with an init_kwds_generator
+
+    np.random.seed(435265)
+    X = np.random.normal(size=(50, 3))
+    y = np.random.randint(0, 2, size=50)
+    w = np.random.uniform(0.5, 2, size=50)
+
+    for model_class, init_kwds in [(OLS, {}),
+                                   (GLM, {"family": Binomial()})]:
+        mod = DistributedModel(3, model_class=model_class,
+                               init_kwds=init_kwds)
+        fit = mod.fit(_data_gen(y, X, 3), parallel_method="shared_memory",
+                      fit_kwds={"alpha": 0.5})
+        fit_seq = mod.fit(_data_gen(y, X, 3), parallel_method="sequential",
+                          fit_kwds={"alpha": 0.5})
+        assert_allclose(fit.params, fit_seq.params, atol=1e-12)
+
+    mod = DistributedModel(2, estimation_method=_est_unregularized_naive,
+                           join_method=_join_naive)
+    fit = mod.fit(_data_gen(y, X, 2), parallel_method="shared_memory")
+    fit_seq = mod.fit(_data_gen(y, X, 2), parallel_method="sequential")
+    assert_allclose(fit.params, fit_seq.params, atol=1e-12)
+
+    fit = mod.fit(_data_gen(y, X, 2), parallel_method="shared_memory",
+                  n_jobs=1)
+    assert_allclose(fit.params, fit_seq.params, atol=1e-12)
+
+    def _weights_gen(weights, partitions):
+        for _, wp in _data_gen(weights, weights[:, None], partitions):
+            yield {"weights": wp[:, 0]}
+
+    from statsmodels.regression.linear_model import WLS
+    mod = DistributedModel(2, model_class=WLS,
+                           estimation_method=_est_unregularized_naive,
+                           join_method=_join_naive)
+    fit = mod.fit(_data_gen(y, X, 2), parallel_method="shared_memory",
+                  init_kwds_generator=_weights_gen(w, 2))
+    fit_seq = mod.fit(_data_gen(y, X, 2), parallel_method="sequential",
+                      init_kwds_generator=_weights_gen(w, 2))
+    assert_allclose(fit.params, fit_seq.params, atol=1e-12)
+
+
 def test_single_partition():
 
     # tests that the results make sense if we have a single partition
@@ -34,6 +34,9 @@ class ResultsWrapper:
         obj = getattr(results, attr)
         data = results.model.data
         how = self._wrap_attrs.get(attr)
+        if obj is None:
+            # removed data, see LikelihoodModelResults.remove_data
+            return obj
         if how and isinstance(how, tuple):
             obj = data.wrap_output(obj, how[0], *how[1:])
         elif how:
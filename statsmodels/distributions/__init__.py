@@ -1,4 +1,5 @@
 from statsmodels.tools._test_runner import PytestTester
+from statsmodels.tools._lazy import lazy_submodules
 from .empirical_distribution import (
     ECDF, ECDFDiscrete, monotone_fn_inverter, StepFunction
     )
@@ -22,3 +23,7 @@ __all__ = [
     ]
 
 test = PytestTester()
+
+# Submodules are imported on first access, e.g. through statsmodels.api
+__getattr__ = lazy_submodules(__name__)
+del lazy_submodules
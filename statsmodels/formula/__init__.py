@@ -1,5 +1,5 @@
-__all__ = ['handle_formula_data', 'test']
-from .formulatools import handle_formula_data
+__all__ = ['FormulaDesign', 'handle_formula_data', 'test']
+from .formulatools import FormulaDesign, handle_formula_data
 
 from statsmodels.tools._test_runner import PytestTester
 
@@ -21,6 +21,125 @@ class NAAction(NAAction):
         return [v[good_mask, ...] for v in values]
 
 
+class FormulaDesign:
+    """
+    A formula compiled for data with a fixed schema
+
+    The formula is parsed, and the categorical levels and the state of
+    stateful transforms are determined from ``data``, once. The design can
+    be passed in place of the formula to ``from_formula`` so that the
+    design matrices of new data are only evaluated, and have the same
+    columns for all data sets.
+
+    Parameters
+    ----------
+    formula : str
+        The formula specifying the model.
+    data : DataFrame
+        The data that are used to determine the categorical levels and the
+        state of stateful transforms. Only the columns need to be present
+        if ``levels`` provides the levels of all categorical variables and
+        the formula does not contain stateful transforms.
+    levels : dict[str, Sequence], optional
+        The levels of categorical variables, keyed by column name. The
+        first level is the reference level. The listed columns are not
+        scanned for their levels.
+    eval_env : {int, patsy.EvalEnvironment}
+        The environment in which the formula is evaluated. An integer is
+        the depth of the namespace relative to the caller. The default, 0,
+        uses the calling namespace.
+
+    Attributes
+    ----------
+    formula : str
+        The formula.
+    model_desc : patsy.ModelDesc
+        The parsed formula.
+    design_info : patsy.DesignInfo
+        The design of the right hand side.
+    endog_design_info : patsy.DesignInfo
+        The design of the left hand side.
+
+    Notes
+    -----
+    Stateful transforms such as ``center`` or ``standardize`` keep the
+    state learned from ``data``, they are not updated for new data. Values
+    of a categorical variable that are not in its levels raise an error.
+
+    Examples
+    --------
+    >>> design = FormulaDesign("y ~ x + C(day)", df.iloc[:0],
+    ...                        levels={"day": ["Mon", "Tue", "Wed"]})
+    >>> for key, chunk in df.groupby("date"):
+    ...     res = OLS.from_formula(design, chunk).fit()
+    """
+
+    def __init__(self, formula, data, levels=None, eval_env=0):
+        from patsy import (
+            EvalEnvironment,
+            ModelDesc,
+            design_matrix_builders,
+        )
+
+        if not isinstance(formula, str):
+            raise TypeError("formula must be a str")
+        if not isinstance(eval_env, EvalEnvironment):
+            eval_env = EvalEnvironment.capture(eval_env, reference=1)
+        if levels:
+            import pandas as pd
+
+            data = data.copy(deep=False)
+            for col, col_levels in levels.items():
+                data[col] = pd.Categorical(data[col],
+                                           categories=list(col_levels))
+        self.formula = formula
+        self.levels = levels
+        self.model_desc = ModelDesc.from_formula(formula)
+        self.eval_env = eval_env
+        self.endog_design_info, self.design_info = design_matrix_builders(
+            [self.model_desc.lhs_termlist, self.model_desc.rhs_termlist],
+            lambda: iter([data]),
+            eval_env,
+        )
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.formula!r})"
+
+    def build(self, data, missing="drop"):
+        """
+        Build the design matrices of data
+
+        Parameters
+        ----------
+        data : DataFrame
+            The data, which must contain the variables of the formula.
+        missing : {"drop", "raise"}
+            The handling of missing values.
+
+        Returns
+        -------
+        matrices : tuple[DataFrame]
+            The endog and exog matrices.
+        missing_mask : {ndarray, None}
+            Boolean mask of the dropped rows, None if no rows are dropped.
+        design_info : patsy.DesignInfo
+            The design of exog.
+        """
+        from patsy import build_design_matrices
+
+        na_action = NAAction(on_NA=missing)
+        result = build_design_matrices(
+            [self.endog_design_info, self.design_info],
+            data,
+            NA_action=na_action,
+            return_type="dataframe",
+        )
+        missing_mask = getattr(na_action, "missing_mask", None)
+        if not np.any(missing_mask):
+            missing_mask = None
+        return tuple(result), missing_mask, self.design_info
+
+
 def handle_formula_data(Y, X, formula, depth=0, missing='drop'):
     """
     Returns endog, exog, and the model specification from arrays and formula.
@@ -33,10 +152,12 @@ def handle_formula_data(Y, X, formula, depth=0, missing='drop'):
     X : array_like
         Either exog or None. If all the data for the formula is provided in
         Y then you must explicitly set X to None.
-    formula : str or patsy.model_desc
+    formula : str or patsy.model_desc or FormulaDesign
         You can pass a handler by import formula_handler and adding a
         key-value pair where the key is the formula object class and
         the value is a function that returns endog, exog, formula object.
+        A FormulaDesign builds the matrices of Y without parsing the
+        formula again, X must be None.
 
     Returns
     -------
@@ -49,6 +170,11 @@ def handle_formula_data(Y, X, formula, depth=0, missing='drop'):
     if isinstance(formula, tuple(formula_handler.keys())):
         return formula_handler[type(formula)]
 
+    if isinstance(formula, FormulaDesign):
+        if X is not None:
+            raise ValueError("X must be None if formula is a FormulaDesign")
+        return formula.build(Y, missing=missing)
+
     na_action = NAAction(on_NA=missing)
 
     if X is not None:
@@ -11,7 +11,8 @@ import pytest
 
 from statsmodels.datasets import cpunish
 from statsmodels.datasets.longley import load, load_pandas
-from statsmodels.formula.api import ols
+from statsmodels.formula import FormulaDesign
+from statsmodels.formula.api import glm, ols
 from statsmodels.formula.formulatools import make_hypotheses_matrices
 from statsmodels.tools import add_constant
 from statsmodels.tools.testing import assert_equal
@@ -242,3 +243,40 @@ def test_formula_predict_series_exog():
     oos = data_full.iloc[500:]["x"]
     prediction = res.get_prediction(oos)
     assert prediction.predicted_mean.shape[0] == 500
+
+
+def test_formula_design():
+    rs = np.random.RandomState(0)
+    df = pd.DataFrame({"y": rs.standard_normal(60),
+                       "x": rs.standard_normal(60),
+                       "g": rs.choice(["a", "b", "c"], 60),
+                       "day": np.repeat(np.arange(6), 10)})
+    df.loc[3, "x"] = np.nan
+    levels = {"g": ["c", "a", "b", "d"]}
+    formula = "y ~ x + C(g) + np.exp(x)"
+    design = FormulaDesign(formula, df.iloc[:0], levels=levels)
+    assert design.formula == formula
+    names = ["Intercept", "C(g)[T.a]", "C(g)[T.b]", "C(g)[T.d]", "x",
+             "np.exp(x)"]
+    assert design.design_info.column_names == names
+
+    for _, chunk in df.groupby("day"):
+        model = ols(design, chunk)
+        assert model.exog_names == names
+        assert model.formula == formula
+        expected = ols("y ~ x + C(g, levels=['c', 'a', 'b', 'd']) + "
+                       "np.exp(x)", chunk)
+        assert_equal(model.exog, expected.exog)
+        assert_equal(model.endog, expected.endog)
+        assert_equal(model.data.missing_row_idx,
+                     expected.data.missing_row_idx)
+
+    res = glm(design, df.iloc[10:40]).fit()
+    assert_equal(res.predict(df.iloc[40:]).index, df.index[40:])
+
+    with pytest.raises(patsy.PatsyError):
+        ols(design, df.assign(g="z"))
+    with pytest.raises(patsy.PatsyError):
+        ols(design, df, missing="raise")
+    with pytest.raises(TypeError):
+        FormulaDesign(patsy.ModelDesc.from_formula(formula), df)
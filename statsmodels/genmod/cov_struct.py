@@ -184,6 +184,50 @@ class CovStruct:
         soln = [spl.cho_solve(vco, x) for x in rhs]
         return soln
 
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+        """
+        Solves the matrix equations of `covariance_matrix_solve` for a
+        block of clusters with the same size.
+
+        Parameters
+        ----------
+        expval : ndarray
+           The expected values of endog with shape (m, k), one row
+           for each of the m clusters of size k.
+        index : ndarray
+           The group indices of the m clusters.
+        stdev : ndarray
+            The standard deviations of endog with shape (m, k).
+        rhs : list/tuple of ndarray
+            A set of right-hand sides with shape (m, k) or (m, k, p).
+            Row j defines the equation that is solved for cluster
+            index[j].
+
+        Returns
+        -------
+        soln : list/tuple of ndarray
+            The solutions to the matrix equations, with the same
+            shapes as the right-hand sides.
+
+        Notes
+        -----
+        Returns None if the solver fails.
+
+        This is a default implementation that calls
+        `covariance_matrix_solve` for every cluster.  Subclasses
+        reimplement it to solve all equations using array operations.
+        """
+
+        soln = [np.empty(np.shape(x)) for x in rhs]
+        for j, i in enumerate(index):
+            rslt = self.covariance_matrix_solve(
+                expval[j], i, stdev[j], [x[j] for x in rhs])
+            if rslt is None:
+                return None
+            for y, x in zip(soln, rslt):
+                y[j] = x
+        return soln
+
     def summary(self):
         """
         Returns a text summary of the current estimate of the
@@ -218,6 +262,11 @@ class Independence(CovStruct):
                 rslt.append(x / v[:, None])
         return rslt
 
+    @Appender(CovStruct.covariance_matrix_solve_batch.__doc__)
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+        v = stdev ** 2
+        return [x / v if x.ndim == 2 else x / v[..., None] for x in rhs]
+
     def summary(self):
         return ("Observations within a cluster are modeled "
                 "as being independent.")
@@ -335,21 +384,33 @@ class Exchangeable(CovStruct):
 
         residsq_sum, scale = 0, 0
         fsum1, fsum2, n_pairs = 0., 0., 0.
-        for i in range(self.model.num_group):
-            expval, _ = cached_means[i]
-            stdev = np.sqrt(varfunc(expval))
-            resid = (endog[i] - expval) / stdev
-            f = weights_li[i] if has_weights else 1.
+        if not has_weights and self.model._use_blocks():
 
-            ssr = np.sum(resid * resid)
-            scale += f * ssr
-            fsum1 += f * len(endog[i])
+            def block_sums(blk, expval, lpr):
+                resid = (blk.endog - expval) / np.sqrt(varfunc(expval))
+                ssr = np.sum(resid * resid, 1)
+                return (ssr.sum(), np.sum(resid.sum(1) ** 2 - ssr) / 2,
+                        resid.size, 0.5 * resid.size * (resid.shape[1] - 1))
 
-            residsq_sum += f * (resid.sum() ** 2 - ssr) / 2
-            ngrp = len(resid)
-            npr = 0.5 * ngrp * (ngrp - 1)
-            fsum2 += f * npr
-            n_pairs += npr
+            sums = np.sum(self.model._map_blocks(block_sums), 0)
+            scale, residsq_sum, fsum1, fsum2 = sums
+            n_pairs = fsum2
+        else:
+            for i in range(self.model.num_group):
+                expval, _ = cached_means[i]
+                stdev = np.sqrt(varfunc(expval))
+                resid = (endog[i] - expval) / stdev
+                f = weights_li[i] if has_weights else 1.
+
+                ssr = np.sum(resid * resid)
+                scale += f * ssr
+                fsum1 += f * len(endog[i])
+
+                residsq_sum += f * (resid.sum() ** 2 - ssr) / 2
+                ngrp = len(resid)
+                npr = 0.5 * ngrp * (ngrp - 1)
+                fsum2 += f * npr
+                n_pairs += npr
 
         ddof = self.model.ddof_scale
         scale /= (fsum1 * (nobs - ddof) / float(nobs))
@@ -387,6 +448,24 @@ class Exchangeable(CovStruct):
 
         return rslt
 
+    @Appender(CovStruct.covariance_matrix_solve_batch.__doc__)
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+
+        k = expval.shape[1]
+        c = self.dep_params / (1. - self.dep_params)
+        c /= 1. + self.dep_params * (k - 1)
+
+        rslt = []
+        for x in rhs:
+            sd = stdev if x.ndim == 2 else stdev[..., None]
+            x1 = x / sd
+            y = x1 / (1. - self.dep_params)
+            y -= c * x1.sum(1, keepdims=True)
+            y /= sd
+            rslt.append(y)
+
+        return rslt
+
     def summary(self):
         return ("The correlation between two observations in the " +
                 "same cluster is %.3f" % self.dep_params)
@@ -611,6 +690,7 @@ class Stationary(CovStruct):
         self.max_lag = max_lag
         self.grid = bool(grid)
         self.dep_params = np.zeros(max_lag + 1)
+        self._factor_key = None
 
     def initialize(self, model):
 
@@ -740,6 +820,60 @@ class Stationary(CovStruct):
 
         return rslt
 
+    @Appender(CovStruct.covariance_matrix_solve_batch.__doc__)
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+
+        m, k = expval.shape
+        if self.grid and k <= self.max_lag:
+            return super().covariance_matrix_solve_batch(
+                expval, index, stdev, rhs)
+
+        # The correlation matrix only depends on the time pattern of
+        # a cluster, so it is factored once for all clusters with the
+        # same pattern, and reused until dep_params is updated.
+        key = self.dep_params.tobytes()
+        if self._factor_key != key:
+            self._factors = {}
+            self._factor_key = key
+
+        if self.grid:
+            patterns, inverse = [None], np.zeros(m, dtype=int)
+        else:
+            tm = np.asarray([self.time[i] for i in index])
+            patterns, inverse = np.unique(tm, axis=0, return_inverse=True)
+            inverse = inverse.ravel()
+
+        soln = [np.empty(np.shape(x)) for x in rhs]
+        for j, pattern in enumerate(patterns):
+            ii = np.flatnonzero(inverse == j)
+            pkey = (k, None if pattern is None else pattern.tobytes())
+            if pkey not in self._factors:
+                cmat, _ = self.covariance_matrix(expval[ii[0]], index[ii[0]])
+                try:
+                    self._factors[pkey] = spl.cho_factor(cmat)
+                except np.linalg.LinAlgError:
+                    self._factors[pkey] = None
+            factor = self._factors[pkey]
+
+            if factor is None:
+                # Not positive definite, solve cluster by cluster
+                rslt = super().covariance_matrix_solve_batch(
+                    expval[ii], index[ii], stdev[ii], [x[ii] for x in rhs])
+                if rslt is None:
+                    return None
+            else:
+                rslt = []
+                for x in rhs:
+                    sd = stdev[ii] if x.ndim == 2 else stdev[ii][..., None]
+                    x1 = np.moveaxis(x[ii] / sd, 1, 0)
+                    y = spl.cho_solve(factor, x1.reshape(k, -1))
+                    rslt.append(np.moveaxis(y.reshape(x1.shape), 0, 1) / sd)
+
+            for y, x in zip(soln, rslt):
+                y[ii] = x
+
+        return soln
+
     def summary(self):
 
         lag = np.arange(self.max_lag + 1)
@@ -986,6 +1120,35 @@ class Autoregressive(CovStruct):
 
         return soln
 
+    @Appender(CovStruct.covariance_matrix_solve_batch.__doc__)
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+
+        k = expval.shape[1]
+        if k == 1:
+            v = stdev ** 2
+            return [x / v if x.ndim == 2 else x / v[..., None] for x in rhs]
+
+        # Apply the tri-diagonal inverse along the cluster axis, see
+        # covariance_matrix_solve.  For k = 2 only the first and last
+        # positions are present.
+        r = self.dep_params
+        c0 = (1. + r ** 2) / (1. - r ** 2)
+        c1 = 1. / (1. - r ** 2)
+        c2 = -r / (1. - r ** 2)
+        soln = []
+        for x in rhs:
+            sd = stdev if x.ndim == 2 else stdev[..., None]
+            x1 = x / sd
+            y = c0 * x1
+            y[:, 1:] += c2 * x1[:, :-1]
+            y[:, :-1] += c2 * x1[:, 1:]
+            y[:, 0] = c1 * x1[:, 0] + c2 * x1[:, 1]
+            y[:, -1] = c1 * x1[:, -1] + c2 * x1[:, -2]
+            y /= sd
+            soln.append(y)
+
+        return soln
+
     def summary(self):
 
         return ("Autoregressive(1) dependence parameter: %.3f\n" %
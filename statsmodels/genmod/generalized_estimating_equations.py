@@ -25,6 +25,10 @@ improved small-sample properties.  Biometrics. 2001 Mar;57(1):126-34.
 from statsmodels.compat.python import lzip
 from statsmodels.compat.pandas import Appender
 
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import os
+
 import numpy as np
 from scipy import stats
 import pandas as pd
@@ -319,6 +323,10 @@ _gee_fit_doc = """
         The default value is None, which uses `X2` (Pearson's
         chi-square) for Gamma, Gaussian, and Inverse Gaussian.
         The default is 1 for the Binomial and Poisson families.
+    n_jobs : int
+        The number of threads used to process the blocks of clusters
+        with the same size.  -1 uses all available cores.  Default
+        is 1.
 
     Returns
     -------
@@ -335,8 +343,20 @@ _gee_fit_doc = """
     For the Gaussian family, there is no benefit to setting
     `params_niter` to a value greater than 1, since the mean
     structure parameters converge in one step.
+
+    Clusters with the same size are stacked into blocks, and the
+    estimating equations of all clusters in a block are formed
+    with array operations.  The working covariance structures
+    solve the equations of a block at once, see
+    `CovStruct.covariance_matrix_solve_batch`.
 """
 
+# The maximum number of clusters stacked in a single block
+_BLOCK_CLUSTERS = 10000
+
+_ClusterBlock = namedtuple(
+    "_ClusterBlock", ["index", "endog", "exog", "offset", "weights"])
+
 _gee_results_doc = """
     Attributes
     ----------
@@ -490,6 +510,7 @@ class GEE(GLM):
          'notes': ""})
 
     cached_means = None
+    _n_jobs = 1
 
     def __init__(self, endog, exog, groups, time=None, family=None,
                  cov_struct=None, missing='none', offset=None,
@@ -1034,6 +1055,46 @@ class GEE(GLM):
             incorporate the scale.
         """
 
+        if self._use_blocks():
+
+            def block_sums(blk, expval, lpr):
+                resid, dmat, sdev = self._block_terms(blk, expval, lpr)
+                if blk.weights is not None:
+                    wresid = resid * blk.weights
+                    wdmat = dmat * blk.weights[..., None]
+                else:
+                    wresid = resid
+                    wdmat = dmat
+                rslt = self.cov_struct.covariance_matrix_solve_batch(
+                    expval, blk.index, sdev, (wdmat, wresid))
+                if rslt is None:
+                    return None
+                vinv_d, vinv_resid = rslt
+                return (np.tensordot(dmat, vinv_d, axes=([0, 1], [0, 1])),
+                        np.tensordot(dmat, vinv_resid, axes=([0, 1], [0, 1])))
+
+            sums = self._map_blocks(block_sums)
+            if any(x is None for x in sums):
+                return None, None
+            bmat = sum(x[0] for x in sums)
+            score = sum(x[1] for x in sums)
+        else:
+            bmat, score = self._update_mean_params_loop()
+            if bmat is None:
+                return None, None
+
+        try:
+            update = np.linalg.solve(bmat, score)
+        except np.linalg.LinAlgError:
+            update = np.dot(np.linalg.pinv(bmat), score)
+
+        self._fit_history["cov_adjust"].append(
+            self.cov_struct.cov_adjust)
+
+        return update, score
+
+    def _update_mean_params_loop(self):
+
         endog = self.endog_li
         exog = self.exog_li
         weights = getattr(self, "weights_li", None)
@@ -1067,15 +1128,7 @@ class GEE(GLM):
             bmat += np.dot(dmat.T, vinv_d)
             score += np.dot(dmat.T, vinv_resid)
 
-        try:
-            update = np.linalg.solve(bmat, score)
-        except np.linalg.LinAlgError:
-            update = np.dot(np.linalg.pinv(bmat), score)
-
-        self._fit_history["cov_adjust"].append(
-            self.cov_struct.cov_adjust)
-
-        return update, score
+        return bmat, score
 
     def update_cached_means(self, mean_params):
         """
@@ -1085,12 +1138,34 @@ class GEE(GLM):
         keep the cached means up to date.
         """
 
+        linkinv = self.family.link.inverse
+
+        if self._use_blocks():
+            blocks = self._cluster_blocks()
+            cached_means = [None] * self.num_group
+            means = []
+            for blk in blocks:
+                lpr = np.dot(blk.exog, mean_params)
+                if blk.offset is not None:
+                    lpr += blk.offset
+                expval = linkinv(lpr)
+                means.append((expval, lpr))
+                for j, i in enumerate(blk.index):
+                    cached_means[i] = (expval[j], lpr[j])
+            # Clusters without observations are not in the blocks, they
+            # get empty means so that the list is indexed by cluster
+            for i, x in enumerate(cached_means):
+                if x is None:
+                    lpr = np.zeros(0)
+                    cached_means[i] = (linkinv(lpr), lpr)
+            self.cached_means = cached_means
+            self._cached_blocks = (self.cached_means, blocks, means)
+            return
+
         endog = self.endog_li
         exog = self.exog_li
         offset = self.offset_li
 
-        linkinv = self.family.link.inverse
-
         self.cached_means = []
 
         for i in range(self.num_group):
@@ -1105,6 +1180,94 @@ class GEE(GLM):
 
             self.cached_means.append((expval, lpr))
 
+    def _use_blocks(self):
+        """
+        Returns True if the clusters can be processed in blocks.
+
+        The block computations require that the inverse link and the
+        mean derivative act elementwise on the linear predictor.
+        """
+        return (type(self).mean_deriv is GEE.mean_deriv and
+                not isinstance(self.family, _Multinomial))
+
+    def _cluster_blocks(self):
+        """
+        Returns the clusters grouped by size.
+
+        The data of the clusters with the same size are stacked into
+        arrays with one row per cluster.  The blocks are built once
+        for each version of the cluster data, since `exog_li` is
+        temporarily replaced when handling a constraint.
+        """
+
+        cache = self.__dict__.setdefault("_block_cache", {})
+        key = id(self.exog_li)
+        if key in cache and cache[key][0] is self.exog_li:
+            return cache[key][1]
+
+        weights = getattr(self, "weights_li", None)
+        offset = self.offset_li
+        sizes = np.array([len(y) for y in self.endog_li])
+        blocks = []
+        for k in np.unique(sizes):
+            if k == 0:
+                continue
+            index = np.flatnonzero(sizes == k)
+            for start in range(0, len(index), _BLOCK_CLUSTERS):
+                ix = index[start:start + _BLOCK_CLUSTERS]
+                blocks.append(_ClusterBlock(
+                    ix,
+                    np.array([self.endog_li[i] for i in ix]),
+                    np.array([self.exog_li[i] for i in ix]),
+                    None if offset is None else
+                    np.array([offset[i] for i in ix]),
+                    None if weights is None else
+                    np.array([weights[i] for i in ix])))
+
+        cache[key] = (self.exog_li, blocks)
+        return blocks
+
+    def _map_blocks(self, func):
+        """
+        Applies func(block, expval, lpr) to all blocks of clusters,
+        using threads if requested, and returns the list of results.
+        """
+
+        blocks = self._cluster_blocks()
+        cached = getattr(self, "_cached_blocks", None)
+        if (cached is not None and cached[0] is self.cached_means
+                and cached[1] is blocks):
+            means = cached[2]
+        else:
+            # cached_means was replaced, e.g. when restoring the state
+            # after a score test
+            means = []
+            for blk in blocks:
+                means.append(
+                    (np.array([self.cached_means[i][0] for i in blk.index]),
+                     np.array([self.cached_means[i][1] for i in blk.index])))
+            self._cached_blocks = (self.cached_means, blocks, means)
+
+        n_jobs = min(self._n_jobs, len(blocks))
+        if n_jobs <= 1:
+            return [func(blk, *mn) for blk, mn in zip(blocks, means)]
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            return list(pool.map(lambda x: func(x[0], *x[1]),
+                                 zip(blocks, means)))
+
+    def _block_terms(self, blk, expval, lpr):
+        """
+        Returns the residuals, the mean derivatives and the standard
+        deviations of a block of clusters.
+        """
+
+        resid = blk.endog - expval
+        shape = blk.exog.shape
+        dmat = self.mean_deriv(blk.exog.reshape(-1, shape[2]), lpr.ravel())
+        dmat = dmat.reshape(shape)
+        sdev = np.sqrt(self.family.variance(expval))
+        return resid, dmat, sdev
+
     def _covmat(self):
         """
         Returns the sampling covariance matrix of the regression
@@ -1125,6 +1288,51 @@ class GEE(GLM):
            obtaining score test results.
         """
 
+        if self._use_blocks():
+
+            def block_sums(blk, expval, lpr):
+                resid, dmat, sdev = self._block_terms(blk, expval, lpr)
+                if blk.weights is not None:
+                    wresid = resid * blk.weights
+                    wdmat = dmat * blk.weights[..., None]
+                else:
+                    wresid = resid
+                    wdmat = dmat
+                rslt = self.cov_struct.covariance_matrix_solve_batch(
+                    expval, blk.index, sdev, (wdmat, wresid))
+                if rslt is None:
+                    return None
+                vinv_d, vinv_resid = rslt
+                dvinv_resid = np.einsum("ikp,ik->ip", dmat, vinv_resid)
+                return (np.tensordot(dmat, vinv_d, axes=([0, 1], [0, 1])),
+                        np.dot(dvinv_resid.T, dvinv_resid))
+
+            sums = self._map_blocks(block_sums)
+            if any(x is None for x in sums):
+                return None, None, None, None
+            bmat = sum(x[0] for x in sums)
+            cmat = sum(x[1] for x in sums)
+        else:
+            bmat, cmat = self._covmat_loop()
+            if bmat is None:
+                return None, None, None, None
+
+        scale = self.estimate_scale()
+
+        try:
+            bmati = np.linalg.inv(bmat)
+        except np.linalg.LinAlgError:
+            bmati = np.linalg.pinv(bmat)
+
+        cov_naive = bmati * scale
+        cov_robust = np.dot(bmati, np.dot(cmat, bmati))
+
+        cov_naive *= self.scaling_factor
+        cov_robust *= self.scaling_factor
+        return cov_robust, cov_naive, cmat
+
+    def _covmat_loop(self):
+
         endog = self.endog_li
         exog = self.exog_li
         weights = getattr(self, "weights_li", None)
@@ -1152,37 +1360,64 @@ class GEE(GLM):
             rslt = self.cov_struct.covariance_matrix_solve(
                 expval, i, sdev, (wdmat, wresid))
             if rslt is None:
-                return None, None, None, None
+                return None, None
             vinv_d, vinv_resid = tuple(rslt)
 
             bmat += np.dot(dmat.T, vinv_d)
             dvinv_resid = np.dot(dmat.T, vinv_resid)
             cmat += np.outer(dvinv_resid, dvinv_resid)
 
-        scale = self.estimate_scale()
-
-        try:
-            bmati = np.linalg.inv(bmat)
-        except np.linalg.LinAlgError:
-            bmati = np.linalg.pinv(bmat)
-
-        cov_naive = bmati * scale
-        cov_robust = np.dot(bmati, np.dot(cmat, bmati))
-
-        cov_naive *= self.scaling_factor
-        cov_robust *= self.scaling_factor
-        return cov_robust, cov_naive, cmat
+        return bmat, cmat
 
     # Calculate the bias-corrected sandwich estimate of Mancl and
     # DeRouen.
     def _bc_covmat(self, cov_naive):
 
         cov_naive = cov_naive / self.scaling_factor
+        scale = self.estimate_scale()
+
+        if self._use_blocks() and self.weights is None:
+
+            def block_sums(blk, expval, lpr):
+                resid, dmat, sdev = self._block_terms(blk, expval, lpr)
+                rslt = self.cov_struct.covariance_matrix_solve_batch(
+                    expval, blk.index, sdev, (dmat,))
+                if rslt is None:
+                    return None
+                vinv_d = rslt[0] / scale
+
+                hmat = np.matmul(dmat, np.matmul(vinv_d, cov_naive)
+                                 .transpose(0, 2, 1))
+                k = resid.shape[1]
+                aresid = np.linalg.solve(np.eye(k) - hmat,
+                                         resid[..., None])[..., 0]
+                rslt = self.cov_struct.covariance_matrix_solve_batch(
+                    expval, blk.index, sdev, (aresid,))
+                if rslt is None:
+                    return None
+                srt = np.einsum("ikp,ik->ip", dmat, rslt[0]) / scale
+                return np.dot(srt.T, srt)
+
+            sums = self._map_blocks(block_sums)
+            if any(x is None for x in sums):
+                return None
+            bcm = sum(sums)
+        else:
+            bcm = self._bc_covmat_loop(cov_naive, scale)
+            if bcm is None:
+                return None
+
+        cov_robust_bc = np.dot(cov_naive, np.dot(bcm, cov_naive))
+        cov_robust_bc *= self.scaling_factor
+
+        return cov_robust_bc
+
+    def _bc_covmat_loop(self, cov_naive, scale):
+
         endog = self.endog_li
         exog = self.exog_li
         varfunc = self.family.variance
         cached_means = self.cached_means
-        scale = self.estimate_scale()
 
         bcm = 0
         for i in range(self.num_group):
@@ -1213,10 +1448,7 @@ class GEE(GLM):
             srt = f * np.dot(dmat.T, srt) / scale
             bcm += np.outer(srt, srt)
 
-        cov_robust_bc = np.dot(cov_naive, np.dot(bcm, cov_naive))
-        cov_robust_bc *= self.scaling_factor
-
-        return cov_robust_bc
+        return bcm
 
     def _starting_params(self):
 
@@ -1234,10 +1466,17 @@ class GEE(GLM):
     def fit(self, maxiter=60, ctol=1e-6, start_params=None,
             params_niter=1, first_dep_update=0,
             cov_type='robust', ddof_scale=None, scaling_factor=1.,
-            scale=None):
+            scale=None, n_jobs=1):
 
         self.scaletype = scale
 
+        n_jobs = int(n_jobs)
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs < 1:
+            raise ValueError("n_jobs must be a positive integer or -1")
+        self._n_jobs = n_jobs
+
         # Subtract this number from the total sample size when
         # normalizing the scale parameter estimate.
         if ddof_scale is None:
@@ -2428,11 +2667,11 @@ class OrdinalGEE(GEE):
     @Appender(_gee_fit_doc)
     def fit(self, maxiter=60, ctol=1e-6, start_params=None,
             params_niter=1, first_dep_update=0,
-            cov_type='robust'):
+            cov_type='robust', n_jobs=1):
 
         rslt = super().fit(maxiter, ctol, start_params,
                            params_niter, first_dep_update,
-                           cov_type=cov_type)
+                           cov_type=cov_type, n_jobs=n_jobs)
 
         rslt = rslt._results   # use unwrapped instance
         res_kwds = {k: getattr(rslt, k) for k in rslt._props}
@@ -2813,11 +3052,11 @@ class NominalGEE(GEE):
     @Appender(_gee_fit_doc)
     def fit(self, maxiter=60, ctol=1e-6, start_params=None,
             params_niter=1, first_dep_update=0,
-            cov_type='robust'):
+            cov_type='robust', n_jobs=1):
 
         rslt = super().fit(maxiter, ctol, start_params,
                            params_niter, first_dep_update,
-                           cov_type=cov_type)
+                           cov_type=cov_type, n_jobs=n_jobs)
         if rslt is None:
             warnings.warn("GEE updates did not converge",
                           ConvergenceWarning)
@@ -18,11 +18,13 @@ McCullagh, P. and Nelder, J.A.  1989.  "Generalized Linear Models." 2nd ed.
     Chapman & Hall, Boca Rotan.
 """
 from statsmodels.compat.pandas import Appender
+from statsmodels.compat.scipy import SP_LT_112
 
 import warnings
 
 import numpy as np
 from numpy.linalg import LinAlgError
+from scipy import sparse
 
 from statsmodels.base import _prediction_inference as pred
 import statsmodels.base._parameter_inference as pinfer
@@ -36,6 +38,7 @@ from statsmodels.graphics._regressionplots_doc import (
 )
 import statsmodels.regression._tools as reg_tools
 import statsmodels.regression.linear_model as lm
+from statsmodels.stats.sandwich_covariance import _SparseCovariance
 from statsmodels.tools.decorators import (
     cache_readonly,
     cached_data,
@@ -44,11 +47,12 @@ from statsmodels.tools.decorators import (
 from statsmodels.tools.data import _as_array_with_name
 from statsmodels.tools.docstring import Docstring
 from statsmodels.tools.sm_exceptions import (
+    ConvergenceWarning,
     DomainWarning,
     HessianInversionWarning,
     PerfectSeparationWarning,
 )
-from statsmodels.tools.validation import float_like
+from statsmodels.tools.validation import float_like, string_like
 
 # need import in module instead of lazily to copy `__doc__`
 from . import families
@@ -61,6 +65,84 @@ def _check_convergence(criterion, iteration, atol, rtol):
                        atol=atol, rtol=rtol)
 
 
+def _sparse_wls(endog, exog, weights, method='lstsq', start_params=None):
+    """
+    Weighted least squares with a sparse design via the normal equations.
+
+    Parameters
+    ----------
+    endog : ndarray
+        Working dependent variable, 1d.
+    exog : scipy.sparse matrix
+        Design matrix in CSR format.
+    weights : ndarray
+        Working weights, 1d.
+    method : {'lstsq', 'cg'}
+        'lstsq' solves the sparse normal equations with a sparse LU
+        factorization. 'cg' uses Jacobi preconditioned conjugate gradients
+        started at `start_params`.
+    start_params : ndarray, optional
+        Starting value for the conjugate gradient iterations.
+
+    Returns
+    -------
+    Bunch
+        Contains ``params`` and X'WX as ``_xtwx``. With 'lstsq' the
+        factorization of X'WX is attached as ``_factor`` so that it can be
+        reused.
+    """
+    from scipy.sparse import linalg as splinalg
+
+    from statsmodels.tools.tools import Bunch
+
+    msg = 'NaN, inf or invalid value detected in {0}, estimation infeasible.'
+    if not np.all(np.isfinite(weights)):
+        raise ValueError(msg.format('weights'))
+    if not np.all(np.isfinite(endog)):
+        raise ValueError(msg.format('endog'))
+
+    xtwx = (exog.T @ exog.multiply(weights[:, None])).tocsc()
+    xtwy = exog.T @ (weights * endog)
+    if method == 'cg':
+        diag = xtwx.diagonal()
+        precond = sparse.diags(1. / np.where(diag > 0, diag, 1.))
+        x0 = None
+        if start_params is not None and np.all(np.isfinite(start_params)):
+            x0 = start_params
+        tol_kwds = {'tol': 1e-10} if SP_LT_112 else {'rtol': 1e-10}
+        params, info = splinalg.cg(xtwx, xtwy, x0=x0, M=precond, atol=0.,
+                                   **tol_kwds)
+        if info > 0:
+            warnings.warn('Conjugate gradient solver did not converge in '
+                          '%d iterations' % info, ConvergenceWarning)
+        return Bunch(params=params, _xtwx=xtwx)
+    factor = splinalg.splu(xtwx)
+    return Bunch(params=factor.solve(xtwy), _xtwx=xtwx, _factor=factor)
+
+
+def _sparse_wls_cov(wls_results):
+    """
+    Inverse of X'WX from the last sparse IRLS step, held by its factorization.
+    """
+    return _SparseCovariance(wls_results._xtwx,
+                             lu=wls_results.get('_factor'))
+
+
+def _check_sparse_cov_type(cov_type, cov_kwds):
+    """
+    Raise if the sandwich covariance is not available for a sparse exog
+    """
+    groups = (cov_kwds or {}).get('groups')
+    if cov_type.upper() in ('NONROBUST', 'HC0', 'HC1', 'HC2', 'HC3'):
+        return
+    if cov_type == 'cluster' and np.ndim(np.squeeze(groups)) <= 1:
+        return
+    raise NotImplementedError(
+        f'cov_type {cov_type!r} is not available with a sparse exog. '
+        "Use 'nonrobust', 'HC0' to 'HC3' or 'cluster' with one group "
+        'variable.')
+
+
 # Remove after 0.13 when bic changes to bic llf
 class _ModuleVariable:
     _value = None
@@ -367,7 +449,12 @@ class GLM(base.LikelihoodModel):
         """
         Initialize a generalized linear model.
         """
-        self.df_model = np.linalg.matrix_rank(self.exog) - 1
+        if sparse.issparse(self.exog):
+            # the rank of a sparse design is not computed, it is assumed to
+            # have full column rank
+            self.df_model = self.exog.shape[1] - 1
+        else:
+            self.df_model = np.linalg.matrix_rank(self.exog) - 1
 
         if (self.freq_weights is not None) and \
            (self.freq_weights.shape[0] == self.endog.shape[0]):
@@ -446,7 +533,7 @@ class GLM(base.LikelihoodModel):
         Evaluate the log-likelihood for a generalized linear model.
         """
         scale = float_like(scale, "scale", optional=True)
-        lin_pred = np.dot(self.exog, params) + self._offset_exposure
+        lin_pred = self.exog @ params + self._offset_exposure
         expval = self.family.link.inverse(lin_pred)
         if scale is None:
             scale = self.estimate_scale(expval)
@@ -468,12 +555,16 @@ class GLM(base.LikelihoodModel):
 
         Returns
         -------
-        score_obs : ndarray, 2d
+        score_obs : {ndarray, scipy.sparse.csr_matrix}, 2d
             The first derivative of the loglikelihood function evaluated at
-            params for each observation.
+            params for each observation. This is a sparse CSR matrix if exog
+            is sparse.
         """
         scale = float_like(scale, "scale", optional=True)
         score_factor = self.score_factor(params, scale=scale)
+        if sparse.issparse(self.exog):
+            return sparse.csr_matrix(
+                self.exog.multiply(score_factor[:, None]))
         return score_factor[:, None] * self.exog
 
     def score(self, params, scale=None):
@@ -496,7 +587,7 @@ class GLM(base.LikelihoodModel):
         """
         scale = float_like(scale, "scale", optional=True)
         score_factor = self.score_factor(params, scale=scale)
-        return np.dot(score_factor, self.exog)
+        return self.exog.T @ score_factor
 
     def score_factor(self, params, scale=None):
         """weights for score for each observation
@@ -616,12 +707,24 @@ class GLM(base.LikelihoodModel):
             else:
                 observed = True
         scale = float_like(scale, "scale", optional=True)
-        tmp = getattr(self, '_tmp_like_exog', np.empty_like(self.exog, dtype=float))
-
         factor = self.hessian_factor(params, scale=scale, observed=observed)
+        if sparse.issparse(self.exog):
+            return self._sparse_hessian(params, scale=scale,
+                                        observed=observed).toarray()
+
+        tmp = getattr(self, '_tmp_like_exog', None)
+        if tmp is None:
+            tmp = np.empty_like(self.exog, dtype=float)
         np.multiply(self.exog.T, factor, out=tmp.T)
         return -tmp.T.dot(self.exog)
 
+    def _sparse_hessian(self, params, scale=None, observed=True):
+        """
+        Hessian as a sparse k x k matrix if exog is sparse, see `hessian`
+        """
+        factor = self.hessian_factor(params, scale=scale, observed=observed)
+        return -(self.exog.T @ self.exog.multiply(factor[:, None])).tocsc()
+
     def information(self, params, scale=None):
         """
         Fisher information matrix.
@@ -1013,7 +1116,11 @@ class GLM(base.LikelihoodModel):
         if exog is None:
             exog = self.exog
 
-        linpred = np.dot(exog, params) + offset + exposure
+        if sparse.issparse(exog):
+            linpred = exog @ params
+        else:
+            linpred = np.dot(exog, params)
+        linpred = linpred + offset + exposure
 
         if which == "mean":
             return self.family.fitted(linpred)
@@ -1095,7 +1202,8 @@ class GLM(base.LikelihoodModel):
 
     def fit(self, start_params=None, maxiter=100, method='IRLS', tol=1e-8,
             scale=None, cov_type='nonrobust', cov_kwds=None, use_t=None,
-            full_output=True, disp=False, max_start_irls=3, **kwargs):
+            full_output=True, disp=False, max_start_irls=3, store="full",
+            **kwargs):
         """
         Fits a generalized linear model for a given family.
 
@@ -1139,6 +1247,15 @@ class GLM(base.LikelihoodModel):
             The number of IRLS iterations used to obtain starting
             values for gradient optimization.  Only relevant if
             `method` is set to something other than 'IRLS'.
+        store : {"full", "minimal"}, optional
+            If "minimal", the results only keep the parameters, the
+            covariance of the parameters and the scalar statistics `deviance`,
+            `pearson_chi2`, `llf`, `aic` and `bic_llf`. The results do not
+            refer to the data or to arrays of length nobs, and the model
+            instance that is attached to the results is a copy without data.
+            Prediction requires `exog`. Residual based statistics are
+            available after attaching the data with
+            `GLMResults.restore_data`. Default is "full".
         atol : float, optional
             (available with IRLS fits) The absolute tolerance criterion that
             must be satisfied. Defaults to ``tol``. Convergence is attained
@@ -1160,6 +1277,10 @@ class GLM(base.LikelihoodModel):
             near-singular cases by truncating small singular values based
             on `rcond` of the respective numpy.linalg function. 'qr' is
             only valid for cases that are not singular nor near-singular.
+            If exog is a scipy.sparse matrix, then 'lstsq' solves the sparse
+            normal equations with a sparse LU factorization and 'cg' uses
+            preconditioned conjugate gradients warm started at the previous
+            IRLS estimate. 'pinv' and 'qr' are not available in this case.
         optim_hessian : {'eim', 'oim'}, optional
             (available with scipy optimizer fits) When 'oim'--the default--the
             observed Hessian is used in fitting. 'eim' is the expected Hessian.
@@ -1173,6 +1294,17 @@ class GLM(base.LikelihoodModel):
         in future versions. If attach_wls' is true, then the final WLS
         instance of the IRLS iteration is attached to the results instance
         as `results_wls` attribute.
+
+        exog can be a scipy.sparse matrix if missing is 'none'. IRLS then
+        works with the sparse design throughout and only forms the sparse
+        k x k matrix X'WX. The rank of a sparse exog is not checked, it is
+        assumed to have full column rank. The covariance of the parameters
+        is kept as the factorization of X'WX, and for the sandwich
+        covariances with cov_type 'HCx' and 'cluster' also as the sparse
+        scores, so that `bse` and `cov_params` with `column` or `r_matrix`
+        only solve for the required columns. Other cov_types and
+        `get_influence` are not available with a sparse exog. The
+        factorization is not pickled and is computed again when needed.
         """
         if isinstance(scale, str):
             scale = scale.lower()
@@ -1189,18 +1321,20 @@ class GLM(base.LikelihoodModel):
                     "scale must be a float if given and no a string."
                 )
         self.scaletype = scale
+        store = string_like(store, "store", options=("full", "minimal"))
 
         if method.lower() == "irls":
             if cov_type.lower() == 'eim':
                 cov_type = 'nonrobust'
-            return self._fit_irls(start_params=start_params, maxiter=maxiter,
+            fit_ = self._fit_irls(start_params=start_params, maxiter=maxiter,
                                   tol=tol, scale=scale, cov_type=cov_type,
                                   cov_kwds=cov_kwds, use_t=use_t, **kwargs)
         else:
             self._optim_hessian = kwargs.get('optim_hessian')
             if self._optim_hessian is not None:
                 del kwargs['optim_hessian']
-            self._tmp_like_exog = np.empty_like(self.exog, dtype=float)
+            if not sparse.issparse(self.exog):
+                self._tmp_like_exog = np.empty_like(self.exog, dtype=float)
             fit_ = self._fit_gradient(start_params=start_params,
                                       method=method,
                                       maxiter=maxiter,
@@ -1211,8 +1345,20 @@ class GLM(base.LikelihoodModel):
                                       max_start_irls=max_start_irls,
                                       **kwargs)
             del self._optim_hessian
-            del self._tmp_like_exog
-            return fit_
+            self.__dict__.pop('_tmp_like_exog', None)
+
+        if store == "minimal":
+            required = [key for key in ('offset', 'exposure')
+                        if hasattr(self, key)]
+            if self._has_freq_weights:
+                required.append('freq_weights')
+            if self._has_var_weights:
+                required.append('var_weights')
+            fit_._results._store_minimal(
+                keep=("deviance", "pearson_chi2", "llf", "aic", "bic_llf"),
+                extra_attr=["model.offset", "model.exposure", "results_wls"],
+                required=required)
+        return fit_
 
     def _fit_gradient(self, start_params=None, method="newton",
                       maxiter=100, tol=1e-8, full_output=True,
@@ -1299,12 +1445,16 @@ class GLM(base.LikelihoodModel):
 
         endog = self.endog
         wlsexog = self.exog
+        is_sparse = sparse.issparse(wlsexog)
+        if is_sparse and wls_method not in ('lstsq', 'cg'):
+            raise ValueError("wls_method must be 'lstsq' or 'cg' when exog "
+                             "is sparse")
         if start_params is None:
             start_params = np.zeros(self.exog.shape[1])
             mu = self.family.starting_mu(self.endog)
             lin_pred = self.family.predict(mu)
         else:
-            lin_pred = np.dot(wlsexog, start_params) + self._offset_exposure
+            lin_pred = wlsexog @ start_params + self._offset_exposure
             mu = self.family.fitted(lin_pred)
         self.scale = self.estimate_scale(mu)
         dev = self.family.deviance(self.endog, mu, self.var_weights,
@@ -1331,11 +1481,16 @@ class GLM(base.LikelihoodModel):
                             self.family.weights(mu))
             wlsendog = (lin_pred + self.family.link.deriv(mu) * (self.endog-mu)
                         - self._offset_exposure)
-            wls_mod = reg_tools._MinimalWLS(wlsendog, wlsexog,
-                                            self.weights, check_endog=True,
-                                            check_weights=True)
-            wls_results = wls_mod.fit(method=wls_method)
-            lin_pred = np.dot(self.exog, wls_results.params)
+            if is_sparse:
+                wls_results = _sparse_wls(wlsendog, wlsexog, self.weights,
+                                          method=wls_method,
+                                          start_params=history['params'][-1])
+            else:
+                wls_mod = reg_tools._MinimalWLS(wlsendog, wlsexog,
+                                                self.weights, check_endog=True,
+                                                check_weights=True)
+                wls_results = wls_mod.fit(method=wls_method)
+            lin_pred = self.exog @ wls_results.params
             lin_pred += self._offset_exposure
             mu = self.family.fitted(lin_pred)
             history = self._update_history(wls_results, mu, history)
@@ -1350,7 +1505,11 @@ class GLM(base.LikelihoodModel):
                 break
         self.mu = mu
 
-        if maxiter > 0:  # Only if iterative used
+        if maxiter > 0 and is_sparse:
+            # the inverse of X'WX is kept factorized, columns of it are only
+            # computed when the covariance is used
+            wls_results.normalized_cov_params = _sparse_wls_cov(wls_results)
+        elif maxiter > 0:  # Only if iterative used
             wls_method2 = 'pinv' if wls_method == 'lstsq' else wls_method
             wls_model = lm.WLS(wlsendog, wlsexog, self.weights)
             wls_results = wls_model.fit(method=wls_method2)
@@ -1692,6 +1851,9 @@ class GLMResults(base.LikelihoodModelResults):
             warnings.warn('cov_type not fully supported with var_weights',
                           SpecificationWarning)
 
+        if sparse.issparse(model.exog):
+            _check_sparse_cov_type(cov_type, cov_kwds)
+
         if cov_type == 'nonrobust':
             self.cov_type = 'nonrobust'
             self.cov_kwds = {'description': 'Standard Errors assume that the' +
@@ -1704,6 +1866,54 @@ class GLMResults(base.LikelihoodModelResults):
             get_robustcov_results(self, cov_type=cov_type, use_self=True,
                                   use_t=use_t, **cov_kwds)
 
+    def _sparse_cov_params(self, scale=None):
+        # covariance held by sparse factors for a sparse exog, or None
+        if hasattr(self, 'cov_params_default'):
+            cov = self.cov_params_default
+        else:
+            cov = self.normalized_cov_params
+            if isinstance(cov, _SparseCovariance):
+                cov = cov * (self.scale if scale is None else scale)
+        return cov if isinstance(cov, _SparseCovariance) else None
+
+    @Appender(base.LikelihoodModelResults.cov_params.__doc__)
+    def cov_params(self, r_matrix=None, column=None, scale=None, cov_p=None,
+                   other=None):
+        cov = self._sparse_cov_params(scale) if cov_p is None else None
+        if cov is None:
+            return super().cov_params(r_matrix=r_matrix, column=column,
+                                      scale=scale, cov_p=cov_p, other=other)
+        if column is not None and (r_matrix is not None or other is not None):
+            raise ValueError('Column should be specified without other '
+                             'arguments.')
+        if other is not None and r_matrix is None:
+            raise ValueError('other can only be specified with r_matrix')
+
+        # only the columns that are needed are solved for
+        if column is not None:
+            column = np.asarray(column)
+            cov_columns = cov.columns(column.ravel())
+            if column.shape == ():
+                return cov_columns[column, 0]
+            return cov_columns[column]
+        elif r_matrix is not None:
+            r_matrix = np.asarray(r_matrix)
+            if r_matrix.shape == ():
+                raise ValueError("r_matrix should be 1d or 2d")
+            other = r_matrix if other is None else np.asarray(other)
+            return np.dot(r_matrix, cov.dot(np.transpose(other)))
+        return cov.toarray()
+
+    @cached_value
+    def bse(self):
+        """The standard errors of the parameter estimates."""
+        cov = self._sparse_cov_params()
+        if cov is None:
+            return super().bse
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.sqrt(cov.diagonal())
+
     @cached_data
     def resid_response(self):
         """
@@ -2231,7 +2441,11 @@ class GLMResults(base.LikelihoodModelResults):
             or expected hessian.
         """
         weights = self.model.hessian_factor(self.params, observed=observed)
-        wexog = np.sqrt(weights)[:, None] * self.model.exog
+        exog = self.model.exog
+        if sparse.issparse(exog):
+            xtwx = exog.T @ exog.multiply(weights[:, None])
+            return weights * _SparseCovariance(xtwx).quad_form_rows(exog)
+        wexog = np.sqrt(weights)[:, None] * exog
 
         hd = (wexog * np.linalg.pinv(wexog).T).sum(1)
         return hd
@@ -2259,6 +2473,13 @@ class GLMResults(base.LikelihoodModelResults):
         """
         from statsmodels.stats.outliers_influence import GLMInfluence
 
+        if sparse.issparse(self.model.exog):
+            raise NotImplementedError('get_influence is not available with a '
+                                      'sparse exog, the influence measures '
+                                      'use dense nobs x k arrays. The hat '
+                                      'matrix diagonal is available from '
+                                      'get_hat_matrix_diag.')
+
         weights = self.model.hessian_factor(self.params, observed=observed)
         weights_sqrt = np.sqrt(weights)
         wexog = weights_sqrt[:, None] * self.model.exog
@@ -2433,6 +2654,17 @@ class GLMResults(base.LikelihoodModelResults):
         self._iweights = None
         self._n_trials = None
 
+    def _restore_data(self):
+        model = self.model
+        self._endog = model.endog
+        self._freq_weights = model.freq_weights
+        self._var_weights = model.var_weights
+        self._iweights = model.iweights
+        if isinstance(self.family, families.Binomial):
+            self._n_trials = model.n_trials
+        else:
+            self._n_trials = 1
+
     @Appender(_plot_added_variable_doc % {'extra_params_doc': ''})
     def plot_added_variable(self, focus_exog, resid_type=None,
                             use_glm_weights=True, fit_kwargs=None,
@@ -2267,3 +2267,117 @@ def test_stationary_covsolve():
                                            sd, [z])
 
             assert_allclose(z1, z2[0], rtol=1e-5, atol=1e-5)
+
+
+@pytest.mark.parametrize("cs", [cov_struct.Independence(),
+                                cov_struct.Exchangeable(),
+                                cov_struct.Autoregressive(grid=True),
+                                cov_struct.Stationary(max_lag=2, grid=True)])
+@pytest.mark.parametrize("k", [1, 2, 5])
+def test_covsolve_batch(cs, k):
+
+    np.random.seed(3242)
+    m = 6
+    if isinstance(cs, cov_struct.Stationary):
+        if k <= cs.max_lag:
+            pytest.skip("Stationary requires clusters longer than max_lag")
+        cs.dep_params = np.r_[1, 0.4, 0.1]
+    else:
+        cs.dep_params = 0.3
+    expval = np.zeros((m, k))
+    sd = np.random.uniform(0.5, 2, size=(m, k))
+    rhs = [np.random.normal(size=(m, k)), np.random.normal(size=(m, k, 3))]
+    index = np.arange(m)
+
+    soln = cs.covariance_matrix_solve_batch(expval, index, sd, rhs)
+    for j in range(m):
+        desired = cov_struct.CovStruct.covariance_matrix_solve(
+            cs, expval[j], j, sd[j], [x[j] for x in rhs])
+        for x, y in zip(soln, desired):
+            assert_allclose(x[j], y, rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize("cs", ["independence", "exchangeable",
+                                "autoregressive", "stationary", "weights"])
+def test_fit_blocks(cs, monkeypatch):
+    # Clusters processed in blocks of equal size agree with the
+    # cluster by cluster computations
+
+    np.random.seed(4361)
+    sizes = np.random.randint(1, 7, 300)
+    groups = np.repeat(np.arange(300), sizes)
+    n = len(groups)
+    time = np.concatenate([np.sort(np.random.choice(8, s, replace=False))
+                           for s in sizes])
+    exog = np.c_[np.ones(n), np.random.normal(size=(n, 2))]
+    u = np.random.normal(size=300)[groups]
+    endog = np.random.poisson(np.exp(0.3 * exog[:, 1] + 0.5 * u))
+    offset = np.random.uniform(-0.2, 0.2, n)
+    weights = None
+    if cs == "independence":
+        cov = cov_struct.Independence
+    elif cs == "exchangeable":
+        cov = cov_struct.Exchangeable
+    elif cs == "autoregressive":
+        def cov():
+            return cov_struct.Autoregressive(grid=True)
+    elif cs == "stationary":
+        def cov():
+            return cov_struct.Stationary(max_lag=2, grid=False)
+    else:
+        cov = cov_struct.Exchangeable
+        weights = np.random.uniform(1, 2, 300)[groups]
+
+    def fit(**kwargs):
+        model = gee.GEE(endog, exog, groups, time=time,
+                        family=families.Poisson(), cov_struct=cov(),
+                        offset=offset, weights=weights)
+        return model.fit(**kwargs)
+
+    result = fit(cov_type="bias_reduced" if weights is None else "robust",
+                 n_jobs=2)
+    score = result.model.compare_score_test(
+        gee.GEE(endog, exog[:, :2], groups, time=time,
+                family=families.Poisson(), cov_struct=cov(), offset=offset,
+                weights=weights).fit())
+
+    monkeypatch.setattr(gee.GEE, "_use_blocks", lambda self: False)
+    desired = fit(cov_type="bias_reduced" if weights is None else "robust")
+    desired_score = desired.model.compare_score_test(
+        gee.GEE(endog, exog[:, :2], groups, time=time,
+                family=families.Poisson(), cov_struct=cov(), offset=offset,
+                weights=weights).fit())
+
+    assert_allclose(result.params, desired.params, rtol=1e-8)
+    assert_allclose(result.cov_params(), desired.cov_params(), rtol=1e-8)
+    assert_allclose(result.cov_naive, desired.cov_naive, rtol=1e-8)
+    if cs != "independence":
+        assert_allclose(result.cov_struct.dep_params,
+                        desired.cov_struct.dep_params, rtol=1e-8)
+    assert_allclose(score["statistic"], desired_score["statistic"],
+                    rtol=1e-8)
+
+
+def test_cached_means_blocks_empty_cluster():
+    # The blocked means have one entry per cluster, in order, when a
+    # cluster has no observations
+
+    np.random.seed(8231)
+    groups = np.repeat(np.arange(6), [3, 2, 3, 4, 2, 3])
+    n = len(groups)
+    exog = np.c_[np.ones(n), np.random.normal(size=n)]
+    endog = np.random.poisson(1, n)
+    offset = np.random.uniform(-0.2, 0.2, n)
+    model = gee.GEE(endog, exog, groups, family=families.Poisson(),
+                    offset=offset)
+    model.endog_li[1] = model.endog_li[1][:0]
+    model.exog_li[1] = model.exog_li[1][:0]
+    model.offset_li[1] = model.offset_li[1][:0]
+
+    params = np.r_[0.2, -0.3]
+    model.update_cached_means(params)
+    assert len(model.cached_means) == model.num_group
+    for i, (expval, lpr) in enumerate(model.cached_means):
+        desired = np.dot(model.exog_li[i], params) + model.offset_li[i]
+        assert_allclose(lpr, desired)
+        assert_allclose(expval, np.exp(desired))
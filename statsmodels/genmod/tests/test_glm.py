@@ -3126,3 +3126,173 @@ def test_glm_summary2_method():
     res_g1 = mod.fit(start_params=res1.params, method="bfgs")
     summ = res_g1.summary2()
     assert re.compile(r"Method:\s+bfgs").findall(str(summ))
+
+
+@pytest.mark.parametrize("family", [sm.families.Poisson(),
+                                    sm.families.Binomial(),
+                                    sm.families.Gaussian()])
+@pytest.mark.parametrize("wls_method", ["lstsq", "cg"])
+def test_glm_sparse_exog(family, wls_method):
+    from scipy import sparse
+
+    rs = np.random.RandomState(987125)
+    nobs, n_groups = 600, 30
+    groups = rs.randint(0, n_groups, nobs)
+    x = rs.standard_normal(nobs)
+    dummies = np.eye(n_groups)[groups][:, 1:]
+    exog = np.column_stack([np.ones(nobs), x, dummies])
+    linpred = 0.1 + 0.5 * x + 0.05 * (groups % 5)
+    if isinstance(family, sm.families.Binomial):
+        endog = (rs.uniform(size=nobs) < 1 / (1 + np.exp(-linpred)))
+        endog = endog.astype(float)
+    elif isinstance(family, sm.families.Poisson):
+        endog = rs.poisson(np.exp(linpred))
+    else:
+        endog = linpred + rs.standard_normal(nobs)
+    offset = rs.uniform(-0.1, 0.1, size=nobs)
+    kwds = {"offset": offset}
+
+    res = GLM(endog, exog, family=family, **kwds).fit()
+    mod_sp = GLM(endog, sparse.csr_matrix(exog), family=family, **kwds)
+    res_sp = mod_sp.fit(wls_method=wls_method)
+    assert sparse.issparse(mod_sp.exog)
+    assert mod_sp.exog_names == res.model.exog_names
+    rtol = 1e-6 if wls_method == "cg" else 1e-10
+    assert_allclose(res_sp.params, res.params, rtol=rtol, atol=1e-8)
+    assert_allclose(res_sp.bse, res.bse, rtol=rtol)
+    assert_allclose(res_sp.llf, res.llf, rtol=1e-10)
+    assert_allclose(res_sp.df_model, res.df_model)
+    assert_allclose(res_sp.predict(sparse.csr_matrix(exog[:5])),
+                    res.predict(exog[:5]), rtol=rtol)
+
+    res_hc = mod_sp.fit(cov_type="HC0")
+    res_hc_d = GLM(endog, exog, family=family, **kwds).fit(cov_type="HC0")
+    assert_allclose(res_hc.bse, res_hc_d.bse, rtol=1e-8)
+    assert_allclose(res_hc.cov_params(), res_hc_d.cov_params(), rtol=1e-8,
+                    atol=1e-14)
+    assert_allclose(res_hc.cov_params(column=[1, 3]),
+                    res_hc_d.cov_params(column=[1, 3]), rtol=1e-8)
+
+    cov_kwds = {"groups": groups % 20}
+    res_cl = mod_sp.fit(cov_type="cluster", cov_kwds=cov_kwds)
+    res_cl_d = GLM(endog, exog, family=family, **kwds).fit(
+        cov_type="cluster", cov_kwds=cov_kwds)
+    assert_allclose(res_cl.bse, res_cl_d.bse, rtol=1e-8)
+    r_matrix = np.zeros((2, exog.shape[1]))
+    r_matrix[0, 1] = r_matrix[1, 2] = 1
+    assert_allclose(res_cl.cov_params(r_matrix=r_matrix),
+                    res_cl_d.cov_params(r_matrix=r_matrix), rtol=1e-8)
+    with pytest.raises(NotImplementedError, match="sparse"):
+        mod_sp.fit(cov_type="HAC", cov_kwds={"maxlags": 2})
+
+    # gradient optimizers use the sparse score and hessian
+    res_nt = mod_sp.fit(method="newton", start_params=res.params)
+    assert_allclose(res_nt.params, res.params, rtol=1e-6, atol=1e-8)
+
+    with pytest.raises(ValueError, match="sparse"):
+        mod_sp.fit(wls_method="qr")
+
+
+def test_glm_sparse_exog_results():
+    from io import BytesIO
+    import pickle
+
+    from scipy import sparse
+
+    from statsmodels.genmod.generalized_linear_model import GLMResults
+
+    rs = np.random.RandomState(0)
+    nobs = 300
+    exog = add_constant(rs.standard_normal((nobs, 3)))
+    endog = rs.poisson(np.exp(exog @ [0.1, 0.2, -0.1, 0.3]))
+    family = sm.families.Poisson()
+    res = GLM(endog, exog, family=family).fit()
+    mod_sp = GLM(endog, sparse.csr_matrix(exog), family=family)
+    res_sp = mod_sp.fit()
+
+    # the sparse LU factorization is computed again after unpickling
+    res_pkl = pickle.loads(pickle.dumps(res_sp))
+    assert_allclose(res_pkl.bse, res.bse, rtol=1e-10)
+    assert_allclose(res_pkl.cov_params(column=[1, 2]),
+                    res.cov_params(column=[1, 2]), rtol=1e-10)
+    fh = BytesIO()
+    res_sp.save(fh)
+    fh.seek(0)
+    assert_allclose(GLMResults.load(fh).bse, res.bse, rtol=1e-10)
+
+    for which in [None, "mean", "linear"]:
+        pred = res.get_prediction(which=which).summary_frame()
+        pred_sp = res_sp.get_prediction(which=which).summary_frame()
+        assert_allclose(pred_sp, pred, rtol=1e-8)
+    pred = res.get_prediction(exog[:5]).summary_frame()
+    pred_sp = res_sp.get_prediction(sparse.csr_matrix(exog[:5]))
+    assert_allclose(pred_sp.summary_frame(), pred, rtol=1e-8)
+    res_hc = mod_sp.fit(cov_type="HC0")
+    assert_allclose(res_hc.get_prediction().se_mean,
+                    GLM(endog, exog, family=family).fit(
+                        cov_type="HC0").get_prediction().se_mean, rtol=1e-8)
+
+    assert_allclose(res_sp.get_hat_matrix_diag(), res.get_hat_matrix_diag(),
+                    rtol=1e-8)
+    with pytest.raises(NotImplementedError, match="sparse exog"):
+        res_sp.get_influence()
+    with pytest.raises(NotImplementedError, match="'HAC' is not available"):
+        mod_sp.fit(cov_type="HAC", cov_kwds={"maxlags": 2})
+
+
+def test_glm_sparse_exog_large_k():
+    # X'WX is diagonal for a one-hot exog without constant, a dense k x k
+    # covariance would need 180 GB
+    from scipy import sparse
+
+    rs = np.random.RandomState(0)
+    k, nobs = 150000, 450000
+    groups = np.arange(nobs) % k
+    exog = sparse.csr_matrix((np.ones(nobs), (np.arange(nobs), groups)),
+                             shape=(nobs, k))
+    endog = rs.poisson(2., size=nobs) + 0.5
+    res = GLM(endog, exog, family=sm.families.Poisson()).fit()
+
+    mean = np.bincount(groups, weights=endog) / np.bincount(groups)
+    assert_allclose(res.params, np.log(mean), rtol=1e-8)
+    # var(log(mean)) = 1 / (n_i * mean)
+    idx = [0, 5, k - 1]
+    cov = res.cov_params(column=idx)
+    assert cov.shape == (3, 3)
+    assert_allclose(np.diag(cov), 1 / (3 * mean[idx]), rtol=1e-8)
+    assert_allclose(cov - np.diag(np.diag(cov)), 0, atol=1e-14)
+    assert_allclose(res.cov_params(column=5), 1 / (3 * mean[5]), rtol=1e-8)
+
+    res_hc = GLM(endog, exog, family=sm.families.Poisson()).fit(
+        cov_type="HC0")
+    resid2 = (endog - mean[groups]) ** 2
+    meat = np.bincount(groups, weights=resid2)
+    assert_allclose(res_hc.cov_params(column=idx)[[0, 1, 2], [0, 1, 2]],
+                    meat[idx] / (3 * mean[idx]) ** 2, rtol=1e-8)
+
+
+def test_glm_store_minimal():
+    rs = np.random.RandomState(0)
+    x = add_constant(rs.standard_normal((300, 3)))
+    exposure = rs.uniform(1, 3, 300)
+    y = rs.poisson(exposure * np.exp(x @ [0.1, 0.2, -0.2, 0.3]))
+    model = GLM(y, x, family=sm.families.Poisson(), exposure=exposure)
+    res = model.fit()
+    res_min = model.fit(store="minimal")
+    assert res_min.model.exog is None
+    assert res_min.model.exposure is None
+    assert model.exog is not None
+    assert res_min.mu is None
+    for attr in ["params", "bse", "deviance", "pearson_chi2", "llf", "aic",
+                 "bic_llf"]:
+        assert_allclose(getattr(res_min, attr), getattr(res, attr),
+                        err_msg=attr)
+    assert_allclose(res_min.predict(x[:5], exposure=exposure[:5]),
+                    res.predict(x[:5], exposure=exposure[:5]))
+
+    with pytest.raises(ValueError, match="exposure"):
+        res_min.restore_data(y, x)
+    res_min.restore_data(y, x, exposure=exposure)
+    assert_allclose(res_min.resid_deviance, res.resid_deviance)
+    assert_allclose(res_min.fittedvalues, res.fittedvalues)
+    assert_allclose(res_min.llnull, res.llnull)
@@ -3,8 +3,13 @@ from .table import SimpleTable, csv2st
 from .smpickle import save_pickle, load_pickle
 
 from statsmodels.tools._test_runner import PytestTester
+from statsmodels.tools._lazy import lazy_submodules
 
 __all__ = ['test', 'csv2st', 'SimpleTable', 'savetxt',
            'save_pickle', 'load_pickle']
 
 test = PytestTester()
+
+# Submodules are imported on first access, e.g. through statsmodels.api
+__getattr__ = lazy_submodules(__name__)
+del lazy_submodules
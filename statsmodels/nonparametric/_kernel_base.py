@@ -246,6 +246,22 @@ class GenericKDE :
         self.efficient = defaults.efficient
         self.return_only_bw = defaults.return_only_bw
         self.n_jobs = defaults.n_jobs
+        self.approx = defaults.approx
+        self.approx_tol = defaults.approx_tol
+        self.block_size = defaults.block_size
+
+    def _kernel_engine(self, data, var_type, bw, values=None, approx=True,
+                       **kwargs):
+        """
+        Returns the engine that evaluates the kernel sums over `data`.
+
+        If `approx` is False, the approximation in the settings is not used.
+        """
+        from ._kernel_engine import KernelEngine
+        return KernelEngine(data, var_type, bw, values=values,
+                            approx=self.approx if approx else None,
+                            tol=self.approx_tol, block_size=self.block_size,
+                            **kwargs)
 
     def _normal_reference(self):
         """
@@ -376,6 +392,20 @@ class EstimatorSettings:
         ``n_cores`` the number of available CPU cores.
         See the `joblib documentation
         <https://joblib.readthedocs.io/en/latest/generated/joblib.Parallel.html>`_ for more details.
+    approx : {None, "tree", "binned"}, optional
+        Approximation of the kernel sums over the training data for the
+        Gaussian kernel of the continuous variables. "tree" only uses the
+        training points that are close to the prediction points, found with
+        a KD-tree. "binned" replaces the training data by linearly binned
+        data on a grid, and is available for up to 3 continuous variables.
+        Default is None, which uses all training points.
+    approx_tol : float, optional
+        The bound on the error of each term of an approximated kernel sum,
+        relative to the peak of the continuous product kernel. Default is
+        1e-4.
+    block_size : int, optional
+        The maximum number of kernel values that are computed at once.
+        Larger blocks are faster but need more memory. Default is 2**20.
 
     Examples
     --------
@@ -383,7 +413,8 @@ class EstimatorSettings:
     >>> k_dens = KDEMultivariate(data, var_type, defaults=settings)
     """
     def __init__(self, efficient=False, randomize=False, n_res=25, n_sub=50,
-                 return_median=True, return_only_bw=False, n_jobs=-1):
+                 return_median=True, return_only_bw=False, n_jobs=-1,
+                 approx=None, approx_tol=1e-4, block_size=None):
         self.efficient = efficient
         self.randomize = randomize
         self.n_res = n_res
@@ -391,6 +422,9 @@ class EstimatorSettings:
         self.return_median = return_median
         self.return_only_bw = return_only_bw  # TODO: remove this?
         self.n_jobs = n_jobs
+        self.approx = approx
+        self.approx_tol = approx_tol
+        self.block_size = block_size
 
 
 class LeaveOneOut:
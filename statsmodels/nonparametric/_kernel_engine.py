@@ -0,0 +1,445 @@
+"""
+Blocked evaluation of generalized product kernels
+
+The kernel sums of `KDEMultivariate`, `KDEMultivariateConditional` and
+`KernelReg` are computed for blocks of prediction points at once, instead of
+one prediction point at a time.  Sums over the training data with a
+continuous Gaussian kernel can be approximated with a bounded error, either
+by restricting each block to the training points found with a KD-tree or by
+replacing the training data with linearly binned data.
+"""
+import numpy as np
+from scipy import spatial
+
+from ._kernel_base import kernel_func
+
+# Maximum number of kernel values in a block
+BLOCK_SIZE = 2 ** 20
+# Number of prediction points in a block of the tree approximation
+TREE_ROWS = 128
+
+
+def _wang_ryzin(h, Xi, x, levels=None):
+    kernel_value = 0.5 * (1 - h) * (h ** np.abs(Xi - x))
+    return np.where(Xi == x, 1 - h, kernel_value)
+
+
+def _aitchison_aitken(h, Xi, x, levels):
+    return np.where(Xi == x, 1 - h, h / (levels.size - 1))
+
+
+def _aitchison_aitken_reg(h, Xi, x, levels=None):
+    return np.where(Xi == x, 1., h)
+
+
+def _wang_ryzin_cdf(h, Xi, x, levels):
+    mask = (levels <= x).astype(np.double)
+    return mask @ _wang_ryzin(h, Xi, levels[:, None])
+
+
+def _aitchison_aitken_cdf(h, Xi, x, levels):
+    mask = (levels <= np.trunc(x)).astype(np.double)
+    return mask @ _aitchison_aitken(h, Xi, levels[:, None], levels)
+
+
+def _wang_ryzin_convolution(h, Xi, x, levels):
+    return _wang_ryzin(h, x, levels) @ _wang_ryzin(h, Xi, levels[:, None])
+
+
+def _aitchison_aitken_convolution(h, Xi, x, levels):
+    return (_aitchison_aitken(h, x, levels, levels) @
+            _aitchison_aitken(h, Xi, levels[:, None], levels))
+
+
+# Versions of the kernels in ``kernel_func`` that broadcast the training
+# data against the prediction points. The remaining kernels already do.
+_discrete_kernels = dict(
+    wangryzin=_wang_ryzin,
+    aitchisonaitken=_aitchison_aitken,
+    aitchison_aitken_reg=_aitchison_aitken_reg,
+    wangryzin_cdf=_wang_ryzin_cdf,
+    aitchisonaitken_cdf=_aitchison_aitken_cdf,
+    wangryzin_convolution=_wang_ryzin_convolution,
+    aitchisonaitken_convolution=_aitchison_aitken_convolution,
+)
+
+# Continuous kernels that can be used with an approximation, and the width
+# of the kernel relative to the bandwidth.
+_approx_kernels = dict(gaussian=1., gauss_convolution=np.sqrt(2))
+
+
+def _evaluate(kertype, h, Xi, x, levels):
+    if kertype in _discrete_kernels:
+        return _discrete_kernels[kertype](h, Xi, x, levels)
+    return kernel_func[kertype](h, Xi, x)
+
+
+class _Block:
+    """
+    A block of prediction points and training points
+
+    Attributes
+    ----------
+    rows : {slice, ndarray}
+        The position of the prediction points.
+    predict : ndarray
+        The prediction points, (m, k_vars).
+    data : ndarray
+        The training points, (n, k_vars). Bin centers if binned.
+    weights : {ndarray, None}
+        The weight of each training point, None if all are one.
+    values : {ndarray, None}
+        The values attached to the training points, (n, p). The weighted
+        sum of the values in a bin if binned.
+    index : {ndarray, None}
+        The sorted positions of the training points in the data, None if
+        the block contains all training points or bins.
+    """
+
+    def __init__(self, rows, predict, data, weights, values, index=None):
+        self.rows = rows
+        self.predict = predict
+        self.data = data
+        self.weights = weights
+        self.values = values
+        self.index = index
+
+    def weighted(self, kernel):
+        """Multiply the kernel values by the weights of the training points"""
+        if self.weights is None:
+            return kernel
+        return kernel * self.weights
+
+
+class KernelEngine:
+    """
+    Blocks of generalized product kernel values
+
+    Parameters
+    ----------
+    data : ndarray
+        The training data, (nobs, k_vars).
+    var_type : str
+        The type of the variables (continuous, ordered, unordered).
+    bw : ndarray
+        The bandwidths of the variables.
+    values : ndarray, optional
+        Values attached to the training points, (nobs, p), for example the
+        dependent variable of a regression.
+    approx : {None, "tree", "binned"}, optional
+        The approximation of the sums over the training data. If None, all
+        training points are used.
+    tol : float, optional
+        The tolerance of the approximation, relative to the peak of the
+        continuous product kernel.
+    block_size : int, optional
+        The maximum number of kernel values in a block.
+    ckertype : str, optional
+        The continuous kernel that is approximated, "gaussian" or
+        "gauss_convolution".
+    cols : array_like, optional
+        The variables that define the neighbourhood of a prediction point in
+        the tree approximation. Kernel sums are only approximated over
+        kernels that include all these variables. Default is all variables.
+
+    Notes
+    -----
+    The tree approximation drops the training points whose scaled distance
+    to the prediction points in the continuous variables exceeds
+    ``sqrt(-2 * log(tol))``. The binned approximation replaces the training
+    points by the vertices of a grid with spacing
+    ``bw * sqrt(8 * tol / k_cont)`` in the continuous variables, using
+    linear binning. In both cases, the error of each term of the kernel sum
+    is less than ``tol`` times the peak of the continuous product kernel,
+    since the discrete kernels are bounded by one.
+    """
+
+    def __init__(self, data, var_type, bw, values=None, approx=None,
+                 tol=1e-4, block_size=None, ckertype='gaussian', cols=None):
+        self.data = data
+        self.var_type = var_type
+        self.bw = np.asarray(bw, dtype=np.double)
+        self.block_size = BLOCK_SIZE if block_size is None else block_size
+        self.levels = [None if vtype == 'c' else np.unique(data[:, ii])
+                       for ii, vtype in enumerate(var_type)]
+        self.approx = approx
+        self.ckertype = ckertype
+        if approx is None:
+            self._data, self._weights, self._values = data, None, values
+            return
+
+        if approx not in ('tree', 'binned'):
+            raise ValueError('approx must be None, "tree" or "binned".')
+        if ckertype not in _approx_kernels:
+            raise ValueError('Approximations are only available for the '
+                             'Gaussian kernel.')
+        if not 0 < tol < 1:
+            raise ValueError('The approximation tolerance must be in (0, 1).')
+        cols = np.arange(len(var_type)) if cols is None else np.asarray(cols)
+        cont = np.array([ii for ii in cols if var_type[ii] == 'c'], dtype=int)
+        if cont.size == 0:
+            raise ValueError('Approximations require at least one continuous '
+                             'variable.')
+        width = _approx_kernels[ckertype] * self.bw
+        if approx == 'tree':
+            self._cont = cont
+            self._scale = width[cont]
+            self._tree = spatial.cKDTree(data[:, cont] / self._scale)
+            self._radius = np.sqrt(-2 * np.log(tol))
+            self._data, self._weights, self._values = data, None, values
+        else:
+            cont = np.array([ii for ii, vtype in enumerate(var_type)
+                             if vtype == 'c'])
+            if cont.size > 3:
+                raise ValueError('The binned approximation is only available '
+                                 'for up to 3 continuous variables.')
+            spacing = width[cont] * np.sqrt(8 * tol / cont.size)
+            self._bin(cont, spacing, values)
+
+    def _bin(self, cont, spacing, values):
+        # Linear binning in the continuous variables; the discrete variables
+        # are kept as they are.
+        data = self.data
+        k_cont = cont.size
+        origin = data[:, cont].min(0)
+        grid = (data[:, cont] - origin) / spacing
+        lower = np.floor(grid)
+        frac = grid - lower
+
+        keys = []
+        weights = []
+        for corner in np.ndindex(*(2,) * k_cont):
+            corner = np.array(corner)
+            key = data.copy()
+            key[:, cont] = lower + corner
+            keys.append(key)
+            weights.append(np.prod(np.where(corner, frac, 1 - frac), axis=1))
+        # The vertices of each observation, used for its self-contribution
+        self._vertices = [(key.copy(), weight)
+                          for key, weight in zip(keys, weights)]
+        for key, _ in self._vertices:
+            key[:, cont] = origin + key[:, cont] * spacing
+        keys = np.concatenate(keys)
+        weights = np.concatenate(weights)
+        keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        nbins = keys.shape[0]
+        # The bins of the vertices of each observation
+        self._vertex_bins = inverse.reshape(2 ** k_cont, -1)
+
+        keys[:, cont] = origin + keys[:, cont] * spacing
+        self._data = keys
+        self._weights = np.bincount(inverse, weights=weights,
+                                    minlength=nbins)
+        self._values = None
+        if values is not None:
+            values = np.tile(values, (2 ** k_cont, 1))
+            self._values = np.column_stack([
+                np.bincount(inverse, weights=weights * col, minlength=nbins)
+                for col in values.T])
+
+    def blocks(self, data_predict):
+        """
+        Iterate over blocks of prediction points and training points
+
+        Parameters
+        ----------
+        data_predict : ndarray
+            The prediction points, (m, k_vars).
+
+        Yields
+        ------
+        _Block
+            The blocks. Kernel sums are the sums over the blocks.
+        """
+        if self.approx == 'tree':
+            yield from self._tree_blocks(data_predict)
+            return
+        nobs = self._data.shape[0]
+        step = max(1, self.block_size // max(nobs, 1))
+        for start in range(0, data_predict.shape[0], step):
+            rows = slice(start, start + step)
+            yield _Block(rows, data_predict[rows], self._data,
+                         self._weights, self._values)
+
+    def _tree_blocks(self, data_predict):
+        scaled = data_predict[:, self._cont] / self._scale
+        order = spatial.cKDTree(scaled).indices
+        for start in range(0, order.size, TREE_ROWS):
+            rows = order[start:start + TREE_ROWS]
+            points = scaled[rows]
+            center = (points.max(0) + points.min(0)) / 2
+            reach = np.sqrt(((points - center) ** 2).sum(1).max())
+            near = self._tree.query_ball_point(center, reach + self._radius)
+            near = np.sort(np.asarray(near, dtype=np.intp))
+            step = max(1, self.block_size // rows.size)
+            for col in range(0, near.size, step):
+                idx = near[col:col + step]
+                values = None if self._values is None else self._values[idx]
+                yield _Block(rows, data_predict[rows], self._data[idx], None,
+                             values, index=idx)
+
+    def _check_kernel(self, ckertype, cols):
+        if self.approx is None or ckertype in (self.ckertype, 'd_gaussian'):
+            return
+        if any(self.var_type[ii] == 'c' for ii in cols):
+            raise ValueError('The continuous kernel %s cannot be used with '
+                             'the approximation of the %s kernel.'
+                             % (ckertype, self.ckertype))
+
+    def kernel(self, block, ckertype='gaussian', okertype='wangryzin',
+               ukertype='aitchisonaitken', cols=None):
+        """
+        Product kernel values of a block, as in ``gpke(..., tosum=False)``
+
+        Parameters
+        ----------
+        block : _Block
+            The block.
+        ckertype, okertype, ukertype : str, optional
+            The kernels of the continuous, ordered and unordered variables.
+        cols : array_like, optional
+            The variables included in the product. Default is all variables.
+
+        Returns
+        -------
+        ndarray
+            The kernel values with shape (m, n), divided by the product of
+            the bandwidths of the continuous variables.
+        """
+        cols = range(len(self.var_type)) if cols is None else cols
+        self._check_kernel(ckertype, cols)
+        kertypes = dict(c=ckertype, o=okertype, u=ukertype)
+        kernel = None
+        scale = 1.
+        for ii in cols:
+            vtype = self.var_type[ii]
+            value = _evaluate(kertypes[vtype], self.bw[ii],
+                              block.data[None, :, ii],
+                              block.predict[:, ii, None], self.levels[ii])
+            kernel = value if kernel is None else kernel * value
+            if vtype == 'c':
+                scale *= self.bw[ii]
+        return kernel / scale
+
+    def kernel_sum(self, data_predict, ckertype='gaussian',
+                   okertype='wangryzin', ukertype='aitchisonaitken',
+                   cols=None):
+        """
+        Sum of the product kernel values over the training data
+
+        Equivalent to ``gpke(bw, data, data_predict[i], ...)`` for each row
+        ``i`` of `data_predict`.
+        """
+        out = np.zeros(data_predict.shape[0])
+        for block in self.blocks(data_predict):
+            kernel = self.kernel(block, ckertype, okertype, ukertype, cols)
+            out[block.rows] += block.weighted(kernel).sum(1)
+        return out
+
+    def exclude_self(self, block, kernel):
+        """
+        Set the kernel values of the training points with themselves to zero
+
+        The prediction points of `block` have to be the training data, as in
+        ``blocks(data)``. Not available if the data are binned, see
+        `kernel_diag`. `kernel` is modified in place and returned.
+        """
+        if self.approx == 'binned':
+            raise ValueError('The binned training points do not contain '
+                             'the observations.')
+        rows = np.arange(self.data.shape[0])[block.rows]
+        if block.index is None:
+            kernel[np.arange(rows.size), rows] = 0
+            return kernel
+        pos = np.searchsorted(block.index, rows)
+        found = pos < block.index.size
+        found[found] &= block.index[pos[found]] == rows[found]
+        kernel[np.flatnonzero(found), pos[found]] = 0
+        return kernel
+
+    def kernel_diag(self, ckertype='gaussian', okertype='wangryzin',
+                    ukertype='aitchisonaitken', cols=None):
+        """
+        The product kernel of each training point with itself
+
+        This is the contribution of a training point to the kernel sum at
+        the same point. If the data are binned, it is the contribution of
+        the binned training point, which leave-one-out estimators remove
+        from the binned sums.
+        """
+        return sum(value for value, _ in self.kernel_diag_terms(
+            ckertype, okertype, ukertype, cols))
+
+    def kernel_diag_terms(self, ckertype='gaussian', okertype='wangryzin',
+                          ukertype='aitchisonaitken', cols=None):
+        """
+        The terms of `kernel_diag`, one for each vertex of the binning
+
+        Returns
+        -------
+        list of (ndarray, ndarray)
+            The weighted kernel values, (nobs,), and the differences of the
+            training points that contribute them to the observations,
+            (nobs, k_vars). Without binning, this is the kernel of each
+            observation with itself and a zero difference.
+        """
+        if self.approx == 'binned':
+            vertices = self._vertices
+        else:
+            vertices = [(self.data, None)]
+        data = self.data
+        cols = range(len(self.var_type)) if cols is None else cols
+        kertypes = dict(c=ckertype, o=okertype, u=ukertype)
+        scale = np.prod([self.bw[ii] for ii in cols
+                         if self.var_type[ii] == 'c'])
+        terms = []
+        for vertex, weight in vertices:
+            value = np.ones(data.shape[0]) if weight is None else weight
+            for ii in cols:
+                value = value * _evaluate(kertypes[self.var_type[ii]],
+                                          self.bw[ii], vertex[:, ii],
+                                          data[:, ii], self.levels[ii])
+            terms.append((value / scale, vertex - data))
+        return terms
+
+    def loo_kernel_sum(self, ckertype='gaussian', okertype='wangryzin',
+                       ukertype='aitchisonaitken', cols=None):
+        """
+        Leave-one-out sums of the product kernel values at the training data
+
+        The kernel value of each training point with itself is set to zero
+        in each block, so that small sums do not lose precision as they
+        would if the diagonal was subtracted from the full sums. If the data
+        are binned, the sums are evaluated at the bin centers and linearly
+        interpolated to the training points, so that the cost depends on the
+        number of bins instead of the number of observations.
+        """
+        kertypes = dict(ckertype=ckertype, okertype=okertype,
+                        ukertype=ukertype, cols=cols)
+        if self.approx != 'binned':
+            out = np.zeros(self.data.shape[0])
+            for block in self.blocks(self.data):
+                kernel = self.exclude_self(block,
+                                           self.kernel(block, **kertypes))
+                out[block.rows] += kernel.sum(1)
+            return out
+
+        bin_sum = self.kernel_sum(self._data, **kertypes)
+        out = np.zeros(self.data.shape[0])
+        for (_, weight), bins in zip(self._vertices, self._vertex_bins):
+            out += weight * bin_sum[bins]
+        # Remove the binned observation from its interpolated sum
+        cols = range(len(self.var_type)) if cols is None else cols
+        types = dict(c=ckertype, o=okertype, u=ukertype)
+        scale = np.prod([self.bw[ii] for ii in cols
+                         if self.var_type[ii] == 'c'])
+        for vertex, weight in self._vertices:
+            for other, other_weight in self._vertices:
+                value = weight * other_weight
+                for ii in cols:
+                    value = value * _evaluate(types[self.var_type[ii]],
+                                              self.bw[ii], other[:, ii],
+                                              vertex[:, ii], self.levels[ii])
+                out -= value / scale
+        return out
@@ -138,28 +138,147 @@ def lowess(np.ndarray[DTYPE_t, ndim = 1] endog,
 
     """
     cdef:
-        Py_ssize_t j
-        int k
-        Py_ssize_t robiter, i, left_end, right_end
-        np.npy_intp n, out_n, last_fit_i
+        np.npy_intp n, out_n
         np.ndarray[DTYPE_t, ndim = 1] x, y
-        np.ndarray[DTYPE_t, ndim = 1] y_fit
-        np.ndarray[DTYPE_t, ndim = 1] weights
-        DTYPE_t xval, radius
-
-    y = endog   # now just alias
-    x = exog
-
+        np.ndarray[DTYPE_t, ndim = 1] y_fit, weights, work
+        double *x_data
+        double *y_data
+        double *xvals_data
+        double *y_fit_data
+        double *resid_data
+        double *weights_data
+        double *work_data
 
     if not 0 <= frac <= 1:
            raise ValueError("Lowess `frac` must be in the range [0,1]!")
 
+    x = np.ascontiguousarray(exog)
+    y = np.ascontiguousarray(endog)
+    xvals = np.ascontiguousarray(xvals)
+    resid_weights = np.array(resid_weights, dtype=DTYPE)
+
     n = np.PyArray_DIMS(x)[0]
     out_n = np.PyArray_DIMS(xvals)[0]
 
+    y_fit = np.empty(out_n)
+    weights = np.empty(n)
+    work = np.empty(2 * n)
+
+    x_data = <double *>np.PyArray_DATA(x)
+    y_data = <double *>np.PyArray_DATA(y)
+    xvals_data = <double *>np.PyArray_DATA(xvals)
+    y_fit_data = <double *>np.PyArray_DATA(y_fit)
+    resid_data = <double *>np.PyArray_DATA(resid_weights)
+    weights_data = <double *>np.PyArray_DATA(weights)
+    work_data = <double *>np.PyArray_DATA(work)
+
+    with nogil:
+        lowess_fit(x_data, y_data, n, xvals_data, out_n, y_fit_data,
+                   resid_data, weights_data, work_data, frac, it, delta,
+                   given_xvals)
+
+    return np.array([xvals, y_fit]).T, resid_weights
+
+
+def lowess_rows(const double[:, ::1] endog,
+                const double[:, ::1] exog,
+                const double[:, ::1] xvals,
+                double[:, ::1] out,
+                const double[::1] frac,
+                const np.int64_t[::1] it,
+                const double[::1] delta,
+                Py_ssize_t start,
+                Py_ssize_t stop,
+                bint given_xvals = 0):
+    """
+    lowess_rows(endog, exog, xvals, out, frac, it, delta, start, stop, given_xvals=False)
+
+    LOWESS of the rows ``start:stop`` of a 2-D array of series
+
+    Parameters
+    ----------
+    endog : 2-D numpy array
+        The y-values of the series, one series per row.
+    exog : 2-D numpy array
+        The x-values of the series. Each row has to be increasing.
+    xvals : 2-D numpy array
+        The x-values at which to evaluate each series. Each row has to be
+        increasing. Ignored unless given_xvals is True.
+    out : 2-D numpy array
+        The array in which the fitted values are written, with the shape of
+        endog, or of xvals if given_xvals is True.
+    frac, delta : 1-D numpy array
+        The fraction of the data and the interpolation distance of each
+        series.
+    it : 1-D numpy array
+        The number of residual-based reweightings of each series.
+    start, stop : indexing integer
+        The rows that are smoothed.
+    given_xvals : bool
+        If True, the series are evaluated at xvals using the robustness
+        weights of it - 1 reweightings, as in `lowess`.
+
+    Notes
+    -----
+    The rows are smoothed without holding the GIL, so that several threads
+    can smooth different rows at the same time.
+    """
+    cdef:
+        Py_ssize_t row, n = endog.shape[1], out_n = out.shape[1]
+        Py_ssize_t n_it
+        double[::1] resid_weights = np.empty(n)
+        double[::1] y_fit = np.empty(n)
+        double[::1] weights = np.empty(n)
+        double[::1] work = np.empty(2 * n)
+
+    if n == 0 or out_n == 0:
+        return
+    with nogil:
+        for row in range(start, stop):
+            resid_weights[:] = 1.0
+            if not given_xvals:
+                lowess_fit(&exog[row, 0], &endog[row, 0], n, &exog[row, 0],
+                           n, &out[row, 0], &resid_weights[0], &weights[0],
+                           &work[0], frac[row], it[row], delta[row], 0)
+                continue
+            n_it = it[row]
+            if n_it > 0:
+                lowess_fit(&exog[row, 0], &endog[row, 0], n, &exog[row, 0],
+                           n, &y_fit[0], &resid_weights[0], &weights[0],
+                           &work[0], frac[row], n_it - 1, delta[row], 0)
+            lowess_fit(&exog[row, 0], &endog[row, 0], n, &xvals[row, 0],
+                       out_n, &out[row, 0], &resid_weights[0], &weights[0],
+                       &work[0], frac[row], 0, delta[row], 1)
+
+
+cdef void lowess_fit(const double *x,
+                     const double *y,
+                     Py_ssize_t n,
+                     const double *xvals,
+                     Py_ssize_t out_n,
+                     double *y_fit,
+                     double *resid_weights,
+                     double *weights,
+                     double *work,
+                     double frac,
+                     Py_ssize_t it,
+                     double delta,
+                     bint given_xvals) noexcept nogil:
+    """
+    The lowess iterations of a single series, see `lowess`
+
+    resid_weights holds the initial robustness weights, and is overwritten
+    with the final ones unless given_xvals is True. weights has length n,
+    and work has length 2 * n.
+    """
+    cdef:
+        Py_ssize_t j, k, robiter, i, left_end, right_end, last_fit_i
+        double xval, radius
+        bint reg_ok
+
     # The number of neighbors in each regression.
     # round up if close to integer
-    k =  int(frac * n + 1e-10)
+    k = <Py_ssize_t>(frac * n + 1e-10)
 
     # frac should be set, so that 2 <= k <= n.
     # Conform them instead of throwing error.
@@ -168,9 +287,6 @@ def lowess(np.ndarray[DTYPE_t, ndim = 1] endog,
     if k > n:
         k = n
 
-    y_fit = np.empty(out_n)
-    weights = np.empty(n)
-
     it += 1 # Add one to it for initial run.
     for robiter in range(it):
         i = 0
@@ -184,26 +300,20 @@ def lowess(np.ndarray[DTYPE_t, ndim = 1] endog,
         # 'do' Fit y[i]'s 'until' the end of the regression
         while True:
             # The x value at which we will fit this time
-            xval  = xvals[i]
-
-            # Re-initialize the weights for each point xval.
-            for j in range(n):
-                weights[j] = 0.0
+            xval = xvals[i]
 
             # Describe the neighborhood around the current xval.
-            left_end, right_end, radius = update_neighborhood(x, xval, n,
-                                                              left_end,
-                                                              right_end)
+            radius = find_neighborhood(x, xval, n, &left_end, &right_end)
 
             # Calculate the weights for the regression in this neighborhood.
             # Determine if at least some weights are positive, so a regression
             # is ok.
-            reg_ok = calculate_weights(x, weights, resid_weights, xval, left_end,
-                                       right_end, radius)
+            reg_ok = calculate_weights(x, weights, resid_weights, xval,
+                                       left_end, right_end, radius)
 
             # If ok, run the regression
-            calculate_y_fit(x, y, i, xval, y_fit, weights, left_end, right_end,
-                            reg_ok, fill_with_nans=given_xvals)
+            calculate_y_fit(x, y, i, xval, y_fit, weights, left_end,
+                            right_end, reg_ok, given_xvals)
 
             # If we skipped some points (because of how delta was set), go back
             # and fit them by linear interpolation.
@@ -212,16 +322,14 @@ def lowess(np.ndarray[DTYPE_t, ndim = 1] endog,
 
             # Update the last fit counter to indicate we've now fit this point.
             # Find the next i for which we'll run a regression.
-            i, last_fit_i = update_indices(xvals, y_fit, delta, i, out_n, last_fit_i)
+            next_indices(xvals, y_fit, delta, &i, out_n, &last_fit_i)
 
             if last_fit_i >= out_n-1:
                 break
 
         # Calculate residual weights
         if not given_xvals:
-            resid_weights = calculate_residual_weights(y, y_fit)
-
-    return np.array([xvals, y_fit]).T, resid_weights
+            residual_weights(y, y_fit, n, resid_weights, work)
 
 
 cpdef update_neighborhood(const double[::1] x,
@@ -262,8 +370,20 @@ cpdef update_neighborhood(const double[::1] x,
         distances between xval and its left-most or right-most
         neighbor.
     """
-
     cdef double radius
+    radius = find_neighborhood(&x[0], xval, n, &left_end, &right_end)
+    return left_end, right_end, radius
+
+
+cdef double find_neighborhood(const double *x,
+                              double xval,
+                              Py_ssize_t n,
+                              Py_ssize_t *left_end,
+                              Py_ssize_t *right_end) noexcept nogil:
+    """
+    Move the neighborhood [left_end, right_end) to xval, see
+    `update_neighborhood`, and return its radius.
+    """
     # A subtle loop. Start from the current neighborhood range:
     # [left_end, right_end). Shift both ends rightwards by one
     # (so that the neighborhood still contains k points), until
@@ -274,26 +394,25 @@ cpdef update_neighborhood(const double[::1] x,
     # Once the right end hits the end of the data, hold the
     # neighborhood the same for the remaining xvals.
     while True:
-        if right_end < n:
-            if xval > ((x[left_end] + x[right_end]) / 2.0):
-                left_end += 1
-                right_end += 1
+        if right_end[0] < n:
+            if xval > ((x[left_end[0]] + x[right_end[0]]) / 2.0):
+                left_end[0] += 1
+                right_end[0] += 1
             else:
                 break
         else:
             break
 
-    radius = fmax(xval - x[left_end], x[right_end-1] - xval)
+    return fmax(xval - x[left_end[0]], x[right_end[0] - 1] - xval)
 
-    return left_end, right_end, radius
 
-cdef bint calculate_weights(np.ndarray[DTYPE_t, ndim = 1] x,
-                            np.ndarray[DTYPE_t, ndim = 1] weights,
-                            np.ndarray[DTYPE_t, ndim = 1] resid_weights,
-                            DTYPE_t xval,
+cdef bint calculate_weights(const double *x,
+                            double *weights,
+                            const double *resid_weights,
+                            double xval,
                             Py_ssize_t left_end,
                             Py_ssize_t right_end,
-                            double radius):
+                            double radius) noexcept nogil:
     """
     Calculate weights
 
@@ -325,26 +444,21 @@ cdef bint calculate_weights(np.ndarray[DTYPE_t, ndim = 1] x,
         If True, at least some points have positive weight, and the
         regression will be run. If False, the regression is skipped
         and y_fit[i] is set to equal y[i].
-    Also, changes elements of weights in-place.
+    Also, changes elements of weights[left_end:right_end] in-place.
     """
 
     cdef:
-        np.ndarray[DTYPE_t, ndim = 1] x_j = x[left_end:right_end]
-        np.ndarray[DTYPE_t, ndim = 1] dist_i_j = np.abs(x_j - xval) / radius
-        bint reg_ok = 1  # True
-        double sum_weights
+        Py_ssize_t j
+        double sum_weights = 0, dist
         int num_nonzero_weights = 0
 
-    # Assign the distance measure to the weights, then apply the tricube
-    # function to change in-place.
-    weights[left_end:right_end] = dist_i_j
-
-    tricube(weights[left_end:right_end])
-    weights[left_end:right_end] = (weights[left_end:right_end] *
-                                      resid_weights[left_end:right_end])
-
-    sum_weights = np.sum(weights[left_end:right_end])
+    # Apply the tricube function (1 - dist**3)**3 to the distances in
+    # units of the radius, and multiply with the residual weights.
     for j in range(left_end, right_end):
+        dist = fabs(x[j] - xval) / radius
+        dist = 1.0 - dist * dist * dist
+        weights[j] = dist * dist * dist * resid_weights[j]
+        sum_weights += weights[j]
         num_nonzero_weights += weights[j] > 1e-12
 
     if num_nonzero_weights < 2:
@@ -354,19 +468,19 @@ cdef bint calculate_weights(np.ndarray[DTYPE_t, ndim = 1] x,
     for j in range(left_end, right_end):
         weights[j] /= sum_weights
 
-    return reg_ok
+    return 1
 
 
-cdef void calculate_y_fit(np.ndarray[DTYPE_t, ndim = 1] x,
-                          np.ndarray[DTYPE_t, ndim = 1] y,
+cdef void calculate_y_fit(const double *x,
+                          const double *y,
                           Py_ssize_t i,
-                          DTYPE_t xval,
-                          np.ndarray[DTYPE_t, ndim = 1] y_fit,
-                          np.ndarray[DTYPE_t, ndim = 1] weights,
+                          double xval,
+                          double *y_fit,
+                          const double *weights,
                           Py_ssize_t left_end,
                           Py_ssize_t right_end,
                           bint reg_ok,
-                          bint fill_with_nans = 0):
+                          bint fill_with_nans = 0) noexcept nogil:
     """
     Calculate smoothed/fitted y-value by weighted regression.
 
@@ -413,7 +527,8 @@ cdef void calculate_y_fit(np.ndarray[DTYPE_t, ndim = 1] x,
     """
 
     cdef:
-       double sum_weighted_x = 0, weighted_sqdev_x = 0, p_i_j
+        Py_ssize_t j
+        double sum_weighted_x = 0, weighted_sqdev_x = 0, p_i_j
 
     if not reg_ok:
         if fill_with_nans:
@@ -435,10 +550,11 @@ cdef void calculate_y_fit(np.ndarray[DTYPE_t, ndim = 1] x,
                              (x[j] - sum_weighted_x) / weighted_sqdev_x)
             y_fit[i] += p_i_j * y[j]
 
-cdef void interpolate_skipped_fits(const double[::1] xvals,
-                                   double[::1] y_fit,
+
+cdef void interpolate_skipped_fits(const double *xvals,
+                                   double *y_fit,
                                    Py_ssize_t i,
-                                   Py_ssize_t last_fit_i):
+                                   Py_ssize_t last_fit_i) noexcept nogil:
     """
     Calculate smoothed/fitted y by linear interpolation between the current
     and previous y fitted by weighted regression.
@@ -463,7 +579,6 @@ cdef void interpolate_skipped_fits(const double[::1] xvals,
     """
 
     cdef:
-        double[::1] a_view
         Py_ssize_t j
         Py_ssize_t offset = last_fit_i + 1
         Py_ssize_t n = i - offset
@@ -513,12 +628,25 @@ cpdef update_indices(const double[::1] xvals,
     The relationship between the outputs is s.t. xvals[i+1] >
     xvals[last_fit_i] + delta.
     """
+    next_indices(&xvals[0], &y_fit[0], delta, &i, out_n, &last_fit_i)
+    return i, last_fit_i
+
+
+cdef void next_indices(const double *xvals,
+                       double *y_fit,
+                       double delta,
+                       Py_ssize_t *i,
+                       Py_ssize_t out_n,
+                       Py_ssize_t *last_fit_i) noexcept nogil:
+    """
+    Update the counters i and last_fit_i in-place, see `update_indices`.
+    """
     cdef:
         Py_ssize_t k
         double cutpoint
 
-    last_fit_i = i
-    k = last_fit_i
+    last_fit_i[0] = i[0]
+    k = last_fit_i[0]
     # For most points within delta of the current point, we skip the
     # weighted linear regression (which save much computation of
     # weights and fitted points). Instead, we'll jump to the last
@@ -527,23 +655,21 @@ cpdef update_indices(const double[::1] xvals,
 
     # This loop increments until we fall just outside of delta distance,
     # copying the results for any repeated x's along the way.
-    cutpoint = xvals[last_fit_i] + delta
-    for k in range(last_fit_i + 1, out_n):
+    cutpoint = xvals[last_fit_i[0]] + delta
+    for k in range(last_fit_i[0] + 1, out_n):
         if xvals[k] > cutpoint:
             break
-        if xvals[k] == xvals[last_fit_i]:
+        if xvals[k] == xvals[last_fit_i[0]]:
             # if tied with previous x-value, just use the already
             # fitted y, and update the last-fit counter.
-            y_fit[k] = y_fit[last_fit_i]
-            last_fit_i = k
+            y_fit[k] = y_fit[last_fit_i[0]]
+            last_fit_i[0] = k
 
     # i, which indicates the next point to fit the regression at, is
     # either one prior to k (since k should be the first point outside
     # of delta) or is just incremented + 1 if k = i+1. This insures we
     # always step forward.
-    i = max(k-1, last_fit_i + 1)
-
-    return i, last_fit_i
+    i[0] = max(k - 1, last_fit_i[0] + 1)
 
 
 cpdef np.ndarray calculate_residual_weights(const double[::1] y, const double[::1] y_fit):
@@ -565,84 +691,89 @@ cpdef np.ndarray calculate_residual_weights(const double[::1] y, const double[::
         next iteration of regressions.
     """
     cdef:
-        Py_ssize_t j
         np.npy_intp n = y.size
-        np.ndarray std_resid = np.empty(n)
-        double median, scale
-        double* std_resid_data = <double *>np.PyArray_DATA(std_resid)
+        np.ndarray out = np.empty(n)
+        double[::1] work = np.empty(2 * n)
+
+    if n > 0:
+        residual_weights(&y[0], &y_fit[0], n,
+                         <double *>np.PyArray_DATA(out), &work[0])
+    return out
+
+
+cdef void residual_weights(const double *y,
+                           const double *y_fit,
+                           Py_ssize_t n,
+                           double *out,
+                           double *work) noexcept nogil:
+    """
+    Write the residual weights of `calculate_residual_weights` to out,
+    using work of length 2 * n.
+    """
+    cdef:
+        Py_ssize_t j
+        double median, scale, weight
+        double *std_resid = work
+        double *tmp = work + n
 
     for j in range(n):
-        std_resid_data[j] = fabs(y[j] - y_fit[j])
+        std_resid[j] = fabs(y[j] - y_fit[j])
+        tmp[j] = std_resid[j]
 
-    median = <double>np.median(std_resid)
+    median = select_kth(tmp, n, n // 2)
+    if n % 2 == 0:
+        median = (median + select_kth(tmp, n // 2, n // 2 - 1)) / 2.0
     if median == 0:
         for j in range(n):
-            std_resid_data[j] = <double>(std_resid_data[j] > 0)
+            std_resid[j] = <double>(std_resid[j] > 0)
     else:
         scale = 6.0 * median
         for j in range(n):
-            std_resid_data[j] /= scale
+            std_resid[j] /= scale
 
     # Some trimming of outlier residuals.
     for j in range(n):
-        if std_resid_data[j] > 1:
-            std_resid_data[j] = 1.0
+        if std_resid[j] > 1:
+            std_resid[j] = 1.0
     # std_resid[std_resid >= 0.999] = 1.0
     # std_resid[std_resid <= 0.001] = 0.0
 
-    return bisquare(std_resid)
-
-
-cdef void tricube(double[::1] x):
-    """
-    The tri-cubic function (1 - x**3)**3. Used to weight neighboring
-    points along the x-axis based on their distance to the current point.
-
-    Parameters
-    ----------
-    x: 1-D numpy array
-        A vector of neighbors` distances from the current point,
-        in units of the neighborhood radius.
-
-    Returns
-    -------
-    Nothing. Changes array elements in-place
-    """
-
-    # fast_array_cube is an elementwise, in-place cubed-power
-    # operator.
-    cdef:
-        np.npy_intp n = x.size
-        Py_ssize_t j
-        double tmp
-
-    fast_array_cube(x)
     for j in range(n):
-        x[j] = 1.0 - x[j]
-    fast_array_cube(x)
+        weight = 1.0 - std_resid[j] * std_resid[j]
+        out[j] = weight * weight
 
 
-cdef void fast_array_cube(double[::1] x):
+cdef double select_kth(double *x, Py_ssize_t n, Py_ssize_t k) noexcept nogil:
     """
-    A fast, elementwise, in-place cube operator. Called by the
-    tricube function.
-
-    Parameters
-    ----------
-    x: 1-D numpy array
-
-    Returns
-    -------
-    Nothing. Changes array elements in-place.
+    The k-th smallest value of x, which is partially sorted in-place so that
+    x[:k] holds the k smallest values.
     """
     cdef:
-        np.npy_intp n = x.size
-        Py_ssize_t j
-        double tmp
-
-    for j in range(n):
-        tmp = x[j]
-        x[j] = tmp * tmp * tmp
+        Py_ssize_t lo = 0, hi = n - 1, i, j
+        double pivot, tmp
+
+    while lo < hi:
+        pivot = x[(lo + hi) // 2]
+        i = lo
+        j = hi
+        while i <= j:
+            while x[i] < pivot:
+                i += 1
+            while x[j] > pivot:
+                j -= 1
+            if i <= j:
+                tmp = x[i]
+                x[i] = x[j]
+                x[j] = tmp
+                i += 1
+                j -= 1
+        if k <= j:
+            hi = j
+        elif k >= i:
+            lo = i
+        else:
+            break
+    return x[k]
 
 
 cpdef np.ndarray bisquare(const double[::1] x):
@@ -1,12 +1,12 @@
 __all__ = [
-    "KDEUnivariate",
+    "KDEUnivariate", "kdensity_binned",
     "KDEMultivariate", "KDEMultivariateConditional", "EstimatorSettings",
     "KernelReg", "KernelCensoredReg",
-    "lowess", "bandwidths",
+    "lowess", "lowess_batch", "IncrementalLowess", "bandwidths",
     "pdf_kernel_asym", "cdf_kernel_asym"
 ]
-from .kde import KDEUnivariate
-from .smoothers_lowess import lowess
+from .kde import KDEUnivariate, kdensity_binned
+from .smoothers_lowess import IncrementalLowess, lowess, lowess_batch
 from . import bandwidths
 
 from .kernel_density import \
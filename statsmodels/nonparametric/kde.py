@@ -12,7 +12,7 @@ https://en.wikipedia.org/wiki/Kernel_%28statistics%29
 Silverman, B.W.  Density Estimation for Statistics and Data Analysis.
 """
 import numpy as np
-from scipy import integrate, stats
+from scipy import integrate, signal, special
 
 from statsmodels.sandbox.nonparametric import kernels
 from statsmodels.tools.decorators import cache_readonly
@@ -20,7 +20,6 @@ from statsmodels.tools.validation import array_like, float_like
 
 from . import bandwidths
 from .kdetools import forrt, revrt, silverman_transform
-from .linbin import fast_linbin
 
 # Kernels Switch for estimators
 
@@ -56,9 +55,11 @@ class KDEUnivariate:
 
     Notes
     -----
-    If cdf, sf, cumhazard, or entropy are computed, they are computed based on
-    the definition of the kernel rather than the FFT approximation, even if
-    the density is fit with FFT = True.
+    The cdf, sf, cumhazard and icdf are computed on the grid of the density
+    estimate. If the density is fit with fft=True, they are computed from the
+    binned data in the same way as the density, otherwise they are computed
+    from the integrated kernel at each observation. The entropy is computed
+    from the definition of the kernel.
 
     `KDEUnivariate` is much faster than `KDEMultivariate`, due to its FFT-based
     implementation.  It should be preferred for univariate, continuous data.
@@ -132,11 +133,17 @@ class KDEUnivariate:
 
         fft : bool
             Whether or not to use FFT. FFT implementation is more
-            computationally efficient. However, only the Gaussian kernel
-            is implemented. If FFT is False, then a 'nobs' x 'gridsize'
-            intermediate array is created.
+            computationally efficient. The data are linearly binned on the
+            grid, which is the support of the estimate. If FFT is False, then
+            a 'nobs' x 'gridsize' intermediate array is created.
+        weights : array_like, optional
+            Nonnegative weights of the observations, frequency or analytic
+            weights. The density is normalized by the sum of the weights, so
+            that both give the same estimate. The bandwidth rules use the
+            unweighted data.
         gridsize : int
-            If gridsize is None, max(len(x), 50) is used.
+            If gridsize is None, max(len(x), 50) is used without FFT, and
+            max(len(x), 512) rounded up to the next power of 2 with FFT.
         cut : float
             Defines the length of the grid past the lowest and highest values
             of x so that the kernel goes to zero. The end points are
@@ -158,13 +165,9 @@ class KDEUnivariate:
 
         endog = self.endog
 
+        if weights is not None:
+            weights = np.array(weights, dtype=float)
         if fft:
-            if kernel != "gau":
-                msg = "Only gaussian kernel is available for fft"
-                raise NotImplementedError(msg)
-            if weights is not None:
-                msg = "Weights are not implemented for fft"
-                raise NotImplementedError(msg)
             density, grid, bw = kdensityfft(
                 endog,
                 kernel=kernel,
@@ -189,6 +192,8 @@ class KDEUnivariate:
         self.density = density
         self.support = grid
         self.bw = bw
+        self._fft = fft
+        self._clip = clip
         self.kernel = kernel_switch[kernel](h=bw)  # we instantiate twice,
         # should this passed to funcs?
         # put here to ensure empty cache after re-fit with new options
@@ -209,23 +214,25 @@ class KDEUnivariate:
         """
         _checkisfit(self)
         kern = self.kernel
-        if kern.domain is None:  # TODO: test for grid point at domain bound
-            a, b = -np.inf, np.inf
-        else:
-            a, b = kern.domain
-
-        def func(x, s):
-            return np.squeeze(kern.density(s, x))
-
         support = self.support
-        support = np.r_[a, support]
-        gridsize = len(support)
         endog = self.endog
-        probs = [
-            integrate.quad(func, support[i - 1], support[i], args=endog)[0]
-            for i in range(1, gridsize)
-        ]
-        return np.cumsum(probs)
+        weights = kern.weights
+        if weights is None:
+            weights = np.ones(len(endog))
+        clip_x = (endog > self._clip[0]) & (endog < self._clip[1])
+        endog, weights = endog[clip_x], weights[clip_x]
+        if self._fft:
+            delta = support[1] - support[0]
+            counts = _linbin(endog[:, None], weights, support[:1], [delta],
+                             [len(support)])
+            cdf = _convolve_grid(counts, [_kernel_grid(kern, self.bw, delta,
+                                                       len(support), cdf=True)])
+            # remove the rounding errors of the FFT
+            cdf = np.maximum.accumulate(cdf)
+        else:
+            cdf = _kernel_cdf(kern, (support[:, None] - endog) / self.bw)
+            cdf = cdf @ weights
+        return np.clip(cdf / weights.sum(), 0, 1)
 
     @cache_readonly
     def cumhazard(self):
@@ -284,12 +291,13 @@ class KDEUnivariate:
 
         Notes
         -----
-        Will not work if fit has not been called. Uses
-        `scipy.stats.mstats.mquantiles`.
+        Will not work if fit has not been called. The quantiles at
+        ``np.linspace(0, 1, gridsize)`` are obtained by linear interpolation
+        of the cdf on the support.
         """
         _checkisfit(self)
         gridsize = len(self.density)
-        return stats.mstats.mquantiles(self.endog, np.linspace(0, 1, gridsize))
+        return np.interp(np.linspace(0, 1, gridsize), self.cdf, self.support)
 
     def evaluate(self, point):
         """
@@ -469,15 +477,16 @@ def kdensityfft(
     x : array_like
         The variable for which the density estimate is desired.
     kernel : str
-        ONLY GAUSSIAN IS CURRENTLY IMPLEMENTED.
-        "bi" for biweight
-        "cos" for cosine
-        "epa" for Epanechnikov, default
-        "epa2" for alternative Epanechnikov
-        "gau" for Gaussian.
-        "par" for Parzen
-        "rect" for rectangular
-        "tri" for triangular
+        The Kernel to be used. Choices are
+        - "biw" for biweight
+        - "cos" for cosine
+        - "cos2" for the cosine kernel used by Stata
+        - "epa" for Epanechnikov
+        - "gau" for Gaussian.
+        - "tri" for triangular
+        - "tric" for tricube
+        - "triw" for triweight
+        - "uni" for uniform
     bw : str, float, callable
         The bandwidth to use. Choices are:
 
@@ -497,9 +506,8 @@ def kdensityfft(
           * kern - the kernel instance used
 
     weights : array or None
-        WEIGHTS ARE NOT CURRENTLY IMPLEMENTED.
-        Optional  weights. If the x value is clipped, then this weight is
-        also dropped.
+        Optional nonnegative weights. If the x value is clipped, then this
+        weight is also dropped.
     gridsize : int
         If gridsize is None, min(len(x), 512) is used. Note that the provided
         number is rounded up to the next highest power of 2.
@@ -524,12 +532,12 @@ def kdensityfft(
 
     Notes
     -----
-    Only the default kernel is implemented. Weights are not implemented yet.
-    This follows Silverman (1982) with changes suggested by Jones and Lotwick
-    (1984). However, the discretization step is replaced by linear binning
-    of Fan and Marron (1994). This should be extended to accept the parts
-    that are dependent only on the data to speed things up for
-    cross-validation.
+    The Gaussian kernel follows Silverman (1982) with changes suggested by
+    Jones and Lotwick (1984). However, the discretization step is replaced by
+    linear binning of Fan and Marron (1994). The other kernels are evaluated
+    on the grid and convolved with the binned data, as in `kdensity_binned`.
+    This should be extended to accept the parts that are dependent only on
+    the data to speed things up for cross-validation.
 
     References
     ----------
@@ -545,7 +553,9 @@ def kdensityfft(
     """
     x = np.asarray(x)
     # will not work for two columns.
-    x = x[np.logical_and(x > clip[0], x < clip[1])]
+    clip_x = np.logical_and(x > clip[0], x < clip[1])
+    x = x[clip_x]
+    weights = _check_weights(weights, clip_x)
 
     # Get kernel object corresponding to selection
     kern = kernel_switch[kernel]()
@@ -590,7 +600,19 @@ def kdensityfft(
     #    binned /= (nobs)*delta**2 # normalize binned to sum to 1/delta
 
     # NOTE: THE ABOVE IS WRONG, JUST TRY WITH LINEAR BINNING
-    binned = fast_linbin(x, a, b, gridsize) / (delta * nobs)
+    if weights is None:
+        weights = np.ones(nobs)
+    counts = _linbin(x[:, None], weights, [a], [delta], [int(gridsize)])
+    if kernel != "gau":
+        kern.seth(bw)
+        f = _convolve_grid(counts, [_kernel_grid(kern, bw, delta,
+                                                 int(gridsize))])
+        f = np.clip(f, 0, None) / weights.sum()
+        if retgrid:
+            return f, grid, bw
+        else:
+            return f, bw
+    binned = counts / (delta * weights.sum())
 
     # step 2 compute FFT of the weights, using Munro (1976) FFT convention
     y = forrt(binned)
@@ -608,3 +630,197 @@ def kdensityfft(
         return f, grid, bw
     else:
         return f, bw
+
+
+def kdensity_binned(
+    x,
+    kernel="gau",
+    bw="normal_reference",
+    weights=None,
+    gridsize=None,
+    adjust=1,
+    cut=3,
+):
+    """
+    Multivariate binned kernel density estimator on a grid
+
+    Parameters
+    ----------
+    x : array_like
+        The data, (nobs,) or (nobs, k_vars).
+    kernel : str
+        The kernel that is used for each variable in a product kernel.
+        Choices are the kernels of `kdensity`.
+    bw : str, float, array_like, callable
+        The bandwidth of each variable. A str or callable is used as in
+        `kdensity` for each variable separately. A float is used for all
+        variables.
+    weights : array_like, optional
+        Nonnegative weights of the observations, frequency or analytic
+        weights. The density is normalized by the sum of the weights, so that
+        both give the same estimate. The bandwidth rules use the unweighted
+        data.
+    gridsize : {int, array_like}, optional
+        The number of grid points of each variable. The default is
+        ``max(512 // 2 ** (k_vars - 1), 16)``.
+    adjust : float
+        An adjustment factor for the bw. Bandwidth becomes bw * adjust.
+    cut : float
+        Defines the length of the grid past the lowest and highest values of
+        each variable. The end points are ``min(x) - cut * bw`` and
+        ``max(x) + cut * bw``.
+
+    Returns
+    -------
+    density : ndarray
+        The densities estimated at the grid points, with shape `gridsize`.
+    grid : list of ndarray
+        The grid points of each variable.
+    bw : ndarray
+        The bandwidths of the variables.
+
+    Notes
+    -----
+    The data are linearly binned on the grid, see Fan and Marron (1994), and
+    the binned data are convolved with the kernel evaluated at the
+    differences between grid points using FFTs. The product kernel is
+    separable, so that the convolution is done one variable at a time. The
+    cost is O(nobs * 2 ** k_vars) for the binning and
+    O(prod(gridsize) * log(gridsize)) for the convolution, independent of
+    the number of observations. The error of the binning decreases with the
+    ratio of the grid spacing to the bandwidth, more slowly for the uniform
+    kernel, which is discontinuous.
+
+    References
+    ----------
+    Fan, J. and J.S. Marron. (1994) `Fast implementations of nonparametric
+        curve estimators`. Journal of Computational and Graphical Statistics.
+        3.1, 35-56.
+    Wand, M.P. (1994) `Fast computation of multivariate kernel estimators`.
+        Journal of Computational and Graphical Statistics. 3.4, 433-445.
+
+    Examples
+    --------
+    >>> density, grid, bw = kdensity_binned(x, kernel="epa", weights=counts)
+    >>> plt.contour(grid[0], grid[1], density.T)
+    """
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x[:, None]
+    nobs, k_vars = x.shape
+    weights = _check_weights(weights, np.ones(nobs, dtype=bool))
+    if weights is None:
+        weights = np.ones(nobs)
+
+    kern = kernel_switch[kernel]()
+    if callable(bw):
+        bw = [float(bw(x[:, i], kern)) for i in range(k_vars)]
+    elif isinstance(bw, str):
+        bw = [bandwidths.select_bandwidth(x[:, i], bw, kern)
+              for i in range(k_vars)]
+    bw = np.broadcast_to(np.asarray(bw, dtype=float), (k_vars,)) * adjust
+
+    if gridsize is None:
+        gridsize = max(512 // 2 ** (k_vars - 1), 16)
+    gridsize = np.broadcast_to(np.asarray(gridsize, dtype=int), (k_vars,))
+    a = x.min(0) - cut * bw
+    b = x.max(0) + cut * bw
+    grid = [np.linspace(a[i], b[i], gridsize[i]) for i in range(k_vars)]
+    delta = (b - a) / (gridsize - 1)
+
+    counts = _linbin(x, weights, a, delta, gridsize)
+    density = _convolve_grid(counts, [
+        _kernel_grid(kern, bw[i], delta[i], gridsize[i])
+        for i in range(k_vars)])
+    density = np.clip(density, 0, None) / weights.sum()
+    return density, grid, bw
+
+
+def _check_weights(weights, clip_x):
+    if weights is None:
+        return None
+    weights = np.asarray(weights, dtype=float)
+    if len(weights) != len(clip_x):
+        msg = "The length of the weights must be the same as the given x."
+        raise ValueError(msg)
+    if np.any(weights < 0):
+        raise ValueError("The weights must be nonnegative.")
+    return weights[clip_x]
+
+
+def _linbin(x, weights, a, delta, gridsize):
+    """
+    Linear binning of weighted (nobs, k_vars) data on a regular grid
+
+    Each observation is split between the 2 ** k_vars vertices of its grid
+    cell in proportion to the volume of the opposite sub-cell.
+    """
+    gridsize = tuple(int(size) for size in gridsize)
+    pos = (x - np.asarray(a)) / np.asarray(delta)
+    lower = np.clip(np.floor(pos), 0, np.array(gridsize) - 2).astype(np.intp)
+    frac = pos - lower
+    counts = np.zeros(np.prod(gridsize))
+    for corner in np.ndindex(*(2,) * x.shape[1]):
+        index = np.ravel_multi_index((lower + corner).T, gridsize)
+        share = np.prod(np.where(corner, frac, 1 - frac), axis=1)
+        counts += np.bincount(index, weights * share, minlength=counts.size)
+    return counts.reshape(gridsize)
+
+
+# Nodes and weights of the quadrature of the kernels with bounded support
+_leggauss = np.polynomial.legendre.leggauss(20)
+
+
+def _kernel_cdf(kern, u):
+    """
+    The integral of the kernel up to u, for the kernels in kernel_switch
+    """
+    u = np.asarray(u, dtype=float)
+    if kern.domain is None:
+        # The Gaussian is the only kernel with unbounded support
+        return special.ndtr(u)
+    lower, upper = kern.domain
+    u = np.clip(u, lower, upper)
+    out = np.zeros(u.shape)
+    # Gauss-Legendre quadrature on each side of zero, where the kernels
+    # are smooth
+    for start, stop in ((lower, np.minimum(u, 0)), (0, np.maximum(u, 0))):
+        half = (stop - start) / 2
+        for node, weight in zip(*_leggauss):
+            out += half * weight * kern.weight(start + half * (node + 1))
+    return out
+
+
+def _kernel_grid(kern, bw, delta, gridsize, cdf=False):
+    """
+    The kernel, or its integral, at the differences between grid points
+
+    Returns the values at ``delta * j`` for ``j = 1 - gridsize, ...,
+    gridsize - 1``, scaled by the bandwidth `bw`.
+    """
+    u = np.arange(1 - gridsize, gridsize) * delta / bw
+    if cdf:
+        return _kernel_cdf(kern, u)
+    values = kern.weight(u) * np.ones_like(u)
+    if kern.domain is not None:
+        values[(u < kern.domain[0]) | (u > kern.domain[1])] = 0
+    return np.clip(values, 0, None) / bw
+
+
+def _convolve_grid(counts, kernels):
+    """
+    Convolve binned data with a product kernel using FFTs
+
+    `kernels` holds the output of `_kernel_grid` for each variable. The
+    result is the kernel sum at the grid points.
+    """
+    out = counts
+    for axis, kern in enumerate(kernels):
+        gridsize = counts.shape[axis]
+        shape = [1] * counts.ndim
+        shape[axis] = kern.size
+        out = signal.fftconvolve(out, kern.reshape(shape), axes=axis)
+        index = [slice(None)] * counts.ndim
+        index[axis] = slice(gridsize - 1, 2 * gridsize - 1)
+        out = out[tuple(index)]
+    return out
@@ -30,7 +30,6 @@ References
 # TODO: make default behavior efficient=True above a certain n_obs
 import numpy as np
 
-from . import kernels
 from ._kernel_base import GenericKDE, EstimatorSettings, gpke, \
     LeaveOneOut, _adjust_shape
 
@@ -149,13 +148,15 @@ class KDEMultivariate(GenericKDE):
 
         .. math:: K_{h}(X_{i},X_{j}) =
             \prod_{s=1}^{q}h_{s}^{-1}k\left(\frac{X_{is}-X_{js}}{h_{s}}\right)
+
+        The leave-one-out sums are computed in blocks of observations, in
+        which the kernel value :math:`K_{h}(X_{i},X_{i})` of each observation
+        with itself is set to zero.  `func` must operate elementwise on
+        arrays.
         """
-        LOO = LeaveOneOut(self.data)
-        L = 0
-        for i, X_not_i in enumerate(LOO):
-            f_i = gpke(bw, data=-X_not_i, data_predict=-self.data[i, :],
-                       var_type=self.var_type)
-            L += func(f_i)
+        engine = self._kernel_engine(self.data, self.var_type, bw)
+        f = engine.loo_kernel_sum()
+        L = func(f).sum()
 
         return -L
 
@@ -186,11 +187,8 @@ class KDEMultivariate(GenericKDE):
         else:
             data_predict = _adjust_shape(data_predict, self.k_vars)
 
-        pdf_est = []
-        for i in range(np.shape(data_predict)[0]):
-            pdf_est.append(gpke(self.bw, data=self.data,
-                                data_predict=data_predict[i, :],
-                                var_type=self.var_type) / self.nobs)
+        engine = self._kernel_engine(self.data, self.var_type, self.bw)
+        pdf_est = engine.kernel_sum(data_predict) / self.nobs
 
         pdf_est = np.squeeze(pdf_est)
         return pdf_est
@@ -231,14 +229,11 @@ class KDEMultivariate(GenericKDE):
         else:
             data_predict = _adjust_shape(data_predict, self.k_vars)
 
-        cdf_est = []
-        for i in range(np.shape(data_predict)[0]):
-            cdf_est.append(gpke(self.bw, data=self.data,
-                                data_predict=data_predict[i, :],
-                                var_type=self.var_type,
-                                ckertype="gaussian_cdf",
-                                ukertype="aitchisonaitken_cdf",
-                                okertype='wangryzin_cdf') / self.nobs)
+        engine = self._kernel_engine(self.data, self.var_type, self.bw,
+                                     approx=False)
+        cdf_est = engine.kernel_sum(data_predict, ckertype="gaussian_cdf",
+                                    ukertype="aitchisonaitken_cdf",
+                                    okertype='wangryzin_cdf') / self.nobs
 
         cdf_est = np.squeeze(cdf_est)
         return cdf_est
@@ -278,55 +273,16 @@ class KDEMultivariate(GenericKDE):
         .. [2] Racine, J., Li, Q. "Nonparametric Estimation of Distributions
                 with Categorical and Continuous Data." Working Paper. (2000)
         """
-        #F = 0
-        #for i in range(self.nobs):
-        #    k_bar_sum = gpke(bw, data=-self.data,
-        #                     data_predict=-self.data[i, :],
-        #                     var_type=self.var_type,
-        #                     ckertype='gauss_convolution',
-        #                     okertype='wangryzin_convolution',
-        #                     ukertype='aitchisonaitken_convolution')
-        #    F += k_bar_sum
-        ## there is a + because loo_likelihood returns the negative
-        #return (F / self.nobs**2 + self.loo_likelihood(bw) * \
-        #        2 / ((self.nobs) * (self.nobs - 1)))
-
-        # The code below is equivalent to the commented-out code above.  It's
-        # about 20% faster due to some code being moved outside the for-loops
-        # and shared by gpke() and loo_likelihood().
-        F = 0
-        kertypes = dict(c=kernels.gaussian_convolution,
-                        o=kernels.wang_ryzin_convolution,
-                        u=kernels.aitchison_aitken_convolution)
         nobs = self.nobs
-        data = -self.data
-        var_type = self.var_type
-        ix_cont = np.array([c == 'c' for c in var_type])
-        _bw_cont_product = bw[ix_cont].prod()
-        Kval = np.empty(data.shape)
-        for i in range(nobs):
-            for ii, vtype in enumerate(var_type):
-                Kval[:, ii] = kertypes[vtype](bw[ii],
-                                              data[:, ii],
-                                              data[i, ii])
-
-            dens = Kval.prod(axis=1) / _bw_cont_product
-            k_bar_sum = dens.sum(axis=0)
-            F += k_bar_sum  # sum of prod kernel over nobs
-
-        kertypes = dict(c=kernels.gaussian,
-                        o=kernels.wang_ryzin,
-                        u=kernels.aitchison_aitken)
-        LOO = LeaveOneOut(self.data)
-        L = 0   # leave-one-out likelihood
-        Kval = np.empty((data.shape[0]-1, data.shape[1]))
-        for i, X_not_i in enumerate(LOO):
-            for ii, vtype in enumerate(var_type):
-                Kval[:, ii] = kertypes[vtype](bw[ii],
-                                              -X_not_i[:, ii],
-                                              data[i, ii])
-            dens = Kval.prod(axis=1) / _bw_cont_product
-            L += dens.sum(axis=0)
+        # Sum of the convolution kernel over all pairs of observations
+        engine = self._kernel_engine(self.data, self.var_type, bw,
+                                     ckertype='gauss_convolution')
+        F = engine.kernel_sum(self.data, ckertype='gauss_convolution',
+                              okertype='wangryzin_convolution',
+                              ukertype='aitchisonaitken_convolution').sum()
+        # Leave-one-out sum of the kernel
+        engine = self._kernel_engine(self.data, self.var_type, bw)
+        L = engine.loo_kernel_sum().sum()
 
         # CV objective function, eq. (2.4) of Ref. [3]
         return (F / nobs**2 - 2 * L / (nobs * (nobs - 1)))
@@ -416,6 +372,7 @@ class KDEMultivariateConditional(GenericKDE):
         self.nobs, self.k_dep = np.shape(self.endog)
         self.data = np.column_stack((self.endog, self.exog))
         self.k_vars = np.shape(self.data)[1]
+        self._exog_cols = range(self.k_dep, self.k_vars)
         defaults = EstimatorSettings() if defaults is None else defaults
         self._set_defaults(defaults)
         if not self.efficient:
@@ -459,20 +416,15 @@ class KDEMultivariateConditional(GenericKDE):
         Notes
         -----
         Similar to ``KDE.loo_likelihood`, but substitute ``f(y|x)=f(x,y)/f(x)``
-        for ``f(x)``.
+        for ``f(x)``.  The leave-one-out sums are computed in blocks of
+        observations, in which the kernel value of each observation with
+        itself is set to zero.  `func` must operate elementwise on arrays.
         """
-        yLOO = LeaveOneOut(self.data)
-        xLOO = LeaveOneOut(self.exog).__iter__()
-        L = 0
-        for i, Y_j in enumerate(yLOO):
-            X_not_i = next(xLOO)
-            f_yx = gpke(bw, data=-Y_j, data_predict=-self.data[i, :],
-                        var_type=(self.dep_type + self.indep_type))
-            f_x = gpke(bw[self.k_dep:], data=-X_not_i,
-                       data_predict=-self.exog[i, :],
-                       var_type=self.indep_type)
-            f_i = f_yx / f_x
-            L += func(f_i)
+        engine = self._kernel_engine(self.data, self.data_type, bw,
+                                     cols=self._exog_cols)
+        f_yx = engine.loo_kernel_sum()
+        f_x = engine.loo_kernel_sum(cols=self._exog_cols)
+        L = func(f_yx / f_x).sum()
 
         return -L
 
@@ -515,16 +467,12 @@ class KDEMultivariateConditional(GenericKDE):
         else:
             exog_predict = _adjust_shape(exog_predict, self.k_indep)
 
-        pdf_est = []
         data_predict = np.column_stack((endog_predict, exog_predict))
-        for i in range(np.shape(data_predict)[0]):
-            f_yx = gpke(self.bw, data=self.data,
-                        data_predict=data_predict[i, :],
-                        var_type=(self.dep_type + self.indep_type))
-            f_x = gpke(self.bw[self.k_dep:], data=self.exog,
-                       data_predict=exog_predict[i, :],
-                       var_type=self.indep_type)
-            pdf_est.append(f_yx / f_x)
+        engine = self._kernel_engine(self.data, self.data_type, self.bw,
+                                     cols=self._exog_cols)
+        f_yx = engine.kernel_sum(data_predict)
+        f_x = engine.kernel_sum(data_predict, cols=self._exog_cols)
+        pdf_est = f_yx / f_x
 
         return np.squeeze(pdf_est)
 
@@ -578,25 +526,21 @@ class KDEMultivariateConditional(GenericKDE):
         else:
             exog_predict = _adjust_shape(exog_predict, self.k_indep)
 
-        N_data_predict = np.shape(exog_predict)[0]
-        cdf_est = np.empty(N_data_predict)
-        for i in range(N_data_predict):
-            mu_x = gpke(self.bw[self.k_dep:], data=self.exog,
-                        data_predict=exog_predict[i, :],
-                        var_type=self.indep_type) / self.nobs
-            mu_x = np.squeeze(mu_x)
-            cdf_endog = gpke(self.bw[0:self.k_dep], data=self.endog,
-                             data_predict=endog_predict[i, :],
-                             var_type=self.dep_type,
-                             ckertype="gaussian_cdf",
-                             ukertype="aitchisonaitken_cdf",
-                             okertype='wangryzin_cdf', tosum=False)
-
-            cdf_exog = gpke(self.bw[self.k_dep:], data=self.exog,
-                            data_predict=exog_predict[i, :],
-                            var_type=self.indep_type, tosum=False)
-            S = (cdf_endog * cdf_exog).sum(axis=0)
-            cdf_est[i] = S / (self.nobs * mu_x)
+        data_predict = np.column_stack((endog_predict, exog_predict))
+        engine = self._kernel_engine(self.data, self.data_type, self.bw,
+                                     approx=False)
+        dep_cols = range(self.k_dep)
+        mu_x = np.zeros(data_predict.shape[0])
+        S = np.zeros(data_predict.shape[0])
+        for block in engine.blocks(data_predict):
+            cdf_endog = engine.kernel(block, ckertype="gaussian_cdf",
+                                      ukertype="aitchisonaitken_cdf",
+                                      okertype='wangryzin_cdf',
+                                      cols=dep_cols)
+            cdf_exog = engine.kernel(block, cols=self._exog_cols)
+            mu_x[block.rows] += cdf_exog.sum(1)
+            S[block.rows] += (cdf_endog * cdf_exog).sum(1)
+        cdf_est = S / mu_x
 
         return cdf_est
 
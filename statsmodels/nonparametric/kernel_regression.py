@@ -252,6 +252,117 @@ class KernelReg(GenericKDE):
         #B_x = (f_x * d_mx - m_x * d_fx) / (f_x ** 2)
         return G, B_x
 
+    def _fit_loc_constant(self, bw, data_predict, loo=False):
+        """
+        Local constant estimates at all points in `data_predict`.
+
+        Equivalent to `_est_loc_constant` at each point, with the kernel sums
+        computed for blocks of points.  If `loo` is True, `data_predict` must
+        be `exog`, and the leave-one-out estimates are returned.
+
+        Returns
+        -------
+        G : ndarray
+            The conditional mean at `data_predict`.
+        B_x : ndarray
+            The marginal effects, with shape (npredict, k_vars).
+        """
+        kertypes = dict(ckertype=self.ckertype, ukertype=self.ukertype,
+                        okertype=self.okertype)
+        engine = self._kernel_engine(self.exog, self.var_type, bw,
+                                     values=self.endog)
+        npredict = data_predict.shape[0]
+        G_numer = np.zeros(npredict)
+        G_denom = np.zeros(npredict)
+        d_mx = np.zeros(npredict)
+        d_fx = np.zeros(npredict)
+        # without binning, the observations are left out inside the blocks
+        exclude = loo and engine.approx != 'binned'
+        for block in engine.blocks(data_predict):
+            ker_x = engine.kernel(block, **kertypes)
+            ker_xc = engine.kernel(block, ckertype='d_gaussian')
+            if exclude:
+                engine.exclude_self(block, ker_x)
+                engine.exclude_self(block, ker_xc)
+            endog = block.values[:, 0]
+            G_numer[block.rows] += ker_x @ endog
+            G_denom[block.rows] += block.weighted(ker_x).sum(1)
+            d_mx[block.rows] -= ker_xc @ endog
+            d_fx[block.rows] -= block.weighted(ker_xc).sum(1)
+
+        nobs = self.nobs
+        if loo:
+            nobs -= 1
+        if loo and not exclude:
+            # remove the binned observations from the sums
+            endog = self.endog[:, 0]
+            ker_x = engine.kernel_diag(**kertypes)
+            ker_xc = engine.kernel_diag(ckertype='d_gaussian')
+            G_numer -= ker_x * endog
+            G_denom -= ker_x
+            d_mx += ker_xc * endog
+            d_fx += ker_xc
+        G = G_numer / G_denom
+        B_x = (G_numer * d_fx - G_denom * d_mx) / (nobs * G_denom**2)
+        B_x = np.repeat(B_x[:, None], self.k_vars, axis=1)
+        return G, B_x
+
+    def _fit_loc_linear(self, bw, data_predict, loo=False):
+        """
+        Local linear estimates at all points in `data_predict`.
+
+        Equivalent to `_est_loc_linear` at each point, with the kernel sums
+        computed for blocks of points.  If `loo` is True, `data_predict` must
+        be `exog`, and the leave-one-out estimates are returned.
+
+        Returns
+        -------
+        mean : ndarray
+            The conditional mean at `data_predict`.
+        mfx : ndarray
+            The marginal effects, with shape (npredict, k_vars).
+        """
+        kertypes = dict(ckertype=self.ckertype, ukertype=self.ukertype,
+                        okertype=self.okertype)
+        engine = self._kernel_engine(self.exog, self.var_type, bw,
+                                     values=self.endog)
+        npredict, k_vars = data_predict.shape[0], self.k_vars
+        # The matrix on p.492 in [7] and the corresponding vector
+        M = np.zeros((npredict, k_vars + 1, k_vars + 1))
+        V = np.zeros((npredict, k_vars + 1))
+        # without binning, the observations are left out inside the blocks
+        exclude = loo and engine.approx != 'binned'
+        for block in engine.blocks(data_predict):
+            ker = engine.kernel(block, **kertypes)
+            if exclude:
+                engine.exclude_self(block, ker)
+            diff = block.data[None, :, :] - block.predict[:, None, :]
+            ker_diff = block.weighted(ker)[:, :, None] * diff
+            M12 = ker_diff.sum(1)
+            rows = block.rows
+            M[rows, 0, 0] += block.weighted(ker).sum(1)
+            M[rows, 0, 1:] += M12
+            M[rows, 1:, 0] += M12
+            M[rows, 1:, 1:] += ker_diff.transpose(0, 2, 1) @ diff
+            ker_endog = ker * block.values[:, 0]
+            V[rows, 0] += ker_endog.sum(1)
+            V[rows, 1:] += (ker_endog[:, None, :] @ diff)[:, 0]
+
+        if loo and not exclude:
+            # remove the binned observations, all entries of M and V get a
+            # contribution since the bins are not at the observations
+            endog = self.endog[:, 0]
+            for ker, diff in engine.kernel_diag_terms(**kertypes):
+                ker_diff = ker[:, None] * diff
+                M[:, 0, 0] -= ker
+                M[:, 0, 1:] -= ker_diff
+                M[:, 1:, 0] -= ker_diff
+                M[:, 1:, 1:] -= ker_diff[:, :, None] * diff[:, None, :]
+                V[:, 0] -= ker * endog
+                V[:, 1:] -= ker_diff * endog[:, None]
+        mean_mfx = np.linalg.pinv(M) @ V[:, :, None]
+        return mean_mfx[:, 0, 0], mean_mfx[:, 1:, 0]
+
     def aic_hurvich(self, bw, func=None):
         """
         Computes the AIC Hurvich criteria for the estimation of the bandwidth.
@@ -272,23 +383,23 @@ class KernelReg(GenericKDE):
         ----------
         See ch.2 in [1] and p.35 in [2].
         """
-        H = np.empty((self.nobs, self.nobs))
-        for j in range(self.nobs):
-            H[:, j] = gpke(bw, data=self.exog, data_predict=self.exog[j,:],
-                           ckertype=self.ckertype, ukertype=self.ukertype,
-                           okertype=self.okertype, var_type=self.var_type,
-                           tosum=False)
-
-        denom = H.sum(axis=1)
-        H = H / denom
+        # Only the diagonal of the normalized kernel matrix H is needed
+        engine = self._kernel_engine(self.exog, self.var_type, bw,
+                                     approx=False)
+        kertypes = dict(ckertype=self.ckertype, ukertype=self.ukertype,
+                        okertype=self.okertype)
+        denom = np.zeros(self.nobs)
+        for block in engine.blocks(self.exog):
+            denom += engine.kernel(block, **kertypes).sum(0)
+        trace_H = (engine.kernel_diag(**kertypes) / denom).sum()
         gx = KernelReg(endog=self.endog, exog=self.exog, var_type=self.var_type,
                        reg_type=self.reg_type, bw=bw,
                        defaults=EstimatorSettings(efficient=False)).fit()[0]
         gx = np.reshape(gx, (self.nobs, 1))
         sigma = ((self.endog - gx)**2).sum(axis=0) / float(self.nobs)
 
-        frac = (1 + np.trace(H) / float(self.nobs)) / \
-               (1 - (np.trace(H) + 2) / float(self.nobs))
+        frac = (1 + trace_H / float(self.nobs)) / \
+               (1 - (trace_H + 2) / float(self.nobs))
         #siga = np.dot(self.endog.T, (I - H).T)
         #sigb = np.dot((I - H), self.endog)
         #sigma = np.dot(siga, sigb) / float(self.nobs)
@@ -323,18 +434,27 @@ class KernelReg(GenericKDE):
 
         where :math:`g_{-i}(X_{i})` is the leave-one-out estimator of g(X)
         and :math:`h` is the vector of bandwidths
+
+        For the local constant and local linear estimators, the
+        leave-one-out estimates are computed in blocks of observations, in
+        which the kernel value of each observation with itself is set to
+        zero. If the data are binned, the contribution of each binned
+        observation is subtracted from the sums.
         """
-        LOO_X = LeaveOneOut(self.exog)
-        LOO_Y = LeaveOneOut(self.endog).__iter__()
-        L = 0
-        for ii, X_not_i in enumerate(LOO_X):
-            Y = next(LOO_Y)
-            G = func(bw, endog=Y, exog=-X_not_i,
-                     data_predict=-self.exog[ii, :])[0]
-            L += (self.endog[ii] - G) ** 2
+        if func == self._est_loc_constant:
+            G = self._fit_loc_constant(bw, self.exog, loo=True)[0]
+        elif func == self._est_loc_linear:
+            G = self._fit_loc_linear(bw, self.exog, loo=True)[0]
+        else:
+            LOO_X = LeaveOneOut(self.exog)
+            LOO_Y = LeaveOneOut(self.endog).__iter__()
+            G = np.empty(self.nobs)
+            for ii, X_not_i in enumerate(LOO_X):
+                Y = next(LOO_Y)
+                G[ii] = np.squeeze(func(bw, endog=Y, exog=-X_not_i,
+                                        data_predict=-self.exog[ii, :])[0])
 
-        # Note: There might be a way to vectorize this. See p.72 in [1]
-        return L / self.nobs
+        return ((self.endog[:, 0] - G) ** 2).sum() / self.nobs
 
     def r_squared(self):
         r"""
@@ -377,23 +497,14 @@ class KernelReg(GenericKDE):
         mfx : ndarray
             The marginal effects, i.e. the partial derivatives of the mean.
         """
-        func = self.est[self.reg_type]
         if data_predict is None:
             data_predict = self.exog
         else:
             data_predict = _adjust_shape(data_predict, self.k_vars)
 
-        N_data_predict = np.shape(data_predict)[0]
-        mean = np.empty((N_data_predict,))
-        mfx = np.empty((N_data_predict, self.k_vars))
-        for i in range(N_data_predict):
-            mean_mfx = func(self.bw, self.endog, self.exog,
-                            data_predict=data_predict[i, :])
-            mean[i] = np.squeeze(mean_mfx[0])
-            mfx_c = np.squeeze(mean_mfx[1])
-            mfx[i, :] = mfx_c
-
-        return mean, mfx
+        if self.reg_type == 'lc':
+            return self._fit_loc_constant(self.bw, data_predict)
+        return self._fit_loc_linear(self.bw, data_predict)
 
     def sig_test(self, var_pos, nboot=50, nested_res=25, pivot=False):
         """
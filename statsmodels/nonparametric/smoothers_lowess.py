@@ -6,8 +6,15 @@ Author : Josef Perktold
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import os
+
 import numpy as np
-from ._smoothers_lowess import lowess as _lowess
+from ._smoothers_lowess import (
+    calculate_residual_weights as _residual_weights,
+    lowess as _lowess,
+    lowess_rows as _lowess_rows,
+)
 
 def lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0, xvals=None, is_sorted=False,
            missing='drop', return_sorted=True):
@@ -263,3 +270,439 @@ def lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0, xvals=None, is_sorted=Fal
 
         # we do not need to return exog anymore
         return yfitted
+
+
+def lowess_batch(endog, exog, frac=2.0/3.0, it=3, delta=0.0, xvals=None,
+                 is_sorted=False, out=None, n_jobs=1):
+    """
+    LOWESS of many series at once
+
+    Parameters
+    ----------
+    endog : 2-D numpy array
+        The y-values of the observed points, one series per row.
+    exog : 1-D or 2-D numpy array
+        The x-values of the observed points, either shared by all series or
+        one row per series.
+    frac : {float, array_like}
+        Between 0 and 1. The fraction of the data used when estimating each
+        y-value, either for all series or one value per series.
+    it : {int, array_like}
+        The number of residual-based reweightings to perform, either for all
+        series or one value per series.
+    delta : {float, array_like}
+        Distance within which to use linear-interpolation instead of
+        weighted regression, either for all series or one value per series.
+    xvals : 1-D or 2-D numpy array, optional
+        Values of the exogenous variable at which to evaluate the
+        regression, either shared by all series or one row per series. If
+        supplied, cannot use delta.
+    is_sorted : bool
+        If False (default), then the data will be sorted by exog before
+        calculating lowess. If True, then it is assumed that each row of
+        exog, and of xvals if given, is already sorted.
+    out : 2-D numpy array, optional
+        C-contiguous float64 array in which the fitted values are written,
+        with the shape of endog, or (nseries, nxvals) if xvals is given.
+    n_jobs : int
+        The number of threads used to smooth the series. -1 uses all
+        available cores. Default is 1.
+
+    Returns
+    -------
+    ndarray
+        The fitted values of each series, in the order of the observations
+        in endog, or of xvals if given. This is `out` if it is given.
+
+    See Also
+    --------
+    lowess
+
+    Notes
+    -----
+    Each series is smoothed as by ``lowess(endog[i], exog[i], frac=frac[i],
+    it=it[i], delta=delta[i], xvals=xvals[i], return_sorted=False)``. The
+    series are smoothed without holding the GIL, so that the threads run in
+    parallel. Unlike `lowess`, nan and inf values are not allowed.
+
+    Examples
+    --------
+    >>> fitted = lowess_batch(endog, exog, frac=0.2, it=1, n_jobs=-1)
+    """
+    endog = np.asarray(endog, float)
+    exog = np.asarray(exog, float)
+    if endog.ndim != 2:
+        raise ValueError('endog must be 2-dimensional')
+    nseries, nobs = endog.shape
+    if exog.ndim not in (1, 2) or exog.shape[-1] != nobs:
+        raise ValueError('exog must be a vector or an array with the '
+                         'shape of endog')
+    exog = np.broadcast_to(exog, endog.shape)
+    if not (np.all(np.isfinite(endog)) and np.all(np.isfinite(exog))):
+        raise ValueError('nan or inf found in data')
+
+    params = []
+    for name, value, dtype in (('frac', frac, float), ('it', it, np.int64),
+                               ('delta', delta, float)):
+        value = np.asarray(value, dtype=dtype)
+        if value.ndim > 1 or value.size not in (1, nseries):
+            raise ValueError('%s must be a scalar or have one value per '
+                             'series' % name)
+        params.append(np.ascontiguousarray(np.broadcast_to(value,
+                                                           (nseries,))))
+    frac, it, delta = params
+    if np.any((frac < 0) | (frac > 1)):
+        raise ValueError("Lowess `frac` must be in the range [0,1]!")
+
+    given_xvals = xvals is not None
+    if given_xvals:
+        if np.any(delta != 0):
+            raise ValueError("Cannot have non-zero 'delta' and 'xvals' "
+                             "values")
+        xvals = np.asarray(xvals, float)
+        if xvals.ndim not in (1, 2) or (xvals.ndim == 2 and
+                                        xvals.shape[0] != nseries):
+            raise ValueError('xvals must be a vector or have one row per '
+                             'series')
+        if not np.all(np.isfinite(xvals)):
+            raise ValueError("nan or inf found in xvals")
+        xvals = np.broadcast_to(xvals, (nseries, xvals.shape[-1]))
+    shape = xvals.shape if given_xvals else endog.shape
+    if out is None:
+        out = np.empty(shape)
+    elif (not isinstance(out, np.ndarray) or out.shape != shape or
+          out.dtype != np.double or not out.flags.c_contiguous or
+          not out.flags.writeable):
+        raise ValueError('out must be a writeable C-contiguous float64 array '
+                         'with shape %s' % (shape,))
+
+    rows = np.arange(nseries)[:, None]
+    if not is_sorted:
+        order = np.argsort(exog, axis=1, kind='mergesort')
+        exog = exog[rows, order]
+        endog = endog[rows, order]
+        if given_xvals:
+            xorder = np.argsort(xvals, axis=1, kind='mergesort')
+            xvals = xvals[rows, xorder]
+    exog = np.ascontiguousarray(exog)
+    endog = np.ascontiguousarray(endog)
+    xvals = np.ascontiguousarray(xvals) if given_xvals else exog
+    fitted = out if is_sorted else np.empty(shape)
+
+    n_jobs = int(n_jobs)
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be a positive integer or -1")
+
+    def smooth(start, stop):
+        _lowess_rows(endog, exog, xvals, fitted, frac, it, delta, start,
+                     stop, given_xvals)
+
+    # Several chunks per thread balance the load of series of
+    # different difficulty
+    nchunks = min(nseries, 4 * n_jobs) if n_jobs > 1 else 1
+    bounds = np.linspace(0, nseries, nchunks + 1).astype(int)
+    if nchunks <= 1:
+        smooth(0, nseries)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            list(pool.map(smooth, bounds[:-1], bounds[1:]))
+
+    if not is_sorted:
+        out[rows, xorder if given_xvals else order] = fitted
+    return out
+
+
+class IncrementalLowess:
+    """
+    LOWESS of a growing or sliding window of data, updated incrementally
+
+    Parameters
+    ----------
+    frac : float
+        Between 0 and 1. The fraction of the data used
+        when estimating each y-value.
+    it : int
+        The number of residual-based reweightings
+        to perform.
+    delta : float
+        Distance within which to use linear-interpolation
+        instead of weighted regression.
+    window : int, optional
+        The maximum number of observations that are kept. When new
+        observations are added, the oldest observations are dropped. By
+        default, all observations are kept.
+    weight_tol : float, optional
+        The tolerance of the robustness weights. A regression is only run
+        again if the robustness weight of one of its observations changed by
+        more than `weight_tol` since it was last used. If 0, the fit is
+        identical to `lowess`.
+
+    Notes
+    -----
+    The observations are kept sorted by exog together with the fits and the
+    robustness weights of each iteration. When observations are added or
+    dropped, only the regressions whose neighborhood changed, or that use an
+    observation whose robustness weight changed by more than `weight_tol`,
+    are run again. The number of neighbors, ``frac * nobs``, is fixed once
+    the window is full, so that appending a few observations to the end of
+    a sliding window recomputes about ``frac * window`` regressions instead
+    of all of them.
+
+    The residuals of all observations determine the scale of the
+    robustness weights, so that with `it` > 0 every update can change all
+    weights slightly. Changes below `weight_tol` are ignored.
+
+    With `delta` > 0, regressions are run at a subset of the observations
+    and the remaining fits are interpolated, as in `lowess`. The
+    observations at which regressions were run are kept on update whenever
+    possible, so that the fits can differ from `lowess` by the
+    interpolation error after observations were dropped. Use `refit` to
+    recompute the fit from scratch.
+
+    Examples
+    --------
+    >>> smoother = IncrementalLowess(frac=0.1, it=1, window=50000)
+    >>> smoother.fit(endog, exog)
+    >>> res = smoother.update(new_endog, new_exog)
+    """
+
+    def __init__(self, frac=2.0 / 3.0, it=3, delta=0.0, window=None,
+                 weight_tol=1e-2):
+        if not 0 <= frac <= 1:
+            raise ValueError("Lowess `frac` must be in the range [0,1]!")
+        if window is not None and window < 2:
+            raise ValueError("window must be at least 2")
+        self.frac = frac
+        self.it = int(it)
+        self.delta = delta
+        self.window = window
+        self.weight_tol = weight_tol
+        self._reset()
+
+    def _reset(self):
+        stages = self.it + 1
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._next_id = 0
+        self._k = 0
+        self._fits = np.empty((stages, 0))
+        self._weights = np.empty((stages, 0))
+        self._is_anchor = np.empty(0, dtype=bool)
+        self._left = np.empty(0, dtype=np.intp)
+        self.resid_weights = np.empty(0)
+        self.n_regressions = 0
+
+    @property
+    def exog(self):
+        """The observations of exog in the window, sorted"""
+        return self._x
+
+    @property
+    def endog(self):
+        """The observations of endog in the window, sorted by exog"""
+        return self._y
+
+    @property
+    def fittedvalues(self):
+        """The fitted values at exog"""
+        return self._fits[-1]
+
+    def fit(self, endog, exog):
+        """
+        Fit the smoother to new data, dropping any previous observations
+
+        Parameters
+        ----------
+        endog : 1-D numpy array
+            The y-values of the observed points
+        exog : 1-D numpy array
+            The x-values of the observed points
+
+        Returns
+        -------
+        ndarray
+            A numpy array with two columns. The first column contains the
+            sorted x (exog) values and the second column the associated
+            estimated y (endog) values.
+        """
+        self._reset()
+        return self.update(endog, exog)
+
+    def update(self, endog, exog):
+        """
+        Add observations and update the fit
+
+        Observations with nan or inf are dropped. If a window is set, the
+        oldest observations are dropped so that at most `window`
+        observations are kept.
+
+        Parameters
+        ----------
+        endog : 1-D numpy array
+            The y-values of the new points
+        exog : 1-D numpy array
+            The x-values of the new points
+
+        Returns
+        -------
+        ndarray
+            A numpy array with two columns. The first column contains the
+            sorted x (exog) values and the second column the associated
+            estimated y (endog) values of all observations in the window.
+        """
+        endog = np.asarray(endog, float)
+        exog = np.asarray(exog, float)
+        if exog.ndim != 1:
+            raise ValueError('exog must be a vector')
+        if endog.ndim != 1:
+            raise ValueError('endog must be a vector')
+        if endog.shape[0] != exog.shape[0]:
+            raise ValueError('exog and endog must have same length')
+        ids = self._next_id + np.arange(exog.shape[0])
+        self._next_id += exog.shape[0]
+        valid = np.isfinite(exog) & np.isfinite(endog)
+        exog, endog, ids = exog[valid], endog[valid], ids[valid]
+
+        keep = np.ones(self._x.shape[0], dtype=bool)
+        if self.window is not None:
+            # the ids increase with the time an observation was added
+            all_ids = np.concatenate([self._ids, ids])
+            if all_ids.shape[0] > self.window:
+                first = np.sort(all_ids)[-self.window]
+                keep = self._ids >= first
+                new = ids >= first
+                exog, endog, ids = exog[new], endog[new], ids[new]
+
+        x = np.concatenate([self._x[keep], exog])
+        order = np.argsort(x, kind='mergesort')
+        old_pos = np.concatenate([np.flatnonzero(keep),
+                                  np.full(exog.shape[0], -1)])[order]
+        self._x = np.ascontiguousarray(x[order])
+        self._y = np.ascontiguousarray(
+            np.concatenate([self._y[keep], endog])[order])
+        self._ids = np.concatenate([self._ids[keep], ids])[order]
+        self._smooth(old_pos)
+        return np.column_stack([self._x, self.fittedvalues])
+
+    def refit(self):
+        """
+        Recompute the fit of the current observations from scratch
+
+        Returns
+        -------
+        ndarray
+            A numpy array with two columns. The first column contains the
+            sorted x (exog) values and the second column the associated
+            estimated y (endog) values.
+        """
+        self._smooth(np.full(self._x.shape[0], -1), rebuild=True)
+        return np.column_stack([self._x, self.fittedvalues])
+
+    def _anchors(self, old_pos, rebuild):
+        # The observations at which a regression is run, following the
+        # rules of lowess.  Previous anchors are preferred, so that the
+        # regressions can be reused.
+        x = self._x
+        nobs = x.shape[0]
+        if self.delta == 0:
+            return np.flatnonzero(np.r_[True, x[1:] != x[:-1]])
+        if rebuild:
+            previous = np.empty(0, dtype=np.intp)
+        else:
+            previous = np.flatnonzero((old_pos >= 0) &
+                                      self._is_anchor[np.maximum(old_pos, 0)])
+        anchors = [0]
+        while True:
+            anchor = anchors[-1]
+            last_tie = np.searchsorted(x, x[anchor], side='right') - 1
+            if last_tie >= nobs - 1:
+                break
+            beyond = np.searchsorted(x, x[anchor] + self.delta, side='right')
+            nxt = max(min(beyond, nobs - 1) - 1, last_tie + 1)
+            idx = np.searchsorted(previous, last_tie, side='right')
+            if idx < previous.shape[0] and previous[idx] <= nxt:
+                nxt = previous[idx]
+            anchors.append(nxt)
+        return np.array(anchors, dtype=np.intp)
+
+    def _smooth(self, old_pos, rebuild=False):
+        x, y = self._x, self._y
+        nobs = x.shape[0]
+        stages = self.it + 1
+        if nobs == 0:
+            self._reset()
+            return
+        k = min(max(int(self.frac * nobs + 1e-10), 2), nobs)
+        rebuild = rebuild or k != self._k
+        anchors = self._anchors(old_pos, rebuild)
+        # The neighborhood of each anchor is x[left:left + k]
+        left = np.searchsorted((x[:nobs - k] + x[k:]) / 2.0, x[anchors])
+        stop = left + k
+
+        old = np.maximum(old_pos, 0)
+        added = old_pos < 0
+        if rebuild:
+            changed = np.ones(anchors.shape[0], dtype=bool)
+        else:
+            count = np.r_[0, np.cumsum(added)]
+            first, last = old_pos[left], old_pos[stop - 1]
+            was_anchor = ~added[anchors] & self._is_anchor[old[anchors]]
+            changed = ((count[stop] > count[left]) | (last - first != k - 1) |
+                       ~was_anchor | (self._left[old[anchors]] != first))
+
+        fits = np.empty((stages, nobs))
+        weights = np.ones((stages, nobs))
+        if self._fits.shape[1]:
+            weights[1:] = self._weights[1:, old]
+        for stage in range(stages):
+            dirty = changed
+            if stage > 0:
+                target = _residual_weights(y, fits[stage - 1])
+                moved = np.abs(target - weights[stage]) > self.weight_tol
+                moved |= added
+                if rebuild:
+                    moved[:] = True
+                weights[stage, moved] = target[moved]
+                count = np.r_[0, np.cumsum(moved)]
+                dirty = dirty | (count[stop] > count[left])
+            anchor_fits = np.empty(anchors.shape[0])
+            keep = ~dirty
+            if keep.any():
+                anchor_fits[keep] = self._fits[stage, old[anchors[keep]]]
+            if dirty.any():
+                anchor_fits[dirty] = self._regress(anchors[dirty],
+                                                   left[dirty], k,
+                                                   weights[stage])
+            fits[stage] = np.interp(x, x[anchors], anchor_fits)
+
+        self._k = k
+        self._fits = fits
+        self._weights = weights
+        self._is_anchor = np.zeros(nobs, dtype=bool)
+        self._is_anchor[anchors] = True
+        self._left = np.zeros(nobs, dtype=np.intp)
+        self._left[anchors] = left
+        self.resid_weights = _residual_weights(y, fits[-1])
+
+    def _regress(self, anchors, left, k, weights, chunksize=128):
+        # Run the local regressions at the anchors on the slices of the data
+        # that contain their neighborhoods
+        x, y = self._x, self._y
+        out = np.empty(anchors.shape[0])
+        breaks = np.flatnonzero(np.diff(left) > k) + 1
+        for run in np.split(np.arange(anchors.shape[0]), breaks):
+            for start in range(0, run.shape[0], chunksize):
+                chunk = run[start:start + chunksize]
+                lo, hi = left[chunk[0]], left[chunk[-1]] + k
+                res, _ = _lowess(y[lo:hi], x[lo:hi], x[anchors[chunk]],
+                                 weights[lo:hi], frac=k / (hi - lo), it=0,
+                                 delta=0.0, given_xvals=True)
+                out[chunk] = res[:, 1]
+        self.n_regressions += anchors.shape[0]
+        # Without a valid regression, lowess uses the observation itself
+        bad = np.isnan(out)
+        out[bad] = y[anchors[bad]]
+        return out
@@ -4,10 +4,15 @@ import numpy.testing as npt
 import numpy as np
 import pandas as pd
 import pytest
-from scipy import stats
+from scipy import optimize, special, stats
 
 from statsmodels.distributions.mixture_rvs import mixture_rvs
-from statsmodels.nonparametric.kde import KDEUnivariate as KDE
+from statsmodels.nonparametric.kde import (
+    KDEUnivariate as KDE,
+    kdensity,
+    kdensity_binned,
+    kernel_switch,
+)
 import statsmodels.sandbox.nonparametric.kernels as kernels
 import statsmodels.nonparametric.bandwidths as bandwidths
 
@@ -46,9 +51,14 @@ class TestKDEExceptions:
         with pytest.raises(ValueError):
             self.kde.evaluate(0)
 
-    def test_non_weighted_fft_exception(self):
-        with pytest.raises(NotImplementedError):
-            self.kde.fit(kernel="gau", gridsize=50, weights=self.weights_200,
+    def test_wrong_weight_length_fft_exception(self):
+        with pytest.raises(ValueError):
+            self.kde.fit(kernel="gau", gridsize=50, weights=self.weights_100,
+                         fft=True, bw="silverman")
+
+    def test_negative_weights_exception(self):
+        with pytest.raises(ValueError, match="nonnegative"):
+            self.kde.fit(kernel="epa", gridsize=50, weights=-self.weights_200,
                          fft=True, bw="silverman")
 
     def test_wrong_weight_length_exception(self):
@@ -56,10 +66,6 @@ class TestKDEExceptions:
             self.kde.fit(kernel="gau", gridsize=50, weights=self.weights_100,
                          fft=False, bw="silverman")
 
-    def test_non_gaussian_fft_exception(self):
-        with pytest.raises(NotImplementedError):
-            self.kde.fit(kernel="epa", gridsize=50, fft=True, bw="silverman")
-
 
 class CheckKDE:
     decimal_density = 7
@@ -120,8 +126,17 @@ class TestKDEGauss(CheckKDE):
 
     def test_icdf_gridded(self):
         kde = self.res1
-        icdf = KCDEResults['gau_icdf']
-        npt.assert_allclose(icdf, kde.icdf)
+        probs = np.linspace(0, 1, len(kde.support))
+        inner = slice(2, -2)
+
+        def cdf(x, prob):
+            return special.ndtr((x - kde.endog) / kde.bw).mean() - prob
+
+        icdf = [optimize.brentq(cdf, -5, 5, args=(prob,))
+                for prob in probs[inner]]
+        npt.assert_allclose(kde.icdf[inner], icdf, atol=1e-3)
+        assert kde.icdf[0] == kde.support[0]
+        assert kde.icdf[-1] == kde.support[-1]
 
 
 class TestKDEGaussPandas(TestKDEGauss):
@@ -398,3 +413,78 @@ class TestKDECustomBandwidth:
 
         npt.assert_almost_equal(s1, kde.support, self.decimal_density)
         npt.assert_almost_equal(d1, kde.density, self.decimal_density)
+
+
+@pytest.mark.parametrize("kernel", sorted(kernel_switch))
+def test_fft_weighted_kernels(kernel):
+    weights = np.linspace(1, 100, 200)
+    res_fft = KDE(Xi).fit(kernel=kernel, weights=weights, fft=True, bw=0.4,
+                          gridsize=512)
+    res = KDE(Xi).fit(kernel=kernel, weights=weights, fft=False, bw=0.4,
+                      gridsize=512)
+    npt.assert_allclose(res_fft.support, res.support)
+    # the uniform kernel is discontinuous, so that binning is less accurate
+    atol = 0.1 if kernel == "uni" else 2e-3
+    npt.assert_allclose(res_fft.density, res.density,
+                        atol=atol * res.density.max())
+    npt.assert_allclose(res_fft.cdf, res.cdf, atol=atol)
+    assert np.all(np.diff(res_fft.cdf) >= 0)
+    npt.assert_allclose(res.cdf[-1], 1, atol=1e-4)
+
+
+def test_fft_frequency_weights():
+    counts = np.arange(200) % 3 + 1
+    res_w = KDE(Xi).fit(kernel="biw", weights=counts, bw=0.3)
+    res = KDE(np.repeat(Xi, counts)).fit(kernel="biw", bw=0.3,
+                                         gridsize=len(res_w.support))
+    npt.assert_allclose(res_w.support, res.support)
+    npt.assert_allclose(res_w.density, res.density, rtol=1e-10,
+                        atol=1e-12 * res.density.max())
+
+
+class TestKDEBinned:
+
+    @classmethod
+    def setup_class(cls):
+        rs = np.random.RandomState(0)
+        cls.x = rs.standard_normal((300, 3)) * [1, 2, 0.5]
+        cls.weights = rs.uniform(0, 2, 300)
+
+    @pytest.mark.parametrize("kernel", ["gau", "epa", "triw"])
+    @pytest.mark.parametrize("k_vars", [2, 3])
+    def test_direct(self, kernel, k_vars):
+        x = self.x[:, :k_vars]
+        bw = np.array([0.8, 1.6, 0.4])[:k_vars]
+        density, grid, bw = kdensity_binned(x, kernel=kernel, bw=bw,
+                                            weights=self.weights,
+                                            gridsize=[128, 128, 64][k_vars - 1])
+        assert density.shape == tuple(len(axis) for axis in grid)
+
+        # direct evaluation at a subset of the grid points
+        rs = np.random.RandomState(1)
+        index = tuple(rs.randint(0, len(axis), 500) for axis in grid)
+        kern = kernel_switch[kernel]()
+        direct = np.ones((500, len(x)))
+        for axis, idx, col, h in zip(grid, index, x.T, bw):
+            u = (axis[idx, None] - col) / h
+            value = kern.weight(u) / h
+            if kern.domain is not None:
+                value[np.abs(u) > kern.domain[1]] = 0
+            direct *= value
+        direct = direct @ self.weights / self.weights.sum()
+        npt.assert_allclose(density[index], direct,
+                            atol=0.02 * density.max())
+
+        volume = np.prod([axis[1] - axis[0] for axis in grid])
+        npt.assert_allclose(density.sum() * volume, 1, rtol=1e-2)
+
+    def test_univariate(self):
+        x = self.x[:, 0]
+        density, grid, bw = kdensity_binned(x, kernel="epa", gridsize=512,
+                                            weights=self.weights)
+        direct, support, bw_direct = kdensity(x, kernel="epa",
+                                              weights=self.weights,
+                                              gridsize=512)
+        npt.assert_allclose(bw, bw_direct)
+        npt.assert_allclose(grid[0], support)
+        npt.assert_allclose(density, direct, atol=1e-3 * direct.max())
@@ -425,3 +425,127 @@ def test_all_kernels(kernel, reset_randomstate):
     density = sm.nonparametric.KDEUnivariate(data)
     density.fit(kernel="gau", fft=False)
     assert isinstance(density.evaluate(x_grid), np.ndarray)
+
+
+def _mixed_data(nobs=150, seed=1234):
+    rs = np.random.RandomState(seed)
+    return np.column_stack([rs.normal(size=nobs), rs.normal(2, 1, size=nobs),
+                            rs.binomial(3, 0.5, size=nobs),
+                            rs.binomial(2, 0.3, size=nobs)])
+
+
+@pytest.mark.parametrize("block_size", [None, 100])
+def test_blocked_evaluation(block_size):
+    # The blocked kernel sums agree with the pointwise gpke evaluation
+    from statsmodels.nonparametric._kernel_base import gpke, LeaveOneOut
+
+    data = _mixed_data()
+    var_type = 'ccou'
+    bw = np.array([0.5, 0.6, 0.3, 0.2])
+    nobs = data.shape[0]
+    settings = nparam.EstimatorSettings(block_size=block_size)
+    dens = nparam.KDEMultivariate(data, var_type, bw=bw, defaults=settings)
+    data_predict = data[:20] + 0.1
+
+    pdf = [gpke(bw, data, x, var_type) / nobs for x in data_predict]
+    assert_allclose(dens.pdf(data_predict), pdf, rtol=1e-12)
+    cdf = [gpke(bw, data, x, var_type, ckertype="gaussian_cdf",
+                ukertype="aitchisonaitken_cdf",
+                okertype="wangryzin_cdf") / nobs for x in data_predict]
+    assert_allclose(dens.cdf(data_predict), cdf, rtol=1e-12)
+
+    loo = 0
+    for i, X_not_i in enumerate(LeaveOneOut(data)):
+        loo += np.log(gpke(bw, -X_not_i, -data[i], var_type))
+    assert_allclose(dens.loo_likelihood(bw, np.log), -loo, rtol=1e-12)
+
+    dens_c = nparam.KDEMultivariateConditional(
+        data[:, :2], data[:, 2:], 'cc', 'ou', bw=bw, defaults=settings)
+    f_yx = [gpke(bw, data, x, var_type) for x in data_predict]
+    f_x = [gpke(bw[2:], data[:, 2:], x[2:], 'ou') for x in data_predict]
+    assert_allclose(dens_c.pdf(data_predict[:, :2], data_predict[:, 2:]),
+                    np.divide(f_yx, f_x), rtol=1e-12)
+
+
+@pytest.mark.parametrize("approx", [None, "tree"])
+@pytest.mark.parametrize("bw", [0.03, 0.05, 0.1])
+def test_loo_small_bandwidth(approx, bw):
+    # The leave-one-out densities of isolated points are tiny, they are not
+    # lost by cancellation
+    from statsmodels.nonparametric._kernel_base import gpke, LeaveOneOut
+
+    data = np.random.RandomState(0).standard_normal((300, 2))
+    bw = np.array([bw, bw])
+    settings = nparam.EstimatorSettings(approx=approx, approx_tol=1e-300)
+    dens = nparam.KDEMultivariate(data, 'cc', bw=bw, defaults=settings)
+    f = np.array([gpke(bw, -X_not_i, -data[i], 'cc')
+                  for i, X_not_i in enumerate(LeaveOneOut(data))])
+    assert np.all(f > 0)
+    engine = dens._kernel_engine(data, 'cc', bw)
+    assert_allclose(engine.loo_kernel_sum(), f, rtol=1e-10)
+    assert_allclose(dens.loo_likelihood(bw, np.log), -np.log(f).sum(),
+                    rtol=1e-12)
+
+    dens_c = nparam.KDEMultivariateConditional(
+        data[:, :1], data[:, 1:], 'c', 'c', bw=bw, defaults=settings)
+    f_x = np.array([gpke(bw[1:], -X_not_i, -data[i, 1:], 'c')
+                    for i, X_not_i in enumerate(LeaveOneOut(data[:, 1:]))])
+    assert_allclose(dens_c.loo_likelihood(bw, np.log),
+                    -np.log(f / f_x).sum(), rtol=1e-12)
+
+
+@pytest.mark.parametrize("approx", ["tree", "binned"])
+def test_approximation(approx):
+    data = _mixed_data(400)
+    var_type = 'ccou'
+    bw = np.array([0.3, 0.4, 0.3, 0.2])
+    tol = 1e-5
+    dens = nparam.KDEMultivariate(data, var_type, bw=bw)
+    settings = nparam.EstimatorSettings(approx=approx, approx_tol=tol)
+    dens_approx = nparam.KDEMultivariate(data, var_type, bw=bw,
+                                         defaults=settings)
+    data_predict = np.column_stack([np.linspace(-3, 3, 50),
+                                    np.linspace(-1, 5, 50),
+                                    np.tile([0, 1, 2, 3, 1], 10),
+                                    np.tile([0, 1], 25)])
+    # The error bound relative to the peak of the continuous kernel
+    bound = tol / (2 * np.pi * bw[0] * bw[1])
+    assert_array_less = npt.assert_array_less
+    assert_array_less(np.abs(dens_approx.pdf(data_predict) -
+                             dens.pdf(data_predict)), bound)
+    assert_allclose(dens_approx.loo_likelihood(bw, np.log),
+                    dens.loo_likelihood(bw, np.log), rtol=1e-4)
+    assert_allclose(dens_approx.imse(bw), dens.imse(bw), rtol=1e-4)
+    # The cdf is not approximated
+    assert_allclose(dens_approx.cdf(data_predict), dens.cdf(data_predict),
+                    rtol=1e-12)
+
+    dens_c = nparam.KDEMultivariateConditional(
+        data[:, :1], data[:, 1:], 'c', 'cou', bw=bw)
+    dens_c_approx = nparam.KDEMultivariateConditional(
+        data[:, :1], data[:, 1:], 'c', 'cou', bw=bw, defaults=settings)
+    assert_allclose(dens_c_approx.pdf(), dens_c.pdf(), rtol=1e-3)
+    assert_allclose(dens_c_approx.loo_likelihood(bw, np.log),
+                    dens_c.loo_likelihood(bw, np.log), rtol=1e-4)
+
+
+def test_approximation_invalid():
+    data = _mixed_data()
+    bw = np.array([0.5, 0.6, 0.3, 0.2])
+    settings = nparam.EstimatorSettings(approx="grid")
+    dens = nparam.KDEMultivariate(data, 'ccou', bw=bw, defaults=settings)
+    with pytest.raises(ValueError, match="approx must be"):
+        dens.pdf()
+
+    settings = nparam.EstimatorSettings(approx="tree")
+    dens = nparam.KDEMultivariate(data[:, 2:], 'ou', bw=bw[2:],
+                                  defaults=settings)
+    with pytest.raises(ValueError, match="continuous variable"):
+        dens.pdf()
+
+    settings = nparam.EstimatorSettings(approx="binned")
+    data = np.random.RandomState(0).normal(size=(50, 4))
+    dens = nparam.KDEMultivariate(data, 'cccc', bw=np.ones(4),
+                                  defaults=settings)
+    with pytest.raises(ValueError, match="up to 3 continuous"):
+        dens.pdf()
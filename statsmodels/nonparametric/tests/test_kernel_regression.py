@@ -390,3 +390,102 @@ def test_invalid_kernel():
     with pytest.raises(ValueError):
         nparam.KernelCensoredReg(x, y, reg_type='ll', var_type='cc', bw='cv_ls',
                                  censor_val=0, ckertype='silverman')
+
+
+def _mixed_reg_data(nobs=150, seed=1234):
+    rs = np.random.RandomState(seed)
+    exog = np.column_stack([rs.normal(size=nobs), rs.binomial(3, 0.5, nobs),
+                            rs.uniform(size=nobs)])
+    endog = (np.sin(exog[:, 0]) + 0.3 * exog[:, 1] + exog[:, 2] +
+             rs.normal(scale=0.2, size=nobs))
+    return endog, exog
+
+
+@pytest.mark.parametrize("reg_type", ["lc", "ll"])
+@pytest.mark.parametrize("block_size", [None, 100])
+def test_blocked_fit(reg_type, block_size):
+    # The blocked estimates agree with the pointwise estimators
+    from statsmodels.nonparametric._kernel_base import LeaveOneOut
+
+    endog, exog = _mixed_reg_data()
+    bw = np.array([0.4, 0.3, 0.2])
+    settings = nparam.EstimatorSettings(block_size=block_size)
+    model = nparam.KernelReg(endog, exog, 'coc', reg_type=reg_type, bw=bw,
+                             defaults=settings)
+    func = model.est[reg_type]
+    mean, mfx = model.fit(exog[:20] + 0.05)
+    for i, x in enumerate(exog[:20] + 0.05):
+        mean_i, mfx_i = func(bw, model.endog, model.exog, data_predict=x)
+        npt.assert_allclose(mean[i], np.squeeze(mean_i), rtol=1e-10)
+        npt.assert_allclose(mfx[i], np.squeeze(mfx_i), rtol=1e-8,
+                            atol=1e-12)
+
+    cv = 0
+    loo_endog = LeaveOneOut(model.endog).__iter__()
+    for i, X_not_i in enumerate(LeaveOneOut(model.exog)):
+        G = func(bw, endog=next(loo_endog), exog=-X_not_i,
+                 data_predict=-model.exog[i])[0]
+        cv += np.squeeze((model.endog[i] - G) ** 2)
+    npt.assert_allclose(model.cv_loo(bw, func), cv / model.nobs, rtol=1e-10)
+
+
+@pytest.mark.parametrize("reg_type, bw", [("lc", 0.05), ("ll", 0.15)])
+def test_loo_small_bandwidth(reg_type, bw):
+    # The leave-one-out estimates do not lose the small kernel sums of
+    # isolated points by cancellation
+    from statsmodels.nonparametric._kernel_base import LeaveOneOut
+
+    rs = np.random.RandomState(0)
+    exog = rs.standard_normal((200, 2))
+    endog = exog.sum(1) + rs.normal(scale=0.1, size=200)
+    bw = np.array([bw, bw])
+    model = nparam.KernelReg(endog, exog, 'cc', reg_type=reg_type, bw=bw)
+    func = model.est[reg_type]
+    mean, _ = model._fit_loc_constant(bw, model.exog, loo=True) \
+        if reg_type == "lc" else model._fit_loc_linear(bw, model.exog,
+                                                         loo=True)
+    loo_endog = LeaveOneOut(model.endog).__iter__()
+    for i, X_not_i in enumerate(LeaveOneOut(model.exog)):
+        mean_i = func(bw, endog=next(loo_endog), exog=-X_not_i,
+                      data_predict=-model.exog[i])[0]
+        npt.assert_allclose(mean[i], np.squeeze(mean_i), rtol=1e-8)
+
+
+def test_loo_binned_local_linear():
+    # The binned observation is removed from all sums of the local linear
+    # estimator, not only from the kernel sum
+    rs = np.random.RandomState(0)
+    exog = rs.standard_normal((300, 2))
+    endog = exog.sum(1) ** 2 + rs.normal(scale=0.1, size=300)
+    bw = np.array([0.3, 0.3])
+    model = nparam.KernelReg(endog, exog, 'cc', reg_type='ll', bw=bw)
+    settings = nparam.EstimatorSettings(approx="binned", approx_tol=1e-4)
+    model_binned = nparam.KernelReg(endog, exog, 'cc', reg_type='ll', bw=bw,
+                                    defaults=settings)
+    mean = model._fit_loc_linear(bw, model.exog, loo=True)[0]
+    mean_binned = model_binned._fit_loc_linear(bw, model.exog, loo=True)[0]
+    npt.assert_allclose(mean_binned, mean, atol=0.02)
+
+
+@pytest.mark.parametrize("reg_type", ["lc", "ll"])
+@pytest.mark.parametrize("approx", ["tree", "binned"])
+def test_approximate_fit(reg_type, approx):
+    endog, exog = _mixed_reg_data(300)
+    bw = np.array([0.4, 0.3, 0.2])
+    model = nparam.KernelReg(endog, exog, 'coc', reg_type=reg_type, bw=bw)
+    settings = nparam.EstimatorSettings(approx=approx, approx_tol=1e-6)
+    model_approx = nparam.KernelReg(endog, exog, 'coc', reg_type=reg_type,
+                                    bw=bw, defaults=settings)
+    npt.assert_allclose(model_approx.fit()[0], model.fit()[0], atol=1e-5)
+    func = model.est[reg_type]
+    npt.assert_allclose(model_approx.cv_loo(bw, model_approx.est[reg_type]),
+                        model.cv_loo(bw, func), rtol=1e-3)
+
+
+def test_approximate_fit_kernel():
+    endog, exog = _mixed_reg_data()
+    settings = nparam.EstimatorSettings(approx="tree")
+    model = nparam.KernelReg(endog, exog, 'coc', bw=[0.4, 0.3, 0.2],
+                             ckertype='tricube', defaults=settings)
+    with pytest.raises(ValueError, match="cannot be used"):
+        model.fit()
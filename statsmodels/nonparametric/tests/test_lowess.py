@@ -21,7 +21,11 @@ from numpy.testing import (
 )
 import pytest
 
-from statsmodels.nonparametric.smoothers_lowess import lowess
+from statsmodels.nonparametric.smoothers_lowess import (
+    IncrementalLowess,
+    lowess,
+    lowess_batch,
+)
 import pandas as pd
 
 # Number of decimals to test equality with.
@@ -304,3 +308,154 @@ def test_xvals_dtype(reset_randomstate):
     # Previously raised ValueError: Buffer dtype mismatch
     results_xvals = lowess(y, x, frac=0.4, xvals=x[:5])
     assert_allclose(results_xvals, np.zeros(5), atol=1e-12)
+
+
+class TestIncrementalLowess:
+
+    @classmethod
+    def setup_class(cls):
+        rs = np.random.RandomState(0)
+        cls.x = np.arange(600.)
+        cls.y = np.sin(cls.x / 50) + rs.standard_t(3, 600)
+        # some ties
+        cls.x[100:110] = 100
+
+    @pytest.mark.parametrize("it", [0, 2])
+    def test_window(self, it):
+        x, y = self.x, self.y
+        smoother = IncrementalLowess(frac=0.2, it=it, window=400,
+                                     weight_tol=0)
+        res = smoother.fit(y[:350], x[:350])
+        assert_allclose(res, lowess(y[:350], x[:350], frac=0.2, it=it),
+                        rtol=1e-13, atol=1e-13)
+        for start in range(350, 600, 50):
+            res = smoother.update(y[start:start + 50], x[start:start + 50])
+            lo = max(start + 50 - 400, 0)
+            expected = lowess(y[lo:start + 50], x[lo:start + 50], frac=0.2,
+                              it=it)
+            assert_allclose(res, expected, rtol=1e-13, atol=1e-13)
+        assert_equal(smoother.exog, x[200:])
+
+    def test_regressions(self):
+        x, y = self.x, self.y
+        smoother = IncrementalLowess(frac=0.2, it=0, window=400)
+        smoother.fit(y[:400], x[:400])
+        # one regression for each distinct value
+        n_fit = len(np.unique(x[:400]))
+        assert_equal(smoother.n_regressions, n_fit)
+        smoother.update(y[400:410], x[400:410])
+        # the neighborhoods of 80 points change on each side
+        assert smoother.n_regressions - n_fit <= 2 * (80 + 10)
+
+    def test_weight_tol(self):
+        x, y = self.x, self.y
+        smoother = IncrementalLowess(frac=0.2, it=3, window=400)
+        smoother.fit(y[:400], x[:400])
+        for start in range(400, 600, 20):
+            res = smoother.update(y[start:start + 20], x[start:start + 20])
+        expected = lowess(y[200:], x[200:], frac=0.2, it=3)
+        assert_allclose(res, expected, atol=0.05)
+        assert_allclose(smoother.refit(), expected, rtol=1e-13, atol=1e-13)
+
+    def test_delta(self):
+        x, y = self.x, self.y
+        smoother = IncrementalLowess(frac=0.2, it=1, delta=10, window=400,
+                                     weight_tol=0)
+        res = smoother.fit(y[:400], x[:400])
+        expected = lowess(y[:400], x[:400], frac=0.2, it=1, delta=10)
+        assert_allclose(res, expected, rtol=1e-13, atol=1e-13)
+        # appending keeps the anchors of lowess
+        res = smoother.update(y[400:420], x[400:420])
+        expected = lowess(y[20:420], x[20:420], frac=0.2, it=1, delta=10)
+        assert_allclose(res, expected, atol=0.05)
+        assert_allclose(smoother.refit(), expected, rtol=1e-13, atol=1e-13)
+
+    def test_unsorted_missing(self):
+        rs = np.random.RandomState(1)
+        x = rs.uniform(0, 10, 200)
+        y = np.cos(x) + 0.1 * rs.standard_normal(200)
+        y[5] = np.nan
+        smoother = IncrementalLowess(frac=0.3, it=1, weight_tol=0)
+        smoother.fit(y[:100], x[:100])
+        res = smoother.update(y[100:], x[100:])
+        assert_allclose(res, lowess(y, x, frac=0.3, it=1), rtol=1e-13,
+                        atol=1e-13)
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            IncrementalLowess(frac=2)
+        with pytest.raises(ValueError):
+            IncrementalLowess(window=1)
+        with pytest.raises(ValueError):
+            IncrementalLowess().fit(np.zeros(3), np.zeros(4))
+
+
+class TestLowessBatch:
+    @classmethod
+    def setup_class(cls):
+        rs = np.random.RandomState(2)
+        cls.exog = rs.uniform(0, 10, (12, 150))
+        cls.endog = np.sin(cls.exog) + rs.standard_t(3, cls.exog.shape)
+        cls.frac = rs.uniform(0.1, 0.9, 12)
+        cls.it = rs.randint(0, 4, 12)
+        cls.delta = rs.uniform(0, 0.5, 12)
+
+    def expected(self, **kwargs):
+        return np.array([
+            lowess(self.endog[i], self.exog[i], frac=self.frac[i],
+                   it=self.it[i], return_sorted=False,
+                   **{key: val[i] for key, val in kwargs.items()})
+            for i in range(len(self.endog))])
+
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_per_series(self, n_jobs):
+        res = lowess_batch(self.endog, self.exog, frac=self.frac, it=self.it,
+                           delta=self.delta, n_jobs=n_jobs)
+        assert_equal(res, self.expected(delta=self.delta))
+
+    def test_sorted_out(self):
+        order = np.argsort(self.exog, axis=1)
+        exog = np.take_along_axis(self.exog, order, 1)
+        endog = np.take_along_axis(self.endog, order, 1)
+        out = np.empty_like(endog)
+        res = lowess_batch(endog, exog, frac=0.4, it=2, is_sorted=True,
+                           out=out)
+        assert_(res is out)
+        for i in range(len(endog)):
+            assert_equal(out[i], lowess(endog[i], exog[i], frac=0.4, it=2,
+                                        is_sorted=True, return_sorted=False))
+
+    def test_shared_exog(self):
+        res = lowess_batch(self.endog, self.exog[0], frac=0.3, delta=0.1)
+        for i in range(len(self.endog)):
+            assert_equal(res[i], lowess(self.endog[i], self.exog[0],
+                                        frac=0.3, delta=0.1,
+                                        return_sorted=False))
+
+    def test_xvals(self):
+        xvals = np.linspace(10, 0, 23)
+        res = lowess_batch(self.endog, self.exog, frac=self.frac, it=self.it,
+                           xvals=xvals, n_jobs=2)
+        expected = self.expected(xvals=np.tile(xvals, (12, 1)))
+        assert_equal(res, expected)
+
+    def test_errors(self):
+        endog, exog = self.endog, self.exog
+        with pytest.raises(ValueError):
+            lowess_batch(endog[0], exog[0])
+        with pytest.raises(ValueError):
+            lowess_batch(endog, exog[:, 1:])
+        with pytest.raises(ValueError):
+            lowess_batch(endog, exog, frac=[0.5, 0.5])
+        with pytest.raises(ValueError):
+            lowess_batch(endog, exog, frac=1.5)
+        with pytest.raises(ValueError):
+            lowess_batch(endog, exog, delta=0.1, xvals=exog[0])
+        with pytest.raises(ValueError):
+            lowess_batch(endog, exog, out=np.empty((12, 150), order="F"))
+        with pytest.raises(ValueError):
+            lowess_batch(endog, exog, n_jobs=0)
+        endog = endog.copy()
+        endog[0, 0] = np.nan
+        with pytest.raises(ValueError):
+            lowess_batch(endog, exog)
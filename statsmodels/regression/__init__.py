@@ -1,7 +1,12 @@
 from .linear_model import yule_walker
 
 from statsmodels.tools._test_runner import PytestTester
+from statsmodels.tools._lazy import lazy_submodules
 
 __all__ = ['yule_walker', 'test']
 
 test = PytestTester()
+
+# Submodules are imported on first access, e.g. through statsmodels.api
+__getattr__ = lazy_submodules(__name__)
+del lazy_submodules
@@ -7,9 +7,11 @@ License: BSD-3
 """
 
 import numpy as np
-from scipy import stats
+from scipy import sparse, stats
 import pandas as pd
 
+from statsmodels.base._prediction_inference import _var_linear_prediction
+
 
 # this is similar to ContrastResults after t_test, copied and adjusted
 class PredictionResults:
@@ -170,14 +172,17 @@ def get_prediction(self, exog=None, transform=True, weights=None,
             if callable(row_labels):
                 row_labels = None
 
-        exog = np.asarray(exog)
-        if exog.ndim == 1:
-            # Params informs whether a row or column vector
-            if self.params.shape[0] > 1:
-                exog = exog[None, :]
-            else:
-                exog = exog[:, None]
-        exog = np.atleast_2d(exog)  # needed in count model shape[1]
+        if sparse.issparse(exog):
+            exog = sparse.csr_matrix(exog)
+        else:
+            exog = np.asarray(exog)
+            if exog.ndim == 1:
+                # Params informs whether a row or column vector
+                if self.params.shape[0] > 1:
+                    exog = exog[None, :]
+                else:
+                    exog = exog[:, None]
+            exog = np.atleast_2d(exog)  # needed in count model shape[1]
     else:
         exog = self.model.exog
         if weights is None:
@@ -197,8 +202,7 @@ def get_prediction(self, exog=None, transform=True, weights=None,
         pred_kwds = {}
     predicted_mean = self.model.predict(self.params, exog, **pred_kwds)
 
-    covb = self.cov_params()
-    var_pred_mean = (exog * np.dot(covb, exog.T).T).sum(1)
+    var_pred_mean = _var_linear_prediction(self, exog)
     var_resid = self.scale  # self.mse_resid / weights
 
     # TODO: check that we have correct scale, Refactor scale #???
@@ -1,4 +1,5 @@
 import numpy as np
+from scipy import linalg
 from statsmodels.tools.tools import Bunch
 
 
@@ -122,3 +123,135 @@ class _MinimalWLS:
 
         return Bunch(params=params, fittedvalues=fitted_values, resid=resid,
                      model=self, scale=scale)
+
+
+class _WLSWorkspace:
+    """
+    Weighted least squares with persistent buffers for repeated fits.
+
+    Parameters
+    ----------
+    endog : ndarray
+        1d endogenous response variable. The dependent variable.
+    exog : ndarray
+        A nobs x k array where `nobs` is the number of observations and `k`
+        is the number of regressors. exog is only read in blocks of rows, so
+        that it can also be a memory-mapped array.
+    chunksize : int, optional
+        The number of rows in each block. The default uses blocks of about
+        8MB.
+
+    Notes
+    -----
+    Intended for methods that iteratively apply WLS with changing weights
+    to the same data, like the IRLS of robust linear models.
+
+    `fit` accumulates X'WX and X'Wy over blocks of rows, so that the
+    weighted exog is never formed, and solves the normal equations by a
+    Cholesky factorization of the equilibrated X'WX. If X'WX is too
+    ill-conditioned for the normal equations, e.g. if exog does not have
+    full rank or many weights are zero, then the parameters are computed
+    with the pseudoinverse of the weighted exog as in `_MinimalWLS`.
+
+    The results provide the same terms as `_MinimalWLS`. Their fittedvalues
+    and resid are buffers of the workspace that are overwritten by the next
+    call to `fit` or `results`.
+    """
+
+    msg = _MinimalWLS.msg
+    # largest condition number of the equilibrated X'WX for which the
+    # normal equations are used
+    max_cond = 1e8
+
+    def __init__(self, endog, exog, chunksize=None):
+        self.endog = endog
+        self.exog = exog
+        nobs, k_vars = exog.shape
+        if chunksize is None:
+            chunksize = 2 ** 20 // max(k_vars, 1)
+        self.chunksize = max(int(chunksize), 1)
+        self.df_resid = nobs - k_vars
+        self.weights = 1.0
+        self.fittedvalues = np.empty(nobs)
+        self.resid = np.empty(nobs)
+
+    def _blocks(self):
+        nobs = self.exog.shape[0]
+        for start in range(0, nobs, self.chunksize):
+            yield slice(start, start + self.chunksize)
+
+    def fit(self, weights=1.0, check_weights=False):
+        """
+        Estimate the parameters for the given weights
+
+        Parameters
+        ----------
+        weights : {float, ndarray}
+            Scalar or 1d array of weights.
+        check_weights : bool, optional
+            Flag indicating whether to check for inf/nan or negative values
+            in weights. If True and any are found, ValueError is raised.
+
+        Returns
+        -------
+        results : Bunch
+            The results as returned by `results`.
+        """
+        scalar = np.ndim(weights) == 0
+        if check_weights:
+            if not (np.all(np.isfinite(weights)) and np.all(weights >= 0)):
+                raise ValueError(self.msg.format('weights'))
+
+        endog, exog = self.endog, self.exog
+        k_vars = exog.shape[1]
+        xwx = np.zeros((k_vars, k_vars))
+        xwy = np.zeros(k_vars)
+        for block in self._blocks():
+            x = exog[block]
+            wx = x * weights if scalar else x * weights[block, None]
+            xwx += wx.T.dot(x)
+            xwy += wx.T.dot(endog[block])
+
+        diag = np.diag(xwx)
+        params = None
+        if np.all(diag > 0):
+            # equilibrate, so that only the conditioning of the correlation
+            # structure matters, and not the scaling of the columns
+            scaling = 1 / np.sqrt(diag)
+            xwx_scaled = scaling[:, None] * xwx * scaling
+            eigvals = np.linalg.eigvalsh(xwx_scaled)
+            if eigvals[0] * self.max_cond > eigvals[-1]:
+                factor = linalg.cho_factor(xwx_scaled, lower=True)
+                params = scaling * linalg.cho_solve(factor, scaling * xwy)
+        if params is None:
+            w_half = np.sqrt(weights)
+            wexog = w_half * exog if scalar else w_half[:, None] * exog
+            params = np.linalg.pinv(wexog).dot(w_half * endog)
+        return self.results(params, weights)
+
+    def results(self, params, weights=1.0):
+        """
+        Construct results
+
+        Parameters
+        ----------
+        params : ndarray
+            Model parameters
+        weights : {float, ndarray}
+            Scalar or 1d array of weights used for the scale.
+
+        Returns
+        -------
+        results : Bunch
+            Bunch with params, fittedvalues, resid, model and scale, where
+            `model.weights` are the weights and scale is computed using the
+            weighted residuals.
+        """
+        self.weights = weights
+        for block in self._blocks():
+            self.fittedvalues[block] = self.exog[block].dot(params)
+        resid = np.subtract(self.endog, self.fittedvalues, out=self.resid)
+        scale = np.dot(weights * resid, resid) / self.df_resid
+
+        return Bunch(params=params, fittedvalues=self.fittedvalues,
+                     resid=resid, model=self, scale=scale)
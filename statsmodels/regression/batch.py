@@ -0,0 +1,397 @@
+"""
+Batched estimation of many small regressions
+
+Fits the same model to many groups of observations at once. The data is
+either stacked in 3-d arrays with one slice per group, or given in long
+format together with a vector of group labels. All groups are estimated
+with batched linear algebra, without creating model and results instances
+for the individual groups. The estimates and statistics are returned in a
+structured array with one record per group.
+
+License: BSD-3
+"""
+import numpy as np
+import pandas as pd
+from scipy import special, stats
+
+__all__ = ["fit_ols", "fit_wls", "fit_logit"]
+
+
+class _Stacked:
+    """Groups of equal size stacked in arrays of shape (n_groups, nobs, k)"""
+
+    def __init__(self, endog, exog):
+        self.exog = exog
+        self.endog = endog
+        n_groups, nobs, _ = exog.shape
+        self.labels = np.arange(n_groups)
+        self.nobs = np.full(n_groups, nobs)
+
+    def prepare(self, values):
+        return np.broadcast_to(values, self.endog.shape)
+
+    def gram(self, weights):
+        return np.einsum("gni,gn,gnj->gij", self.exog, weights, self.exog)
+
+    def xtv(self, values):
+        return np.einsum("gni,gn->gi", self.exog, values)
+
+    def sum(self, values):
+        return values.sum(1)
+
+    def expand(self, values):
+        return values[:, None]
+
+    def predict(self, params):
+        return np.einsum("gni,gi->gn", self.exog, params)
+
+    def take(self, mask):
+        return _Stacked(self.endog[mask], self.exog[mask])
+
+
+class _Grouped:
+    """Observations in long format, sorted by group"""
+
+    def __init__(self, endog, exog, groups, sorted_codes=False):
+        if sorted_codes:
+            self.labels = np.arange(groups[-1] + 1)
+            self.codes = groups
+        else:
+            codes, self.labels = pd.factorize(groups, sort=True)
+            self._order = np.argsort(codes, kind="stable")
+            self.codes = codes[self._order]
+            exog = exog[self._order]
+            endog = endog[self._order]
+        self.nobs = np.bincount(self.codes)
+        self.starts = np.r_[0, np.cumsum(self.nobs)[:-1]]
+        self.exog = exog
+        self.endog = endog
+
+    def prepare(self, values):
+        return np.broadcast_to(values, self._order.shape)[self._order]
+
+    def gram(self, weights):
+        exog = self.exog
+        k = exog.shape[1]
+        out = np.empty((len(self.labels), k, k))
+        # One reduction per pair of columns avoids a (nobs, k, k) temporary
+        for i in range(k):
+            wx = weights * exog[:, i]
+            for j in range(i + 1):
+                out[:, i, j] = out[:, j, i] = np.add.reduceat(
+                    wx * exog[:, j], self.starts)
+        return out
+
+    def xtv(self, values):
+        return np.add.reduceat(self.exog * values[:, None], self.starts,
+                               axis=0)
+
+    def sum(self, values):
+        return np.add.reduceat(values, self.starts)
+
+    def expand(self, values):
+        return values[self.codes]
+
+    def predict(self, params):
+        return np.einsum("ni,ni->n", self.exog, params[self.codes])
+
+    def take(self, mask):
+        keep = mask[self.codes]
+        codes = np.cumsum(mask)[self.codes[keep]] - 1
+        return _Grouped(self.endog[keep], self.exog[keep], codes,
+                        sorted_codes=True)
+
+
+def _batch_data(endog, exog, groups):
+    endog = np.asarray(endog, dtype=float)
+    exog = np.asarray(exog, dtype=float)
+    if groups is None:
+        if exog.ndim != 3 or endog.shape != exog.shape[:2]:
+            raise ValueError("Without groups, exog must have shape "
+                             "(n_groups, nobs, k) and endog must have shape "
+                             "(n_groups, nobs).")
+        return _Stacked(endog, exog)
+    groups = np.asarray(groups)
+    if exog.ndim == 1:
+        exog = exog[:, None]
+    if (exog.ndim != 2 or endog.ndim != 1 or groups.ndim != 1
+            or not endog.shape[0] == exog.shape[0] == groups.shape[0]):
+        raise ValueError("With groups, endog and groups must be 1-d and exog "
+                         "2-d, all with the same number of observations.")
+    return _Grouped(endog, exog, groups)
+
+
+def _k_constant(exog, hasconst):
+    if hasconst is not None:
+        return int(hasconst)
+    exog = exog.reshape(-1, exog.shape[-1])
+    const = (np.ptp(exog, axis=0) == 0) & (exog[0] != 0)
+    return int(const.any())
+
+
+def _pinv(x):
+    return np.linalg.pinv(x, hermitian=True)
+
+
+def _structured(labels, nobs, fields, k):
+    """Combine per-group results into a structured array"""
+    labels = np.asarray(labels)
+    dtype = [("group", labels.dtype), ("nobs", np.int64)]
+    for name, value in fields.items():
+        if value.ndim == 2:
+            dtype.append((name, value.dtype, (k,)))
+        else:
+            dtype.append((name, value.dtype))
+    out = np.empty(len(labels), dtype=dtype)
+    out["group"] = labels
+    out["nobs"] = nobs
+    for name, value in fields.items():
+        out[name] = value
+    return out
+
+
+def fit_wls(endog, exog, weights=1.0, groups=None, hasconst=None):
+    """
+    Estimate weighted least squares for many groups
+
+    Parameters
+    ----------
+    endog : array_like
+        The dependent variable, either with shape (n_groups, nobs) or, if
+        groups is given, 1-d with shape (nobs,).
+    exog : array_like
+        The regressors, either with shape (n_groups, nobs, k) or, if groups
+        is given, with shape (nobs, k).
+    weights : array_like, optional
+        The weights, with the same shape as endog, or a scalar.
+    groups : array_like, optional
+        The group labels of the observations in long format. The groups do
+        not need to be sorted or of equal size.
+    hasconst : bool, optional
+        Indicates whether exog includes a constant. If None, exog is checked
+        for a constant column over all observations.
+
+    Returns
+    -------
+    ndarray
+        Structured array with one record per group, sorted by the group
+        label, with fields
+
+        - group : the group label, or the index of the group for 3-d input
+        - nobs : the number of observations
+        - df_model, df_resid : degrees of freedom as in RegressionResults
+        - params, bse, tvalues, pvalues : arrays with shape (k,)
+        - ssr, scale, rsquared, rsquared_adj, fvalue, f_pvalue, llf, aic,
+          bic : as in RegressionResults
+
+    See Also
+    --------
+    statsmodels.regression.linear_model.WLS
+        Weighted least squares for a single group.
+
+    Notes
+    -----
+    No checks for missing values are performed. Rank deficient groups are
+    estimated with the pseudoinverse of :math:`X'WX`, as with
+    ``WLS.fit(method="pinv")``.
+
+    Examples
+    --------
+    >>> res = fit_ols(df["sales"], df[["const", "price"]], groups=df["store"])
+    >>> res["group"], res["params"][:, 1], res["rsquared"]
+    """
+    data = _batch_data(endog, exog, groups)
+    weights = data.prepare(np.asarray(weights, dtype=float))
+    endog = data.endog
+    k_constant = _k_constant(data.exog, hasconst)
+
+    xtx = data.gram(weights)
+    normalized_cov = _pinv(xtx)
+    rank = np.linalg.matrix_rank(xtx, hermitian=True)
+    params = np.einsum("gij,gj->gi", normalized_cov,
+                       data.xtv(weights * endog))
+    resid = endog - data.predict(params)
+
+    nobs = data.nobs
+    sum_weights = data.sum(weights)
+    ssr = data.sum(weights * resid ** 2)
+    uncentered_tss = data.sum(weights * endog ** 2)
+    ymean = data.sum(weights * endog) / sum_weights
+    centered_tss = data.sum(weights * (endog - data.expand(ymean)) ** 2)
+    tss = centered_tss if k_constant else uncentered_tss
+    df_model = (rank - k_constant).astype(float)
+    df_resid = (nobs - rank).astype(float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = ssr / df_resid
+        bse = np.sqrt(scale[:, None]
+                      * np.diagonal(normalized_cov, axis1=1, axis2=2))
+        tvalues = params / bse
+        pvalues = 2 * stats.t.sf(np.abs(tvalues), df_resid[:, None])
+        rsquared = 1 - ssr / tss
+        rsquared_adj = 1 - (nobs - k_constant) / df_resid * (1 - rsquared)
+        fvalue = (tss - ssr) / df_model / scale
+        f_pvalue = stats.f.sf(fvalue, df_model, df_resid)
+        nobs2 = nobs / 2.0
+        llf = (-nobs2 * np.log(2 * np.pi) - nobs2 * np.log(ssr / nobs)
+               - nobs2 + 0.5 * data.sum(np.log(weights)))
+    k_params = df_model + k_constant
+
+    fields = {
+        "df_model": df_model,
+        "df_resid": df_resid,
+        "params": params,
+        "bse": bse,
+        "tvalues": tvalues,
+        "pvalues": pvalues,
+        "ssr": ssr,
+        "scale": scale,
+        "rsquared": rsquared,
+        "rsquared_adj": rsquared_adj,
+        "fvalue": fvalue,
+        "f_pvalue": f_pvalue,
+        "llf": llf,
+        "aic": -2 * llf + 2 * k_params,
+        "bic": -2 * llf + np.log(nobs) * k_params,
+    }
+    return _structured(data.labels, nobs, fields, params.shape[1])
+
+
+def fit_ols(endog, exog, groups=None, hasconst=None):
+    """
+    Estimate ordinary least squares for many groups
+
+    Parameters
+    ----------
+    endog : array_like
+        The dependent variable, either with shape (n_groups, nobs) or, if
+        groups is given, 1-d with shape (nobs,).
+    exog : array_like
+        The regressors, either with shape (n_groups, nobs, k) or, if groups
+        is given, with shape (nobs, k).
+    groups : array_like, optional
+        The group labels of the observations in long format. The groups do
+        not need to be sorted or of equal size.
+    hasconst : bool, optional
+        Indicates whether exog includes a constant. If None, exog is checked
+        for a constant column over all observations.
+
+    Returns
+    -------
+    ndarray
+        Structured array with one record per group, see ``fit_wls``.
+
+    See Also
+    --------
+    fit_wls
+        Weighted least squares for many groups.
+    statsmodels.regression.linear_model.OLS
+        Ordinary least squares for a single group.
+    """
+    return fit_wls(endog, exog, groups=groups, hasconst=hasconst)
+
+
+def fit_logit(endog, exog, groups=None, maxiter=35, tol=1e-8):
+    """
+    Estimate logistic regressions for many groups
+
+    Parameters
+    ----------
+    endog : array_like
+        The binary dependent variable, either with shape (n_groups, nobs)
+        or, if groups is given, 1-d with shape (nobs,).
+    exog : array_like
+        The regressors, either with shape (n_groups, nobs, k) or, if groups
+        is given, with shape (nobs, k). Should include a constant.
+    groups : array_like, optional
+        The group labels of the observations in long format. The groups do
+        not need to be sorted or of equal size.
+    maxiter : int, optional
+        The maximum number of Newton iterations.
+    tol : float, optional
+        Convergence tolerance for the largest change in the parameters.
+
+    Returns
+    -------
+    ndarray
+        Structured array with one record per group, sorted by the group
+        label, with fields
+
+        - group : the group label, or the index of the group for 3-d input
+        - nobs : the number of observations
+        - df_model, df_resid : degrees of freedom as in LogitResults
+        - params, bse, tvalues, pvalues : arrays with shape (k,)
+        - llf, llnull, prsquared, aic, bic : as in LogitResults
+        - converged : whether the Newton iterations converged
+        - iterations : the number of Newton iterations
+
+    See Also
+    --------
+    statsmodels.discrete.discrete_model.Logit
+        Logistic regression for a single group.
+
+    Notes
+    -----
+    All groups are estimated by Newton's method simultaneously, groups that
+    have converged are not updated further. Groups with perfectly separated
+    data do not converge. ``llnull`` is the loglikelihood of the model with
+    only a constant.
+    """
+    data = _batch_data(endog, exog, groups)
+    endog = data.endog
+    n_groups = len(data.labels)
+    k = data.exog.shape[-1]
+
+    params = np.zeros((n_groups, k))
+    active = np.ones(n_groups, dtype=bool)
+    iterations = np.zeros(n_groups, dtype=np.int64)
+    # Only the groups that have not converged are iterated
+    sub, sub_params = data, params
+    for _ in range(maxiter):
+        mu = special.expit(sub.predict(sub_params))
+        hessian = sub.gram(mu * (1 - mu))
+        step = np.einsum("gij,gj->gi", _pinv(hessian),
+                         sub.xtv(sub.endog - mu))
+        sub_params = sub_params + step
+        params[active] = sub_params
+        iterations[active] += 1
+        moving = np.max(np.abs(step), axis=1) > tol
+        if not moving.any():
+            active[:] = False
+            break
+        if not moving.all():
+            active[active] = moving
+            sub, sub_params = sub.take(moving), sub_params[moving]
+
+    linpred = data.predict(params)
+    mu = special.expit(linpred)
+    hessian = data.gram(mu * (1 - mu))
+    cov = _pinv(hessian)
+    rank = np.linalg.matrix_rank(hessian, hermitian=True)
+    nobs = data.nobs
+    llf = data.sum(endog * linpred - np.logaddexp(0, linpred))
+    ymean = data.sum(endog) / nobs
+    with np.errstate(divide="ignore", invalid="ignore"):
+        llnull = nobs * special.xlogy(ymean, ymean) + nobs * special.xlog1py(
+            1 - ymean, -ymean)
+        bse = np.sqrt(np.diagonal(cov, axis1=1, axis2=2))
+        tvalues = params / bse
+        pvalues = 2 * stats.norm.sf(np.abs(tvalues))
+        prsquared = 1 - llf / llnull
+
+    fields = {
+        "df_model": (rank - 1).astype(float),
+        "df_resid": (nobs - rank).astype(float),
+        "params": params,
+        "bse": bse,
+        "tvalues": tvalues,
+        "pvalues": pvalues,
+        "llf": llf,
+        "llnull": llnull,
+        "prsquared": prsquared,
+        "aic": -2 * llf + 2 * rank,
+        "bic": -2 * llf + np.log(nobs) * rank,
+        "converged": ~active,
+        "iterations": iterations,
+    }
+    return _structured(data.labels, nobs, fields, k)
@@ -277,6 +277,7 @@ class RegressionModel(base.LikelihoodModel):
             ] = "nonrobust",
             cov_kwds=None,
             use_t: bool | None = None,
+            store: Literal["full", "minimal"] = "full",
             **kwargs
     ):
         """
@@ -303,6 +304,15 @@ class RegressionModel(base.LikelihoodModel):
             p-values.  Default behavior depends on cov_type. See
             `linear_model.RegressionResults.get_robustcov_results` for
             implementation details.
+        store : {"full", "minimal"}, optional
+            If "minimal", the results only keep the parameters, the
+            covariance of the parameters and the scalar statistics used for
+            inference, like `ssr`, `rsquared`, `llf` and `fvalue`. The
+            results do not refer to the data or to arrays of length nobs, and
+            the model instance that is attached to the results is a copy
+            without data. Prediction requires `exog`. Residual based
+            statistics are available after attaching the data with
+            `RegressionResults.restore_data`. Default is "full".
         **kwargs
             Additional keyword arguments that contain information used when
             constructing a model using the formula interface.
@@ -325,6 +335,7 @@ class RegressionModel(base.LikelihoodModel):
         The fit method uses the pseudoinverse of the design/exogenous variables
         to solve the least squares minimization.
         """
+        store = string_like(store, "store", options=("full", "minimal"))
         if method == "pinv":
             if not (hasattr(self, 'pinv_wexog') and
                     hasattr(self, 'normalized_cov_params') and
@@ -378,6 +389,12 @@ class RegressionModel(base.LikelihoodModel):
                 normalized_cov_params=self.normalized_cov_params,
                 cov_type=cov_type, cov_kwds=cov_kwds, use_t=use_t,
                 **kwargs)
+        if store == "minimal":
+            # the residual diagnostics of summary need the data
+            lfit._cache["_residual_diagnostics"] = lfit._residual_diagnostics()
+            lfit._store_minimal(
+                keep=lfit._minimal_stats,
+                extra_attr=["model.exog_Q", "model.effects"])
         return RegressionResultsWrapper(lfit)
 
     def predict(self, params, exog=None):
@@ -831,6 +848,42 @@ class WLS(RegressionModel):
 
         return self.weights
 
+    @classmethod
+    def from_chunks(cls, chunks, hasconst=None, missing='none'):
+        """
+        Create a model that is estimated from chunks of data.
+
+        Parameters
+        ----------
+        chunks : iterable or callable
+            An iterable that yields tuples ``(endog, exog, weights)``, or
+            ``(endog, exog)`` for OLS, holding the rows of one chunk. A
+            callable that returns such an iterator is also accepted.
+            Robust covariance estimators require `chunks` to be iterable
+            more than once.
+        hasconst : {None, bool}, optional
+            Indicates whether the design includes a user-supplied constant.
+        missing : str, optional
+            Available options are 'none', 'drop', and 'raise'.
+
+        Returns
+        -------
+        StreamingWLS or StreamingOLS
+            Model holding the accumulated sufficient statistics. Call its
+            `fit` method to estimate the parameters.
+
+        See Also
+        --------
+        statsmodels.regression.streaming.StreamingWLS
+            Out-of-core weighted least squares.
+        """
+        from statsmodels.regression.streaming import (
+            StreamingOLS,
+            StreamingWLS,
+        )
+        klass = StreamingOLS if issubclass(cls, OLS) else StreamingWLS
+        return klass(chunks, hasconst=hasconst, missing=missing)
+
     @Appender(_fit_regularized_doc)
     def fit_regularized(self, method="elastic_net", alpha=0.,
                         L1_wt=1., start_params=None, profile_scale=False,
@@ -1618,6 +1671,12 @@ class RegressionResults(base.LikelihoodModelResults):
     """
 
     _cache = {}  # needs to be a class attribute for scale setter?
+    # statistics computed before the data is dropped with store="minimal"
+    _minimal_stats = ("nobs", "scale", "ssr", "centered_tss",
+                      "uncentered_tss", "ess",
+                      "rsquared", "rsquared_adj", "mse_model", "mse_resid",
+                      "mse_total", "fvalue", "f_pvalue", "llf", "aic", "bic",
+                      "condition_number")
 
     def __init__(self, model, params, normalized_cov_params=None, scale=1.,
                  cov_type='nonrobust', cov_kwds=None, use_t=None, **kwargs):
@@ -1966,6 +2025,26 @@ class RegressionResults(base.LikelihoodModelResults):
         eigvals = self.eigenvals
         return np.sqrt(eigvals[0]/eigvals[-1])
 
+    def _residual_diagnostics(self):
+        """
+        Normality and autocorrelation tests of the residuals for summary
+
+        The tests are stored in the cache with store="minimal", otherwise
+        they are computed on each call.
+        """
+        from statsmodels.stats.stattools import (
+            durbin_watson,
+            jarque_bera,
+            omni_normtest,
+        )
+        if "_residual_diagnostics" in self._cache:
+            return self._cache["_residual_diagnostics"]
+        self._check_data_attached("The residual diagnostics")
+        jb, jbpv, skew, kurtosis = jarque_bera(self.wresid)
+        omni, omnipv = omni_normtest(self.wresid)
+        return dict(jb=jb, jbpv=jbpv, skew=skew, kurtosis=kurtosis,
+                    omni=omni, omnipv=omnipv, dw=durbin_watson(self.wresid))
+
     # TODO: make these properties reset bse
     def _HCCM(self, scale):
         H = np.dot(self.model.pinv_wexog,
@@ -1981,6 +2060,7 @@ class RegressionResults(base.LikelihoodModelResults):
         """
         Heteroscedasticity robust covariance matrix. See HC0_se.
         """
+        self._check_data_attached("cov_HC0")
         self.het_scale = self.wresid**2
         cov_HC0 = self._HCCM(self.het_scale)
         return cov_HC0
@@ -1990,6 +2070,7 @@ class RegressionResults(base.LikelihoodModelResults):
         """
         Heteroscedasticity robust covariance matrix. See HC1_se.
         """
+        self._check_data_attached("cov_HC1")
         self.het_scale = self.nobs/(self.df_resid)*(self.wresid**2)
         cov_HC1 = self._HCCM(self.het_scale)
         return cov_HC1
@@ -1999,6 +2080,7 @@ class RegressionResults(base.LikelihoodModelResults):
         """
         Heteroscedasticity robust covariance matrix. See HC2_se.
         """
+        self._check_data_attached("cov_HC2")
         wexog = self.model.wexog
         h = self._abat_diagonal(wexog, self.normalized_cov_params)
         self.het_scale = self.wresid**2/(1-h)
@@ -2010,6 +2092,7 @@ class RegressionResults(base.LikelihoodModelResults):
         """
         Heteroscedasticity robust covariance matrix. See HC3_se.
         """
+        self._check_data_attached("cov_HC3")
         wexog = self.model.wexog
         h = self._abat_diagonal(wexog, self.normalized_cov_params)
         self.het_scale = (self.wresid / (1 - h))**2
@@ -2093,6 +2176,7 @@ class RegressionResults(base.LikelihoodModelResults):
 
         if not hasattr(self, 'resid'):
             raise ValueError('Method requires residuals.')
+        self._check_data_attached("resid_pearson")
         eps = np.finfo(self.wresid.dtype).eps
         if np.sqrt(self.scale) < 10 * eps * self.model.endog.mean():
             # do not divide if scale is zero close to numerical precision
@@ -2104,6 +2188,11 @@ class RegressionResults(base.LikelihoodModelResults):
         else:
             return self.wresid / np.sqrt(self.scale)
 
+    def _restore_data(self):
+        # needed by the heteroscedasticity robust covariances
+        if self.model.pinv_wexog is None:
+            self.model.pinv_wexog = pinv_extended(self.model.wexog)[0]
+
     def _is_nested(self, restricted):
         """
         Parameters
@@ -2186,6 +2275,7 @@ class RegressionResults(base.LikelihoodModelResults):
 
         import statsmodels.stats.sandwich_covariance as sw
 
+        self._check_data_attached("compare_lm_test")
         if not self._is_nested(restricted):
             raise ValueError("Restricted model is not nested by full model.")
 
@@ -2444,7 +2534,8 @@ class RegressionResults(base.LikelihoodModelResults):
         - 'cluster': clustered covariance estimator
 
           ``groups`` : array_like[int], required :
-            Integer-valued index of clusters or groups.
+            Integer-valued index of clusters or groups. A 2-d array with one
+            column per cluster dimension gives multi-way clustering.
 
           ``use_correction``: bool, optional
             If True the sandwich covariance is calculated with a small
@@ -2517,6 +2608,7 @@ class RegressionResults(base.LikelihoodModelResults):
         from statsmodels.base.covtype import descriptions, normalize_cov_type
         import statsmodels.stats.sandwich_covariance as sw
 
+        self._check_data_attached("get_robustcov_results")
         cov_type = normalize_cov_type(cov_type)
 
         if 'kernel' in kwargs:
@@ -2609,16 +2701,15 @@ class RegressionResults(base.LikelihoodModelResults):
                 if adjust_df:
                     # need to find number of groups
                     # duplicate work
-                    n_groups0 = len(np.unique(groups[:, 0]))
-                    n_groups1 = len(np.unique(groups[:, 1]))
-                    self.n_groups = (n_groups0, n_groups1)
-                    n_groups = min(n_groups0, n_groups1)  # use for adjust_df
-
-                # Note: sw.cov_cluster_2groups has 3 returns
-                res.cov_params_default = sw.cov_cluster_2groups(
-                    self, groups, use_correction=use_correction)[0]
+                    self.n_groups = tuple(
+                        len(np.unique(groups[:, col]))
+                        for col in range(groups.shape[1]))
+                    n_groups = min(self.n_groups)  # use for adjust_df
+
+                res.cov_params_default = sw.cov_cluster_multiway(
+                    self, groups, use_correction=use_correction)
             else:
-                raise ValueError('only two groups are supported')
+                raise ValueError('groups must be 1-d or 2-d')
             res.cov_kwds['description'] = descriptions['cluster']
 
         elif cov_type.lower() == 'hac-panel':
@@ -2737,16 +2828,13 @@ class RegressionResults(base.LikelihoodModelResults):
         For more information on regression results and diagnostic table,
         see our documentation of `Examples/Linear Regression Models/Regression diagnostics`.
         """
-        from statsmodels.stats.stattools import (
-            durbin_watson,
-            jarque_bera,
-            omni_normtest,
-        )
         alpha = float_like(alpha, "alpha", optional=False)
         slim = bool_like(slim, "slim", optional=False, strict=True)
 
-        jb, jbpv, skew, kurtosis = jarque_bera(self.wresid)
-        omni, omnipv = omni_normtest(self.wresid)
+        resid_stats = self._residual_diagnostics()
+        jb, jbpv, skew, kurtosis = (resid_stats[key] for key in
+                                    ("jb", "jbpv", "skew", "kurtosis"))
+        omni, omnipv = resid_stats["omni"], resid_stats["omnipv"]
 
         eigvals = self.eigenvals
         condno = self.condition_number
@@ -2806,7 +2894,7 @@ class RegressionResults(base.LikelihoodModelResults):
                           ]
 
             diagn_right = [('Durbin-Watson:',
-                            ["%#8.3f" % durbin_watson(self.wresid)]
+                            ["%#8.3f" % resid_stats["dw"]]
                             ),
                            ('Jarque-Bera (JB):', ["%#8.3f" % jb]),
                            ('Prob(JB):', ["%#8.3g" % jbpv]),
@@ -2837,7 +2925,7 @@ class RegressionResults(base.LikelihoodModelResults):
             )
         if hasattr(self, 'cov_type'):
             etext.append(self.cov_kwds['description'])
-        if self.model.exog.shape[0] < self.model.exog.shape[1]:
+        if self.nobs < len(self.params):
             wstr = "The input rank is higher than the number of observations."
             etext.append(wstr)
         if eigvals[-1] < 1e-10:
@@ -2902,15 +2990,11 @@ class RegressionResults(base.LikelihoodModelResults):
             A class that holds summary results.
         """
         # Diagnostics
-        from statsmodels.stats.stattools import (
-            durbin_watson,
-            jarque_bera,
-            omni_normtest,
-        )
-
-        jb, jbpv, skew, kurtosis = jarque_bera(self.wresid)
-        omni, omnipv = omni_normtest(self.wresid)
-        dw = durbin_watson(self.wresid)
+        resid_stats = self._residual_diagnostics()
+        jb, jbpv, skew, kurtosis = (resid_stats[key] for key in
+                                    ("jb", "jbpv", "skew", "kurtosis"))
+        omni, omnipv = resid_stats["omni"], resid_stats["omnipv"]
+        dw = resid_stats["dw"]
         eigvals = self.eigenvals
         condno = self.condition_number
         diagnostic = dict([
@@ -2940,7 +3024,7 @@ class RegressionResults(base.LikelihoodModelResults):
             )
         if hasattr(self, 'cov_type'):
             etext.append(self.cov_kwds['description'])
-        if self.model.exog.shape[0] < self.model.exog.shape[1]:
+        if self.nobs < len(self.params):
             wstr = "The input rank is higher than the number of observations."
             etext.append(wstr)
 
@@ -3022,6 +3106,8 @@ class OLSResults(RegressionResults):
             A class that exposes methods to examine observation influence.
         """
         from statsmodels.stats.outliers_influence import OLSInfluence
+
+        self._check_data_attached("get_influence")
         return OLSInfluence(self)
 
     def outlier_test(self, method='bonf', alpha=.05, labels=None,
@@ -3072,6 +3158,8 @@ class OLSResults(RegressionResults):
         df = df_resid - 1.
         """
         from statsmodels.stats.outliers_influence import outlier_test
+
+        self._check_data_attached("outlier_test")
         return outlier_test(self, method, alpha, labels=labels,
                             order=order, cutoff=cutoff)
 
@@ -3125,6 +3213,7 @@ class OLSResults(RegressionResults):
         >>> fitted.el_test([0], [1])
         >>> (27.248146353888796, 1.7894660442330235e-07)
         """
+        self._check_data_attached("el_test")
         params = np.copy(self.params)
         opt_fun_inst = _ELRegOpts()  # to store weights
         if len(param_nums) == len(params):
@@ -3227,6 +3316,7 @@ class OLSResults(RegressionResults):
         (>50), the starting parameters of the interior minimization need
         to be changed.
         """
+        self._check_data_attached("conf_int_el")
         r0 = stats.chi2.ppf(1 - sig, 1)
         if upper_bound is None:
             upper_bound = self.conf_int(.01)[param_num][1]
@@ -606,6 +606,156 @@ def _convert_vc(exog_vc):
     return VCSpec(vc_names, vc_colnames, vc_mats)
 
 
+class _GroupBuckets:
+    """
+    The groups of a MixedLM stacked into buckets of equal size.
+
+    Groups with the same number of observations and the same number
+    of columns for each variance component are stacked into 3-d
+    arrays.  The cross products of the design matrices do not depend
+    on the parameters and are computed once.  All quantities that the
+    log-likelihood and its derivatives need from a group are formed
+    from the q x q Sherman-Morrison-Woodbury system of the group, see
+    `_smw_solver`, which is solved for all groups in a bucket at once.
+
+    Parameters
+    ----------
+    model : MixedLM
+        The model.  The random effects design matrices must be dense.
+    """
+
+    def __init__(self, model):
+
+        k_vc = model.k_vc
+        members = {}
+        for group_ix in range(model.n_groups):
+            key = ((len(model.endog_li[group_ix]),) +
+                   tuple(model.exog_vc.mats[j][group_ix].shape[1]
+                         for j in range(k_vc)))
+            members.setdefault(key, []).append(group_ix)
+
+        # The columns of the design matrix of a group that correspond
+        # to each covariance parameter, in the order of _gen_dV_dPar.
+        re_cols = []
+        for j1 in range(model.k_re):
+            for j2 in range(j1 + 1):
+                re_cols.append((np.r_[j1], np.r_[j2], j1 == j2))
+
+        self.buckets = []
+        self.vc_dims = np.zeros(k_vc)
+        for key, ix in sorted(members.items()):
+            vc_dims = np.asarray(key[1:], dtype=int)
+            exog = np.array([model.exog_li[i] for i in ix], dtype=np.float64)
+            endog = np.array([model.endog_li[i] for i in ix],
+                             dtype=np.float64)
+            ex_r = np.array([model._aex_r[i] for i in ix], dtype=np.float64)
+            cols = list(re_cols)
+            start = model.k_re
+            for d in vc_dims:
+                jj = np.arange(start, start + d)
+                cols.append((jj, jj, True))
+                start += d
+            self.vc_dims += len(ix) * vc_dims
+            ex_rt = ex_r.transpose(0, 2, 1)
+            self.buckets.append(dict(
+                endog=endog, exog=exog, ex_r=ex_r, vc_dims=vc_dims,
+                cols=cols, ztz=np.matmul(ex_rt, ex_r),
+                ztx=np.matmul(ex_rt, exog),
+                zty=np.einsum("mqn,mn->mq", ex_rt, endog)))
+
+        endex = np.column_stack((model.exog, model.endog)).astype(np.float64)
+        self.xtxy = np.dot(endex[:, :-1].T, endex)
+
+    @staticmethod
+    def _qmat(bucket, cov_re_inv, vc_vari):
+        """
+        The q x q matrices Z'Z + B^{-1} of the groups in a bucket.
+        """
+        k = cov_re_inv.shape[0]
+        qmat = bucket["ztz"].copy()
+        qmat[:, :k, :k] += cov_re_inv
+        d = qmat.shape[1]
+        ii = np.arange(k, d)
+        qmat[:, ii, ii] += np.repeat(vc_vari, bucket["vc_dims"])
+        return qmat
+
+    def gls(self, cov_re_inv, vc_vari):
+        """
+        Returns exog' V^{-1} [exog, endog] summed over the groups.
+        """
+
+        xtxy = self.xtxy.copy()
+        for b in self.buckets:
+            qmat = self._qmat(b, cov_re_inv, vc_vari)
+            ztw = np.concatenate((b["ztx"], b["zty"][..., None]), axis=2)
+            u = np.linalg.solve(qmat, ztw)
+            xtxy -= np.einsum("mqp,mqs->ps", b["ztx"], u)
+
+        return xtxy
+
+    def evaluate(self, cov_re_inv, vc_vari, fe_params, logdet=False,
+                 parts=False):
+        """
+        Evaluates the quadratic forms of the likelihood.
+
+        Parameters
+        ----------
+        cov_re_inv : ndarray
+            The inverse of the random effects covariance matrix.
+        vc_vari : ndarray
+            The inverse variance components.
+        fe_params : ndarray
+            The fixed effects parameters.
+        logdet : bool
+            If True, the sum of the log determinants of Z'Z + B^{-1}
+            is calculated.
+        parts : bool
+            If True, Z'V^{-1}Z, Z'V^{-1}exog and Z'V^{-1}resid are
+            returned for each bucket.
+
+        Returns
+        -------
+        dict
+            With keys "xvx" (exog' V^{-1} exog), "rvr" (resid' V^{-1}
+            resid) and "xvr" (exog' V^{-1} resid) summed over the
+            groups, "logdet" and "parts", a list of tuples
+            (bucket, zvz, zvx, zvr).
+        """
+
+        k_fe = len(fe_params)
+        xvx = np.zeros((k_fe, k_fe))
+        rvr, xvr, ld = 0., 0., 0.
+        out = []
+        for b in self.buckets:
+            qmat = self._qmat(b, cov_re_inv, vc_vari)
+            if logdet:
+                ld += np.linalg.slogdet(qmat)[1].sum()
+
+            # Apply V^{-1} = I - Z qmat^{-1} Z' to exog, resid and, if
+            # needed, Z as in _smw_solver
+            exog, ex_r = b["exog"], b["ex_r"]
+            resid = b["endog"] - np.dot(exog, fe_params)
+            rhs = [exog, resid[..., None]]
+            if parts:
+                rhs.append(ex_r)
+            rhs = np.concatenate(rhs, axis=2)
+            qmati = np.linalg.solve(qmat, ex_r.transpose(0, 2, 1))
+            vi = rhs - np.matmul(ex_r, np.matmul(qmati, rhs))
+            vix, vir = vi[..., :k_fe], vi[..., k_fe]
+
+            xvx += np.einsum("mnp,mns->ps", exog, vix)
+            rvr += np.dot(resid.ravel(), vir.ravel())
+            xvr = xvr + np.einsum("mnp,mn->p", exog, vir)
+
+            if parts:
+                zvz = np.einsum("mnq,mns->mqs", ex_r, vi[..., k_fe + 1:])
+                zvx = np.einsum("mnq,mnp->mqp", ex_r, vix)
+                zvr = np.einsum("mnq,mn->mq", ex_r, vir)
+                out.append((b, zvz, zvx, zvr))
+
+        return dict(xvx=xvx, rvr=rvr, xvr=xvr, logdet=ld, parts=out)
+
+
 class MixedLM(base.LikelihoodModel):
     """
     Linear Mixed Effects Model
@@ -829,6 +979,13 @@ class MixedLM(base.LikelihoodModel):
             ma = _dot(a.T, a)
             self._aex_r2.append(ma)
 
+        # Stack the groups into buckets of equal size, unless the
+        # variance components have sparse design matrices
+        if any(sparse.issparse(a) for a in self._aex_r):
+            self._buckets = None
+        else:
+            self._buckets = _GroupBuckets(self)
+
         # Precompute this
         self._lin, self._quad = self._reparam()
 
@@ -1311,6 +1468,22 @@ class MixedLM(base.LikelihoodModel):
             else:
                 cov_re_inv = np.linalg.inv(cov_re)
 
+        if self._buckets is not None:
+            vcomp = np.asarray(vcomp, dtype=np.float64)
+            ii = vcomp >= tol
+            if np.any(~ii & (self._buckets.vc_dims > 0)):
+                # Pseudo-inverse
+                sing = True
+            vc_vari = np.zeros_like(vcomp)
+            vc_vari[ii] = 1 / vcomp[ii]
+            xtxy = self._buckets.gls(cov_re_inv, vc_vari)
+            if sing:
+                fe_params = np.dot(np.linalg.pinv(xtxy[:, 0:-1]),
+                                   xtxy[:, -1])
+            else:
+                fe_params = np.linalg.solve(xtxy[:, 0:-1], xtxy[:, -1])
+            return fe_params, sing
+
         # Cache these quantities that do not change.
         if not hasattr(self, "_endex_li"):
             self._endex_li = []
@@ -1502,12 +1675,16 @@ class MixedLM(base.LikelihoodModel):
         else:
             fe_params = params.fe_params
 
+        # The grouped cross products are only used for a nonsingular
+        # cov_re, degenerate points are evaluated group by group
+        buckets = self._buckets
         if self.k_re > 0:
             try:
                 cov_re_inv = np.linalg.inv(cov_re)
             except np.linalg.LinAlgError:
                 cov_re_inv = np.linalg.pinv(cov_re)
                 self._cov_sing += 1
+                buckets = None
             _, cov_re_logdet = np.linalg.slogdet(cov_re)
         else:
             cov_re_inv = np.zeros((0, 0))
@@ -1527,31 +1704,42 @@ class MixedLM(base.LikelihoodModel):
         if (self.fe_pen is not None):
             likeval -= self.fe_pen.func(fe_params)
 
-        xvx, qf = 0., 0.
-        for group_ix, group in enumerate(self.group_labels):
+        if buckets is not None:
+            vcomp = np.asarray(vcomp, dtype=np.float64)
+            terms = buckets.evaluate(cov_re_inv, 1 / vcomp,
+                                     fe_params, logdet=True)
+            dims = buckets.vc_dims
+            ii = dims > 0
+            ld = (self.n_groups * cov_re_logdet + terms["logdet"] +
+                  np.dot(np.log(vcomp[ii]), dims[ii]))
+            likeval -= ld / 2.
+            qf, xvx = terms["rvr"], terms["xvx"]
+        else:
+            xvx, qf = 0., 0.
+            for group_ix, group in enumerate(self.group_labels):
 
-            vc_var = self._expand_vcomp(vcomp, group_ix)
-            cov_aug_logdet = cov_re_logdet + np.sum(np.log(vc_var))
+                vc_var = self._expand_vcomp(vcomp, group_ix)
+                cov_aug_logdet = cov_re_logdet + np.sum(np.log(vc_var))
 
-            exog = self.exog_li[group_ix]
-            ex_r, ex2_r = self._aex_r[group_ix], self._aex_r2[group_ix]
-            solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var)
+                exog = self.exog_li[group_ix]
+                ex_r, ex2_r = self._aex_r[group_ix], self._aex_r2[group_ix]
+                solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var)
 
-            resid = resid_all[self.row_indices[group]]
+                resid = resid_all[self.row_indices[group]]
 
-            # Part 1 of the log likelihood (for both ML and REML)
-            ld = _smw_logdet(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var,
-                             cov_aug_logdet)
-            likeval -= ld / 2.
+                # Part 1 of the log likelihood (for both ML and REML)
+                ld = _smw_logdet(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var,
+                                 cov_aug_logdet)
+                likeval -= ld / 2.
 
-            # Part 2 of the log likelihood (for both ML and REML)
-            u = solver(resid)
-            qf += np.dot(resid, u)
+                # Part 2 of the log likelihood (for both ML and REML)
+                u = solver(resid)
+                qf += np.dot(resid, u)
 
-            # Adjustment for REML
-            if self.reml:
-                mat = solver(exog)
-                xvx += np.dot(exog.T, mat)
+                # Adjustment for REML
+                if self.reml:
+                    mat = solver(exog)
+                    xvx += np.dot(exog.T, mat)
 
         if self.reml:
             likeval -= (self.n_totobs - self.k_fe) * np.log(qf) / 2.
@@ -1694,11 +1882,13 @@ class MixedLM(base.LikelihoodModel):
         cov_re = params.cov_re
         vcomp = params.vcomp
 
+        buckets = self._buckets
         try:
             cov_re_inv = np.linalg.inv(cov_re)
         except np.linalg.LinAlgError:
             cov_re_inv = np.linalg.pinv(cov_re)
             self._cov_sing += 1
+            buckets = None
 
         score_fe = np.zeros(self.k_fe)
         score_re = np.zeros(self.k_re2)
@@ -1733,58 +1923,84 @@ class MixedLM(base.LikelihoodModel):
         # resid' V^{-1} dV/dQ_jj V^{-1} resid (a scalar)
         rvavr = np.zeros(self.k_re2 + self.k_vc)
 
-        for group_ix, group in enumerate(self.group_labels):
+        if buckets is not None:
+            vcomp = np.asarray(vcomp, dtype=np.float64)
+            terms = buckets.evaluate(cov_re_inv, 1 / vcomp,
+                                     fe_params, parts=True)
+            rvir, xtvir, xtvix = terms["rvr"], terms["xvr"], terms["xvx"]
+            for b, zvz, zvx, zvr in terms["parts"]:
+                for jj, (cl, cr, sym) in enumerate(b["cols"]):
+                    dlv[jj] = zvz[:, cr, cl].sum()
+                    if not sym:
+                        dlv[jj] += zvz[:, cl, cr].sum()
 
-            vc_var = self._expand_vcomp(vcomp, group_ix)
+                    ulr = np.sum(zvr[:, cl] * zvr[:, cr])
+                    rvavr[jj] += ulr if sym else 2 * ulr
 
-            exog = self.exog_li[group_ix]
-            ex_r, ex2_r = self._aex_r[group_ix], self._aex_r2[group_ix]
-            solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var)
+                    if self.reml:
+                        ulr = np.einsum("mip,mis->ps", zvx[:, cl],
+                                        zvx[:, cr])
+                        xtax[jj] += ulr
+                        if not sym:
+                            xtax[jj] += ulr.T
+
+                if self.k_re > 0:
+                    score_re -= 0.5 * dlv[0:self.k_re2]
+                if self.k_vc > 0:
+                    score_vc -= 0.5 * dlv[self.k_re2:]
+        else:
+            for group_ix, group in enumerate(self.group_labels):
 
-            # The residuals
-            resid = self.endog_li[group_ix]
-            if self.k_fe > 0:
-                expval = np.dot(exog, fe_params)
-                resid = resid - expval
+                vc_var = self._expand_vcomp(vcomp, group_ix)
 
-            if self.reml:
-                viexog = solver(exog)
-                xtvix += np.dot(exog.T, viexog)
+                exog = self.exog_li[group_ix]
+                ex_r, ex2_r = self._aex_r[group_ix], self._aex_r2[group_ix]
+                solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var)
 
-            # Contributions to the covariance parameter gradient
-            vir = solver(resid)
-            for (jj, matl, matr, vsl, vsr, sym) in\
-                    self._gen_dV_dPar(ex_r, solver, group_ix):
-                dlv[jj] = _dotsum(matr, vsl)
-                if not sym:
-                    dlv[jj] += _dotsum(matl, vsr)
-
-                ul = _dot(vir, matl)
-                ur = ul.T if sym else _dot(matr.T, vir)
-                ulr = np.dot(ul, ur)
-                rvavr[jj] += ulr
-                if not sym:
-                    rvavr[jj] += ulr.T
+                # The residuals
+                resid = self.endog_li[group_ix]
+                if self.k_fe > 0:
+                    expval = np.dot(exog, fe_params)
+                    resid = resid - expval
 
                 if self.reml:
-                    ul = _dot(viexog.T, matl)
-                    ur = ul.T if sym else _dot(matr.T, viexog)
+                    viexog = solver(exog)
+                    xtvix += np.dot(exog.T, viexog)
+
+                # Contributions to the covariance parameter gradient
+                vir = solver(resid)
+                for (jj, matl, matr, vsl, vsr, sym) in\
+                        self._gen_dV_dPar(ex_r, solver, group_ix):
+                    dlv[jj] = _dotsum(matr, vsl)
+                    if not sym:
+                        dlv[jj] += _dotsum(matl, vsr)
+
+                    ul = _dot(vir, matl)
+                    ur = ul.T if sym else _dot(matr.T, vir)
                     ulr = np.dot(ul, ur)
-                    xtax[jj] += ulr
+                    rvavr[jj] += ulr
                     if not sym:
-                        xtax[jj] += ulr.T
+                        rvavr[jj] += ulr.T
+
+                    if self.reml:
+                        ul = _dot(viexog.T, matl)
+                        ur = ul.T if sym else _dot(matr.T, viexog)
+                        ulr = np.dot(ul, ur)
+                        xtax[jj] += ulr
+                        if not sym:
+                            xtax[jj] += ulr.T
 
-            # Contribution of log|V| to the covariance parameter
-            # gradient.
-            if self.k_re > 0:
-                score_re -= 0.5 * dlv[0:self.k_re2]
-            if self.k_vc > 0:
-                score_vc -= 0.5 * dlv[self.k_re2:]
+                # Contribution of log|V| to the covariance parameter
+                # gradient.
+                if self.k_re > 0:
+                    score_re -= 0.5 * dlv[0:self.k_re2]
+                if self.k_vc > 0:
+                    score_vc -= 0.5 * dlv[self.k_re2:]
 
-            rvir += np.dot(resid, vir)
+                rvir += np.dot(resid, vir)
 
-            if calc_fe:
-                xtvir += np.dot(exog.T, vir)
+                if calc_fe:
+                    xtvir += np.dot(exog.T, vir)
 
         fac = self.n_totobs
         if self.reml:
@@ -1886,6 +2102,7 @@ class MixedLM(base.LikelihoodModel):
         vcomp = params.vcomp
         cov_re = params.cov_re
         sing = False
+        buckets = self._buckets
 
         if self.k_re > 0:
             try:
@@ -1893,6 +2110,7 @@ class MixedLM(base.LikelihoodModel):
             except np.linalg.LinAlgError:
                 cov_re_inv = np.linalg.pinv(cov_re)
                 sing = True
+                buckets = None
         else:
             cov_re_inv = np.empty((0, 0))
 
@@ -1912,96 +2130,110 @@ class MixedLM(base.LikelihoodModel):
         B = np.zeros(m)
         D = np.zeros((m, m))
         F = [[0.] * m for k in range(m)]
-        for group_ix, group in enumerate(self.group_labels):
-
-            vc_var = self._expand_vcomp(vcomp, group_ix)
-            vc_vari = np.zeros_like(vc_var)
-            ii = np.flatnonzero(vc_var >= 1e-10)
-            if len(ii) > 0:
-                vc_vari[ii] = 1 / vc_var[ii]
-            if len(ii) < len(vc_var):
+        if buckets is not None:
+            vcomp = np.asarray(vcomp, dtype=np.float64)
+            ii = vcomp >= 1e-10
+            if np.any(~ii & (buckets.vc_dims > 0)):
                 sing = True
+            vc_vari = np.zeros_like(vcomp)
+            vc_vari[ii] = 1 / vcomp[ii]
+            terms = buckets.evaluate(cov_re_inv, vc_vari, fe_params,
+                                     parts=True)
+            rvir, xtvix = terms["rvr"], terms["xvx"]
+            for b, zvz, zvx, zvr in terms["parts"]:
+                self._hessian_bucket(b["cols"], zvz, zvx, zvr, hess_re,
+                                     hess_fere, xtax, B, D, F)
+        else:
+            for group_ix, group in enumerate(self.group_labels):
 
-            exog = self.exog_li[group_ix]
-            ex_r, ex2_r = self._aex_r[group_ix], self._aex_r2[group_ix]
-            solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, vc_vari)
+                vc_var = self._expand_vcomp(vcomp, group_ix)
+                vc_vari = np.zeros_like(vc_var)
+                ii = np.flatnonzero(vc_var >= 1e-10)
+                if len(ii) > 0:
+                    vc_vari[ii] = 1 / vc_var[ii]
+                if len(ii) < len(vc_var):
+                    sing = True
 
-            # The residuals
-            resid = self.endog_li[group_ix]
-            if self.k_fe > 0:
-                expval = np.dot(exog, fe_params)
-                resid = resid - expval
+                exog = self.exog_li[group_ix]
+                ex_r, ex2_r = self._aex_r[group_ix], self._aex_r2[group_ix]
+                solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, vc_vari)
 
-            viexog = solver(exog)
-            xtvix += np.dot(exog.T, viexog)
-            vir = solver(resid)
-            rvir += np.dot(resid, vir)
+                # The residuals
+                resid = self.endog_li[group_ix]
+                if self.k_fe > 0:
+                    expval = np.dot(exog, fe_params)
+                    resid = resid - expval
 
-            for (jj1, matl1, matr1, vsl1, vsr1, sym1) in\
-                    self._gen_dV_dPar(ex_r, solver, group_ix):
+                viexog = solver(exog)
+                xtvix += np.dot(exog.T, viexog)
+                vir = solver(resid)
+                rvir += np.dot(resid, vir)
 
-                ul = _dot(viexog.T, matl1)
-                ur = _dot(matr1.T, vir)
-                hess_fere[jj1, :] += np.dot(ul, ur)
-                if not sym1:
-                    ul = _dot(viexog.T, matr1)
-                    ur = _dot(matl1.T, vir)
-                    hess_fere[jj1, :] += np.dot(ul, ur)
+                for (jj1, matl1, matr1, vsl1, vsr1, sym1) in\
+                        self._gen_dV_dPar(ex_r, solver, group_ix):
 
-                if self.reml:
                     ul = _dot(viexog.T, matl1)
-                    ur = ul if sym1 else np.dot(viexog.T, matr1)
-                    ulr = _dot(ul, ur.T)
-                    xtax[jj1] += ulr
+                    ur = _dot(matr1.T, vir)
+                    hess_fere[jj1, :] += np.dot(ul, ur)
                     if not sym1:
-                        xtax[jj1] += ulr.T
+                        ul = _dot(viexog.T, matr1)
+                        ur = _dot(matl1.T, vir)
+                        hess_fere[jj1, :] += np.dot(ul, ur)
 
-                ul = _dot(vir, matl1)
-                ur = ul if sym1 else _dot(vir, matr1)
-                B[jj1] += np.dot(ul, ur) * (1 if sym1 else 2)
-
-                # V^{-1} * dV/d_theta
-                E = [(vsl1, matr1)]
-                if not sym1:
-                    E.append((vsr1, matl1))
-
-                for (jj2, matl2, matr2, vsl2, vsr2, sym2) in\
-                        self._gen_dV_dPar(ex_r, solver, group_ix, jj1):
+                    if self.reml:
+                        ul = _dot(viexog.T, matl1)
+                        ur = ul if sym1 else np.dot(viexog.T, matr1)
+                        ulr = _dot(ul, ur.T)
+                        xtax[jj1] += ulr
+                        if not sym1:
+                            xtax[jj1] += ulr.T
+
+                    ul = _dot(vir, matl1)
+                    ur = ul if sym1 else _dot(vir, matr1)
+                    B[jj1] += np.dot(ul, ur) * (1 if sym1 else 2)
+
+                    # V^{-1} * dV/d_theta
+                    E = [(vsl1, matr1)]
+                    if not sym1:
+                        E.append((vsr1, matl1))
 
-                    re = sum([_multi_dot_three(matr2.T, x[0], x[1].T)
-                              for x in E])
-                    vt = 2 * _dot(_multi_dot_three(vir[None, :], matl2, re),
-                                  vir[:, None])
+                    for (jj2, matl2, matr2, vsl2, vsr2, sym2) in\
+                            self._gen_dV_dPar(ex_r, solver, group_ix, jj1):
 
-                    if not sym2:
-                        le = sum([_multi_dot_three(matl2.T, x[0], x[1].T)
+                        re = sum([_multi_dot_three(matr2.T, x[0], x[1].T)
                                   for x in E])
-                        vt += 2 * _dot(_multi_dot_three(
-                            vir[None, :], matr2, le), vir[:, None])
-
-                    D[jj1, jj2] += np.squeeze(vt)
-                    if jj1 != jj2:
-                        D[jj2, jj1] += np.squeeze(vt)
+                        vt = 2 * _dot(_multi_dot_three(vir[None, :], matl2, re),
+                                      vir[:, None])
 
-                    rt = _dotsum(vsl2, re.T) / 2
-                    if not sym2:
-                        rt += _dotsum(vsr2, le.T) / 2
+                        if not sym2:
+                            le = sum([_multi_dot_three(matl2.T, x[0], x[1].T)
+                                      for x in E])
+                            vt += 2 * _dot(_multi_dot_three(
+                                vir[None, :], matr2, le), vir[:, None])
 
-                    hess_re[jj1, jj2] += rt
-                    if jj1 != jj2:
-                        hess_re[jj2, jj1] += rt
+                        D[jj1, jj2] += np.squeeze(vt)
+                        if jj1 != jj2:
+                            D[jj2, jj1] += np.squeeze(vt)
 
-                    if self.reml:
-                        ev = sum([_dot(x[0], _dot(x[1].T, viexog)) for x in E])
-                        u1 = _dot(viexog.T, matl2)
-                        u2 = _dot(matr2.T, ev)
-                        um = np.dot(u1, u2)
-                        F[jj1][jj2] += um + um.T
+                        rt = _dotsum(vsl2, re.T) / 2
                         if not sym2:
-                            u1 = np.dot(viexog.T, matr2)
-                            u2 = np.dot(matl2.T, ev)
+                            rt += _dotsum(vsr2, le.T) / 2
+
+                        hess_re[jj1, jj2] += rt
+                        if jj1 != jj2:
+                            hess_re[jj2, jj1] += rt
+
+                        if self.reml:
+                            ev = sum([_dot(x[0], _dot(x[1].T, viexog)) for x in E])
+                            u1 = _dot(viexog.T, matl2)
+                            u2 = _dot(matr2.T, ev)
                             um = np.dot(u1, u2)
                             F[jj1][jj2] += um + um.T
+                            if not sym2:
+                                u1 = np.dot(viexog.T, matr2)
+                                u2 = np.dot(matl2.T, ev)
+                                um = np.dot(u1, u2)
+                                F[jj1][jj2] += um + um.T
 
         hess_fe -= fac * xtvix / rvir
         hess_re = hess_re - 0.5 * fac * (D/rvir - np.outer(B, B) / rvir**2)
@@ -2028,6 +2260,61 @@ class MixedLM(base.LikelihoodModel):
 
         return hess, sing
 
+    def _hessian_bucket(self, cols, zvz, zvx, zvr, hess_re, hess_fere,
+                        xtax, B, D, F):
+        """
+        Adds the contributions of a bucket of groups to the terms of
+        the Hessian, see `hessian` and `_GroupBuckets.evaluate`.
+        """
+
+        for jj1, (cl1, cr1, sym1) in enumerate(cols):
+
+            hess_fere[jj1, :] += np.einsum("mip,mi->p", zvx[:, cl1],
+                                           zvr[:, cr1])
+            if not sym1:
+                hess_fere[jj1, :] += np.einsum("mip,mi->p", zvx[:, cr1],
+                                               zvr[:, cl1])
+
+            if self.reml:
+                ulr = np.einsum("mip,mis->ps", zvx[:, cl1], zvx[:, cr1])
+                xtax[jj1] += ulr
+                if not sym1:
+                    xtax[jj1] += ulr.T
+
+            ulr = np.sum(zvr[:, cl1] * zvr[:, cr1])
+            B[jj1] += ulr if sym1 else 2 * ulr
+
+            # V^{-1} * dV/d_theta, as pairs of column sets
+            E = [(cl1, cr1)]
+            if not sym1:
+                E.append((cr1, cl1))
+
+            for jj2 in range(jj1 + 1):
+                cl2, cr2, sym2 = cols[jj2]
+                sides = [(cl2, cr2)]
+                if not sym2:
+                    sides.append((cr2, cl2))
+
+                vt, rt, um = 0., 0., 0.
+                for e0, e1 in E:
+                    for c2, d2 in sides:
+                        g = zvz[:, d2[:, None], e0]
+                        vt += 2 * np.einsum("mi,mij,mj->", zvr[:, c2], g,
+                                            zvr[:, e1])
+                        rt += np.einsum("mij,mji->", g,
+                                        zvz[:, e1[:, None], c2]) / 2
+                        if self.reml:
+                            um += np.einsum("mip,mij,mjs->ps", zvx[:, c2],
+                                            g, zvx[:, e1])
+
+                D[jj1, jj2] += vt
+                hess_re[jj1, jj2] += rt
+                if jj1 != jj2:
+                    D[jj2, jj1] += vt
+                    hess_re[jj2, jj1] += rt
+                if self.reml:
+                    F[jj1][jj2] += um + um.T
+
     def get_scale(self, fe_params, cov_re, vcomp):
         """
         Returns the estimated error variance based on given estimates
@@ -2048,30 +2335,37 @@ class MixedLM(base.LikelihoodModel):
             The estimated error variance.
         """
 
+        buckets = self._buckets
         try:
             cov_re_inv = np.linalg.inv(cov_re)
         except np.linalg.LinAlgError:
             cov_re_inv = np.linalg.pinv(cov_re)
             warnings.warn(_warn_cov_sing)
+            buckets = None
 
-        qf = 0.
-        for group_ix, group in enumerate(self.group_labels):
+        if buckets is not None:
+            vcomp = np.asarray(vcomp, dtype=np.float64)
+            qf = buckets.evaluate(cov_re_inv, 1 / vcomp,
+                                  fe_params)["rvr"]
+        else:
+            qf = 0.
+            for group_ix, group in enumerate(self.group_labels):
 
-            vc_var = self._expand_vcomp(vcomp, group_ix)
+                vc_var = self._expand_vcomp(vcomp, group_ix)
 
-            exog = self.exog_li[group_ix]
-            ex_r, ex2_r = self._aex_r[group_ix], self._aex_r2[group_ix]
+                exog = self.exog_li[group_ix]
+                ex_r, ex2_r = self._aex_r[group_ix], self._aex_r2[group_ix]
 
-            solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var)
+                solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var)
 
-            # The residuals
-            resid = self.endog_li[group_ix]
-            if self.k_fe > 0:
-                expval = np.dot(exog, fe_params)
-                resid = resid - expval
+                # The residuals
+                resid = self.endog_li[group_ix]
+                if self.k_fe > 0:
+                    expval = np.dot(exog, fe_params)
+                    resid = resid - expval
 
-            mat = solver(resid)
-            qf += np.dot(resid, mat)
+                mat = solver(resid)
+                qf += np.dot(resid, mat)
 
         if self.reml:
             qf /= (self.n_totobs - self.k_fe)
@@ -280,6 +280,111 @@ class RollingWLS:
         uncentered_tss = np.dot(wy, wy)
         return centered_tss, uncentered_tss
 
+    def _fit_vectorized(self, store, block, params_only, cov_type):
+        """
+        Estimate all windows using blocked moving-window inner products
+
+        The inner products for each block of windows are computed as
+        differences of cumulative sums that restart at the start of every
+        block, which bounds the accumulation of rounding error. All windows
+        in a block are then solved at once.
+        """
+        nobs, k = self._x.shape
+        w = self._window
+        first = self._min_nobs if self._expanding else w
+        valid = ~self._is_nan
+        wx = np.where(valid[:, None], self._wx, 0.0)
+        wy = np.where(valid, self._wy, 0.0)
+        robust = not params_only and cov_type != "nonrobust"
+        if not params_only:
+            y = np.where(valid, self._y, 0.0)
+            weights = np.where(valid, self._weights, 0.0)
+            with np.errstate(divide="ignore"):
+                log_weights = np.where(valid, np.log(self._weights), 0.0)
+        if robust:
+            # Augmented regressors used to compute the HC0 middle matrix
+            # from moving sums, since e_i = g_i' c with c = (-params, 1)
+            g = np.column_stack([wx, wy])
+
+        for start in range(first, nobs + 1, block):
+            ends = np.arange(start, min(start + block, nobs + 1))
+            lo = max(start - w, 0)
+            upper = ends - lo
+            lower = np.maximum(ends - w, 0) - lo
+
+            def moving_sum(z):
+                csum = np.zeros((z.shape[0] + 1,) + z.shape[1:])
+                np.cumsum(z, axis=0, out=csum[1:])
+                return csum[upper] - csum[lower]
+
+            sl = slice(lo, ends[-1])
+            xpx = moving_sum(wx[sl, :, None] * wx[sl, None, :])
+            xpy = moving_sum(wx[sl] * wy[sl, None])
+            n = moving_sum(valid[sl].astype(float)).round().astype(int)
+
+            ok = n >= self._min_nobs
+            if self._skip_missing:
+                ok &= ~self._has_nan[ends - 1]
+            if not np.any(ok):
+                continue
+            xpx = xpx[ok]
+            try:
+                if params_only:
+                    params = np.linalg.solve(xpx, xpy[ok][..., None])[..., 0]
+                else:
+                    xpxi = np.linalg.inv(xpx)
+                    params = (xpxi @ xpy[ok][..., None])[..., 0]
+            except np.linalg.LinAlgError:
+                # Fall back to individual windows to find the singular ones
+                ok_idx = np.flatnonzero(ok)
+                keep = np.ones(ok_idx.shape[0], dtype=bool)
+                xpxi = np.full_like(xpx, np.nan)
+                for j in range(ok_idx.shape[0]):
+                    try:
+                        xpxi[j] = np.linalg.inv(xpx[j])
+                    except np.linalg.LinAlgError:
+                        keep[j] = False
+                ok[ok_idx[~keep]] = False
+                xpx = xpx[keep]
+                xpxi = xpxi[keep]
+                params = (xpxi @ xpy[ok][..., None])[..., 0]
+
+            loc = ends[ok] - 1
+            store.params[loc] = params
+            if params_only:
+                continue
+
+            xpy = xpy[ok]
+            n = n[ok]
+            uncentered_tss = moving_sum(wy[sl] ** 2)[ok]
+            ssr = (
+                uncentered_tss
+                - 2 * np.sum(params * xpy, axis=1)
+                + np.einsum("ni,nij,nj->n", params, xpx, params)
+            )
+            nobs2 = n / 2.0
+            llf = -np.log(ssr) * nobs2
+            llf -= (1 + np.log(np.pi / nobs2)) * nobs2
+            llf += 0.5 * moving_sum(log_weights[sl])[ok]
+            sum_w = moving_sum(weights[sl])[ok]
+            sum_wy = moving_sum((weights * y)[sl])[ok]
+
+            store.ssr[loc] = ssr
+            store.llf[loc] = llf
+            store.nobs[loc] = n
+            store.s2[loc] = ssr / (n - k)
+            store.xpxi[loc] = xpxi
+            store.centered_tss[loc] = uncentered_tss - sum_wy ** 2 / sum_w
+            store.uncentered_tss[loc] = uncentered_tss
+            if robust:
+                gg = g[sl, :, None] * g[sl, None, :]
+                xx = wx[sl, :, None] * wx[sl, None, :]
+                fourth = moving_sum(gg[:, :, :, None, None] * xx[:, None, None])
+                c = np.column_stack([-params, np.ones(params.shape[0])])
+                store.xeex[loc] = np.einsum(
+                    "na,nb,nabij->nij", c, c, fourth[ok]
+                )
+
     def _reset(self, idx):
         """Compute xpx and xpy using a single dot product"""
         _, wy, wx, _, not_missing = self._get_data(idx)
@@ -302,7 +407,7 @@ class RollingWLS:
 
         Parameters
         ----------
-        method : {'inv', 'lstsq', 'pinv'}
+        method : {'inv', 'lstsq', 'pinv', 'vectorized'}
             Method to use when computing the the model parameters.
 
             * 'inv' - use moving windows inner-products and matrix inversion.
@@ -311,6 +416,15 @@ class RollingWLS:
             * 'lstsq' - Use numpy.linalg.lstsq
             * 'pinv' - Use numpy.linalg.pinv. This method matches the default
               estimator in non-moving regression estimators.
+            * 'vectorized' - use moving windows inner-products computed for
+              blocks of windows at once, and solve all windows in a block
+              together. All statistics, including the sum of squared
+              residuals and the robust covariance, are computed from moving
+              sums rather than from the residuals of each window, and only
+              the statistics required by ``cov_type`` are computed. This
+              method is much faster than 'inv' when the number of windows
+              is large, but may be less accurate when the model fits the
+              data almost perfectly.
         cov_type : {'nonrobust', 'HCCM', 'HC0'}
             Covariance estimator:
 
@@ -322,6 +436,9 @@ class RollingWLS:
             Interval to recompute the moving window inner products used to
             estimate the model parameters. Smaller values improve accuracy,
             although in practice this setting is not required to be set.
+            When method is 'vectorized', this is the number of windows
+            estimated in each block, and the default is chosen to limit the
+            memory used by each block.
         use_t : bool, optional
             Flag indicating to use the Student's t distribution when computing
             p-values.
@@ -335,14 +452,21 @@ class RollingWLS:
             Estimation results where all pre-sample values are nan-filled.
         """
         method = string_like(
-            method, "method", options=("inv", "lstsq", "pinv")
+            method, "method", options=("inv", "lstsq", "pinv", "vectorized")
         )
         reset = int_like(reset, "reset", optional=True)
-        reset = self._y.shape[0] if reset is None else reset
+        nobs, k = self._x.shape
+        if reset is None:
+            if method == "vectorized":
+                # Limit the size of the largest moving sum in each block
+                robust = not params_only and cov_type != "nonrobust"
+                size = (k + 1) ** 2 * k ** 2 if robust else k ** 2
+                reset = max(1, 2 ** 22 // size - self._window)
+            else:
+                reset = self._y.shape[0]
         if reset < 1:
             raise ValueError("reset must be a positive integer")
 
-        nobs, k = self._x.shape
         store = RollingStore(
             params=np.full((nobs, k), np.nan),
             ssr=np.full(nobs, np.nan),
@@ -354,6 +478,12 @@ class RollingWLS:
             centered_tss=np.full(nobs, np.nan),
             uncentered_tss=np.full(nobs, np.nan),
         )
+        if method == "vectorized":
+            self._fit_vectorized(store, reset, params_only, cov_type)
+            return RollingRegressionResults(
+                self, store, self.k_constant, use_t, cov_type
+            )
+
         w = self._window
         first = self._min_nobs if self._expanding else w
         xpx, xpy, nobs = self._reset(first)
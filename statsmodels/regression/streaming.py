@@ -0,0 +1,429 @@
+"""
+Out-of-core least squares estimation
+
+Estimates OLS and WLS by accumulating the sufficient statistics
+:math:`X'WX`, :math:`X'Wy` and :math:`y'Wy` over chunks of data, so that the
+memory required is independent of the number of observations.
+
+License: BSD-3
+"""
+import numpy as np
+import pandas as pd
+
+from statsmodels.regression.linear_model import RegressionResults
+from statsmodels.tools.decorators import cache_readonly
+from statsmodels.tools.sm_exceptions import MissingDataError
+from statsmodels.tools.tools import Bunch
+from statsmodels.tools.validation import string_like
+
+__all__ = ["StreamingOLS", "StreamingWLS", "StreamingRegressionResults"]
+
+
+def _iter_chunks(chunks):
+    """Return an iterator over chunks"""
+    if callable(chunks):
+        return iter(chunks())
+    return iter(chunks)
+
+
+def _is_reiterable(chunks):
+    return callable(chunks) or iter(chunks) is not chunks
+
+
+class StreamingWLS:
+    """
+    Weighted least squares estimated from chunks of data
+
+    Parameters
+    ----------
+    chunks : iterable or callable
+        An iterable that yields tuples ``(endog, exog, weights)``, where
+        ``weights`` may be omitted to use unit weights. Each element holds
+        the rows of one chunk, e.g., a slice of a memory-mapped array or a
+        row group of a parquet file. A callable that returns such an
+        iterator is also accepted. Robust covariance estimators require a
+        second pass over the data, and so are only available when `chunks`
+        can be iterated more than once (e.g., a list or a callable).
+    hasconst : {None, bool}, optional
+        Indicates whether the design includes a user-supplied constant. If
+        None, a constant column is detected from the range of each column
+        and an implicit constant is detected from the accumulated cross
+        products.
+    missing : str, optional
+        Available options are 'none', 'drop', and 'raise'. If 'none', no nan
+        checking is done. If 'drop', any rows of a chunk with nans are
+        dropped. If 'raise', an error is raised. Default is 'none'.
+
+    Attributes
+    ----------
+    nobs : float
+        The number of observations used.
+    xtx : ndarray
+        The accumulated weighted cross product of the design.
+    xty : ndarray
+        The accumulated weighted cross product of the design and endog.
+    exog_names : list[str]
+        Names of the regressors, taken from the first chunk if it is a
+        DataFrame.
+    endog_names : str
+        Name of the dependent variable.
+
+    See Also
+    --------
+    statsmodels.regression.linear_model.WLS
+        WLS estimation on data held in memory.
+
+    Notes
+    -----
+    Only the sufficient statistics are kept, so that residuals, fitted
+    values and statistics based on them (for example the residual
+    diagnostics in ``summary``) are not available from the results.
+
+    The sum of squared residuals is computed from the normal equations,
+    and so may lose precision when the model fits the data almost
+    perfectly.
+
+    Examples
+    --------
+    >>> x = np.load("exog.npy", mmap_mode="r")
+    >>> y = np.load("endog.npy", mmap_mode="r")
+    >>> chunks = [(y[i:i + 100000], x[i:i + 100000])
+    ...           for i in range(0, y.shape[0], 100000)]
+    >>> res = StreamingOLS(chunks).fit(cov_type="HC1")
+    """
+
+    _weighted = True
+
+    def __init__(self, chunks, hasconst=None, missing="none"):
+        self.missing = string_like(
+            missing, "missing", options=("none", "drop", "raise")
+        )
+        self.chunks = chunks
+        self.exog_names = None
+        self.endog_names = None
+        self.nobs = 0.0
+        self.xtx = None
+        self.xty = None
+        self._accumulate()
+        self._handle_constant(hasconst)
+
+        eigvals = np.clip(np.linalg.eigvalsh(self.xtx), 0, np.inf)
+        self.wexog_singular_values = np.sqrt(eigvals)[::-1]
+        sv = self.wexog_singular_values
+        tol = sv.max(initial=0.0) * max(self.nobs, self.k_exog) * np.finfo(
+            float
+        ).eps
+        self.rank = int(np.sum(sv > tol))
+        self.df_model = float(self.rank - self.k_constant)
+        self.df_resid = self.nobs - self.rank
+        self.data = Bunch(
+            param_names=self.exog_names,
+            xnames=self.exog_names,
+            ynames=self.endog_names,
+            cov_names=self.exog_names,
+            const_idx=self.const_idx,
+            k_constant=self.k_constant,
+            row_labels=None,
+        )
+
+    def _prepare_chunk(self, chunk):
+        if self._weighted and len(chunk) == 3:
+            endog, exog, weights = chunk
+        elif len(chunk) == 2:
+            endog, exog = chunk
+            weights = None
+        else:
+            raise ValueError(
+                "chunks must yield tuples of (endog, exog) or "
+                "(endog, exog, weights)"
+            )
+        if self.exog_names is None:
+            if isinstance(exog, pd.DataFrame):
+                self.exog_names = [str(c) for c in exog.columns]
+            if isinstance(endog, pd.Series) and endog.name is not None:
+                self.endog_names = str(endog.name)
+        endog = np.asarray(endog, dtype=float).squeeze()
+        endog = np.atleast_1d(endog)
+        exog = np.asarray(exog, dtype=float)
+        if exog.ndim == 1:
+            exog = exog[:, None]
+        if exog.shape[0] != endog.shape[0]:
+            raise ValueError("endog and exog in a chunk must have the same "
+                             "number of rows")
+        if weights is None:
+            weights = np.ones(endog.shape[0])
+        else:
+            weights = np.asarray(weights, dtype=float)
+            if weights.ndim == 0:
+                weights = np.full(endog.shape[0], float(weights))
+        if self.missing != "none":
+            isnan = np.isnan(endog) | np.isnan(exog).any(1) | np.isnan(weights)
+            if isnan.any():
+                if self.missing == "raise":
+                    raise MissingDataError("NaNs were encountered in the data")
+                keep = ~isnan
+                endog, exog, weights = endog[keep], exog[keep], weights[keep]
+        return endog, exog, weights
+
+    def _accumulate(self):
+        shift = None
+        for chunk in _iter_chunks(self.chunks):
+            endog, exog, weights = self._prepare_chunk(chunk)
+            if self.xtx is None:
+                k = exog.shape[1]
+                self.k_exog = k
+                self.xtx = np.zeros((k, k))
+                self.xty = np.zeros(k)
+                self._xmin = np.full(k, np.inf)
+                self._xmax = np.full(k, -np.inf)
+                self._sum_wx = np.zeros(k)
+                self._sum_w = self._sum_log_w = 0.0
+                self._yy = self._wyc = self._wycc = 0.0
+            elif exog.shape[1] != self.k_exog:
+                raise ValueError("All chunks must have the same number of "
+                                 "columns in exog")
+            if endog.shape[0] == 0:
+                continue
+            if shift is None:
+                # Center endog at the first chunk mean so that the centered
+                # total sum of squares does not suffer from cancellation
+                shift = np.average(endog, weights=weights)
+            wexog = exog * weights[:, None]
+            self.xtx += wexog.T @ exog
+            self.xty += wexog.T @ endog
+            self.nobs += endog.shape[0]
+            self._xmin = np.minimum(self._xmin, exog.min(0))
+            self._xmax = np.maximum(self._xmax, exog.max(0))
+            self._sum_wx += wexog.sum(0)
+            self._sum_w += weights.sum()
+            self._sum_log_w += np.log(weights).sum()
+            self._yy += np.dot(weights * endog, endog)
+            centered = endog - shift
+            self._wyc += np.dot(weights, centered)
+            self._wycc += np.dot(weights * centered, centered)
+        if self.xtx is None:
+            raise ValueError("chunks did not contain any data")
+        if self.exog_names is None:
+            self.exog_names = ["const" if self._is_const(i) else f"x{i + 1}"
+                               for i in range(self.k_exog)]
+        if self.endog_names is None:
+            self.endog_names = "y"
+
+    def _is_const(self, i):
+        return self._xmin[i] == self._xmax[i] and self._xmin[i] != 0
+
+    def _handle_constant(self, hasconst):
+        const_idx = np.flatnonzero(
+            (self._xmin == self._xmax) & (self._xmin != 0)
+        )
+        self.const_idx = int(const_idx[0]) if const_idx.size else None
+        if hasconst is not None:
+            self.k_constant = int(bool(hasconst))
+            return
+        if self.const_idx is not None:
+            self.k_constant = 1
+            return
+        # Implicit constant: the column of ones lies in the span of exog if
+        # the weighted sum of squared residuals from regressing it on exog,
+        # computed from the cross products, is zero
+        coef = np.linalg.pinv(self.xtx, hermitian=True) @ self._sum_wx
+        ssr_const = self._sum_w - self._sum_wx @ coef
+        self.k_constant = int(np.abs(ssr_const) < 1e-8 * self._sum_w)
+
+    def _het_meat(self, params, normalized_cov_params):
+        """Second pass computing the HC0, HC2 and HC3 middle matrices"""
+        if not _is_reiterable(self.chunks):
+            raise ValueError(
+                "Heteroskedasticity robust covariance requires a second "
+                "pass over the data, but chunks is a one-shot iterator. Use "
+                "a sequence or a callable returning an iterator."
+            )
+        k = self.k_exog
+        meat = {key: np.zeros((k, k)) for key in ("HC0", "HC2", "HC3")}
+        for chunk in _iter_chunks(self.chunks):
+            endog, exog, weights = self._prepare_chunk(chunk)
+            w12 = np.sqrt(weights)
+            wexog = exog * w12[:, None]
+            wresid = w12 * endog - wexog @ params
+            leverage = np.einsum(
+                "ij,jk,ik->i", wexog, normalized_cov_params, wexog
+            )
+            scales = {
+                "HC0": wresid ** 2,
+                "HC2": wresid ** 2 / (1 - leverage),
+                "HC3": wresid ** 2 / (1 - leverage) ** 2,
+            }
+            for key, scale in scales.items():
+                meat[key] += (wexog * scale[:, None]).T @ wexog
+        return meat
+
+    def fit(self, cov_type="nonrobust", use_t=None):
+        """
+        Estimate the model from the accumulated sufficient statistics
+
+        Parameters
+        ----------
+        cov_type : {'nonrobust', 'HC0', 'HC1', 'HC2', 'HC3'}, optional
+            The covariance estimator. The heteroskedasticity robust
+            estimators require a second pass over the chunks.
+        use_t : bool, optional
+            Flag indicating to use the Student's t distribution when
+            computing p-values. Default is True for 'nonrobust' and False
+            otherwise.
+
+        Returns
+        -------
+        StreamingRegressionResults
+            The estimation results.
+        """
+        cov_type = string_like(
+            cov_type,
+            "cov_type",
+            options=("nonrobust", "HC0", "HC1", "HC2", "HC3"),
+            lower=False,
+        )
+        normalized_cov_params = np.linalg.pinv(self.xtx, hermitian=True)
+        params = normalized_cov_params @ self.xty
+        return StreamingRegressionResults(
+            self, params, normalized_cov_params, cov_type=cov_type,
+            use_t=use_t
+        )
+
+
+class StreamingOLS(StreamingWLS):
+    __doc__ = StreamingWLS.__doc__.replace(
+        "Weighted least squares", "Ordinary least squares"
+    ).replace(
+        "``(endog, exog, weights)``, where\n        ``weights`` may be omitted "
+        "to use unit weights.",
+        "``(endog, exog)``."
+    )
+
+    _weighted = False
+
+
+class StreamingRegressionResults(RegressionResults):
+    """
+    Results from a regression estimated from chunks of data
+
+    Parameters
+    ----------
+    model : StreamingWLS
+        The model instance holding the sufficient statistics.
+    params : ndarray
+        The estimated parameters.
+    normalized_cov_params : ndarray
+        The normalized covariance parameters.
+    cov_type : str
+        The covariance estimator used in the results.
+    use_t : bool
+        Flag indicating to use the Student's t in inference.
+
+    Notes
+    -----
+    Statistics that require the residuals or the data, such as
+    ``resid``, ``fittedvalues`` and the influence measures, are not
+    available.
+    """
+
+    def __init__(self, model, params, normalized_cov_params, cov_type,
+                 use_t=None):
+        super().__init__(model, params, normalized_cov_params, scale=1.0,
+                         cov_type=cov_type, use_t=use_t)
+        # scale is not known until ssr is computed
+        self.scale = self.ssr / self.df_resid
+
+    @cache_readonly
+    def nobs(self):
+        """Number of observations n."""
+        return float(self.model.nobs)
+
+    @cache_readonly
+    def ssr(self):
+        """Sum of squared (whitened) residuals."""
+        model = self.model
+        params = self.params
+        ssr = (model._yy - 2 * params @ model.xty
+               + params @ model.xtx @ params)
+        return max(float(ssr), 0.0)
+
+    @cache_readonly
+    def centered_tss(self):
+        """The total (weighted) sum of squares centered about the mean."""
+        model = self.model
+        return model._wycc - model._wyc ** 2 / model._sum_w
+
+    @cache_readonly
+    def uncentered_tss(self):
+        """
+        Uncentered sum of squares.
+
+        The sum of the squared values of the (whitened) endogenous response
+        variable.
+        """
+        return float(self.model._yy)
+
+    @cache_readonly
+    def llf(self):
+        """Log-likelihood of model"""
+        nobs2 = self.nobs / 2.0
+        llf = -np.log(self.ssr) * nobs2
+        llf -= (1 + np.log(np.pi / nobs2)) * nobs2
+        llf += 0.5 * self.model._sum_log_w
+        return llf
+
+    @cache_readonly
+    def _het_meat(self):
+        return self.model._het_meat(self.params, self.normalized_cov_params)
+
+    def _het_cov(self, meat):
+        ncp = self.normalized_cov_params
+        return ncp @ meat @ ncp
+
+    @cache_readonly
+    def cov_HC0(self):
+        """
+        Heteroscedasticity robust covariance matrix. See HC0_se.
+        """
+        return self._het_cov(self._het_meat["HC0"])
+
+    @cache_readonly
+    def cov_HC1(self):
+        """
+        Heteroscedasticity robust covariance matrix. See HC1_se.
+        """
+        return self.nobs / self.df_resid * self.cov_HC0
+
+    @cache_readonly
+    def cov_HC2(self):
+        """
+        Heteroscedasticity robust covariance matrix. See HC2_se.
+        """
+        return self._het_cov(self._het_meat["HC2"])
+
+    @cache_readonly
+    def cov_HC3(self):
+        """
+        Heteroscedasticity robust covariance matrix. See HC3_se.
+        """
+        return self._het_cov(self._het_meat["HC3"])
+
+    def _not_available(self, name):
+        raise NotImplementedError(
+            f"{name} is not available for models estimated from chunks"
+        )
+
+    @cache_readonly
+    def wresid(self):
+        self._not_available("wresid")
+
+    @cache_readonly
+    def resid(self):
+        self._not_available("resid")
+
+    @cache_readonly
+    def fittedvalues(self):
+        self._not_available("fittedvalues")
+
+    def summary(self, *args, **kwargs):
+        self._not_available("summary")
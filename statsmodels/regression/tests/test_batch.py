@@ -0,0 +1,101 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.discrete.discrete_model import Logit
+from statsmodels.regression import batch
+from statsmodels.regression.linear_model import OLS, WLS
+
+
+@pytest.fixture(scope="module")
+def data():
+    rs = np.random.RandomState(1234)
+    n_groups, nobs = 20, 40
+    exog = np.concatenate(
+        [np.ones((n_groups, nobs, 1)), rs.standard_normal((n_groups, nobs, 2))],
+        axis=2,
+    )
+    endog = exog @ [1.0, 0.5, -0.5] + rs.standard_normal((n_groups, nobs))
+    weights = rs.uniform(0.5, 2, (n_groups, nobs))
+    binary = (exog @ [0.2, 1.0, -1.0] + rs.logistic(size=(n_groups, nobs))
+              > 0).astype(float)
+    return endog, exog, weights, binary
+
+
+STATS = ["df_model", "df_resid", "ssr", "scale", "rsquared", "rsquared_adj",
+         "fvalue", "f_pvalue", "llf", "aic", "bic"]
+
+
+def test_wls_stacked(data):
+    endog, exog, weights, _ = data
+    res = batch.fit_wls(endog, exog, weights)
+    assert_equal(res["group"], np.arange(20))
+    assert_equal(res["nobs"], 40)
+    for g in range(20):
+        res_g = WLS(endog[g], exog[g], weights=weights[g]).fit()
+        for name in ["params", "bse", "tvalues", "pvalues"] + STATS:
+            assert_allclose(res[name][g], getattr(res_g, name), rtol=1e-8,
+                            err_msg=name)
+
+
+def test_ols_groups(data):
+    endog, exog, _, _ = data
+    rs = np.random.RandomState(0)
+    endog = endog.ravel()
+    exog = exog.reshape(-1, 3)
+    groups = np.repeat(np.array(list("abcdefghijklmnopqrst")), 40)
+    # unsorted groups of unequal size
+    keep = rs.permutation(endog.shape[0])[:600]
+    endog, exog, groups = endog[keep], exog[keep], groups[keep]
+    res = batch.fit_ols(endog, exog, groups=groups)
+    assert_equal(res["group"], np.unique(groups))
+    for i, label in enumerate(res["group"]):
+        mask = groups == label
+        res_g = OLS(endog[mask], exog[mask]).fit()
+        assert res["nobs"][i] == mask.sum()
+        for name in ["params", "bse", "pvalues"] + STATS:
+            assert_allclose(res[name][i], getattr(res_g, name), rtol=1e-8,
+                            err_msg=name)
+
+
+def test_ols_no_constant(data):
+    endog, exog, _, _ = data
+    res = batch.fit_ols(endog, exog[..., 1:])
+    res_g = OLS(endog[3], exog[3, :, 1:]).fit()
+    for name in ["params", "rsquared", "fvalue", "df_model", "aic"]:
+        assert_allclose(res[name][3], getattr(res_g, name), err_msg=name)
+
+
+def test_logit(data):
+    _, exog, _, binary = data
+    res = batch.fit_logit(binary, exog)
+    assert res["converged"].all()
+    for g in range(20):
+        res_g = Logit(binary[g], exog[g]).fit(disp=0)
+        for name in ["params", "bse", "pvalues", "llf", "llnull",
+                     "prsquared", "aic", "bic", "df_model", "df_resid"]:
+            assert_allclose(res[name][g], getattr(res_g, name), rtol=1e-6,
+                            err_msg=name)
+
+    groups = np.repeat(np.arange(20), 40)
+    res_long = batch.fit_logit(binary.ravel(), exog.reshape(-1, 3),
+                               groups=groups)
+    assert_allclose(res_long["params"], res["params"], rtol=1e-8)
+    assert_equal(res_long["iterations"], res["iterations"])
+
+
+def test_logit_separation(data):
+    _, exog, _, binary = data
+    binary = binary.copy()
+    binary[0] = exog[0, :, 1] > 0
+    res = batch.fit_logit(binary, exog, maxiter=20)
+    assert not res["converged"][0]
+    assert res["converged"][1:].all()
+
+
+def test_invalid(data):
+    endog, exog, _, _ = data
+    with pytest.raises(ValueError, match="Without groups"):
+        batch.fit_ols(endog.ravel(), exog.reshape(-1, 3))
+    with pytest.raises(ValueError, match="With groups"):
+        batch.fit_ols(endog, exog, groups=np.arange(20))
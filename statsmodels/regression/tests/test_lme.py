@@ -10,7 +10,7 @@ from scipy import sparse
 import pytest
 
 from statsmodels.regression.mixed_linear_model import (
-    MixedLM, MixedLMParams, _smw_solver, _smw_logdet)
+    MixedLM, MixedLMParams, VCSpec, _smw_solver, _smw_logdet)
 from numpy.testing import (assert_almost_equal, assert_equal, assert_allclose,
                            assert_)
 
@@ -1345,3 +1345,51 @@ def test_get_distribution():
     v += vcomp[1] * (exog_vcb**2).sum(1).mean()
     v += scale
     assert_allclose(np.var(yr - ey), v, rtol=1e-2, atol=1e-4)
+
+
+@pytest.mark.parametrize("reml", [False, True])
+def test_group_buckets(reml):
+    # The stacked groups must reproduce the group-by-group evaluation
+    # with unequal group sizes, variance components and integer data
+    rs = np.random.RandomState(3425)
+    sizes = rs.randint(1, 6, size=60)
+    groups = np.repeat(np.arange(60), sizes)
+    n = len(groups)
+    exog = np.column_stack((np.ones(n), rs.randint(-3, 4, size=n)))
+    exog_re = np.column_stack((np.ones(n), rs.normal(size=n)))
+    endog = rs.randint(0, 20, size=n) + 2 * groups % 7
+    mats = [rs.normal(size=(k, 1 + g % 2)) for g, k in enumerate(sizes)]
+    colnames = [["a%d" % j for j in range(m.shape[1])] for m in mats]
+    exog_vc = VCSpec(["a"], [colnames], [mats])
+
+    model = MixedLM(endog, exog, groups, exog_re=exog_re, exog_vc=exog_vc)
+    assert model._buckets is not None
+    loop = MixedLM(endog, exog, groups, exog_re=exog_re, exog_vc=exog_vc)
+    loop._buckets = None
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = model.fit(reml=reml)
+        result_loop = loop.fit(reml=reml)
+    assert_allclose(result.params, result_loop.params, rtol=1e-5,
+                    atol=1e-6)
+    assert_allclose(result.llf, result_loop.llf, rtol=1e-8)
+    assert_allclose(result.bse, result_loop.bse, rtol=1e-4)
+
+    params = MixedLMParams.from_components(
+        fe_params=np.r_[8., 0.5], cov_re=np.r_[1., 0.2, 0.2, 0.5].reshape(
+            2, 2), vcomp=np.r_[0.4])
+    assert_allclose(model.loglike(params, profile_fe=False),
+                    loop.loglike(params, profile_fe=False), rtol=1e-10)
+    assert_allclose(model.score(params, profile_fe=False),
+                    loop.score(params, profile_fe=False), rtol=1e-8)
+    hess, sing = model.hessian(params)
+    hess_loop, sing_loop = loop.hessian(params)
+    assert_allclose(hess, hess_loop, rtol=1e-8)
+    assert_equal(sing, sing_loop)
+    fe, _ = model.get_fe_params(params.cov_re, params.vcomp)
+    fe_loop, _ = loop.get_fe_params(params.cov_re, params.vcomp)
+    assert_allclose(fe, fe_loop, rtol=1e-10)
+    assert_allclose(model.get_scale(fe, params.cov_re, params.vcomp),
+                    loop.get_scale(fe, params.cov_re, params.vcomp),
+                    rtol=1e-10)
@@ -1638,3 +1638,54 @@ def test_slim_summary(reset_randomstate):
     assert len(slim_summ.tables) == 2
     assert summ.tables[0].as_text() != slim_summ.tables[0].as_text()
     assert slim_summ.tables[1].as_text() == summ.tables[1].as_text()
+
+
+@pytest.mark.parametrize("cov_type", ["nonrobust", "HC1"])
+def test_store_minimal(reset_randomstate, cov_type):
+    x = pd.DataFrame(
+        np.random.standard_normal((200, 3)), columns=["a", "b", "c"]
+    )
+    x = add_constant(x)
+    y = pd.Series(x @ [1.0, 2.0, 0.0, -1.0] + np.random.standard_normal(200))
+    weights = np.random.uniform(0.5, 2, 200)
+    model = WLS(y, x, weights=weights)
+    res = model.fit(cov_type=cov_type)
+    res_min = model.fit(cov_type=cov_type, store="minimal")
+
+    # the user's model keeps its data
+    assert model.wexog is not None
+    assert res_min.model is not model
+    assert res_min.model.wexog is None
+    assert res_min.model.pinv_wexog is None
+    assert res_min.resid is None
+    assert_equal(list(res_min.params.index), list(res.params.index))
+    for attr in ["params", "bse", "pvalues", "rsquared", "rsquared_adj",
+                 "fvalue", "llf", "aic", "bic", "ssr", "condition_number",
+                 "scale", "nobs"]:
+        assert_allclose(getattr(res_min, attr), getattr(res, attr),
+                        err_msg=attr)
+    assert_allclose(res_min.t_test("a = 2").effect, res.t_test("a = 2").effect)
+    assert_allclose(res_min.predict(x.iloc[:5]), res.predict(x.iloc[:5]))
+    pred = res_min.get_prediction(x.iloc[:5]).summary_frame()
+    assert_allclose(pred, res.get_prediction(x.iloc[:5]).summary_frame())
+    # the residual diagnostics of the summary are stored
+    assert res_min.summary().as_text() == res.summary().as_text()
+    assert res_min.summary2().as_text() == res.summary2().as_text()
+    res_ols = OLS(y, x).fit(store="minimal")
+    for method in [res_ols.get_influence, res_ols.outlier_test,
+                   lambda: res_min.get_robustcov_results("HC3"),
+                   lambda: res_min.HC2_se, lambda: res_min.resid_pearson]:
+        with pytest.raises(ValueError, match="restore_data"):
+            method()
+
+    with pytest.raises(ValueError, match="weights"):
+        res_min.restore_data(y, x)
+    res_min.restore_data(y, x, weights=weights)
+    assert_allclose(res_min.resid, res.resid)
+    assert_equal(list(res_min.resid.index), list(res.resid.index))
+    assert_allclose(res_min.HC3_se, res.HC3_se)
+    assert_allclose(res_min.rsquared, res.rsquared)
+    res_min.summary()
+
+    with pytest.raises(ValueError, match="store must be"):
+        model.fit(store="none")
@@ -9,7 +9,6 @@ import numpy as np
 from numpy.testing import (
     assert_allclose,
     assert_equal,
-    assert_raises,
     assert_warns,
 )
 import pytest
@@ -433,17 +432,23 @@ class TestOLSRobustCluster2Input(
         self.rtol = 1e-6
         self.rtolh = 1e-10
 
-    def test_too_many_groups(self):
+    def test_three_groups(self):
+        # multi-way clustering with identical dimensions is one-way
         long_groups = self.groups.reshape(-1, 1)
         groups3 = np.hstack((long_groups, long_groups, long_groups))
-        assert_raises(
-            ValueError,
-            self.res1.get_robustcov_results,
+        res3 = self.res1.get_robustcov_results(
             "cluster",
             groups=groups3,
             use_correction=True,
             use_t=True,
         )
+        res = self.res1.get_robustcov_results(
+            "cluster",
+            groups=self.groups,
+            use_correction=True,
+            use_t=True,
+        )
+        assert_allclose(res3.cov_params(), res.cov_params(), rtol=1e-10)
 
     def test_2way_dataframe(self):
         import pandas as pd
@@ -302,3 +302,25 @@ def test_expanding(basic_data):
     assert np.all(np.isnan(params[:49]))
     first = np.where(np.cumsum(np.all(np.isfinite(xa), axis=1)) >= 50)[0][0]
     assert np.all(np.isfinite(params[first:]))
+
+
+@pytest.mark.parametrize("cov_type", ["nonrobust", "HC0"])
+@pytest.mark.parametrize("expanding", [True, False])
+@pytest.mark.parametrize("missing", ["drop", "skip"])
+def test_vectorized(weighted_data, cov_type, expanding, missing):
+    y, x, w = weighted_data
+    mod = RollingWLS(
+        y, x, 60, weights=w, min_nobs=20, expanding=expanding, missing=missing
+    )
+    res = mod.fit(cov_type=cov_type)
+    res_vec = mod.fit(method="vectorized", cov_type=cov_type, reset=37)
+    for attr in ("params", "bse", "ssr", "llf", "nobs", "rsquared",
+                 "centered_tss", "uncentered_tss", "fvalue"):
+        assert_allclose(
+            np.asarray(getattr(res_vec, attr)),
+            np.asarray(getattr(res, attr)),
+            rtol=1e-7,
+            atol=1e-8,
+        )
+    res_vec = mod.fit(method="vectorized", params_only=True)
+    assert_allclose(res_vec.params, res.params, rtol=1e-7, atol=1e-10)
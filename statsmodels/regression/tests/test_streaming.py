@@ -0,0 +1,113 @@
+import numpy as np
+from numpy.testing import assert_allclose
+import pandas as pd
+import pytest
+
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.regression.streaming import StreamingOLS, StreamingWLS
+from statsmodels.tools.tools import add_constant
+
+
+@pytest.fixture(scope="module")
+def data():
+    rs = np.random.RandomState(1234)
+    nobs = 1003
+    x = add_constant(rs.standard_normal((nobs, 3)))
+    y = x @ [10.0, 1.0, -0.5, 0.0] + rs.standard_normal(nobs) * (
+        1 + np.abs(x[:, 1])
+    )
+    w = rs.chisquare(5, nobs) / 5
+    return y, x, w
+
+
+def split(*arrays, size=100):
+    nobs = arrays[0].shape[0]
+    return [
+        tuple(a[i : i + size] for a in arrays) for i in range(0, nobs, size)
+    ]
+
+
+@pytest.mark.parametrize("cov_type", ["nonrobust", "HC0", "HC1", "HC2",
+                                      "HC3"])
+def test_against_ols(data, cov_type):
+    y, x, _ = data
+    res = OLS(y, x).fit(cov_type=cov_type)
+    res_s = OLS.from_chunks(split(y, x)).fit(cov_type=cov_type)
+    assert res_s.cov_type == res.cov_type
+    assert res_s.use_t == res.use_t
+    assert_allclose(res_s.params, res.params)
+    assert_allclose(res_s.bse, res.bse)
+    assert_allclose(res_s.pvalues, res.pvalues)
+    assert_allclose(res_s.nobs, res.nobs)
+    assert_allclose(res_s.df_model, res.df_model)
+    assert_allclose(res_s.df_resid, res.df_resid)
+    for attr in ("ssr", "rsquared", "rsquared_adj", "fvalue", "f_pvalue",
+                 "llf", "aic", "bic", "centered_tss", "uncentered_tss",
+                 "condition_number"):
+        assert_allclose(getattr(res_s, attr), getattr(res, attr),
+                        err_msg=attr)
+    ft = res.f_test(np.eye(4)[1:])
+    ft_s = res_s.f_test(np.eye(4)[1:])
+    assert_allclose(ft_s.fvalue, ft.fvalue)
+    assert_allclose(ft_s.pvalue, ft.pvalue)
+
+
+@pytest.mark.parametrize("cov_type", ["nonrobust", "HC1"])
+def test_against_wls(data, cov_type):
+    y, x, w = data
+    res = WLS(y, x, weights=w).fit(cov_type=cov_type)
+    res_s = WLS.from_chunks(split(y, x, w)).fit(cov_type=cov_type)
+    assert isinstance(WLS.from_chunks(split(y, x, w)), StreamingWLS)
+    assert_allclose(res_s.params, res.params)
+    assert_allclose(res_s.bse, res.bse)
+    for attr in ("ssr", "rsquared", "fvalue", "llf", "centered_tss"):
+        assert_allclose(getattr(res_s, attr), getattr(res, attr),
+                        err_msg=attr)
+
+
+def test_pandas_names_and_missing(data):
+    y, x, _ = data
+    x = pd.DataFrame(x, columns=["const", "a", "b", "c"])
+    y = pd.Series(y, name="target")
+    y_miss = y.copy()
+    y_miss.iloc[[3, 500]] = np.nan
+    mod = StreamingOLS(split(y_miss, x), missing="drop")
+    assert mod.exog_names == ["const", "a", "b", "c"]
+    assert mod.endog_names == "target"
+    assert mod.k_constant == 1
+    assert mod.const_idx == 0
+    res_s = mod.fit()
+    res = OLS(y_miss, x, missing="drop").fit()
+    assert_allclose(res_s.params, res.params)
+    t = res_s.t_test("a = 1")
+    assert_allclose(t.effect, res.t_test("a = 1").effect)
+
+    with pytest.raises(Exception, match="NaNs"):
+        StreamingOLS(split(y_miss, x), missing="raise")
+
+
+def test_implicit_constant(data):
+    y, x, _ = data
+    dummy = (x[:, 1] > 0).astype(float)
+    x2 = np.column_stack([dummy, 1 - dummy, x[:, 2]])
+    mod = StreamingOLS(split(y, x2))
+    assert mod.k_constant == 1
+    res = OLS(y, x2).fit()
+    assert_allclose(mod.fit().rsquared, res.rsquared)
+    assert StreamingOLS(split(y, x[:, 1:])).k_constant == 0
+
+
+def test_one_shot_iterator(data):
+    y, x, _ = data
+    chunks = iter(split(y, x))
+    mod = StreamingOLS(chunks)
+    res = mod.fit()
+    assert_allclose(res.params, OLS(y, x).fit().params)
+    with pytest.raises(ValueError, match="second pass"):
+        mod.fit(cov_type="HC0")
+    with pytest.raises(NotImplementedError):
+        res.resid
+
+    # A callable returning a new iterator supports the second pass
+    res = StreamingOLS(lambda: iter(split(y, x))).fit(cov_type="HC0")
+    assert_allclose(res.bse, OLS(y, x).fit(cov_type="HC0").bse)
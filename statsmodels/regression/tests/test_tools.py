@@ -3,7 +3,7 @@ from numpy.testing import assert_allclose
 import pytest
 
 from statsmodels.regression.linear_model import WLS
-from statsmodels.regression._tools import _MinimalWLS
+from statsmodels.regression._tools import _MinimalWLS, _WLSWorkspace
 
 
 class TestMinimalWLS:
@@ -60,3 +60,55 @@ class TestMinimalWLS:
             weights[-1] = bad_value
             _MinimalWLS(self.endog1, self.exog1, weights,
                         check_endog=True, check_weights=True).fit()
+
+
+class TestWLSWorkspace(TestMinimalWLS):
+
+    @pytest.mark.parametrize('chunksize', [None, 7])
+    def test_equivalence_with_wls(self, chunksize):
+        workspace = _WLSWorkspace(self.endog1, self.exog1,
+                                  chunksize=chunksize)
+        for weights in [1.0, self.weights1, np.ones(200)]:
+            res = WLS(self.endog1, self.exog1, weights=weights).fit()
+            minres = workspace.fit(weights)
+            assert_allclose(minres.params, res.params, rtol=1e-10)
+            assert_allclose(minres.resid, res.resid, rtol=1e-10)
+            assert_allclose(minres.fittedvalues, res.fittedvalues,
+                            rtol=1e-10)
+            assert_allclose(minres.scale, res.scale, rtol=1e-10)
+
+        workspace = _WLSWorkspace(self.endog2, self.exog2,
+                                  chunksize=chunksize)
+        res = WLS(self.endog2, self.exog2, weights=self.weights2).fit()
+        minres = workspace.fit(self.weights2)
+        assert_allclose(minres.params, res.params, rtol=1e-10)
+        assert_allclose(minres.resid, res.resid, rtol=1e-10)
+
+    def test_singular(self):
+        # zero weights and collinear columns use the pseudoinverse
+        exog = np.column_stack((self.exog1, self.exog1[:, 0]))
+        weights = self.weights1.copy()
+        weights[:150] = 0
+        for exog_, weights_ in [(exog, 1.0), (self.exog1[:, :2], weights)]:
+            res = _MinimalWLS(self.endog1, exog_, weights=weights_).fit()
+            minres = _WLSWorkspace(self.endog1, exog_).fit(weights_)
+            assert_allclose(minres.params, res.params, rtol=1e-10)
+
+    def test_results(self):
+        workspace = _WLSWorkspace(self.endog1, self.exog1, chunksize=64)
+        params = np.arange(5.0)
+        res = _MinimalWLS(self.endog1, self.exog1,
+                          weights=np.ones(200)).results(params)
+        minres = workspace.results(params)
+        assert_allclose(minres.resid, res.resid, rtol=1e-13)
+        assert_allclose(minres.scale, res.scale, rtol=1e-13)
+
+    @pytest.mark.parametrize('bad_value', [np.nan, np.inf, -1.0])
+    def test_inf_nan(self, bad_value):
+        weights = self.weights1.copy()
+        weights[-1] = bad_value
+        workspace = _WLSWorkspace(self.endog1, self.exog1)
+        with pytest.raises(
+                ValueError,
+                match=r'detected in weights, estimation infeasible'):
+            workspace.fit(weights, check_weights=True)
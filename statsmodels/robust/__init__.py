@@ -6,5 +6,10 @@ from . import norms
 from .scale import mad, Huber, HuberScale, hubers_scale
 
 from statsmodels.tools._test_runner import PytestTester
+from statsmodels.tools._lazy import lazy_submodules
 
 test = PytestTester()
+
+# Submodules are imported on first access, e.g. through statsmodels.api
+__getattr__ = lazy_submodules(__name__)
+del lazy_submodules
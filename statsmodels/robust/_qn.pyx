@@ -4,132 +4,215 @@
 import numpy as np
 
 
-def _high_weighted_median(double[::1] a, int[::1] weights):
+cdef double select_kth(double *x, Py_ssize_t n, Py_ssize_t k) noexcept nogil:
     """
-    Computes a weighted high median of a. This is defined as the
-    smallest a[j] such that the sum over all a[i]<=a[j] is strictly
-    greater than half the total sum of the weights
+    The k-th smallest value of x, which is partially sorted in-place.
     """
     cdef:
-        double[::1] a_cp = np.copy(a)
-        int[::1] weights_cp = np.copy(weights)
-        int n = a_cp.shape[0]
-        double[::1] sorted_a = np.zeros((n,), dtype=np.double)
-        double[::1] a_cand = np.zeros((n,), dtype=np.double)
-        int[::1] weights_cand = np.zeros((n,), dtype=np.intc)
-        int kcand = 0
-        int wleft, wright, wmid, wtot, wrest = 0
+        Py_ssize_t lo = 0, hi = n - 1, i, j
+        double pivot, tmp
+
+    while lo < hi:
+        pivot = x[(lo + hi) // 2]
+        i = lo
+        j = hi
+        while i <= j:
+            while x[i] < pivot:
+                i += 1
+            while x[j] > pivot:
+                j -= 1
+            if i <= j:
+                tmp = x[i]
+                x[i] = x[j]
+                x[j] = tmp
+                i += 1
+                j -= 1
+        if k <= j:
+            hi = j
+        elif k >= i:
+            lo = i
+        else:
+            break
+    return x[k]
+
+
+cdef double high_weighted_median(double *a, Py_ssize_t *weights,
+                                 Py_ssize_t n, double *work) noexcept nogil:
+    """
+    Weighted high median of a, which is overwritten together with weights.
+    work needs room for n values.
+    """
+    cdef:
+        Py_ssize_t i, kcand
+        Py_ssize_t wleft, wright, wmid, wtot = 0, wrest = 0
         double trial = 0
-    wtot = np.sum(weights_cp)
+
+    for i in range(n):
+        wtot += weights[i]
     while True:
         wleft = 0
         wmid = 0
         wright = 0
         for i in range(n):
-            sorted_a[i] = a_cp[i]
-        sorted_a = np.partition(sorted_a, kth=n//2)
-        trial = sorted_a[n//2]
+            work[i] = a[i]
+        trial = select_kth(work, n, n // 2)
         for i in range(n):
-            if a_cp[i] < trial:
-                wleft = wleft + weights_cp[i]
-            elif a_cp[i] > trial:
-                wright = wright + weights_cp[i]
+            if a[i] < trial:
+                wleft += weights[i]
+            elif a[i] > trial:
+                wright += weights[i]
             else:
-                wmid = wmid + weights_cp[i]
+                wmid += weights[i]
+        # The candidates are moved to the front of a and weights
         kcand = 0
         if 2 * (wrest + wleft) > wtot:
             for i in range(n):
-                if a_cp[i] < trial:
-                    a_cand[kcand] = a_cp[i]
-                    weights_cand[kcand] = weights_cp[i]
-                    kcand = kcand + 1
+                if a[i] < trial:
+                    a[kcand] = a[i]
+                    weights[kcand] = weights[i]
+                    kcand += 1
         elif 2 * (wrest + wleft + wmid) <= wtot:
             for i in range(n):
-                if a_cp[i] > trial:
-                    a_cand[kcand] = a_cp[i]
-                    weights_cand[kcand] = weights_cp[i]
-                    kcand = kcand + 1
-            wrest = wrest + wleft + wmid
+                if a[i] > trial:
+                    a[kcand] = a[i]
+                    weights[kcand] = weights[i]
+                    kcand += 1
+            wrest += wleft + wmid
         else:
             break
         n = kcand
-        for i in range(n):
-            a_cp[i] = a_cand[i]
-            weights_cp[i] = weights_cand[i]
     return trial
 
 
-def _qn(double[:] a, double c):
+cdef double qn_sorted(const double *a_sorted, Py_ssize_t n,
+                      Py_ssize_t *buffer, double *work) noexcept nogil:
     """
-    Computes the Qn robust estimator of scale, a more efficient alternative
-    to the MAD. The implementation follows the algorithm described in Croux
-    and Rousseeuw (1992).
-
-    Parameters
-    ----------
-    a : array_like
-        Input array.
-    c : float, optional
-        The normalization constant, used to get consistent estimates of the
-        standard deviation at the normal distribution.  Defined as
-        1/(np.sqrt(2) * scipy.stats.norm.ppf(5/8)), which is 2.219144.
-
-    Returns
-    -------
-    The Qn robust estimator of scale
+    Unnormalized Qn of the sorted a_sorted. buffer needs room for 5 * n
+    integers and work for 3 * n values.
     """
     cdef:
-        int n = a.shape[0]
-        int h = n/2 + 1
-        int k = h * (h - 1) / 2
-        int n_left = n * (n + 1) / 2
-        int n_right = n * n
-        int k_new = k + n_left
-        Py_ssize_t i, j, jh, l = 0
-        int sump, sumq = 0
-        double trial, output = 0
-        double[::1] a_sorted = np.sort(a)
-        int[::1] left = np.array([n - i + 1 for i in range(0, n)], dtype=np.intc)
-        int[::1] right = np.array([n if i <= h else n - (i - h) for i in range(0, n)], dtype=np.intc)
-        int[::1] weights = np.zeros((n,), dtype=np.intc)
-        double[::1] work = np.zeros((n,), dtype=np.double)
-        int[::1] p = np.zeros((n,), dtype=np.intc)
-        int[::1] q = np.zeros((n,), dtype=np.intc)
+        Py_ssize_t h = n // 2 + 1
+        Py_ssize_t k = h * (h - 1) // 2
+        Py_ssize_t n_left = n * (n + 1) // 2
+        Py_ssize_t n_right = n * n
+        Py_ssize_t k_new = k + n_left
+        Py_ssize_t i, j, jh, l, sump, sumq
+        Py_ssize_t *left = buffer
+        Py_ssize_t *right = buffer + n
+        Py_ssize_t *weights = buffer + 2 * n
+        Py_ssize_t *p = buffer + 3 * n
+        Py_ssize_t *q = buffer + 4 * n
+        double *cand = work + n
+        double trial
+
+    for i in range(n):
+        left[i] = n - i + 1
+        right[i] = n if i <= h else n - (i - h)
     while n_right - n_left > n:
         j = 0
         for i in range(1, n):
             if left[i] <= right[i]:
                 weights[j] = right[i] - left[i] + 1
                 jh = left[i] + weights[j] // 2
-                work[j] = a_sorted[i] - a_sorted[n - jh]
-                j = j + 1
-        trial = _high_weighted_median(work[:j], weights[:j])
+                cand[j] = a_sorted[i] - a_sorted[n - jh]
+                j += 1
+        trial = high_weighted_median(cand, weights, j, work + 2 * n)
         j = 0
         for i in range(n - 1, -1, -1):
             while j < n and (a_sorted[i] - a_sorted[n - j - 1]) < trial:
-                j = j + 1
+                j += 1
             p[i] = j
         j = n + 1
         for i in range(n):
             while (a_sorted[i] - a_sorted[n - j + 1]) > trial:
-                j = j - 1
+                j -= 1
             q[i] = j
-        sump = np.sum(p)
-        sumq = np.sum(q) - n
+        sump = 0
+        sumq = -n
+        for i in range(n):
+            sump += p[i]
+            sumq += q[i]
         if k_new <= sump:
-            right = np.copy(p)
+            for i in range(n):
+                right[i] = p[i]
             n_right = sump
         elif k_new > sumq:
-            left = np.copy(q)
+            for i in range(n):
+                left[i] = q[i]
             n_left = sumq
         else:
-            output = c * trial
-            return output
+            return trial
     j = 0
     for i in range(1, n):
         for l in range(left[i], right[i] + 1):
             work[j] = a_sorted[i] - a_sorted[n - l]
-            j = j + 1
-    k_new = k_new - (n_left + 1)
-    output = c * np.sort(work[:j])[k_new]
-    return output
+            j += 1
+    return select_kth(work, j, k_new - (n_left + 1))
+
+
+def _high_weighted_median(double[::1] a, int[::1] weights):
+    """
+    Computes a weighted high median of a. This is defined as the
+    smallest a[j] such that the sum over all a[i]<=a[j] is strictly
+    greater than half the total sum of the weights
+    """
+    cdef:
+        Py_ssize_t n = a.shape[0]
+        double[::1] a_cp = np.array(a, dtype=np.double)
+        Py_ssize_t[::1] weights_cp = np.array(weights, dtype=np.intp)
+        double[::1] work = np.empty(n, dtype=np.double)
+    return high_weighted_median(&a_cp[0], &weights_cp[0], n, &work[0])
+
+
+def _qn(double[:] a, double c):
+    """
+    Computes the Qn robust estimator of scale, a more efficient alternative
+    to the MAD. The implementation follows the algorithm described in Croux
+    and Rousseeuw (1992).
+
+    Parameters
+    ----------
+    a : array_like
+        Input array.
+    c : float, optional
+        The normalization constant, used to get consistent estimates of the
+        standard deviation at the normal distribution.  Defined as
+        1/(np.sqrt(2) * scipy.stats.norm.ppf(5/8)), which is 2.219144.
+
+    Returns
+    -------
+    The Qn robust estimator of scale
+    """
+    out = np.empty(1)
+    _qn_rows(np.sort(a)[None, :], c, out)
+    return out[0]
+
+
+def _qn_rows(const double[:, ::1] a_sorted, double c, double[::1] out):
+    """
+    Computes the Qn robust estimator of scale of each row of a 2-d array
+
+    Parameters
+    ----------
+    a_sorted : ndarray
+        C-contiguous 2-d array whose rows are sorted.
+    c : float
+        The normalization constant.
+    out : ndarray
+        Array in which the estimates of the rows are stored.
+    """
+    cdef:
+        Py_ssize_t nrows = a_sorted.shape[0], n = a_sorted.shape[1], row
+        Py_ssize_t[::1] buffer = np.empty(5 * n + 1, dtype=np.intp)
+        double[::1] work = np.empty(3 * n + 1, dtype=np.double)
+
+    if out.shape[0] != nrows:
+        raise ValueError("out must have one value per row")
+    if n < 2:
+        # There are no pairwise differences
+        out[:] = np.nan
+        return
+    with nogil:
+        for row in range(nrows):
+            out[row] = c * qn_sorted(&a_sorted[row, 0], n, &buffer[0],
+                                     &work[0])
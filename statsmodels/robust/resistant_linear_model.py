@@ -66,6 +66,7 @@ class RLMDetS(Model):
 
         self.norm = norm
         self.breakdown_point = breakdown_point
+        self._mod_rlm = None
 
         # TODO: detect constant
         if col_indices is None:
@@ -96,11 +97,15 @@ class RLMDetS(Model):
             ]
         return start_params_all
 
-    def _fit_one(self, start_params, maxiter=100):
-        mod = RLM(self.endog, self.exog, M=self.norm)
-        res = mod.fit(start_params=start_params,
-                      scale_est=self.mscale,
-                      maxiter=maxiter)
+    def _fit_one(self, start_params, maxiter=100, start_scale=None):
+        # the RLM instance is shared by all starts, so that the
+        # decomposition of exog in its setup is only computed once
+        if self._mod_rlm is None:
+            self._mod_rlm = RLM(self.endog, self.exog, M=self.norm)
+        res = self._mod_rlm.fit(start_params=start_params,
+                                start_scale=start_scale,
+                                scale_est=self.mscale,
+                                maxiter=maxiter)
         return res
 
     def fit(self, h, maxiter=100, maxiter_step=5, start_params_extra=None):
@@ -122,7 +127,9 @@ class RLMDetS(Model):
         best_idx = scale_sorted[0]
 
         # TODO: iterate until convergence if start fits are not converged
-        res_best = self._fit_one(res[best_idx].params, maxiter=maxiter)
+        # warm start at the scale of the best start
+        res_best = self._fit_one(res[best_idx].params, maxiter=maxiter,
+                                 start_scale=res[best_idx].scale)
 
         # TODO: add extra start and convergence info
         res_best._results.results_iter = res
@@ -123,12 +123,18 @@ class RLM(base.LikelihoodModel):
 
         Resets the history and number of iterations.
         """
-        self.pinv_wexog = np.linalg.pinv(self.exog)
+        # the pseudoinverse and the rank share a single SVD, computed as in
+        # np.linalg.pinv and np.linalg.matrix_rank
+        u, s, vt = np.linalg.svd(self.exog, full_matrices=False)
+        rank = np.count_nonzero(s > s.max(initial=0) * max(self.exog.shape) *
+                                np.finfo(s.dtype).eps)
+        large = s > 1e-15 * s.max(initial=0)
+        s_inv = np.divide(1, s, where=large, out=np.zeros_like(s))
+        self.pinv_wexog = np.matmul(vt.T, s_inv[:, None] * u.T)
         self.normalized_cov_params = np.dot(self.pinv_wexog,
                                             np.transpose(self.pinv_wexog))
-        self.df_resid = (float(self.exog.shape[0] -
-                               np.linalg.matrix_rank(self.exog)))
-        self.df_model = float(np.linalg.matrix_rank(self.exog) - 1)
+        self.df_resid = float(self.exog.shape[0] - rank)
+        self.df_model = float(rank - 1)
         self.nobs = float(self.endog.shape[0])
 
     def score(self, params):
@@ -259,8 +265,11 @@ class RLM(base.LikelihoodModel):
             raise ValueError("Convergence argument %s not understood" % conv)
         self.scale_est = scale_est
 
+        # The workspace keeps the buffers of the weighted least squares
+        # fits across the IRLS iterations
+        workspace = reg_tools._WLSWorkspace(self.endog, self.exog)
         if start_params is None:
-            wls_results = lm.WLS(self.endog, self.exog).fit()
+            wls_results = workspace.fit()
         else:
             start_params = np.asarray(start_params, dtype=np.double).squeeze()
             start_params = np.atleast_1d(start_params)
@@ -268,10 +277,7 @@ class RLM(base.LikelihoodModel):
                     start_params.ndim != 1):
                 raise ValueError('start_params must by a 1-d array with {} '
                                  'values'.format(self.exog.shape[1]))
-            fake_wls = reg_tools._MinimalWLS(self.endog, self.exog,
-                                             weights=np.ones_like(self.endog),
-                                             check_weights=False)
-            wls_results = fake_wls.results(start_params)
+            wls_results = workspace.results(start_params)
 
         if not init and not start_scale:
             self.scale = self._estimate_scale(wls_results.resid)
@@ -305,9 +311,7 @@ class RLM(base.LikelihoodModel):
                               'weighted data.', ConvergenceWarning)
                 break
             self.weights = self.M.weights(wls_results.resid / self.scale)
-            wls_results = reg_tools._MinimalWLS(self.endog, self.exog,
-                                                weights=self.weights,
-                                                check_weights=True).fit()
+            wls_results = workspace.fit(self.weights, check_weights=True)
             if update_scale is True:
                 self.scale = self._estimate_scale(wls_results.resid)
             history = self._update_history(wls_results, history, conv)
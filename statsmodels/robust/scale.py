@@ -20,7 +20,7 @@ from statsmodels.tools import tools
 from statsmodels.tools.validation import array_like, float_like
 
 from . import norms
-from ._qn import _qn
+from ._qn import _qn_rows
 
 
 class Holder():
@@ -63,7 +63,7 @@ def mad(a, c=Gaussian.ppf(3 / 4.0), axis=0, center=np.median):
             center_val = center(a.ravel())
     else:
         center_val = float_like(center, "center")
-    err = (np.abs(a - center_val)) / c
+    err = np.abs(a - center_val)
     if not err.size:
         if axis is None or err.ndim == 1:
             return np.nan
@@ -71,7 +71,9 @@ def mad(a, c=Gaussian.ppf(3 / 4.0), axis=0, center=np.median):
             shape = list(err.shape)
             shape.pop(axis)
             return np.empty(shape)
-    return np.median(err, axis=axis)
+    # The deviations are a temporary, so that they can be partitioned
+    # in-place, and only the medians are normalized
+    return np.median(err, axis=axis, overwrite_input=True) / c
 
 
 def iqr(a, c=Gaussian.ppf(3 / 4) - Gaussian.ppf(1 / 4), axis=0):
@@ -132,6 +134,12 @@ def qn_scale(a, c=1 / (np.sqrt(2) * Gaussian.ppf(5 / 8)), axis=0):
     -------
     {float, ndarray}
         The Qn robust estimator of scale
+
+    Notes
+    -----
+    The slices along `axis` are sorted together, and the estimates of all
+    slices are computed in a single compiled loop, so that the cost is
+    O(n log n) for each slice of length n without Python overhead per slice.
     """
     a = array_like(
         a, "a", ndim=None, dtype=np.float64, contiguous=True, order="C"
@@ -142,10 +150,15 @@ def qn_scale(a, c=1 / (np.sqrt(2) * Gaussian.ppf(5 / 8)), axis=0):
     elif a.size == 0:
         return np.nan
     else:
-        out = np.apply_along_axis(_qn, axis=axis, arr=a, c=c)
-        if out.ndim == 0:
-            return float(out)
-        return out
+        a = np.moveaxis(a, axis, -1)
+        shape = a.shape[:-1]
+        a_sorted = np.array(a.reshape(-1, a.shape[-1]), order="C")
+        a_sorted.sort(axis=-1)
+        out = np.empty(a_sorted.shape[0])
+        _qn_rows(a_sorted, c, out)
+        if not shape:
+            return float(out[0])
+        return out.reshape(shape)
 
 
 def _qn_naive(a, c=1 / (np.sqrt(2) * Gaussian.ppf(5 / 8))):
@@ -275,6 +288,7 @@ class Huber:
         where estimate_location is an M-estimator and estimate_scale implements
         the check used in Section 5.5 of Venables & Ripley
         """  # noqa:E501
+        nobs = a.shape[axis]
         for _ in range(self.maxiter):
             # Estimate the mean along a given axis
             if est_mu:
@@ -285,25 +299,29 @@ class Huber:
                     nmu = (
                         np.clip(
                             a, mu - self.c * scale, mu + self.c * scale
-                        ).sum(axis)
-                        / a.shape[axis]
+                        ).sum(axis, keepdims=True)
+                        / nobs
                     )
                 else:
                     nmu = norms.estimate_location(
                         a, scale, self.norm, axis, mu, self.maxiter, self.tol
                     )
+                    nmu = tools.unsqueeze(nmu, axis, a.shape)
             else:
                 # Effectively, do nothing
-                nmu = mu.squeeze()
-            nmu = tools.unsqueeze(nmu, axis, a.shape)
+                nmu = mu
 
             subset = np.less_equal(np.abs((a - mu) / scale), self.c)
 
-            scale_num = np.sum(subset * (a - nmu) ** 2 +
-                               (1 - subset) * (scale * self.c)**2, axis)
+            # Observations outside of the threshold contribute the same
+            # amount, so that only the number of them is needed
+            scale_num = (
+                np.sum(np.square(a - nmu), axis, keepdims=True, where=subset)
+                + (nobs - np.count_nonzero(subset, axis, keepdims=True))
+                * (scale * self.c) ** 2
+            )
             scale_denom = n * self.gamma
             nscale = np.sqrt(scale_num / scale_denom)
-            nscale = tools.unsqueeze(nscale, axis, a.shape)
 
             test1 = np.all(
                 np.less_equal(np.abs(scale - nscale), nscale * self.tol)
@@ -379,30 +397,23 @@ class HuberScale:
         )
         s = mad(resid)
 
-        def subset(x):
-            return np.less(np.abs(resid / x), self.d)
-
-        def chi(s):
-            return subset(s) * (resid / s) ** 2 / 2 + (1 - subset(s)) * (
-                self.d ** 2 / 2
-            )
-
-        scalehist = [np.inf, s]
+        # chi(resid / s) * s**2 is resid**2 / 2 for the residuals within the
+        # threshold and (d * s)**2 / 2 for the others, so that the squared
+        # residuals are computed once and each iteration only compares them
+        # to the squared threshold
+        resid2 = np.square(resid)
+        nresid = resid2.size
+        scale_prev = np.inf
         niter = 1
-        while (
-            np.abs(scalehist[niter - 1] - scalehist[niter]) > self.tol
-            and niter < self.maxiter
-        ):
-            nscale = np.sqrt(
-                1
-                / (nobs * h)
-                * np.sum(chi(scalehist[-1]))
-                * scalehist[-1] ** 2
-            )
-            scalehist.append(nscale)
+        while np.abs(scale_prev - s) > self.tol and niter < self.maxiter:
+            thresh2 = (self.d * s) ** 2
+            subset = np.less(resid2, thresh2)
+            sum_chi = (np.sum(resid2, where=subset) +
+                       (nresid - np.count_nonzero(subset)) * thresh2) / 2
+            scale_prev, s = s, np.sqrt(sum_chi / (nobs * h))
             niter += 1
             # TODO: raise on convergence failure?
-        return scalehist[-1]
+        return s
 
 
 hubers_scale = HuberScale()
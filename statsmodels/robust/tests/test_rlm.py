@@ -324,6 +324,32 @@ def test_rlm_start_values():
     assert_allclose(results.params, result_sv.params)
 
 
+def test_rlm_rank_deficient():
+    data = load_stackloss()
+    exog = sm.add_constant(data.exog, prepend=False)
+    exog = np.column_stack((exog, exog[:, 0] + exog[:, 1]))
+    model = RLM(data.endog, exog, M=norms.HuberT())
+    assert_allclose(model.pinv_wexog, np.linalg.pinv(exog), rtol=1e-10,
+                    atol=1e-14)
+    assert model.df_model == 3
+    assert model.df_resid == 17
+    res = model.fit()
+    res_full = RLM(data.endog, exog[:, :-1], M=norms.HuberT()).fit()
+    assert_allclose(res.fittedvalues, res_full.fittedvalues, rtol=1e-7)
+
+
+def test_rlm_memmap(tmp_path):
+    data = load_stackloss()
+    exog = sm.add_constant(data.exog, prepend=False)
+    exog_mm = np.lib.format.open_memmap(tmp_path / "exog.npy", mode="w+",
+                                        shape=exog.shape)
+    exog_mm[:] = exog
+    res = RLM(data.endog, exog, M=norms.TukeyBiweight()).fit()
+    res_mm = RLM(data.endog, exog_mm, M=norms.TukeyBiweight()).fit()
+    assert_allclose(res_mm.params, res.params, rtol=1e-12)
+    assert_allclose(res_mm.bse, res.bse, rtol=1e-12)
+
+
 def test_rlm_start_values_errors():
     data = sm.datasets.stackloss.load_pandas()
     exog = sm.add_constant(data.exog, prepend=False)
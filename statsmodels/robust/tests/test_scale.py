@@ -237,6 +237,18 @@ class TestQn:
             scale.qn_scale(self.sunspot[0:289]), 33.50901, DECIMAL
         )
 
+    def test_qn_batch(self):
+        x = np.random.RandomState(0).standard_t(3, size=(7, 31, 4))
+        for axis in range(3):
+            expected = np.apply_along_axis(scale._qn_naive, axis, x)
+            assert_allclose(scale.qn_scale(x, axis=axis), expected,
+                            rtol=1e-13)
+
+    def test_qn_single(self):
+        assert np.isnan(scale.qn_scale(np.ones(1)))
+        assert_allclose(scale.qn_scale([1.0, 3.0]),
+                        scale._qn_naive(np.array([1.0, 3.0])))
+
     def test_qn_empty(self):
         empty = np.empty(0)
         assert np.isnan(scale.qn_scale(empty))
@@ -308,6 +320,24 @@ class TestHuberAxes:
         assert_equal(m.shape, (40, 10))
 
 
+def test_huber_scale_reference():
+    # direct implementation of the iteration in the HuberScale docstring
+    resid = np.random.RandomState(3).standard_t(3, size=500)
+    d = 2.5
+    h = 497 / 500 * (d ** 2 + (1 - d ** 2) * Gaussian.cdf(d) - 0.5 -
+                     d / np.sqrt(2 * np.pi) * np.exp(-0.5 * d ** 2))
+    s = mad(resid)
+    for _ in range(29):
+        r = resid / s
+        chi = np.where(np.abs(r) < d, r ** 2 / 2, d ** 2 / 2)
+        s_new = np.sqrt(np.sum(chi) * s ** 2 / (500 * h))
+        converged = np.abs(s_new - s) <= 1e-8
+        s = s_new
+        if converged:
+            break
+    assert_allclose(scale.HuberScale()(497, 500, resid), s, rtol=1e-12)
+
+
 def test_mad_axis_none():
     # GH 7027
     a = np.array([[0, 1, 2], [2, 3, 2]])
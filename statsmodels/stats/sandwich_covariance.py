@@ -100,12 +100,16 @@ for inference with clustered errors,” The Review of Economics and
 Statistics 90, no. 3 (2008): 414–427.
 
 """
+from itertools import combinations
+
 import numpy as np
+import pandas as pd
+from scipy import sparse
 
-from statsmodels.tools.grouputils import combine_indices, group_sums
 from statsmodels.stats.moment_helpers import se_cov
 
-__all__ = ['cov_cluster', 'cov_cluster_2groups', 'cov_hac', 'cov_nw_panel',
+__all__ = ['cov_cluster', 'cov_cluster_2groups', 'cov_cluster_multiway',
+           'cov_hac', 'cov_nw_panel',
            'cov_white_simple',
            'cov_hc0', 'cov_hc1', 'cov_hc2', 'cov_hc3',
            'se_cov', 'weights_bartlett', 'weights_uniform']
@@ -215,6 +219,138 @@ def cov_hc3(results):
 
 #---------------------------------------
 
+class _SparseCovariance:
+    """
+    Covariance of the parameters held as sparse factors
+
+    Represents ``factor * B^{-1} (S' S) B^{-1}``, or ``factor * B^{-1}``
+    if `scores` is None, where B is a symmetric sparse k x k matrix and S a
+    sparse array of scores or of group sums of scores. Only the requested
+    columns or the diagonal are computed, so that the dense k x k matrix
+    is not formed unless `toarray` is called.
+
+    Parameters
+    ----------
+    bread : scipy.sparse matrix
+        The matrix B.
+    scores : scipy.sparse matrix, optional
+        The (n, k) array S of the meat ``S' S``.
+    factor : float
+        Scalar factor of the covariance.
+    lu : SuperLU, optional
+        The factorization of B by scipy.sparse.linalg.splu if it is already
+        available. Otherwise B is factorized on first use. The factorization
+        cannot be pickled and is computed again after unpickling.
+    """
+
+    # number of columns solved at once for the diagonal
+    blocksize = 256
+    # maximal number of elements of the dense k x m blocks in quad_form_rows
+    max_block_size = 2 ** 22
+
+    def __init__(self, bread, scores=None, factor=1., lu=None):
+        self.bread = sparse.csc_matrix(bread)
+        self.scores = scores
+        self.factor = factor
+        self._lu = lu
+        self.shape = bread.shape
+        self.ndim = 2
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_lu'] = None
+        return state
+
+    @property
+    def lu(self):
+        """The sparse LU factorization of the bread"""
+        if self._lu is None:
+            from scipy.sparse import linalg as splinalg
+            self._lu = splinalg.splu(self.bread)
+        return self._lu
+
+    def __mul__(self, other):
+        return _SparseCovariance(self.bread, self.scores,
+                                 self.factor * other, lu=self._lu)
+
+    __rmul__ = __mul__
+
+    def dot(self, other):
+        """
+        Product of the covariance with a dense 1d or 2d array
+        """
+        other = np.asarray(other, dtype=float)
+        x = self.lu.solve(other.reshape(other.shape[0], -1))
+        if self.scores is not None:
+            x = self.lu.solve(self.scores.T @ (self.scores @ x))
+        return self.factor * x.reshape(other.shape)
+
+    def columns(self, idx):
+        """
+        Dense columns `idx` of the covariance, (k, len(idx))
+        """
+        idx = np.atleast_1d(idx)
+        unit = np.zeros((self.shape[0], len(idx)))
+        unit[idx, np.arange(len(idx))] = 1
+        return self.dot(unit)
+
+    def diagonal(self):
+        """
+        Diagonal of the covariance, solved in blocks of columns
+        """
+        k = self.shape[0]
+        diag = np.empty(k)
+        for start in range(0, k, self.blocksize):
+            idx = np.arange(start, min(start + self.blocksize, k))
+            diag[idx] = self.columns(idx)[idx, np.arange(len(idx))]
+        return diag
+
+    def quad_form_rows(self, exog):
+        """
+        Diagonal of ``exog @ cov @ exog.T`` for a sparse or dense exog
+
+        The rows are processed in blocks so that only dense k x m arrays
+        with at most `max_block_size` elements are formed.
+        """
+        exog = sparse.csr_matrix(exog)
+        nobs, k = exog.shape
+        step = max(1, self.max_block_size // k)
+        out = np.empty(nobs)
+        for start in range(0, nobs, step):
+            block = exog[start:start + step]
+            cov_xt = self.dot(block.T.toarray())
+            out[start:start + step] = np.asarray(
+                block.multiply(cov_xt.T).sum(1)).ravel()
+        return out
+
+    def toarray(self):
+        """
+        The dense k x k covariance
+        """
+        return self.dot(np.eye(self.shape[0]))
+
+
+def _get_sparse_sandwich_arrays(results, cov_type=''):
+    """scores and bread for a model with sparse score_obs
+
+    Returns the sparse scores and the sparse negative hessian, or None if
+    the model does not have a sparse exog.
+    """
+    if hasattr(results, '_results'):
+        results = results._results
+    model = getattr(results, 'model', None)
+    if not sparse.issparse(getattr(model, 'exog', None)):
+        return None
+    if not hasattr(model, '_sparse_hessian'):
+        raise NotImplementedError('sandwich covariances with a sparse exog '
+                                  'are not available for this model')
+    xu = model.score_obs(results.params)
+    if hasattr(model, 'freq_weights') and not cov_type == 'clu':
+        xu = xu.multiply(1 / np.sqrt(np.asarray(model.freq_weights))[:, None])
+    bread = -model._sparse_hessian(results.params)
+    return sparse.csr_matrix(xu), bread
+
+
 def _get_sandwich_arrays(results, cov_type=''):
     """Helper function to get scores from results
 
@@ -236,6 +372,9 @@ def _get_sandwich_arrays(results, cov_type=''):
             hessian_inv = np.linalg.inv(results.model.hessian(results.params))
         elif hasattr(results.model, 'score_obs'):
             xu = results.model.score_obs(results.params)
+            if sparse.issparse(xu):
+                raise NotImplementedError('this covariance type is not '
+                                          'available with a sparse exog')
             hessian_inv = np.linalg.inv(results.model.hessian(results.params))
         else:
             xu = results.model.wexog * results.wresid[:, None]
@@ -467,11 +606,54 @@ def S_hac_groupsum(x, time, nlags=None, weights_func=weights_bartlett):
     '''
     #needs groupsums
 
-    x_group_sums = group_sums(x, time).T #TODO: transpose return in grou_sum
+    time = np.asarray(time).squeeze()
+    n_periods = time.max() + 1
+    if n_periods > 2 * time.shape[0]:
+        # relabel, otherwise the time sums take too much memory
+        periods, time = np.unique(time, return_inverse=True)
+        n_periods = len(periods)
+    x_group_sums = _group_sums(x, time, n_periods)
 
     return S_hac_simple(x_group_sums, nlags=nlags, weights_func=weights_func)
 
 
+def _group_codes(groups):
+    '''integer labels for groups, the intersection of the columns if 2d
+
+    Returns labels in range(n_groups) and n_groups. The labels are found by
+    hashing and are not sorted. Columns of 2d groups are combined one at a
+    time so that the intermediate labels never exceed nobs**2. Missing
+    values, e.g. nan, form a group of their own.
+    '''
+    groups = np.asarray(groups)
+    if groups.ndim == 1:
+        codes, uniques = pd.factorize(groups)
+        n_groups = len(uniques)
+        missing = codes == -1
+        if missing.any():
+            codes[missing] = n_groups
+            n_groups += 1
+        return codes, n_groups
+    codes, n_groups = _group_codes(groups[:, 0])
+    for col in range(1, groups.shape[1]):
+        codes_col, n_col = _group_codes(groups[:, col])
+        codes, n_groups = _group_codes(codes * n_col + codes_col)
+    return codes, n_groups
+
+
+def _group_sums(x, codes, n_groups):
+    '''sums of rows of x by group labels, (n_groups, k_vars)
+
+    A single bincount over the raveled array replaces one bincount per column.
+    '''
+    if x.ndim == 1:
+        x = x[:, None]
+    k_vars = x.shape[1]
+    idx = (codes[:, None] * k_vars + np.arange(k_vars)).ravel()
+    sums = np.bincount(idx, weights=np.ravel(x), minlength=n_groups * k_vars)
+    return sums.reshape(n_groups, k_vars)
+
+
 def S_crosssection(x, group):
     '''inner covariance matrix for White on group sums sandwich
 
@@ -481,11 +663,57 @@ def S_crosssection(x, group):
     This is used by cov_cluster and indirectly verified
 
     '''
-    x_group_sums = group_sums(x, group).T  #TODO: why transposed
+    codes, n_groups = _group_codes(np.asarray(group).squeeze())
+    x_group_sums = _group_sums(x, codes, n_groups)
 
     return S_white_simple(x_group_sums)
 
 
+def _S_cluster_subsets(x, groups):
+    '''inner covariance matrices for all intersections of cluster dimensions
+
+    Parameters
+    ----------
+    x : ndarray, (nobs, k_vars)
+        data, for cluster robust covariance this is the array of x_i * u_i
+    groups : ndarray, (nobs, n_dims)
+        group labels, one column for each cluster dimension
+
+    Returns
+    -------
+    dict
+        maps each non-empty tuple of columns of groups to a tuple
+        (n_groups, S) for the clusters formed by the intersection of these
+        columns
+
+    Notes
+    -----
+    x is summed only once, over the cells of the intersection of all
+    dimensions. The sums for all other combinations are aggregated from the
+    cell sums, so memory and time are linear in nobs for any number of
+    dimensions.
+    '''
+    nobs, n_dims = groups.shape
+    labels = [_group_codes(groups[:, col]) for col in range(n_dims)]
+    cells, n_cells = _group_codes(np.column_stack([c for c, _ in labels]))
+    cell_sums = _group_sums(x, cells, n_cells)
+    # labels of each cell in each dimension, from any member of the cell
+    first = np.empty(n_cells, dtype=np.intp)
+    first[cells] = np.arange(nobs)
+    cell_labels = np.column_stack([c[first] for c, _ in labels])
+
+    out = {}
+    for n_sub in range(1, n_dims + 1):
+        for subset in combinations(range(n_dims), n_sub):
+            if n_sub == n_dims:
+                sums, n_groups = cell_sums, n_cells
+            else:
+                codes, n_groups = _group_codes(cell_labels[:, list(subset)])
+                sums = _group_sums(cell_sums, codes, n_groups)
+            out[subset] = (n_groups, S_white_simple(sums))
+    return out
+
+
 def cov_crosssection_0(results, group):
     '''this one is still wrong, use cov_cluster instead'''
 
@@ -519,20 +747,20 @@ def cov_cluster(results, group, use_correction=True):
     same result as Stata in UCLA example and same as Peterson
 
     '''
-    #TODO: currently used version of groupsums requires 2d resid
-    xu, hessian_inv = _get_sandwich_arrays(results, cov_type='clu')
-
-    if not hasattr(group, 'dtype') or group.dtype != np.dtype('int'):
-        clusters, group = np.unique(group, return_inverse=True)
+    codes, n_groups = _group_codes(np.asarray(group).squeeze())
+    sparse_arrays = _get_sparse_sandwich_arrays(results, cov_type='clu')
+    if sparse_arrays is not None:
+        xu, bread = sparse_arrays
+        nobs, k_params = xu.shape
+        indicator = sparse.csr_matrix(
+            (np.ones(nobs), (codes, np.arange(nobs))), shape=(n_groups, nobs))
+        cov_c = _SparseCovariance(bread, indicator @ xu)
     else:
-        clusters = np.unique(group)
-
-    scale = S_crosssection(xu, group)
-
-    nobs, k_params = xu.shape
-    n_groups = len(clusters) #replace with stored group attributes if available
-
-    cov_c = _HCCM2(hessian_inv, scale)
+        #TODO: currently used version of groupsums requires 2d resid
+        xu, hessian_inv = _get_sandwich_arrays(results, cov_type='clu')
+        scale = S_white_simple(_group_sums(xu, codes, n_groups))
+        nobs, k_params = xu.shape
+        cov_c = _HCCM2(hessian_inv, scale)
 
     if use_correction:
         cov_c *= (n_groups / (n_groups - 1.) *
@@ -570,31 +798,81 @@ def cov_cluster_2groups(results, group, group2=None, use_correction=True):
     '''
 
     if group2 is None:
+        group = np.asarray(group)
         if group.ndim !=2 or group.shape[1] != 2:
             raise ValueError('if group2 is not given, then groups needs to be ' +
                              'an array with two columns')
-        group0 = group[:, 0]
-        group1 = group[:, 1]
     else:
-        group0 = group
-        group1 = group2
-        group = (group0, group1)
-
+        group = np.column_stack((np.asarray(group).squeeze(),
+                                 np.asarray(group2).squeeze()))
 
-    cov0 = cov_cluster(results, group0, use_correction=use_correction)
-    #[0] because we get still also returns bse
-    cov1 = cov_cluster(results, group1, use_correction=use_correction)
-
-    # cov of cluster formed by intersection of two groups
-    cov01 = cov_cluster(results,
-                        combine_indices(group)[0],
-                        use_correction=use_correction)
+    covs = _cov_cluster_subsets(results, group, use_correction=use_correction)
 
     #robust cov matrix for union of groups
-    cov_both = cov0 + cov1 - cov01
+    cov_both = covs[(0,)] + covs[(1,)] - covs[(0, 1)]
 
     #return all three (for now?)
-    return cov_both, cov0, cov1
+    return cov_both, covs[(0,)], covs[(1,)]
+
+
+def _cov_cluster_subsets(results, groups, use_correction=True):
+    '''cluster robust covariance for all intersections of cluster dimensions
+
+    The scores and the inverse hessian are computed only once.
+    '''
+    xu, hessian_inv = _get_sandwich_arrays(results, cov_type='clu')
+    nobs, k_params = xu.shape
+
+    covs = {}
+    for subset, (n_groups, scale) in _S_cluster_subsets(xu, groups).items():
+        cov_c = _HCCM2(hessian_inv, scale)
+        if use_correction:
+            cov_c *= (n_groups / (n_groups - 1.) *
+                      ((nobs-1.) / float(nobs - k_params)))
+        covs[subset] = cov_c
+    return covs
+
+
+def cov_cluster_multiway(results, groups, use_correction=True):
+    '''cluster robust covariance matrix for several cluster dimensions
+
+    Parameters
+    ----------
+    results : result instance
+       result of a regression, uses results.model.exog and results.resid
+       TODO: this should use wexog instead
+    groups : ndarray, (nobs, n_dims)
+        group labels, one column for each cluster dimension
+    use_correction : bool
+       If true (default), then the small sample correction factor is used
+       for the covariance of each intersection of dimensions.
+
+    Returns
+    -------
+    cov : ndarray, (k_vars, k_vars)
+        cluster robust covariance matrix for parameter estimates
+
+    Notes
+    -----
+    This uses the inclusion-exclusion formula of Cameron, Gelbach and Miller:
+    the covariance matrices of all intersections of an odd number of
+    dimensions are added and those of an even number are subtracted. The
+    result can fail to be positive semi-definite.
+
+    With two columns this is the same as the first return of
+    cov_cluster_2groups, with one column the same as cov_cluster.
+    '''
+    groups = np.asarray(groups)
+    if groups.ndim == 1:
+        groups = groups[:, None]
+    covs = _cov_cluster_subsets(results, groups, use_correction=use_correction)
+    cov = 0
+    for subset, cov_c in covs.items():
+        if len(subset) % 2:
+            cov = cov + cov_c
+        else:
+            cov = cov - cov_c
+    return cov
 
 
 def cov_white_simple(results, use_correction=True):
@@ -625,10 +903,16 @@ def cov_white_simple(results, use_correction=True):
         with small sample corrections
 
     '''
-    xu, hessian_inv = _get_sandwich_arrays(results)
-    sigma = S_white_simple(xu)
+    sparse_arrays = _get_sparse_sandwich_arrays(results)
+    if sparse_arrays is not None:
+        # the meat stays a product of the sparse scores
+        xu, bread = sparse_arrays
+        cov_w = _SparseCovariance(bread, xu)
+    else:
+        xu, hessian_inv = _get_sandwich_arrays(results)
+        sigma = S_white_simple(xu)
 
-    cov_w = _HCCM2(hessian_inv, sigma)  #add bread to sandwich
+        cov_w = _HCCM2(hessian_inv, sigma)  #add bread to sandwich
 
     if use_correction:
         nobs, k_params = xu.shape
@@ -691,23 +975,30 @@ cov_hac = cov_hac_simple   #alias for users
 #I think this is pure within group HAC: apply HAC to each group member
 #separately
 
+def _lagged_index(lag, groupidx):
+    '''row index of the current observations for lag within groups
+
+    groupidx is a sequence of (start, end) tuples. The lagged observations
+    are the returned index minus lag.
+    '''
+    groupidx = np.asarray(groupidx, dtype=np.intp).reshape(-1, 2)
+    lower = groupidx[:, 0] + lag
+    n_obs = groupidx[:, 1] - lower
+    mask = n_obs > 0  # group is longer than lag
+    lower, n_obs = lower[mask], n_obs[mask]
+    offset = np.cumsum(n_obs) - n_obs
+    return (np.arange(n_obs.sum(), dtype=np.intp)
+            + np.repeat(lower - offset, n_obs))
+
+
 def lagged_groups(x, lag, groupidx):
     '''
     assumes sorted by time, groupidx is tuple of start and end values
-    not optimized, just to get a working version, loop over groups
     '''
-    out0 = []
-    out_lagged = []
-    for l,u in groupidx:
-        if l+lag < u: #group is longer than lag
-            out0.append(x[l+lag:u])
-            out_lagged.append(x[l:u-lag])
-
-    if out0 == []:
+    idx = _lagged_index(lag, groupidx)
+    if idx.size == 0:
         raise ValueError('all groups are empty taking lags')
-    #return out0, out_lagged
-    return np.vstack(out0), np.vstack(out_lagged)
-
+    return x[idx], x[idx - lag]
 
 
 def S_nw_panel(xw, weights, groupidx):
@@ -716,13 +1007,38 @@ def S_nw_panel(xw, weights, groupidx):
     no denominator nobs used
 
     no reference for this, just accounting for time indices
+
+    If groupidx partitions all observations into consecutive blocks, then
+    the lagged cross products are computed on the full array and the few
+    products across group boundaries are subtracted. This avoids copying the
+    data for each lag.
     '''
     nlags = len(weights)-1
+    nobs = xw.shape[0]
+
+    bounds = np.asarray(groupidx, dtype=np.intp).reshape(-1, 2)
+    contiguous = (bounds.shape[0] > 0 and bounds[0, 0] == 0 and
+                  bounds[-1, 1] == nobs and
+                  (bounds[1:, 0] == bounds[:-1, 1]).all())
+    if contiguous:
+        # position of each observation within its group
+        pos = np.arange(nobs) - np.repeat(bounds[:, 0],
+                                          bounds[:, 1] - bounds[:, 0])
 
     S = weights[0] * np.dot(xw.T, xw)  #weights just for completeness
     for lag in range(1, nlags+1):
-        xw0, xwlag = lagged_groups(xw, lag, groupidx)
-        s = np.dot(xw0.T, xwlag)
+        if contiguous:
+            if lag >= nobs:
+                raise ValueError('all groups are empty taking lags')
+            s = np.dot(xw[lag:].T, xw[:-lag])
+            # current observations whose lag belongs to a previous group
+            cross = np.nonzero(pos[lag:] < lag)[0] + lag
+            if cross.size == nobs - lag:
+                raise ValueError('all groups are empty taking lags')
+            s -= np.dot(xw[cross].T, xw[cross - lag])
+        else:
+            xw0, xwlag = lagged_groups(xw, lag, groupidx)
+            s = np.dot(xw0.T, xwlag)
         S += weights[lag] * (s + s.T)
     return S
 
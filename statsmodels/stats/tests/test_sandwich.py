@@ -96,3 +96,79 @@ def test_hac_simple():
     cov3 = sw.cov_hac_simple(res_olsg, use_correction=False)
     cov4 = sw.cov_hac_simple(res_olsg, nlags=4, use_correction=False)
     assert_allclose(cov3, cov4)
+
+
+def test_cov_cluster_multiway():
+    rs = np.random.RandomState(987126)
+    nobs = 500
+    groups = np.column_stack([rs.randint(0, 20, nobs),
+                              rs.randint(0, 7, nobs),
+                              rs.randint(100, 104, nobs)])
+    exog = add_constant(rs.standard_normal((nobs, 2)))
+    endog = exog.sum(1) + rs.standard_normal(nobs)
+    res = OLS(endog, exog).fit()
+
+    cov1 = sw.cov_cluster_multiway(res, groups[:, 0])
+    assert_allclose(cov1, sw.cov_cluster(res, groups[:, 0]), rtol=1e-12)
+    cov2 = sw.cov_cluster_multiway(res, groups[:, :2])
+    assert_allclose(cov2, sw.cov_cluster_2groups(res, groups[:, :2])[0],
+                    rtol=1e-12)
+
+    # inclusion-exclusion over all intersections with explicit labels
+    def label(cols):
+        return np.unique(groups[:, cols], axis=0, return_inverse=True)[1]
+
+    cov3 = 0
+    for cols, sign in [([0], 1), ([1], 1), ([2], 1), ([0, 1], -1),
+                       ([0, 2], -1), ([1, 2], -1), ([0, 1, 2], 1)]:
+        cov3 = cov3 + sign * sw.cov_cluster(res, label(cols).ravel())
+    assert_allclose(sw.cov_cluster_multiway(res, groups), cov3, rtol=1e-10)
+
+    res3 = res.get_robustcov_results("cluster", groups=groups)
+    assert_allclose(res3.cov_params(), cov3, rtol=1e-10)
+    assert res3.df_resid_inference == 3
+
+
+def test_cov_cluster_nan_groups():
+    rs = np.random.RandomState(987126)
+    nobs = 200
+    groups = rs.randint(0, 10, nobs).astype(float)
+    groups[::7] = np.nan
+    exog = add_constant(rs.standard_normal((nobs, 2)))
+    endog = exog.sum(1) + rs.standard_normal(nobs)
+    res = OLS(endog, exog).fit()
+
+    # the missing values are one additional group
+    labels = np.where(np.isnan(groups), -1, groups)
+    assert_allclose(sw.cov_cluster(res, groups), sw.cov_cluster(res, labels),
+                    rtol=1e-12)
+    codes, n_groups = sw._group_codes(groups)
+    assert n_groups == 11
+    assert_allclose(codes[::7], 10)
+
+
+def test_nw_panel_lagged_groups():
+    rs = np.random.RandomState(987126)
+    xw = rs.standard_normal((40, 3))
+    weights = sw.weights_bartlett(3)
+    # consecutive blocks covering all rows, including groups shorter than lag
+    groupidx = [(0, 2), (2, 15), (15, 16), (16, 40)]
+
+    def S_loop(groupidx):
+        S = weights[0] * xw.T.dot(xw)
+        for lag in range(1, 4):
+            for low, upp in groupidx:
+                if low + lag < upp:
+                    s = xw[low + lag:upp].T.dot(xw[low:upp - lag])
+                    S += weights[lag] * (s + s.T)
+        return S
+
+    assert_allclose(sw.S_nw_panel(xw, weights, groupidx), S_loop(groupidx),
+                    rtol=1e-12)
+    # not covering all rows uses the explicitly lagged arrays
+    groupidx = [(0, 2), (5, 15), (16, 40)]
+    assert_allclose(sw.S_nw_panel(xw, weights, groupidx), S_loop(groupidx),
+                    rtol=1e-12)
+    x0, xlag = sw.lagged_groups(xw, 2, groupidx)
+    assert_allclose(x0, np.vstack([xw[7:15], xw[18:40]]))
+    assert_allclose(xlag, np.vstack([xw[5:13], xw[16:38]]))
@@ -29,9 +29,88 @@ def test_lazy_imports():
 )
 def test_docstring_optimization_compat():
     # GH#5235 check that importing with stripped docstrings does not raise
-    cmd = sys.executable + ' -OO -c "import statsmodels.api as sm"'
+    # The names in statsmodels.api are imported on first access
+    cmd = (sys.executable + ' -OO -c "import statsmodels.api as sm; '
+           '[getattr(sm, name) for name in sm.__all__]"')
     p = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE,
                          stderr=subprocess.PIPE)
     out = p.communicate()
     rc = p.returncode
     assert rc == 0, out
+
+
+API_MODULES = [
+    "statsmodels.api",
+    "statsmodels.tsa.api",
+    "statsmodels.stats.api",
+    "statsmodels.formula.api",
+]
+
+
+@pytest.mark.skipif(
+    PYTHON_IMPL_WASM,
+    reason="Can't start subprocess in WASM/Pyodide"
+)
+def test_lazy_api_modules():
+    # Importing the api modules must not import the models
+    cmd = ("import sys; "
+           "import " + ", ".join(API_MODULES) + "; "
+           "mods = [x for x in sys.modules if x.startswith(("
+           "'statsmodels.regression.', 'statsmodels.tsa.statespace', "
+           "'statsmodels.genmod.', 'statsmodels.stats.diagnostic'))]; "
+           "assert not mods, mods")
+    out = subprocess.run([sys.executable, "-c", cmd], capture_output=True,
+                         text=True)
+    assert out.returncode == 0, out.stderr
+
+
+# Attribute chains through the packages that the api modules expose
+API_CHAINS = {
+    "statsmodels.api": [
+        "iolib.summary2.summary_col",
+        "iolib.summary.Summary",
+        "tools.sm_exceptions.ConvergenceWarning",
+        "tools.numdiff.approx_fprime",
+        "regression.linear_model.OLS",
+        "robust.norms.HuberT",
+        "distributions.empirical_distribution.ECDF",
+    ],
+}
+
+
+@pytest.mark.parametrize("name", API_MODULES)
+def test_api_names(name):
+    from functools import reduce
+    import importlib
+
+    mod = importlib.import_module(name)
+    assert set(mod.__all__) <= set(dir(mod))
+    assert "lazy_imports" not in dir(mod)
+    for attr in mod.__all__:
+        assert getattr(mod, attr) is not None
+        # Resolved names are stored in the module
+        assert attr in vars(mod)
+    with pytest.raises(AttributeError, match="no attribute 'not_a_name'"):
+        mod.not_a_name
+    for chain in API_CHAINS.get(name, []):
+        assert reduce(getattr, chain.split("."), mod) is not None
+    if name in API_CHAINS:
+        with pytest.raises(AttributeError, match="no attribute 'not_a_name'"):
+            mod.iolib.not_a_name
+        for chain in API_CHAINS[name]:
+            package = getattr(mod, chain.split(".")[0])
+            assert "lazy_submodules" not in dir(package)
+
+
+@pytest.mark.skipif(
+    PYTHON_IMPL_WASM,
+    reason="Can't start subprocess in WASM/Pyodide"
+)
+def test_api_chains_fresh_import():
+    # The submodules are imported by the attribute access alone
+    chains = " and ".join(f"sm.{chain}" for chain in API_CHAINS[
+        "statsmodels.api"])
+    cmd = f"import statsmodels.api as sm; assert {chains}"
+    out = subprocess.run([sys.executable, "-c", cmd], capture_output=True,
+                         text=True)
+    assert out.returncode == 0, out.stderr
@@ -1,6 +1,11 @@
 from .tools import add_constant, categorical
 from statsmodels.tools._test_runner import PytestTester
+from ._lazy import lazy_submodules
 
 __all__ = ['test', 'add_constant', 'categorical']
 
 test = PytestTester()
+
+# Submodules are imported on first access, e.g. through statsmodels.api
+__getattr__ = lazy_submodules(__name__)
+del lazy_submodules
@@ -0,0 +1,114 @@
+"""
+Lazy loading of the names exported by the api modules (PEP 562)
+
+The api modules only list where their names come from. A name is imported
+on first access and then stored in the module namespace, so that later
+lookups do not go through the module ``__getattr__``. The packages that
+statsmodels.api exposes import their submodules on attribute access, so
+that chains such as ``sm.iolib.summary2`` work without importing them.
+"""
+from functools import reduce
+import importlib
+from importlib.util import find_spec, resolve_name
+import sys
+
+
+def lazy_imports(name, imports):
+    """
+    Create the module ``__getattr__`` and ``__dir__`` of an api module
+
+    Parameters
+    ----------
+    name : str
+        The ``__name__`` of the api module.
+    imports : dict[str, list[str]]
+        Map from a module to the names that are imported from it, as in
+        ``from module import a, b``. Module names that start with "." are
+        relative to the package that contains the api module. A name
+        ``"a as b"`` makes the attribute ``a`` available as ``b``, and
+        ``a`` may be a dotted attribute path such as ``"OLS.from_formula"``.
+        Submodules are imported if they are not attributes of the module.
+
+    Returns
+    -------
+    __getattr__ : callable
+        The module level ``__getattr__``.
+    __dir__ : callable
+        The module level ``__dir__``.
+
+    Examples
+    --------
+    In ``statsmodels/example/api.py``
+
+    >>> __getattr__, __dir__ = lazy_imports(__name__, {
+    ...     ".model": ["Model"],
+    ...     "statsmodels.tools": ["tools as tools_module"],
+    ... })
+    >>> del lazy_imports
+    """
+    package = name.rpartition(".")[0]
+    sources = {}
+    for module, names in imports.items():
+        for spec in names:
+            attr, _, alias = (part.strip() for part in spec.partition(" as "))
+            alias = alias or attr
+            if alias in sources:
+                raise ValueError(f"{alias} is imported more than once")
+            sources[alias] = (module, attr)
+
+    def __getattr__(attr_name):
+        try:
+            module, attr = sources[attr_name]
+        except KeyError:
+            raise AttributeError(
+                f"module {name!r} has no attribute {attr_name!r}"
+            ) from None
+        mod = importlib.import_module(resolve_name(module, package))
+        first, *rest = attr.split(".")
+        try:
+            value = getattr(mod, first)
+        except AttributeError:
+            value = importlib.import_module(f"{mod.__name__}.{first}")
+        value = reduce(getattr, rest, value)
+        setattr(sys.modules[name], attr_name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[name])) | set(sources))
+
+    return __getattr__, __dir__
+
+
+def lazy_submodules(name):
+    """
+    Create a package ``__getattr__`` that imports submodules on access
+
+    Parameters
+    ----------
+    name : str
+        The ``__name__`` of the package.
+
+    Returns
+    -------
+    __getattr__ : callable
+        The module level ``__getattr__``. Accessing the name of a submodule
+        imports it, which also makes it an attribute of the package.
+
+    Examples
+    --------
+    In ``statsmodels/example/__init__.py``
+
+    >>> __getattr__ = lazy_submodules(__name__)
+    >>> del lazy_submodules
+    """
+
+    def __getattr__(attr_name):
+        if not attr_name.startswith("__"):
+            submodule = f"{name}.{attr_name}"
+            if find_spec(submodule) is not None:
+                return importlib.import_module(submodule)
+        raise AttributeError(
+            f"module {name!r} has no attribute {attr_name!r}"
+        )
+
+    return __getattr__
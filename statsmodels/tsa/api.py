@@ -1,4 +1,4 @@
-__all__ = [
+__all__ = [  # noqa: F822, names are imported lazily
     "AR",
     "ARDL",
     "ARIMA",
@@ -28,6 +28,7 @@ __all__ = [
     "adfuller",
     "range_unit_root_test",
     "arima",
+    "arima_select_order",
     "arma_generate_sample",
     "arma_order_select_ic",
     "ardl_select_order",
@@ -63,49 +64,130 @@ __all__ = [
     "zivot_andrews"
 ]
 
-from . import interp, stattools, tsatools, vector_ar as var
-from ..graphics import tsaplots as graphics
-from .ar_model import AR, AutoReg
-from .ardl import ARDL, UECM, ardl_select_order
-from .arima import api as arima
-from .arima.model import ARIMA
-from .arima_process import ArmaProcess, arma_generate_sample
-from .base import datetools
-from .exponential_smoothing.ets import ETSModel
-from .filters import api as filters, bk_filter, cf_filter, hp_filter
-from .forecasting.stl import STLForecast
-from .holtwinters import ExponentialSmoothing, Holt, SimpleExpSmoothing
-from .innovations import api as innovations
-from .regime_switching.markov_autoregression import MarkovAutoregression
-from .regime_switching.markov_regression import MarkovRegression
-from .seasonal import STL, seasonal_decompose
-from .statespace import api as statespace
-from .statespace.dynamic_factor import DynamicFactor
-from .statespace.dynamic_factor_mq import DynamicFactorMQ
-from .statespace.sarimax import SARIMAX
-from .statespace.structural import UnobservedComponents
-from .statespace.varmax import VARMAX
-from .stattools import (
-    acf,
-    acovf,
-    adfuller,
-    arma_order_select_ic,
-    bds,
-    breakvar_heteroskedasticity_test,
-    ccf,
-    ccovf,
-    coint,
-    kpss,
-    leybourne,
-    pacf,
-    pacf_ols,
-    pacf_yw,
-    q_stat,
-    range_unit_root_test,
-    zivot_andrews
-)
-from .tsatools import add_lag, add_trend, detrend, lagmat, lagmat2ds
-from .vector_ar.svar_model import SVAR
-from .vector_ar.var_model import VAR
-from .vector_ar.vecm import VECM
-from .x13 import x13_arima_analysis, x13_arima_select_order
+from statsmodels.tools._lazy import lazy_imports
+
+# The names are imported on first access, see statsmodels.tools._lazy
+__getattr__, __dir__ = lazy_imports(__name__, {
+    ".": [
+        "interp",
+        "stattools",
+        "tsatools",
+        "vector_ar as var",
+    ],
+    "..graphics": [
+        "tsaplots as graphics",
+    ],
+    ".ar_model": [
+        "AR",
+        "AutoReg",
+    ],
+    ".ardl": [
+        "ARDL",
+        "UECM",
+        "ardl_select_order",
+    ],
+    ".arima": [
+        "api as arima",
+    ],
+    ".arima.model": [
+        "ARIMA",
+    ],
+    ".arima.order_selection": [
+        "arima_select_order",
+    ],
+    ".arima_process": [
+        "ArmaProcess",
+        "arma_generate_sample",
+    ],
+    ".base": [
+        "datetools",
+    ],
+    ".exponential_smoothing.ets": [
+        "ETSModel",
+    ],
+    ".filters": [
+        "api as filters",
+        "bk_filter",
+        "cf_filter",
+        "hp_filter",
+    ],
+    ".forecasting.stl": [
+        "STLForecast",
+    ],
+    ".holtwinters": [
+        "ExponentialSmoothing",
+        "Holt",
+        "SimpleExpSmoothing",
+    ],
+    ".innovations": [
+        "api as innovations",
+    ],
+    ".regime_switching.markov_autoregression": [
+        "MarkovAutoregression",
+    ],
+    ".regime_switching.markov_regression": [
+        "MarkovRegression",
+    ],
+    ".seasonal": [
+        "STL",
+        "seasonal_decompose",
+    ],
+    ".statespace": [
+        "api as statespace",
+    ],
+    ".statespace.dynamic_factor": [
+        "DynamicFactor",
+    ],
+    ".statespace.dynamic_factor_mq": [
+        "DynamicFactorMQ",
+    ],
+    ".statespace.sarimax": [
+        "SARIMAX",
+    ],
+    ".statespace.structural": [
+        "UnobservedComponents",
+    ],
+    ".statespace.varmax": [
+        "VARMAX",
+    ],
+    ".stattools": [
+        "acf",
+        "acovf",
+        "adfuller",
+        "arma_order_select_ic",
+        "bds",
+        "breakvar_heteroskedasticity_test",
+        "ccf",
+        "ccovf",
+        "coint",
+        "kpss",
+        "leybourne",
+        "pacf",
+        "pacf_ols",
+        "pacf_yw",
+        "q_stat",
+        "range_unit_root_test",
+        "zivot_andrews",
+    ],
+    ".tsatools": [
+        "add_lag",
+        "add_trend",
+        "detrend",
+        "lagmat",
+        "lagmat2ds",
+    ],
+    ".vector_ar.svar_model": [
+        "SVAR",
+    ],
+    ".vector_ar.var_model": [
+        "VAR",
+    ],
+    ".vector_ar.vecm": [
+        "VECM",
+    ],
+    ".x13": [
+        "x13_arima_analysis",
+        "x13_arima_select_order",
+    ],
+})
+del lazy_imports
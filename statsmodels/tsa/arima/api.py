@@ -1,3 +1,4 @@
-__all__ = ["ARIMA"]
+__all__ = ["ARIMA", "arima_select_order"]
 
 from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.arima.order_selection import arima_select_order
@@ -0,0 +1,328 @@
+"""
+ARIMA order selection.
+
+License: BSD-3
+"""
+import numpy as np
+import pandas as pd
+
+from statsmodels.tools import eval_measures
+from statsmodels.tools.parallel import parallel_func
+from statsmodels.tools.validation import (
+    array_like,
+    dict_like,
+    int_like,
+    string_like,
+)
+from statsmodels.tsa.arima.model import ARIMA
+
+_ICS = ("aic", "aicc", "bic", "hqic")
+
+
+def _fit_order(y, order, model_kw, trend, fit_kw, warm_params=None):
+    """
+    Fit a single candidate order, optionally warm-started
+
+    Defined at the module level so that it can be sent to worker processes.
+    Only a small summary of the results is returned, so that the full
+    results instance does not need to be pickled.
+    """
+    from statsmodels.tsa.stattools import _safe_arma_fit
+
+    start_params = None
+    if warm_params is not None:
+        names = ARIMA(y, order=order, trend=trend, **model_kw).param_names
+        # Parameters of the nested model keep their values, new lags start
+        # at zero, which is always stationary and invertible
+        start_params = np.array([warm_params.get(name, 0.0)
+                                 for name in names])
+    res = _safe_arma_fit(y, order, model_kw, trend, fit_kw, start_params)
+    if res is None and start_params is not None:
+        res = _safe_arma_fit(y, order, model_kw, trend, fit_kw)
+    if res is None:
+        return order, None
+
+    retvals = getattr(res, "mle_retvals", None) or {}
+    return order, {
+        "llf": res.llf,
+        "aic": res.aic,
+        "aicc": res.aicc,
+        "bic": res.bic,
+        "hqic": res.hqic,
+        "nobs_effective": res.nobs_effective,
+        "df_model": res.df_model,
+        "converged": bool(retvals.get("converged", True)),
+        "params": dict(zip(res.model.param_names, np.asarray(res.params))),
+    }
+
+
+class ARIMAOrderSelectionResults:
+    """
+    Results from an ARIMA order selection
+
+    Contains the information criteria for all candidate model orders.
+
+    Parameters
+    ----------
+    endog : ndarray
+        The time series used in the selection.
+    table : DataFrame
+        The ranked table of candidate orders.
+    params : dict
+        The estimated parameters of all fitted candidate orders, keyed by
+        ``(ar, ma)``.
+    ic : str
+        The information criterion used to rank the candidates.
+    d : int
+        The order of integration.
+    trend : str
+        The trend used in all candidate models.
+    model_kw : dict
+        The keyword arguments used to create the candidate models.
+    """
+
+    def __init__(self, endog, table, params, ic, d, trend, model_kw):
+        self._endog = endog
+        self._table = table
+        self._params = params
+        self._ic = ic
+        self._d = d
+        self._trend = trend
+        self._model_kw = model_kw
+
+    @property
+    def ic(self):
+        """The information criterion used to rank the candidates."""
+        return self._ic
+
+    @property
+    def table(self):
+        """
+        Candidate orders ranked by the information criterion
+
+        The index contains the ``(ar, ma)`` orders. The column ``status`` is
+        "fitted", "failed" if the estimation raised, or "pruned" if the
+        candidate was skipped because it could not improve on the best
+        criterion value.
+
+        Returns
+        -------
+        DataFrame
+        """
+        return self._table
+
+    @property
+    def params(self):
+        """
+        The estimated parameters of all fitted candidate orders
+
+        Returns
+        -------
+        dict[tuple[int, int], Series]
+        """
+        return self._params
+
+    @property
+    def order(self):
+        """The selected (p, d, q) order."""
+        ar, ma = self._table.index[0]
+        return int(ar), self._d, int(ma)
+
+    @property
+    def model(self):
+        """The model with the selected order."""
+        return ARIMA(self._endog, order=self.order, trend=self._trend,
+                     **self._model_kw)
+
+    @property
+    def start_params(self):
+        """The estimated parameters of the selected model."""
+        return self._params[self._table.index[0]].values
+
+
+def arima_select_order(
+    endog,
+    max_ar=4,
+    max_ma=2,
+    d=0,
+    ic="bic",
+    trend="c",
+    model_kw=None,
+    fit_kw=None,
+    warm_start=True,
+    prune=False,
+    n_jobs=1,
+    verbose=0,
+):
+    """
+    Select the ARMA orders of an ARIMA model using information criteria
+
+    Candidate models are fitted in rounds of increasing ``p + q`` so that
+    every candidate can be started from the estimates of a nested model
+    from the previous round. The candidates within a round are independent
+    and can be fitted in parallel by a pool of worker processes.
+
+    Parameters
+    ----------
+    endog : array_like
+        The time series.
+    max_ar : int
+        Maximum number of AR lags to use. Default 4.
+    max_ma : int
+        Maximum number of MA lags to use. Default 2.
+    d : int
+        The order of integration used in all candidate models. Default 0.
+    ic : {"aic", "aicc", "bic", "hqic"}
+        The information criterion used to rank the candidates. All criteria
+        are reported in the table.
+    trend : str
+        The trend used in all candidate models, see ``ARIMA``.
+    model_kw : dict
+        Additional keyword arguments used to create each ``ARIMA`` model, for
+        example ``exog`` or ``seasonal_order``.
+    fit_kw : dict
+        Keyword arguments passed to ``ARIMA.fit``.
+    warm_start : bool
+        Start the estimation of each candidate from the estimates of the
+        nested candidate with one lag less and the larger loglikelihood. The
+        additional lag starts at zero. Only used with the default
+        "statespace" estimation method. Default is True.
+    prune : bool
+        Skip candidates whose information criterion cannot improve on the
+        best value found so far. See Notes. Default is False.
+    n_jobs : int
+        The number of processes used to fit the candidates of each round.
+        -1 uses all available cores. Requires joblib, otherwise the
+        candidates are fitted serially.
+    verbose : int
+        The verbosity level of ``joblib.Parallel``.
+
+    Returns
+    -------
+    ARIMAOrderSelectionResults
+        The candidates ranked by ``ic`` are available in ``table``.
+
+    See Also
+    --------
+    statsmodels.tsa.stattools.arma_order_select_ic
+        Information criteria of all candidate orders, fitted serially.
+    statsmodels.tsa.ar_model.ar_select_order
+        AR order selection.
+
+    Notes
+    -----
+    When ``prune`` is True, the largest model ``(max_ar, max_ma)`` is fitted
+    first. Every candidate is nested in it, so its loglikelihood bounds the
+    loglikelihood of all candidates from above, and the penalty of a
+    candidate together with this bound gives a lower bound for its
+    information criterion. Candidates whose lower bound exceeds the best
+    criterion value found in the earlier rounds are not fitted. Because the
+    penalty increases with the number of parameters, the search stops at
+    the first round in which all candidates are pruned. The bound relies on
+    the numerical optimizer finding the maximum of the largest model; if
+    its estimation fails or stops early, too many candidates may be pruned.
+
+    Examples
+    --------
+    >>> from statsmodels.tsa.arima_process import arma_generate_sample
+    >>> y = arma_generate_sample([1, -0.75, 0.25], [1, 0.65], 250)
+    >>> sel = arima_select_order(y, max_ar=3, max_ma=2, trend="n", n_jobs=-1)
+    >>> sel.order
+    >>> sel.table.head()
+    >>> res = sel.model.fit(start_params=sel.start_params)
+    """
+    max_ar = int_like(max_ar, "max_ar")
+    max_ma = int_like(max_ma, "max_ma")
+    d = int_like(d, "d")
+    ic = string_like(ic, "ic", options=_ICS)
+    model_kw = dict_like(model_kw, "model_kw", optional=True)
+    fit_kw = dict_like(fit_kw, "fit_kw", optional=True)
+    model_kw = {} if model_kw is None else dict(model_kw)
+    fit_kw = {} if fit_kw is None else dict(fit_kw)
+    if "order" in model_kw or "trend" in model_kw:
+        raise ValueError("model_kw cannot contain order or trend.")
+    if max_ar < 0 or max_ma < 0:
+        raise ValueError("max_ar and max_ma must be non-negative.")
+    y = array_like(endog, "endog", contiguous=True)
+    warm_start = warm_start and fit_kw.get("method") in (None, "statespace")
+
+    parallel, p_func, n_jobs = parallel_func(_fit_order, n_jobs,
+                                             verbose=verbose)
+
+    def fit_round(tasks):
+        return dict(parallel(p_func(y, (ar, d, ma), model_kw, trend, fit_kw,
+                                    warm) for (ar, ma), warm in tasks))
+
+    fitted = {}
+    llf_bound = None
+    if prune:
+        out = fit_round([((max_ar, max_ma), None)])
+        fitted[(max_ar, max_ma)] = out[(max_ar, d, max_ma)]
+        full = fitted[(max_ar, max_ma)]
+        if full is not None:
+            llf_bound = full["llf"]
+            nobs_effective = full["nobs_effective"]
+            df_full = full["df_model"]
+    ic_func = getattr(eval_measures, ic)
+
+    pruned = set()
+    for k in range(max_ar + max_ma + 1):
+        candidates = [(ar, k - ar) for ar in range(max(0, k - max_ma),
+                                                   min(k, max_ar) + 1)]
+        best = [res[ic] for res in fitted.values() if res is not None]
+        best = min(best) if best else np.inf
+        tasks = []
+        for ar, ma in candidates:
+            if (ar, ma) in fitted:
+                continue
+            if llf_bound is not None:
+                df = df_full - (max_ar - ar) - (max_ma - ma)
+                if ic_func(llf_bound, nobs_effective, df) > best:
+                    pruned.add((ar, ma))
+                    continue
+            warm = None
+            if warm_start:
+                parents = [fitted.get(parent) for parent
+                           in ((ar - 1, ma), (ar, ma - 1))
+                           if min(parent) >= 0]
+                parents = [res for res in parents if res is not None]
+                if parents:
+                    warm = max(parents, key=lambda res: res["llf"])["params"]
+            tasks.append(((ar, ma), warm))
+        if not tasks and all(c in pruned for c in candidates):
+            # The penalty increases with k, so later rounds are pruned too
+            for kk in range(k + 1, max_ar + max_ma + 1):
+                pruned.update((ar, kk - ar) for ar in range(
+                    max(0, kk - max_ma), min(kk, max_ar) + 1))
+            break
+        for (ar, _, ma), res in fit_round(tasks).items():
+            fitted[(ar, ma)] = res
+        if llf_bound is not None:
+            # Guard against an imprecise estimate of the largest model
+            llf_bound = max([llf_bound] + [res["llf"] for res
+                                           in fitted.values()
+                                           if res is not None])
+
+    rows = []
+    params = {}
+    columns = ["llf"] + list(_ICS) + ["df_model", "converged", "status"]
+    for ar in range(max_ar + 1):
+        for ma in range(max_ma + 1):
+            res = fitted.get((ar, ma))
+            if res is None:
+                status = "pruned" if (ar, ma) in pruned else "failed"
+                rows.append([np.nan] * (len(_ICS) + 2) + [False, status])
+                continue
+            rows.append([res[col] for col in columns[:-1]] + ["fitted"])
+            params[(ar, ma)] = pd.Series(res["params"])
+    index = pd.MultiIndex.from_product([range(max_ar + 1),
+                                        range(max_ma + 1)],
+                                       names=["ar", "ma"])
+    table = pd.DataFrame(rows, index=index, columns=columns)
+    table = table.sort_values([ic, "df_model"], na_position="last",
+                              kind="mergesort")
+    if not params:
+        raise ValueError("None of the candidate models could be fitted.")
+
+    return ARIMAOrderSelectionResults(y, table, params, ic, d, trend,
+                                      model_kw)
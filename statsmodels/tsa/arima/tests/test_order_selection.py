@@ -0,0 +1,84 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.arima.order_selection import arima_select_order
+from statsmodels.tsa.arima_process import arma_generate_sample
+from statsmodels.tsa.stattools import arma_order_select_ic
+
+
+@pytest.fixture(scope="module")
+def endog():
+    np.random.seed(2014)
+    return arma_generate_sample([1, -0.75, 0.25], [1, 0.65, 0.35], 250)
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+@pytest.mark.filterwarnings("ignore::statsmodels.tools.sm_exceptions"
+                            ".ConvergenceWarning")
+def test_against_arma_order_select_ic(endog):
+    sel = arima_select_order(endog, max_ar=3, max_ma=2, ic="aic",
+                             trend="n", warm_start=False)
+    res = arma_order_select_ic(endog, max_ar=3, max_ma=2, ic=["aic", "bic"],
+                               trend="n")
+    ar, ma = res.aic_min_order
+    assert_equal(sel.order, (ar, 0, ma))
+    table = sel.table
+    assert (table["status"] == "fitted").all()
+    assert table["aic"].is_monotonic_increasing
+    for (ar, ma), row in table.iterrows():
+        assert_allclose(row["aic"], res.aic.loc[ar, ma], rtol=1e-5)
+        assert_allclose(row["bic"], res.bic.loc[ar, ma], rtol=1e-5)
+
+    # Warm starts reach the same optimum
+    sel_warm = arima_select_order(endog, max_ar=3, max_ma=2, ic="aic",
+                                  trend="n")
+    assert_equal(sel_warm.order, sel.order)
+    assert_allclose(sel_warm.table.loc[sel.table.index[0], "aic"],
+                    sel.table["aic"].iloc[0], rtol=1e-5)
+
+    mod = sel.model
+    assert isinstance(mod, ARIMA)
+    assert_equal(mod.order, sel.order)
+    res = mod.fit(start_params=sel.start_params)
+    assert_allclose(res.aic, sel.table["aic"].iloc[0], rtol=1e-5)
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+@pytest.mark.filterwarnings("ignore::statsmodels.tools.sm_exceptions"
+                            ".ConvergenceWarning")
+def test_prune(endog):
+    sel = arima_select_order(endog, max_ar=4, max_ma=3, trend="n")
+    sel_prune = arima_select_order(endog, max_ar=4, max_ma=3, trend="n",
+                                   prune=True)
+    assert_equal(sel_prune.order, sel.order)
+    status = sel_prune.table["status"]
+    assert (status == "pruned").any()
+    # A pruned candidate has a criterion worse than the selected model
+    pruned = status.index[status == "pruned"]
+    assert (sel.table.loc[pruned, "bic"] > sel.table["bic"].iloc[0]).all()
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_parallel(endog):
+    pytest.importorskip("joblib")
+    sel = arima_select_order(endog[:100], max_ar=2, max_ma=1, trend="n",
+                             fit_kw={"method": "innovations_mle"}, n_jobs=2)
+    res = arima_select_order(endog[:100], max_ar=2, max_ma=1, trend="n",
+                             fit_kw={"method": "innovations_mle"})
+    assert_allclose(sel.table["bic"], res.table["bic"])
+    assert_equal(sel.order, res.order)
+
+    ics = arma_order_select_ic(endog[:100], max_ar=2, max_ma=1, trend="n",
+                               n_jobs=2)
+    ics_serial = arma_order_select_ic(endog[:100], max_ar=2, max_ma=1,
+                                      trend="n")
+    assert_allclose(ics.bic, ics_serial.bic)
+
+
+def test_invalid(endog):
+    with pytest.raises(ValueError, match="ic must be one of"):
+        arima_select_order(endog, ic="llf")
+    with pytest.raises(ValueError, match="model_kw cannot contain"):
+        arima_select_order(endog, model_kw={"order": (1, 0, 0)})
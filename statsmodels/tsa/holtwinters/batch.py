@@ -0,0 +1,526 @@
+"""
+Batched estimation and forecasting of many Holt-Winters models
+
+Fits the same exponential smoothing specification to many series at once.
+The grid search for starting values and the smoothing recursions run for
+all series of a chunk in vectorized form, and the local optimization of
+each series starts from the best grid point. Chunks of series can be
+estimated in parallel. The estimates and forecasts are returned as stacked
+arrays, and results instances for the individual series are only created
+when requested.
+
+License: BSD-3
+"""
+import warnings
+
+import numpy as np
+
+from statsmodels.tools.parallel import parallel_func
+from statsmodels.tools.sm_exceptions import ConvergenceWarning
+from statsmodels.tools.validation import (
+    array_like,
+    bool_like,
+    dict_like,
+    int_like,
+    string_like,
+)
+from statsmodels.tsa.holtwinters.model import ExponentialSmoothing, _OptConfig
+
+__all__ = ["fit_batch", "HoltWintersBatchResults"]
+
+_METHODS = (
+    "basinhopping",
+    "bh",
+    "least_squares",
+    "ls",
+    "L-BFGS-B",
+    "TNC",
+    "SLSQP",
+    "Powell",
+    "trust-constr",
+)
+# Maximum number of (series, grid point) pairs smoothed at once
+_BRUTE_BLOCK = 2 ** 16
+
+
+def _trended(lvl, b, phi, trend):
+    if trend == "add":
+        return lvl + phi * b
+    elif trend == "mul":
+        return lvl * b ** phi
+    return lvl
+
+
+def _smooth(y, alpha, beta, gamma, phi, l0, b0, s0, trend, seasonal,
+            legacy=True, full=False):
+    """
+    Run the smoothing recursions for a batch of models
+
+    Parameters
+    ----------
+    y : ndarray
+        The series with shape (nseries, nobs).
+    alpha, beta, gamma : ndarray
+        The smoothing parameters, broadcastable to the batch shape, e.g.,
+        (nseries, npoints) in the grid search.
+    phi : {float, ndarray}
+        The damping parameter.
+    l0, b0 : ndarray
+        The initial level and trend with shape (nseries, 1).
+    s0 : ndarray
+        The initial seasonal values with shape (nseries, m).
+    trend, seasonal : {"add", "mul", None}
+        The components of the model.
+    legacy : bool
+        Compute the residuals with the operations of the compiled smoothers
+        that are used in the estimation. Otherwise, the operations of
+        ``ExponentialSmoothing._predict`` are used, which produce the
+        reported fitted values.
+    full : bool
+        Also return the states needed to forecast.
+
+    Returns
+    -------
+    sse : ndarray
+        The sum of squared residuals with the batch shape.
+    states : tuple
+        The final level and trend and the last m + 1 seasonal values. Only
+        returned if full is True.
+    """
+    nobs = y.shape[1]
+    m = s0.shape[1]
+    shape = np.broadcast(alpha, l0).shape
+    y = y.reshape(y.shape[:1] + (1,) * (len(shape) - 1) + y.shape[1:])
+    alphac = 1 - alpha
+    lvl = np.broadcast_to(l0, shape)
+    b = np.broadcast_to(b0, shape)
+    betac = 1 - beta
+    if trend == "add" and legacy:
+        betac = betac * phi
+    s = None
+    if seasonal is not None:
+        gammac = 1 - gamma
+        # s[i] is stored in slot i % m
+        s = np.empty((m,) + shape)
+        s[...] = np.moveaxis(s0.reshape(s0.shape + (1,) * (len(shape) - 1)),
+                             1, 0)
+
+    def fit_value(lvl, b, s_i):
+        if trend == "mul" and seasonal == "add" and legacy:
+            # The compiled smoother damps the multiplicative trend in the
+            # residual as if it were additive
+            trended = lvl * phi * b
+        else:
+            trended = _trended(lvl, b, phi, trend)
+        if seasonal == "add":
+            return trended + s_i
+        elif seasonal == "mul":
+            return trended * s_i
+        return trended
+
+    sse = np.zeros(shape)
+    s_i = s[0] if seasonal is not None else None
+    value = fit_value(lvl, b, s_i)
+    sse += (y[..., 0] - value) ** 2
+    s_last = None
+    for i in range(1, nobs + 1):
+        y_lag = y[..., i - 1]
+        trended = _trended(lvl, b, phi, trend)
+        if seasonal == "add":
+            s_lag = s[(i - 1) % m]
+            new_lvl = alpha * y_lag - alpha * s_lag + alphac * trended
+        elif seasonal == "mul":
+            s_lag = s[(i - 1) % m]
+            new_lvl = alpha * y_lag / s_lag + alphac * trended
+        else:
+            new_lvl = alpha * y_lag + alphac * trended
+        if trend == "add":
+            if legacy:
+                b = beta * (new_lvl - lvl) + betac * b
+            else:
+                b = beta * (new_lvl - lvl) + betac * (b * phi)
+        elif trend == "mul":
+            b = beta * (new_lvl / lvl) + betac * b ** phi
+        if seasonal is not None:
+            if i == nobs:
+                s_last = s_lag.copy()
+            if seasonal == "add":
+                s[(i - 1) % m] = (gamma * y_lag - gamma * trended
+                                  + gammac * s_lag)
+            else:
+                s[(i - 1) % m] = gamma * y_lag / trended + gammac * s_lag
+            s_i = s[i % m]
+        lvl = new_lvl
+        if i == nobs:
+            break
+        value = fit_value(lvl, b, s_i)
+        sse += (y[..., i] - value) ** 2
+    if not full:
+        return sse
+    return sse, (lvl, b, s, s_last)
+
+
+def _forecast(states, phi, steps, trend, seasonal, damped, nobs):
+    """Forecast from the final states as in ExponentialSmoothing.forecast"""
+    lvl, b, s, s_last = states
+    h = np.arange(1, steps + 1)
+    if damped:
+        phi_h = np.cumsum(phi[:, None] ** h, axis=1)
+    else:
+        phi_h = np.broadcast_to(h, (lvl.shape[0], steps))
+    if trend == "add":
+        fcast = lvl[:, None] + b[:, None] * phi_h
+    elif trend == "mul":
+        fcast = lvl[:, None] * b[:, None] ** phi_h
+    else:
+        fcast = np.repeat(lvl[:, None], steps, axis=1)
+    if seasonal is None:
+        return fcast
+    m = s.shape[0]
+    season = np.empty_like(fcast)
+    for j in range(steps):
+        # The seasonal value one full cycle after the last observation is
+        # not updated, see ExponentialSmoothing._predict
+        loc = nobs + j if j < m - 1 else nobs - 1 + (j - m + 1) % m
+        season[:, j] = s_last if loc == nobs - 1 else s[loc % m]
+    if seasonal == "add":
+        return fcast + season
+    return fcast * season
+
+
+def _brute(models, y, sel, bounds, init):
+    """Vectorized grid search for the starting smoothing parameters"""
+    model = models[0]
+    nseries = len(models)
+    sv_sel = np.zeros_like(sel)
+    sv_sel[:3] = sel[:3]
+    points = model._setup_brute(sv_sel, bounds, init[0, 0])
+    cols = iter(points.T)
+    alpha = next(cols)
+    beta = next(cols) if sv_sel[1] else init[0, 1]
+    gamma = next(cols) if sv_sel[2] else init[0, 2]
+    npoints = points.shape[0]
+    l0, b0, phi = init[:, 3:4], init[:, 4:5], init[0, 5]
+    s0 = init[:, 6:]
+    best = np.empty(nseries, dtype=int)
+    block = max(1, _BRUTE_BLOCK // npoints)
+    with np.errstate(all="ignore"):
+        for start in range(0, nseries, block):
+            loc = slice(start, start + block)
+            sse = _smooth(y[loc], alpha, beta, gamma, phi, l0[loc],
+                          b0[loc], s0[loc], model.trend, model.seasonal)
+            sse[~np.isfinite(sse)] = np.inf
+            best[loc] = sse.argmin(1)
+    return points[best]
+
+
+def _fit_chunk(y, model_kw, use_brute, method, minimize_kwargs, steps,
+               return_results):
+    """
+    Fit one chunk of series
+
+    Defined at the module level so that it can be sent to worker processes.
+    """
+    models = [ExponentialSmoothing(row, **model_kw) for row in y]
+    model = models[0]
+    trend, seasonal = model.trend, model.seasonal
+    has_trend, has_seasonal = model.has_trend, model.has_seasonal
+    damped = model.damped_trend
+    m = model.seasonal_periods
+
+    # Starting values as in ExponentialSmoothing._optimize_parameters
+    init_alpha = 0.5 / max(m, 1)
+    init_beta = 0.1 * init_alpha if has_trend else np.nan
+    init_gamma = 0.05 * (1 - init_alpha) if has_seasonal else np.nan
+    init_phi = 0.99 if damped else 1.0
+    init = np.empty((len(models), 6 + m))
+    init[:, :3] = init_alpha, init_beta, init_gamma
+    init[:, 5] = init_phi
+    for i, mod in enumerate(models):
+        l0, b0, s0 = mod.initial_values()
+        init[i, 3] = l0
+        init[i, 4] = np.nan if b0 is None else b0
+        init[i, 6:] = s0
+    sel = np.array(
+        [True, has_trend, has_seasonal, model._estimate_level,
+         model._estimate_trend, damped]
+        + [has_seasonal and model._estimate_seasonal] * m
+    )
+    if use_brute:
+        bounds = np.array(model._construct_bounds()[:3], dtype=float)
+        init[:, :3][:, sel[:3]] = _brute(models, y, sel, bounds, init)
+
+    nseries = y.shape[0]
+    params = np.empty((nseries, 6 + m))
+    converged = np.empty(nseries, dtype=bool)
+    results = [] if return_results else None
+    for i, mod in enumerate(models):
+        data = _OptConfig()
+        data.alpha = data.beta = data.gamma = None
+        data.phi = None if damped else 1.0
+        data.level = data.trend = data.seasonal = None
+        data.y = mod._y
+        data.params = init[i, sel]
+        data.mle_retvals = data.mask = None
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ConvergenceWarning)
+            data = mod._optimize_parameters(
+                data, False, method, minimize_kwargs
+            )
+        params[i] = data.params
+        retvals = data.mle_retvals
+        if hasattr(retvals, "lowest_optimization_result"):
+            retvals = retvals.lowest_optimization_result
+        converged[i] = retvals.success
+        if return_results:
+            res = mod._predict(
+                h=steps,
+                smoothing_level=data.alpha,
+                smoothing_trend=data.beta,
+                smoothing_seasonal=data.gamma,
+                damping_trend=data.phi,
+                initial_level=data.level,
+                initial_trend=data.trend,
+                initial_seasons=data.seasonal,
+                use_boxcox=False,
+                remove_bias=False,
+                is_optimized=data.mask,
+            )
+            res._results.mle_retvals = data.mle_retvals
+            results.append(res)
+
+    # Final pass with the estimated parameters for all series at once
+    included = np.array([True, has_trend, has_seasonal, True, has_trend,
+                         damped] + [True] * m)
+    params[:, ~included] = np.nan
+    phi = params[:, 5] if damped else np.ones(nseries)
+    with np.errstate(all="ignore"):
+        sse, states = _smooth(
+            y, params[:, 0], params[:, 1], params[:, 2], phi,
+            params[:, 3], params[:, 4], params[:, 6:], trend, seasonal,
+            legacy=False, full=True,
+        )
+        forecasts = _forecast(states, phi, steps, trend, seasonal, damped,
+                              y.shape[1])
+    return params, sse, converged, forecasts, results
+
+
+class HoltWintersBatchResults:
+    """
+    Results from fitting Holt-Winters models to many series
+
+    Parameters
+    ----------
+    params : ndarray
+        The estimated parameters with shape (nseries, 6 + m).
+    param_names : list[str]
+        The names of the columns of params.
+    sse : ndarray
+        The sum of squared residuals of each series.
+    nobs : int
+        The number of observations of each series.
+    k : int
+        The number of estimated parameters of each model.
+    converged : ndarray
+        Flags indicating whether the optimizer converged for each series.
+    forecasts : ndarray
+        The out-of-sample forecasts with shape (nseries, steps).
+    results : list[HoltWintersResults], optional
+        The results instances of the individual series.
+    """
+
+    def __init__(self, params, param_names, sse, nobs, k, converged,
+                 forecasts, results=None):
+        self.params = params
+        self.param_names = param_names
+        self.sse = sse
+        self.nobs = nobs
+        self.k = k
+        self.converged = converged
+        self.forecasts = forecasts
+        self.results = results
+
+    @property
+    def aic(self):
+        """The Akaike information criterion of each series."""
+        return self.nobs * np.log(self.sse / self.nobs) + 2 * self.k
+
+    @property
+    def aicc(self):
+        """The bias-corrected Akaike information criterion of each series."""
+        dof_eff = self.nobs - self.k - 3
+        if dof_eff > 0:
+            penalty = 2 * (self.k + 2) * (self.k + 3) / dof_eff
+        else:
+            penalty = np.inf
+        return self.aic + penalty
+
+    @property
+    def bic(self):
+        """The Bayesian information criterion of each series."""
+        return (self.nobs * np.log(self.sse / self.nobs)
+                + self.k * np.log(self.nobs))
+
+
+def fit_batch(
+    endog,
+    trend=None,
+    damped_trend=False,
+    seasonal=None,
+    *,
+    seasonal_periods=None,
+    initialization_method="estimated",
+    bounds=None,
+    steps=0,
+    method=None,
+    minimize_kwargs=None,
+    use_brute=True,
+    return_results=False,
+    chunksize=256,
+    n_jobs=1,
+    verbose=0,
+):
+    """
+    Fit the same Holt-Winters model to many series and forecast them
+
+    Parameters
+    ----------
+    endog : array_like
+        The series with shape (nseries, nobs), one series per row.
+    trend : {"add", "mul", "additive", "multiplicative", None}, optional
+        Type of trend component.
+    damped_trend : bool, optional
+        Should the trend component be damped.
+    seasonal : {"add", "mul", "additive", "multiplicative", None}, optional
+        Type of seasonal component.
+    seasonal_periods : int, optional
+        The number of periods in a complete seasonal cycle. Required if the
+        model has a seasonal component.
+    initialization_method : str, optional
+        Method for initialize the recursions. One of "estimated",
+        "heuristic" or "legacy-heuristic", see ``ExponentialSmoothing``.
+    bounds : dict[str, tuple[float, float]], optional
+        Bounds for the parameters, see ``ExponentialSmoothing``.
+    steps : int, optional
+        The number of out-of-sample forecasts of each series. Default is 0.
+    method : str, optional
+        The minimizer used, see ``ExponentialSmoothing.fit``. Default is
+        "SLSQP".
+    minimize_kwargs : dict[str, Any], optional
+        Keyword arguments passed to the minimizer, see
+        ``ExponentialSmoothing.fit``.
+    use_brute : bool, optional
+        Search for good starting values using a brute force (grid)
+        optimizer. If False, a naive set of starting values is used.
+    return_results : bool, optional
+        Also return a ``HoltWintersResults`` instance for each series.
+        Default is False.
+    chunksize : int, optional
+        The number of series that are fitted together by one worker.
+    n_jobs : int, optional
+        The number of processes used to fit the chunks. -1 uses all
+        available cores. Requires joblib, otherwise the chunks are fitted
+        serially.
+    verbose : int, optional
+        The verbosity level of ``joblib.Parallel``.
+
+    Returns
+    -------
+    HoltWintersBatchResults
+        The stacked parameters in ``params``, ordered as in
+        ``param_names``, and the forecasts in ``forecasts``. Parameters
+        that are not part of the model are nan.
+
+    See Also
+    --------
+    statsmodels.tsa.holtwinters.ExponentialSmoothing
+        Holt-Winters model of a single series.
+
+    Notes
+    -----
+    The estimates are the same as those from
+    ``ExponentialSmoothing(y, ...).fit(method=method)`` for each row ``y``
+    of endog. The grid search is evaluated for all series and grid points
+    of a chunk in a single pass of vectorized recursions instead of one
+    call of the smoother per grid point, which is the dominant cost of
+    fitting a single model. The fitted values and forecasts of all series
+    of a chunk are computed the same way. Box-Cox transformations, fixed
+    parameters and known initial values are not supported.
+
+    The forecasts continue the recursions from the estimated states. For a
+    damped multiplicative trend, ``HoltWintersResults.forecast`` restarts
+    the recursions from the reported ``initial_trend``, which is damped,
+    and so its forecasts differ from ``forecasts``.
+
+    Examples
+    --------
+    >>> res = fit_batch(sales, trend="add", seasonal="add",
+    ...                 seasonal_periods=7, steps=14, n_jobs=-1)
+    >>> res.forecasts.shape
+    (300000, 14)
+    """
+    y = array_like(endog, "endog", ndim=2, contiguous=True)
+    initialization_method = string_like(
+        initialization_method,
+        "initialization_method",
+        options=("estimated", "heuristic", "legacy-heuristic"),
+    )
+    steps = int_like(steps, "steps")
+    chunksize = int_like(chunksize, "chunksize")
+    use_brute = bool_like(use_brute, "use_brute")
+    return_results = bool_like(return_results, "return_results")
+    minimize_kwargs = dict_like(
+        minimize_kwargs, "minimize_kwargs", optional=True
+    )
+    minimize_kwargs = {} if minimize_kwargs is None else minimize_kwargs
+    if steps < 0:
+        raise ValueError("steps must be non-negative.")
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer.")
+    model_kw = dict(
+        trend=trend,
+        damped_trend=damped_trend,
+        seasonal=seasonal,
+        seasonal_periods=seasonal_periods,
+        initialization_method=initialization_method,
+        bounds=bounds,
+    )
+    method = string_like(
+        method,
+        "method",
+        options=_METHODS,
+        lower=False,
+        optional=True,
+    )
+    method = "SLSQP" if method is None else method
+    # Validate the specification on the first series
+    model = ExponentialSmoothing(y[0], **model_kw)
+
+    parallel, p_func, n_jobs = parallel_func(_fit_chunk, n_jobs,
+                                             verbose=verbose)
+    out = parallel(
+        p_func(y[start:start + chunksize], model_kw, use_brute, method,
+               minimize_kwargs, steps, return_results)
+        for start in range(0, y.shape[0], chunksize)
+    )
+    params, sse, converged, forecasts, results = zip(*out)
+    converged = np.concatenate(converged)
+    if not converged.all():
+        warnings.warn(
+            f"Optimization failed to converge for {(~converged).sum()} of "
+            f"{converged.shape[0]} series. Check converged.",
+            ConvergenceWarning,
+        )
+    m = model.seasonal_periods
+    k = m * model.has_seasonal + 2 * model.has_trend + 2 + model.damped_trend
+    return HoltWintersBatchResults(
+        np.concatenate(params),
+        list(model._ordered_names()),
+        np.concatenate(sse),
+        y.shape[1],
+        k,
+        converged,
+        np.concatenate(forecasts),
+        [res for chunk in results for res in chunk] if return_results
+        else None,
+    )
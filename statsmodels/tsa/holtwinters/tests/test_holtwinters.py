@@ -32,6 +32,7 @@ from statsmodels.tsa.holtwinters._smoothers import (
     to_restricted,
     to_unrestricted,
 )
+from statsmodels.tsa.holtwinters.batch import fit_batch
 
 base, _ = os.path.split(os.path.abspath(__file__))
 housing_data = pd.read_csv(
@@ -2153,3 +2154,84 @@ def test_all_initial_values():
     assert_allclose(fit2.params["initial_level"], lvl)
     assert_allclose(fit2.params["initial_trend"], trend)
     assert_allclose(fit2.params["initial_seasons"], seas)
+
+
+@pytest.fixture(scope="module")
+def aust_panel():
+    rs = np.random.RandomState(0)
+    values = np.asarray(aust)
+    return values * rs.uniform(0.5, 2.0, (5, 1)) + rs.uniform(
+        0, 2, (5, values.shape[0])
+    )
+
+
+@pytest.mark.parametrize("trend", TRENDS)
+@pytest.mark.parametrize("seasonal", SEASONALS)
+@pytest.mark.parametrize("damped", [True, False])
+def test_fit_batch(aust_panel, trend, seasonal, damped):
+    if damped and trend is None:
+        pytest.skip("Can only dampen the trend component")
+    m = 4 if seasonal else None
+    kw = dict(trend=trend, damped_trend=damped, seasonal=seasonal,
+              seasonal_periods=m)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)
+        res = fit_batch(aust_panel, steps=9, return_results=True, **kw)
+    assert res.params.shape == (5, 6 + (m or 0))
+    assert res.forecasts.shape == (5, 9)
+    for i, y in enumerate(aust_panel):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ConvergenceWarning)
+            desired = ExponentialSmoothing(y, **kw).fit()
+        params = pd.Series(res.params[i], index=res.param_names)
+        assert_allclose(params["smoothing_level"],
+                        desired.params["smoothing_level"])
+        assert_allclose(params["initial_level"],
+                        desired.params["initial_level"])
+        if seasonal:
+            assert_allclose(res.params[i, 6:],
+                            desired.params["initial_seasons"])
+        if damped:
+            assert_allclose(params["damping_trend"],
+                            desired.params["damping_trend"])
+        else:
+            assert np.isnan(params["damping_trend"])
+        assert_allclose(res.sse[i], desired.sse)
+        assert_allclose(res.aic[i], desired.aic)
+        assert_allclose(res.aicc[i], desired.aicc)
+        assert_allclose(res.bic[i], desired.bic)
+        assert_allclose(res.results[i].params["smoothing_level"],
+                        desired.params["smoothing_level"])
+        assert_allclose(res.forecasts[i], res.results[i].fcastvalues[:9])
+        if not (damped and trend == "mul"):
+            # The damped multiplicative forecasts of the results restart
+            # the recursions from the reported initial trend
+            assert_allclose(res.forecasts[i], desired.forecast(9))
+
+
+def test_fit_batch_chunks(aust_panel):
+    kw = dict(trend="add", seasonal="mul", seasonal_periods=4, steps=6)
+    res = fit_batch(aust_panel, **kw)
+    assert res.results is None
+    res_chunks = fit_batch(aust_panel, chunksize=2, n_jobs=2, **kw)
+    assert_allclose(res_chunks.params, res.params)
+    assert_allclose(res_chunks.forecasts, res.forecasts)
+    assert_allclose(res_chunks.sse, res.sse)
+    assert res.converged.all()
+
+    res = fit_batch(aust_panel, use_brute=False, method="L-BFGS-B", **kw)
+    desired = ExponentialSmoothing(
+        aust_panel[2], trend="add", seasonal="mul", seasonal_periods=4
+    ).fit(use_brute=False, method="L-BFGS-B")
+    assert_allclose(res.forecasts[2], desired.forecast(6))
+
+
+def test_fit_batch_errors(aust_panel):
+    with pytest.raises(ValueError, match="initialization_method"):
+        fit_batch(aust_panel, initialization_method="known")
+    with pytest.raises(ValueError, match="seasonal_periods must be"):
+        fit_batch(aust_panel, seasonal="add", seasonal_periods=1)
+    with pytest.raises(ValueError, match="steps"):
+        fit_batch(aust_panel, steps=-1)
+    with pytest.raises(ValueError, match="method"):
+        fit_batch(aust_panel, method="unknown")
@@ -50,3 +50,15 @@ cdef void zhamilton_filter_log_iteration(int t, int k_regimes, int order,
                                 np.complex128_t [:] prev_filtered_joint_probabilities,
                                 np.complex128_t [:] curr_filtered_joint_probabilities,
                                 np.complex128_t [:] tmp_predicted_joint_probabilities) nogil
+cdef void shamilton_filter_log_marginalize(int k_regimes, int order,
+                                np.float32_t [:] filtered_joint_probabilities,
+                                np.float32_t [:] marginalized_probabilities) noexcept nogil
+cdef void dhamilton_filter_log_marginalize(int k_regimes, int order,
+                                np.float64_t [:] filtered_joint_probabilities,
+                                np.float64_t [:] marginalized_probabilities) noexcept nogil
+cdef void chamilton_filter_log_marginalize(int k_regimes, int order,
+                                np.complex64_t [:] filtered_joint_probabilities,
+                                np.complex64_t [:] marginalized_probabilities) noexcept nogil
+cdef void zhamilton_filter_log_marginalize(int k_regimes, int order,
+                                np.complex128_t [:] filtered_joint_probabilities,
+                                np.complex128_t [:] marginalized_probabilities) noexcept nogil
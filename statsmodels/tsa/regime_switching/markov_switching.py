@@ -15,14 +15,20 @@ import statsmodels.base.wrapper as wrap
 from statsmodels.tools.decorators import cache_readonly
 from statsmodels.tools.eval_measures import aic, bic, hqic
 from statsmodels.tools.numdiff import approx_fprime_cs, approx_hess_cs
+from statsmodels.tools.parallel import parallel_func
+from statsmodels.tools.rng_qrng import check_random_state
 from statsmodels.tools.sm_exceptions import EstimationWarning
 from statsmodels.tools.tools import Bunch, pinv_extended
 import statsmodels.tsa.base.tsa_model as tsbase
 from statsmodels.tsa.regime_switching._hamilton_filter import (
     chamilton_filter_log,
+    chamilton_filter_log_batch,
     dhamilton_filter_log,
+    dhamilton_filter_log_batch,
     shamilton_filter_log,
+    shamilton_filter_log_batch,
     zhamilton_filter_log,
+    zhamilton_filter_log_batch,
 )
 from statsmodels.tsa.regime_switching._kim_smoother import (
     ckim_smoother_log,
@@ -41,6 +47,11 @@ prefix_hamilton_filter_log_map = {
     'c': chamilton_filter_log, 'z': zhamilton_filter_log
 }
 
+prefix_hamilton_filter_log_batch_map = {
+    's': shamilton_filter_log_batch, 'd': dhamilton_filter_log_batch,
+    'c': chamilton_filter_log_batch, 'z': zhamilton_filter_log_batch
+}
+
 prefix_kim_smoother_log_map = {
     's': skim_smoother_log, 'd': dkim_smoother_log,
     'c': ckim_smoother_log, 'z': zkim_smoother_log
@@ -231,6 +242,107 @@ def cy_hamilton_filter_log(initial_probabilities, regime_transition,
             filtered_joint_probabilities_log[..., 1:])
 
 
+def cy_hamilton_filter_log_batch(initial_probabilities, regime_transition,
+                                 conditional_loglikelihoods, model_order):
+    """
+    Hamilton filter in log space for a batch of parameter vectors
+
+    Parameters
+    ----------
+    initial_probabilities : ndarray
+        Array of initial probabilities, shaped (n_batch, k_regimes).
+    regime_transition : ndarray
+        Matrices of regime transition probabilities, shaped
+        (n_batch, k_regimes, k_regimes, 1) or, with time-varying transition
+        probabilities, (n_batch, k_regimes, k_regimes, nobs + order).
+    conditional_loglikelihoods : ndarray
+        Array of loglikelihoods conditional on the last `order+1` regimes,
+        shaped (n_batch,) + (k_regimes,)*(order + 1) + (nobs,).
+    model_order : int
+        The order of the model.
+
+    Returns
+    -------
+    joint_loglikelihoods : ndarray
+        Array of loglikelihoods conditional on time t information, shaped
+        (n_batch, nobs).
+
+    See Also
+    --------
+    cy_hamilton_filter_log
+        Hamilton filter for a single parameter vector.
+
+    Notes
+    -----
+    Only the loglikelihoods are returned, so that the filtered and predicted
+    probabilities need not be stored for each parameter vector and period.
+    """
+    n_batch, k_regimes = initial_probabilities.shape
+    nobs = conditional_loglikelihoods.shape[-1]
+    order = conditional_loglikelihoods.ndim - 3
+    dtype = conditional_loglikelihoods.dtype
+
+    # Check for compatible shapes.
+    incompatible_shapes = (
+        regime_transition.shape[-1] not in (1, nobs + model_order)
+        or regime_transition.shape[:3] != (n_batch, k_regimes, k_regimes)
+        or conditional_loglikelihoods.shape[:2] != (n_batch, k_regimes))
+    if incompatible_shapes:
+        raise ValueError('Arguments do not have compatible shapes')
+
+    # Convert to log space
+    initial_probabilities = np.log(initial_probabilities)
+    regime_transition = np.log(np.maximum(regime_transition, 1e-20))
+
+    # Initial joint probabilities of the last `order + 1` regimes
+    tmp = initial_probabilities
+    shape = (n_batch, k_regimes, k_regimes)
+    transition_t = 0
+    for i in range(order):
+        if regime_transition.shape[-1] > 1:
+            transition_t = i
+        tmp = (np.reshape(regime_transition[..., transition_t],
+                          shape + (1,) * i) + tmp[:, None])
+
+    # Get appropriate subset of transition matrix
+    if regime_transition.shape[-1] > 1:
+        regime_transition = regime_transition[..., model_order:]
+
+    # Storage
+    joint_loglikelihoods = np.zeros((n_batch, nobs), dtype)
+
+    # Run Cython filter iterations
+    prefix, dtype, _ = find_best_blas_type((
+        regime_transition, conditional_loglikelihoods, joint_loglikelihoods))
+    func = prefix_hamilton_filter_log_batch_map[prefix]
+    func(nobs, k_regimes, order,
+         np.ascontiguousarray(regime_transition, dtype=dtype),
+         np.ascontiguousarray(conditional_loglikelihoods.reshape(
+             n_batch, k_regimes**(order + 1), nobs), dtype=dtype),
+         joint_loglikelihoods,
+         np.ascontiguousarray(tmp.reshape(n_batch, -1), dtype=dtype))
+
+    return joint_loglikelihoods
+
+
+def _search_em(model, candidates, em_iter):
+    """
+    Apply EM iterations to a list of candidate start parameters
+
+    Candidates for which the EM iterations fail are returned as None.
+    """
+    out = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for params in candidates:
+            try:
+                out.append(model._fit_em(params, transformed=False,
+                                         maxiter=em_iter, return_params=True))
+            except Exception:  # FIXME: catch something specific
+                out.append(None)
+    return out
+
+
 def cy_kim_smoother_log(regime_transition, predicted_joint_probabilities,
                         filtered_joint_probabilities):
     """
@@ -974,6 +1086,48 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
         """
         return np.sum(self.loglikeobs(params, transformed))
 
+    def _safe_loglike(self, params):
+        try:
+            return self.loglike(params)
+        except Exception:  # FIXME: catch something specific
+            return -np.inf
+
+    def _loglike_batch(self, params, transformed=True):
+        """
+        Loglikelihood evaluation for a batch of parameter vectors
+
+        Parameters
+        ----------
+        params : array_like
+            Array of parameter vectors, shaped (n_batch, k_params).
+        transformed : bool, optional
+            Whether or not `params` is already transformed. Default is True.
+
+        Returns
+        -------
+        llf : ndarray
+            The loglikelihood of each parameter vector.
+        """
+        params = np.array(params, ndmin=2)
+        if not transformed:
+            params = np.array([self.transform_params(p) for p in params])
+
+        regime_transition = []
+        initial_probabilities = []
+        conditional_loglikelihoods = []
+        for p in params:
+            transition = self.regime_transition_matrix(p)
+            regime_transition.append(transition)
+            initial_probabilities.append(
+                self.initial_probabilities(p, transition))
+            conditional_loglikelihoods.append(
+                self._conditional_loglikelihoods(p))
+
+        joint_loglikelihoods = cy_hamilton_filter_log_batch(
+            np.array(initial_probabilities), np.array(regime_transition),
+            np.array(conditional_loglikelihoods), self.order)
+        return joint_loglikelihoods.sum(-1)
+
     def score(self, params, transformed=True):
         """
         Compute the score function at params.
@@ -1026,7 +1180,8 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
     def fit(self, start_params=None, transformed=True, cov_type='approx',
             cov_kwds=None, method='bfgs', maxiter=100, full_output=1, disp=0,
             callback=None, return_params=False, em_iter=5, search_reps=0,
-            search_iter=5, search_scale=1., **kwargs):
+            search_iter=5, search_scale=1., search_random_state=None,
+            search_n_jobs=1, **kwargs):
         """
         Fits the model by maximum likelihood via Hamilton filter.
 
@@ -1087,6 +1242,13 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
             search parameter repetitions.
         search_scale : float or array, optional.
             Scale of variates for random start parameter search.
+        search_random_state : {None, int, Generator, RandomState}, optional
+            Seed or random number generator used to draw the search
+            parameters. If None, the global ``np.random`` state is used.
+        search_n_jobs : int, optional
+            Number of processes used to apply the EM iterations to the search
+            parameters. -1 uses all available cores. Requires joblib. Default
+            is 1.
         **kwargs
             Additional keyword arguments to pass to the optimizer.
 
@@ -1106,7 +1268,8 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
             start_params = self._start_params_search(
                 search_reps, start_params=start_params,
                 transformed=transformed, em_iter=search_iter,
-                scale=search_scale)
+                scale=search_scale, random_state=search_random_state,
+                n_jobs=search_n_jobs)
             transformed = True
 
         # Get better start params through EM algorithm
@@ -1297,7 +1460,8 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
         return regime_transition
 
     def _start_params_search(self, reps, start_params=None, transformed=True,
-                             em_iter=5, scale=1.):
+                             em_iter=5, scale=1., random_state=None,
+                             n_jobs=1):
         """
         Search for starting parameters as random permutations of a vector
 
@@ -1317,11 +1481,21 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
             Scale of variates for random start parameter search. Can be given
             as an array of length equal to the number of parameters or as a
             single scalar.
+        random_state : {None, int, Generator, RandomState}, optional
+            Seed or random number generator used to draw the variates. If
+            None, the global ``np.random`` state is used.
+        n_jobs : int, optional
+            Number of processes used to apply the EM iterations. -1 uses all
+            available cores. Default is 1.
 
         Notes
         -----
         This is a private method for finding good starting parameters for MLE
         by scoring, where the defaults have been set heuristically.
+
+        The EM iterations of the repetitions are independent and can be run
+        in parallel. The loglikelihoods of all refined parameters are then
+        evaluated in a single batched pass of the Hamilton filter.
         """
         if start_params is None:
             start_params = self.start_params
@@ -1343,30 +1517,45 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
                              ' parameter or as a single scalar.')
 
         # Construct the random variates
+        if random_state is None:
+            uniform = np.random.uniform
+        else:
+            uniform = check_random_state(random_state).uniform
         variates = np.zeros((reps, self.k_params))
         for i in range(self.k_params):
-            variates[:, i] = scale[i] * np.random.uniform(-0.5, 0.5, size=reps)
+            variates[:, i] = scale[i] * uniform(-0.5, 0.5, size=reps)
+        candidates = start_params + variates
+
+        # Apply the EM iterations to each candidate
+        parallel, p_func, n_jobs = parallel_func(_search_em, n_jobs,
+                                                 verbose=0)
+        if n_jobs == 1:
+            proposed = _search_em(self, candidates, em_iter)
+        else:
+            chunks = np.array_split(candidates, min(n_jobs, reps))
+            proposed = sum(parallel(p_func(self, chunk, em_iter)
+                                    for chunk in chunks), [])
+        proposed = [p for p in proposed
+                    if p is not None and np.all(np.isfinite(p))]
 
         llf = self.loglike(start_params, transformed=False)
-        params = start_params
-        for i in range(reps):
+        params = self.transform_params(start_params)
+        if proposed:
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
-
                 try:
-                    proposed_params = self._fit_em(
-                        start_params + variates[i], transformed=False,
-                        maxiter=em_iter, return_params=True)
-                    proposed_llf = self.loglike(proposed_params)
-
-                    if proposed_llf > llf:
-                        llf = proposed_llf
-                        params = self.untransform_params(proposed_params)
+                    proposed_llf = self._loglike_batch(proposed)
                 except Exception:  # FIXME: catch something specific
-                    pass
+                    proposed_llf = np.array(
+                        [self._safe_loglike(p) for p in proposed])
+            proposed_llf = np.where(np.isnan(proposed_llf), -np.inf,
+                                    proposed_llf)
+            best = np.argmax(proposed_llf)
+            if proposed_llf[best] > llf:
+                params = proposed[best]
 
         # Return transformed parameters
-        return self.transform_params(params)
+        return params
 
     @property
     def start_params(self):
@@ -8,6 +8,7 @@ License: BSD-3
 import numpy as np
 from numpy.testing import assert_equal, assert_allclose, assert_raises
 import pandas as pd
+import pytest
 
 from statsmodels.tools.numdiff import approx_fprime_cs
 from statsmodels.tsa.regime_switching import markov_switching
@@ -315,3 +316,67 @@ def test_partials_logistic():
             desired = np.diag(evaluated[:, j, t] - evaluated[:, j, t]**2)
             desired[0, 1] = desired[1, 0] = -np.multiply(*evaluated[:, j, t])
             assert_allclose(partials[..., j, t], desired)
+
+
+def _search_models():
+    from statsmodels.tsa.regime_switching import (
+        markov_autoregression, markov_regression)
+
+    rs = np.random.RandomState(1234)
+    nobs = 150
+    states = (np.cumsum(rs.uniform(size=nobs) < 0.1) % 2).astype(float)
+    endog = 2 * states + rs.standard_normal(nobs)
+    exog_tvtp = np.c_[np.ones(nobs + 2), rs.standard_normal(nobs + 2)]
+    return [
+        markov_regression.MarkovRegression(
+            endog, k_regimes=2, switching_variance=True),
+        markov_regression.MarkovRegression(
+            endog, k_regimes=3, exog_tvtp=exog_tvtp[:nobs]),
+        markov_autoregression.MarkovAutoregression(
+            endog, k_regimes=2, order=2),
+        markov_autoregression.MarkovAutoregression(
+            endog, k_regimes=2, order=1, exog_tvtp=exog_tvtp[:nobs]),
+    ]
+
+
+def test_batch_hamilton_filter():
+    rs = np.random.RandomState(0)
+    for mod in _search_models():
+        params = mod.untransform_params(mod.start_params)
+        params = params + rs.uniform(-0.5, 0.5, size=(4, mod.k_params))
+        desired = [mod.loglike(p, transformed=False) for p in params]
+        assert_allclose(mod._loglike_batch(params, transformed=False),
+                        desired)
+
+
+@pytest.mark.filterwarnings("ignore::statsmodels.tools."
+                            "sm_exceptions.ConvergenceWarning")
+def test_start_params_search():
+    mod = _search_models()[0]
+    llf = mod.loglike(mod.start_params)
+
+    res1 = mod._start_params_search(
+        10, random_state=np.random.default_rng(1234))
+    res2 = mod._start_params_search(10, random_state=1234)
+    res3 = mod._start_params_search(10, random_state=1234, n_jobs=2)
+    assert_allclose(res2, res3)
+    assert mod.loglike(res1) >= llf
+    assert mod.loglike(res2) >= llf
+
+    # Same result as the previous sequential search of the global state
+    np.random.seed(1234)
+    res = mod._start_params_search(10)
+    np.random.seed(1234)
+    variates = np.random.uniform(-0.5, 0.5, size=(mod.k_params, 10)).T
+    start = mod.untransform_params(mod.start_params)
+    desired, desired_llf = mod.start_params, llf
+    for variate in variates:
+        params = mod._fit_em(start + variate, transformed=False, maxiter=5,
+                             return_params=True)
+        if mod.loglike(params) > desired_llf:
+            desired, desired_llf = params, mod.loglike(params)
+    assert_allclose(res, desired)
+
+    res = mod.fit(search_reps=10, search_random_state=1234, em_iter=0,
+                  maxiter=0, return_params=True)
+    assert_allclose(res, res2, rtol=1e-6)
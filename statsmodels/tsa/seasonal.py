@@ -8,6 +8,7 @@ from pandas.core.nanops import nanmean as pd_nanmean
 from statsmodels.tools.validation import PandasWrapper, array_like
 from statsmodels.tsa.stl._stl import STL
 from statsmodels.tsa.filters.filtertools import convolution_filter
+from statsmodels.tsa.stl.batch import mstl_batch, stl_batch
 from statsmodels.tsa.stl.mstl import MSTL
 from statsmodels.tsa.tsatools import freq_to_period
 
@@ -17,6 +18,8 @@ __all__ = [
     "seasonal_mean",
     "DecomposeResult",
     "MSTL",
+    "stl_batch",
+    "mstl_batch",
 ]
 
 
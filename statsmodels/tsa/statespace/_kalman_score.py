@@ -0,0 +1,350 @@
+"""
+Analytic score of the Kalman filter loglikelihood
+
+The derivatives of the loglikelihood are computed by differentiating the
+Kalman filter recursions, so that a single forward pass produces both the
+loglikelihood and its gradient.
+
+License: Simplified-BSD
+"""
+import numpy as np
+
+from statsmodels.tools.numdiff import _get_epsilon
+from statsmodels.tools.tools import Bunch
+
+from . import tools
+from .kalman_filter import FILTER_COLLAPSED, FILTER_CONCENTRATED
+
+_MATRICES = ['design', 'obs_intercept', 'obs_cov', 'transition',
+             'state_intercept', 'selection', 'state_cov']
+
+
+def _check_model(model):
+    ssm = model.ssm
+    if ssm.filter_method & FILTER_CONCENTRATED:
+        raise NotImplementedError('The analytic score is not available for'
+                                  ' models that concentrate the scale out'
+                                  ' of the likelihood.')
+    if ssm.filter_method & FILTER_COLLAPSED:
+        raise NotImplementedError('The analytic score is not available with'
+                                  ' the collapsed filter.')
+    if ssm.filter_timing != 0:
+        raise NotImplementedError('The analytic score is not available with'
+                                  ' the alternate filter timing.')
+    if ssm._complex_endog:
+        raise NotImplementedError('The analytic score is not available for'
+                                  ' complex data.')
+
+
+def _system_matrices(model, params, complex_step=False, initialize=True):
+    ssm = model.ssm
+    model.update(params, transformed=True, includes_fixed=True,
+                 complex_step=complex_step)
+    out = {name: np.array(getattr(ssm, '_' + name)) for name in _MATRICES}
+    if not initialize:
+        return out
+    # The output arrays must be complex to keep the imaginary parts
+    dtype = complex if complex_step else float
+    k_states = ssm.k_states
+    a, Pinf, Pstar = ssm.initialization(
+        model=ssm, complex_step=complex_step,
+        initial_state_mean=np.zeros(k_states, dtype=dtype),
+        initial_diffuse_state_cov=np.zeros((k_states, k_states), dtype=dtype),
+        initial_stationary_state_cov=np.zeros((k_states, k_states),
+                                              dtype=dtype))
+    if np.any(Pinf != 0):
+        raise NotImplementedError('The analytic score does not support exact'
+                                  ' diffuse initialization. Use approximate'
+                                  ' diffuse initialization instead.')
+    out['initial_state'] = np.array(a)
+    out['initial_state_cov'] = np.array(Pstar)
+    return out
+
+
+def system_matrix_derivatives(model, params):
+    """
+    System matrices and their derivatives with respect to the parameters
+
+    Parameters
+    ----------
+    model : MLEModel
+        The model defining the mapping from parameters to system matrices.
+    params : ndarray
+        Transformed parameters, including any fixed parameters.
+
+    Returns
+    -------
+    matrices : dict
+        System matrices, including `initial_state` and `initial_state_cov`,
+        evaluated at `params`.
+    partials : dict
+        Partial derivatives of each matrix, with an additional leading
+        dimension of length `k_params`.
+
+    Notes
+    -----
+    The mapping from parameters to system matrices is differentiated by
+    complex step, which only requires calls to `update` and is exact up to
+    rounding error. No filtering is done here.
+    """
+    params = np.asarray(params, dtype=float)
+    k_params = len(params)
+    epsilon = _get_epsilon(params, 2., None, k_params)
+    # Global initializations are differentiated below, which avoids solving
+    # a Lyapunov equation for each parameter
+    init_type = model.ssm.initialization.initialization_type
+    initialize = init_type not in ('stationary', 'known',
+                                   'approximate_diffuse')
+
+    partials = {}
+    for i in range(k_params):
+        perturbed = params.astype(complex)
+        perturbed[i] += epsilon[i] * 1j
+        out = _system_matrices(model, perturbed, complex_step=True,
+                               initialize=initialize)
+        for name, value in out.items():
+            if i == 0:
+                partials[name] = np.zeros((k_params,) + value.shape)
+            partials[name][i] = value.imag / epsilon[i]
+
+    # Evaluate last at params so that the model is left in its original state
+    matrices = _system_matrices(model, params)
+    if k_params == 0:
+        partials = {name: np.zeros((0,) + value.shape)
+                    for name, value in matrices.items()}
+    elif not initialize:
+        partials.update(_initialization_derivatives(matrices, partials,
+                                                    init_type))
+    return matrices, partials
+
+
+def _initialization_derivatives(matrices, partials, init_type):
+    k_params = partials['transition'].shape[0]
+    a = matrices['initial_state']
+    P = matrices['initial_state_cov']
+    k_states = a.shape[0]
+    if init_type != 'stationary':
+        return {'initial_state': np.zeros((k_params, k_states)),
+                'initial_state_cov': np.zeros((k_params, k_states, k_states))}
+
+    # Differentiate a = T a + c and P = T P T' + R Q R'
+    T = matrices['transition'][..., 0]
+    R = matrices['selection'][..., 0]
+    Q = matrices['state_cov'][..., 0]
+    dT = partials['transition'][..., 0]
+    dR = partials['selection'][..., 0]
+    dQ = partials['state_cov'][..., 0]
+    dc = partials['state_intercept'][..., 0]
+
+    eye = np.eye(k_states)
+    da = np.linalg.solve(eye - T, (dc + dT @ a).T).T
+
+    tmp = dT @ (T @ P).T + dR @ (R @ Q).T
+    rhs = tmp + np.swapaxes(tmp, 1, 2) + (R @ dQ) @ R.T
+    if k_states <= 30:
+        # vec(dP) = (I - T kron T)^{-1} vec(rhs), factorized once
+        lhs = np.eye(k_states**2) - np.kron(T, T)
+        dP = np.linalg.solve(lhs, rhs.reshape(k_params, -1).T).T
+        dP = dP.reshape(k_params, k_states, k_states)
+    else:
+        dP = np.array([tools.solve_discrete_lyapunov(T, rhs[i])
+                       for i in range(k_params)])
+    dP = (dP + np.swapaxes(dP, 1, 2)) / 2
+    return {'initial_state': da, 'initial_state_cov': dP}
+
+
+def _at(matrix, t):
+    # System matrices have a trailing time dimension of length 1 or nobs
+    return matrix[..., t] if matrix.shape[-1] > 1 else matrix[..., 0]
+
+
+def kalman_score(model, params, return_partials=False,
+                 return_information=False):
+    r"""
+    Loglikelihood and score of a state space model in one filter pass
+
+    Parameters
+    ----------
+    model : MLEModel
+        The state space model.
+    params : ndarray
+        Transformed parameters, including any fixed parameters.
+    return_partials : bool, optional
+        Whether to also return the partial derivatives of the forecast errors
+        and their covariance matrices, as used in the information matrix of
+        Harvey (1989). Default is False.
+    return_information : bool, optional
+        Whether to also return the information matrix of Harvey (1989),
+        computed from the same partial derivatives. Default is False.
+
+    Returns
+    -------
+    Bunch
+        Contains `llf_obs` (nobs,) and `score_obs` (nobs, k_params). If
+        `return_partials` is True, also `partials_forecasts_error`
+        (k_endog, nobs, k_params) and `partials_forecasts_error_cov`
+        (k_endog, k_endog, nobs, k_params), which are zero for missing
+        elements. If `return_information` is True, also
+        `information_matrix` (k_params, k_params), the sum over the periods
+        after `loglikelihood_burn`.
+
+    Notes
+    -----
+    Along with the Kalman filter recursions for the predicted state
+    :math:`a_t` and its covariance :math:`P_t`, this runs the recursions for
+    their partial derivatives with respect to each parameter. For parameter
+    :math:`i`, with :math:`\dot X` denoting :math:`\partial X / \partial
+    \theta_i`,
+
+    .. math::
+
+        \dot v_t & = - \dot d_t - \dot Z_t a_t - Z_t \dot a_t \\
+        \dot F_t & = \dot Z_t P_t Z_t' + Z_t \dot P_t Z_t' + Z_t P_t
+                     \dot Z_t' + \dot H_t \\
+        \partial \ell_t / \partial \theta_i & = -\frac{1}{2} \left [
+            tr(F_t^{-1} \dot F_t) + 2 \dot v_t' F_t^{-1} v_t
+            - v_t' F_t^{-1} \dot F_t F_t^{-1} v_t \right ]
+
+    and the derivatives of the filtered and predicted states follow by the
+    product rule. The recursions for all parameters are vectorized, so the
+    cost is one pass over the data instead of one filter pass per parameter.
+
+    Once the predicted state covariance and its derivatives have converged
+    (only possible if the system matrices are time-invariant), their
+    recursions are skipped until a missing observation is encountered.
+    """
+    _check_model(model)
+    ssm = model.ssm
+    params = np.asarray(params, dtype=float)
+    k_params = len(params)
+    matrices, partials = system_matrix_derivatives(model, params)
+
+    endog = np.asarray(ssm.endog)
+    k_endog, nobs = endog.shape
+    tolerance = ssm.tolerance
+    time_invariant = all(matrices[name].shape[-1] == 1
+                         for name in _MATRICES)
+
+    llf_obs = np.zeros(nobs)
+    score_obs = np.zeros((nobs, k_params))
+    information = np.zeros((k_params, k_params))
+    burn = ssm.loglikelihood_burn
+    if return_partials:
+        partials_v = np.zeros((k_endog, nobs, k_params))
+        partials_F = np.zeros((k_endog, k_endog, nobs, k_params))
+
+    a = matrices['initial_state']
+    P = matrices['initial_state_cov']
+    da = partials['initial_state']
+    dP = partials['initial_state_cov']
+    log_2pi = np.log(2 * np.pi)
+    converged = False
+
+    for t in range(nobs):
+        Z = _at(matrices['design'], t)
+        d = _at(matrices['obs_intercept'], t)
+        T = _at(matrices['transition'], t)
+        c = _at(matrices['state_intercept'], t)
+        dZ = _at(partials['design'], t)
+        dd = _at(partials['obs_intercept'], t)
+        dT = _at(partials['transition'], t)
+        dc = _at(partials['state_intercept'], t)
+
+        y = endog[:, t]
+        observed = ~np.isnan(y)
+        if not observed.all():
+            converged = False
+        if observed.any():
+            if not observed.all():
+                idx = np.nonzero(observed)[0]
+                y = y[idx]
+                Z, d = Z[idx], d[idx]
+                dZ, dd = dZ[:, idx], dd[:, idx]
+
+            # Forecast error and its derivatives
+            v = y - d - Z @ a
+            dv = -dd - dZ @ a - da @ Z.T
+
+            if not converged:
+                H = _at(matrices['obs_cov'], t)
+                dH = _at(partials['obs_cov'], t)
+                if not observed.all():
+                    H = H[np.ix_(idx, idx)]
+                    dH = dH[:, idx][:, :, idx]
+                ZP = Z @ P
+                dZP = dZ @ P + Z @ dP
+                F = ZP @ Z.T + H
+                tmp = dZ @ ZP.T
+                dF = tmp + np.swapaxes(tmp, 1, 2) + (Z @ dP) @ Z.T + dH
+
+                # Filter gain K = P Z' F^{-1} and its derivatives
+                F_inv = np.linalg.inv(F)
+                logdet = np.linalg.slogdet(F)[1]
+                K = ZP.T @ F_inv
+                dK = (np.swapaxes(dZP, 1, 2) - K @ dF) @ F_inv
+                F_inv_dF = F_inv @ dF
+
+            u = F_inv @ v
+            llf_obs[t] = -0.5 * (len(y) * log_2pi + logdet + v @ u)
+            score_obs[t] = -0.5 * (
+                np.trace(F_inv_dF, axis1=1, axis2=2)
+                + 2 * dv @ u - np.einsum('i,nij,j->n', u, dF, u))
+            if return_information and t >= burn:
+                information += 0.5 * np.einsum('iab,jba->ij', F_inv_dF,
+                                               F_inv_dF)
+                information += dv @ F_inv @ dv.T
+            if return_partials:
+                if observed.all():
+                    partials_v[:, t] = dv.T
+                    partials_F[:, :, t] = np.moveaxis(dF, 0, -1)
+                else:
+                    partials_v[idx, t] = dv.T
+                    partials_F[np.ix_(idx, idx, [t])] = np.moveaxis(
+                        dF, 0, -1)[:, :, None]
+
+            # Filtered state and derivatives
+            a_filt = a + K @ v
+            da_filt = da + dK @ v + dv @ K.T
+            if not converged:
+                P_filt = P - K @ ZP
+                dP_filt = dP - dK @ ZP - K @ dZP
+        else:
+            a_filt = a
+            da_filt = da
+            P_filt = P
+            dP_filt = dP
+
+        # Predicted state and derivatives
+        a = c + T @ a_filt
+        da = dc + dT @ a_filt + da_filt @ T.T
+        if not converged:
+            R = _at(matrices['selection'], t)
+            Q = _at(matrices['state_cov'], t)
+            dR = _at(partials['selection'], t)
+            dQ = _at(partials['state_cov'], t)
+            RQ = R @ Q
+            tmp = dR @ RQ.T
+            dRQR = tmp + np.swapaxes(tmp, 1, 2) + (R @ dQ) @ R.T
+
+            TP = T @ P_filt
+            tmp = dT @ TP.T
+            P_new = TP @ T.T + RQ @ R.T
+            P_new = (P_new + P_new.T) / 2
+            dP_new = (tmp + np.swapaxes(tmp, 1, 2) + (T @ dP_filt) @ T.T
+                      + dRQR)
+            dP_new = (dP_new + np.swapaxes(dP_new, 1, 2)) / 2
+
+            if (time_invariant and observed.all() and
+                    np.all(np.abs(P_new - P) < tolerance) and
+                    np.all(np.abs(dP_new - dP) < tolerance)):
+                converged = True
+            P = P_new
+            dP = dP_new
+
+    out = Bunch(llf_obs=llf_obs, score_obs=score_obs)
+    if return_partials:
+        out['partials_forecasts_error'] = partials_v
+        out['partials_forecasts_error_cov'] = partials_F
+    if return_information:
+        out['information_matrix'] = information
+    return out
@@ -0,0 +1,433 @@
+"""
+Batched Kalman filter
+
+Vectorized Kalman filter that evaluates the loglikelihood of many independent
+series sharing a single state space specification, each with its own
+parameter vector.
+
+License: Simplified-BSD
+"""
+import copy
+
+import numpy as np
+
+from statsmodels.tools.numdiff import EPS
+from statsmodels.tools.tools import Bunch
+
+from .kalman_filter import FILTER_CONCENTRATED
+
+_MATRICES = ['design', 'obs_intercept', 'obs_cov', 'transition',
+             'state_intercept', 'selection', 'state_cov']
+
+
+class BatchKalmanFilter:
+    r"""
+    Kalman filter for a batch of series sharing one model specification
+
+    Parameters
+    ----------
+    model : MLEModel
+        Model instance that defines the state space specification (e.g. a
+        `SARIMAX` or `UnobservedComponents` model). The model is only used to
+        map parameter vectors into system matrices; its own `endog` is not
+        used except to determine `nobs` when the system matrices are
+        time-varying.
+
+    Notes
+    -----
+    All series are filtered together in a single forward pass, with each step
+    of the recursions vectorized across the batch dimension. This avoids the
+    Python overhead of constructing a filter for each series, which dominates
+    the runtime when fitting the same small model to many short series.
+
+    The system matrices are constructed for each parameter vector by calling
+    `model.update`, so that any specification supported by the model can be
+    used. The recursions themselves then operate on the stacked matrices,
+    which have a leading dimension equal to the number of series.
+
+    Missing observations (NaN) in `endog` are supported, including partially
+    missing observation vectors when `k_endog > 1`.
+
+    The following model features are not supported: exact diffuse
+    initialization (use approximate diffuse initialization instead),
+    concentrating the scale out of the likelihood, and the alternate filter
+    timing. Exogenous regressors are shared across the batch, since they are
+    part of the model specification.
+
+    Examples
+    --------
+    >>> mod = sm.tsa.SARIMAX(endog[0], order=(1, 0, 1))
+    >>> batch = BatchKalmanFilter(mod)
+    >>> llf = batch.loglike(endog, params)  # endog: (n_series, nobs)
+    """
+
+    def __init__(self, model):
+        ssm = model.ssm
+        if ssm.filter_method & FILTER_CONCENTRATED:
+            raise NotImplementedError('Batched filtering is not available'
+                                      ' for models that concentrate the'
+                                      ' scale out of the likelihood.')
+        if ssm.filter_timing != 0:
+            raise NotImplementedError('Batched filtering is not available'
+                                      ' with the alternate filter timing.')
+        self.model = model
+        self.k_endog = model.k_endog
+        self.k_states = model.k_states
+        self.k_posdef = ssm.k_posdef
+        self.loglikelihood_burn = model.loglikelihood_burn
+
+    def _validate_endog(self, endog):
+        endog = np.asarray(endog, dtype=float)
+        if endog.ndim == 2 and self.k_endog == 1:
+            endog = endog[..., None]
+        if endog.ndim != 3 or endog.shape[2] != self.k_endog:
+            raise ValueError('Invalid endog shape. Expected an array with'
+                             ' shape (n_series, nobs, %d), got %s.'
+                             % (self.k_endog, endog.shape))
+        return endog
+
+    def _validate_params(self, params, n_series):
+        params = np.asarray(params, dtype=float)
+        if params.ndim == 1:
+            params = np.broadcast_to(params, (n_series, params.shape[0]))
+        if params.ndim != 2 or params.shape[0] != n_series:
+            raise ValueError('Invalid params shape. Expected an array with'
+                             ' shape (n_series, k_params) or (k_params,),'
+                             ' got %s.' % (params.shape,))
+        return params
+
+    def system_matrices(self, params, transformed=True, includes_fixed=False):
+        """
+        Construct the stacked system matrices for a batch of parameters
+
+        Parameters
+        ----------
+        params : array_like
+            Parameters, with shape (n_series, k_params).
+        transformed : bool, optional
+            Whether or not `params` is already transformed. Default is True.
+        includes_fixed : bool, optional
+            If parameters were previously fixed with the `fix_params` method,
+            this argument describes whether or not `params` also includes
+            the fixed parameters, in addition to the free parameters. Default
+            is False.
+
+        Returns
+        -------
+        matrices : Bunch
+            Stacked system matrices, each with a leading dimension of
+            n_series and a trailing time dimension (of length 1 if the matrix
+            is time-invariant), along with the stacked initial state mean
+            `initial_state` and covariance `initial_state_cov`.
+        """
+        params = np.asarray(params, dtype=float)
+        if params.ndim == 1:
+            params = params[None, :]
+        n_series = params.shape[0]
+        model = self.model
+        ssm = model.ssm
+
+        # The model is updated for each series, so its matrices and
+        # initialization are restored afterwards
+        saved = {name: getattr(ssm, '_' + name).copy() for name in _MATRICES}
+        initialization = copy.deepcopy(ssm.initialization)
+
+        out = {}
+        try:
+            for i in range(n_series):
+                model.update(params[i], transformed=transformed,
+                             includes_fixed=includes_fixed)
+                for name in _MATRICES:
+                    value = getattr(ssm, '_' + name)
+                    if i == 0:
+                        out[name] = np.zeros((n_series,) + value.shape)
+                    elif value.shape != out[name].shape[1:]:
+                        raise ValueError('The shape of the `%s` matrix'
+                                         ' changed across parameter vectors.'
+                                         % name)
+                    out[name][i] = value
+
+                a, Pinf, Pstar = ssm.initialization(model=ssm)
+                if np.any(Pinf != 0):
+                    raise NotImplementedError(
+                        'Batched filtering does not support exact diffuse'
+                        ' initialization. Use approximate diffuse'
+                        ' initialization instead.')
+                if i == 0:
+                    out['initial_state'] = np.zeros((n_series, self.k_states))
+                    out['initial_state_cov'] = np.zeros(
+                        (n_series, self.k_states, self.k_states))
+                out['initial_state'][i] = a
+                out['initial_state_cov'][i] = Pstar
+        finally:
+            for name in _MATRICES:
+                ssm[name] = saved[name]
+            ssm.initialization = initialization
+
+        return Bunch(**out)
+
+    def filter(self, endog, params, transformed=True, includes_fixed=False,
+               matrices=None):
+        r"""
+        Apply the Kalman filter to each series in the batch
+
+        Parameters
+        ----------
+        endog : array_like
+            Observed series, with shape (n_series, nobs, k_endog). If
+            `k_endog` is one, an array with shape (n_series, nobs) is also
+            accepted.
+        params : array_like
+            Parameters for each series, with shape (n_series, k_params). A
+            one-dimensional array is used for every series.
+        transformed : bool, optional
+            Whether or not `params` is already transformed. Default is True.
+        includes_fixed : bool, optional
+            If parameters were previously fixed with the `fix_params` method,
+            this argument describes whether or not `params` also includes
+            the fixed parameters, in addition to the free parameters. Default
+            is False.
+        matrices : Bunch, optional
+            Stacked system matrices, as returned by `system_matrices`. If
+            given, `params` is ignored.
+
+        Returns
+        -------
+        results : Bunch
+            Contains the per-period loglikelihood `llf_obs` (n_series, nobs),
+            the one-step-ahead `forecasts` and `forecasts_error`
+            (n_series, nobs, k_endog) and the `predicted_state`
+            (n_series, nobs + 1, k_states).
+        """
+        endog = self._validate_endog(endog)
+        n_series, nobs, k_endog = endog.shape
+        if matrices is None:
+            params = self._validate_params(params, n_series)
+            matrices = self.system_matrices(params, transformed=transformed,
+                                            includes_fixed=includes_fixed)
+
+        k_states = self.k_states
+        tv = {}
+        for name in _MATRICES:
+            n_t = matrices[name].shape[-1]
+            if n_t not in (1, nobs):
+                raise ValueError('Time-varying `%s` matrix has %d periods'
+                                 ' but endog has %d.' % (name, n_t, nobs))
+            tv[name] = n_t > 1
+
+        # Selected state covariance only needs to be recomputed if either
+        # component is time-varying
+        def selected_state_cov(t):
+            R = matrices['selection'][..., t if tv['selection'] else 0]
+            Q = matrices['state_cov'][..., t if tv['state_cov'] else 0]
+            return R @ Q @ np.swapaxes(R, 1, 2)
+
+        RQR = selected_state_cov(0)
+
+        llf_obs = np.zeros((n_series, nobs))
+        forecasts = np.zeros((n_series, nobs, k_endog))
+        forecasts_error = np.zeros((n_series, nobs, k_endog))
+        predicted_state = np.zeros((n_series, nobs + 1, k_states))
+
+        a = matrices['initial_state'].copy()
+        P = matrices['initial_state_cov'].copy()
+        predicted_state[:, 0] = a
+        log_2pi = np.log(2 * np.pi)
+        eye = np.eye(k_endog)
+
+        for t in range(nobs):
+            Z = matrices['design'][..., t if tv['design'] else 0]
+            d = matrices['obs_intercept'][..., t if tv['obs_intercept'] else 0]
+            H = matrices['obs_cov'][..., t if tv['obs_cov'] else 0]
+            T = matrices['transition'][..., t if tv['transition'] else 0]
+            c = matrices['state_intercept'][
+                ..., t if tv['state_intercept'] else 0]
+            if t > 0 and (tv['selection'] or tv['state_cov']):
+                RQR = selected_state_cov(t)
+
+            y = endog[:, t]
+            forecast = d + np.einsum('nij,nj->ni', Z, a)
+            forecasts[:, t] = forecast
+
+            # Missing elements are handled by zeroing the corresponding rows
+            # of the design matrix and replacing the corresponding block of
+            # the forecast error covariance matrix by the identity, so that
+            # they contribute nothing to the update or the loglikelihood.
+            missing = np.isnan(y)
+            any_missing = missing.any()
+            if any_missing:
+                Z = np.where(missing[..., None], 0, Z)
+                y = np.where(missing, forecast, y)
+                observed = ~missing
+                H = np.where(observed[:, :, None] & observed[:, None, :],
+                             H, 0)
+                H = H + missing[:, :, None] * eye
+                k_obs = observed.sum(axis=1)
+            else:
+                k_obs = k_endog
+
+            v = y - forecast
+            forecasts_error[:, t] = np.where(missing, np.nan, v)
+            ZP = Z @ P
+            F = ZP @ np.swapaxes(Z, 1, 2) + H
+
+            if k_endog == 1:
+                f = F[:, 0, 0]
+                valid = f > 0
+                f = np.where(valid, f, 1)
+                logdet = np.log(f)
+                w = v[:, 0] / np.sqrt(f)
+                quad = w**2
+                W = ZP / np.sqrt(f)[:, None, None]
+                w = w[:, None]
+            else:
+                F = (F + np.swapaxes(F, 1, 2)) / 2
+                valid = np.ones(n_series, dtype=bool)
+                try:
+                    L = np.linalg.cholesky(F)
+                except np.linalg.LinAlgError:
+                    valid = np.linalg.eigvalsh(F)[:, 0] > 0
+                    F[~valid] = eye
+                    L = np.linalg.cholesky(F)
+                logdet = 2 * np.log(np.diagonal(L, axis1=1, axis2=2)).sum(1)
+                # Premultiply the forecast error and Z P by L^{-1}, so that
+                # the updates below only involve inner products
+                tmp = np.linalg.solve(L, np.concatenate([v[..., None], ZP],
+                                                        axis=2))
+                w = tmp[..., 0]
+                W = tmp[..., 1:]
+                quad = (w**2).sum(axis=1)
+
+            llf = -0.5 * (k_obs * log_2pi + logdet + quad)
+            llf_obs[:, t] = np.where(valid, llf, np.nan)
+
+            # Filtered state and covariance
+            Wt = np.swapaxes(W, 1, 2)
+            a_filt = a + np.einsum('nij,nj->ni', Wt, w)
+            P_filt = P - Wt @ W
+
+            # Predicted state and covariance
+            a = c + np.einsum('nij,nj->ni', T, a_filt)
+            P = T @ P_filt @ np.swapaxes(T, 1, 2) + RQR
+            P = (P + np.swapaxes(P, 1, 2)) / 2
+            predicted_state[:, t + 1] = a
+
+        return Bunch(llf_obs=llf_obs, forecasts=forecasts,
+                     forecasts_error=forecasts_error,
+                     predicted_state=predicted_state)
+
+    def loglikeobs(self, endog, params, transformed=True,
+                   includes_fixed=False):
+        """
+        Loglikelihood contribution of each period for each series
+
+        Parameters
+        ----------
+        endog : array_like
+            Observed series, with shape (n_series, nobs, k_endog).
+        params : array_like
+            Parameters for each series, with shape (n_series, k_params).
+        transformed : bool, optional
+            Whether or not `params` is already transformed. Default is True.
+        includes_fixed : bool, optional
+            Whether or not `params` includes fixed parameters. Default is
+            False.
+
+        Returns
+        -------
+        llf_obs : ndarray
+            Array with shape (n_series, nobs).
+        """
+        return self.filter(endog, params, transformed=transformed,
+                           includes_fixed=includes_fixed).llf_obs
+
+    def loglike(self, endog, params, transformed=True, includes_fixed=False):
+        """
+        Loglikelihood of each series
+
+        Parameters
+        ----------
+        endog : array_like
+            Observed series, with shape (n_series, nobs, k_endog).
+        params : array_like
+            Parameters for each series, with shape (n_series, k_params).
+        transformed : bool, optional
+            Whether or not `params` is already transformed. Default is True.
+        includes_fixed : bool, optional
+            Whether or not `params` includes fixed parameters. Default is
+            False.
+
+        Returns
+        -------
+        llf : ndarray
+            Array with shape (n_series,). The first `loglikelihood_burn`
+            periods of the model are excluded, as in `MLEModel.loglike`.
+        """
+        llf_obs = self.loglikeobs(endog, params, transformed=transformed,
+                                  includes_fixed=includes_fixed)
+        return llf_obs[:, self.loglikelihood_burn:].sum(axis=1)
+
+    def score(self, endog, params, transformed=True, includes_fixed=False,
+              approx_centered=False, epsilon=None):
+        """
+        Score (gradient of the loglikelihood) of each series
+
+        Parameters
+        ----------
+        endog : array_like
+            Observed series, with shape (n_series, nobs, k_endog).
+        params : array_like
+            Parameters for each series, with shape (n_series, k_params).
+        transformed : bool, optional
+            Whether or not `params` is already transformed. Default is True.
+        includes_fixed : bool, optional
+            Whether or not `params` includes fixed parameters. Default is
+            False.
+        approx_centered : bool, optional
+            Whether to use centered finite differences. Default is False.
+        epsilon : float, optional
+            Step size. If None, a step size based on the magnitude of each
+            parameter is used.
+
+        Returns
+        -------
+        score : ndarray
+            Array with shape (n_series, k_params).
+
+        Notes
+        -----
+        The loglikelihood at all of the perturbed parameter vectors is
+        evaluated in a single batched filter pass, with each series repeated
+        once per perturbation.
+        """
+        endog = self._validate_endog(endog)
+        n_series = endog.shape[0]
+        params = self._validate_params(params, n_series)
+        k_params = params.shape[1]
+
+        s = 3. if approx_centered else 2.
+        if epsilon is None:
+            h = EPS**(1. / s) * np.maximum(np.abs(params), 0.1)
+        else:
+            h = np.full(params.shape, float(epsilon))
+
+        # Perturbations, stacked as (n_series, n_perturb, k_params)
+        eye = np.eye(k_params)
+        steps = h[:, None, :] * eye[None, :, :]
+        if approx_centered:
+            perturbed = np.concatenate([params[:, None] + steps,
+                                        params[:, None] - steps], axis=1)
+        else:
+            perturbed = np.concatenate([params[:, None],
+                                        params[:, None] + steps], axis=1)
+        n_perturb = perturbed.shape[1]
+
+        llf = self.loglike(
+            np.repeat(endog, n_perturb, axis=0),
+            perturbed.reshape(n_series * n_perturb, k_params),
+            transformed=transformed, includes_fixed=includes_fixed)
+        llf = llf.reshape(n_series, n_perturb)
+
+        if approx_centered:
+            return (llf[:, :k_params] - llf[:, k_params:]) / (2 * h)
+        return (llf[:, 1:] - llf[:, :1]) / h
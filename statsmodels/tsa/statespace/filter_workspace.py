@@ -0,0 +1,157 @@
+"""
+Persistent Kalman filter workspace
+
+Evaluates the loglikelihood of a state space model for many parameter
+vectors while reusing the same system matrix buffers and the same compiled
+filter objects across calls.
+
+License: Simplified-BSD
+"""
+import numpy as np
+
+from .kalman_filter import (
+    MEMORY_CONSERVE,
+    MEMORY_NO_LIKELIHOOD,
+    _filter_loglike,
+)
+
+_MATRICES = ['design', 'obs_intercept', 'obs_cov', 'transition',
+             'state_intercept', 'selection', 'state_cov']
+
+
+class FilterWorkspace:
+    r"""
+    Reusable Kalman filter for repeated loglikelihood evaluations
+
+    Parameters
+    ----------
+    model : MLEModel
+        Model instance (e.g. a `SARIMAX` or `UnobservedComponents` model)
+        whose loglikelihood is evaluated. The workspace takes over the
+        storage of the system matrices of ``model.ssm``.
+
+    Notes
+    -----
+    `MLEModel.loglike` copies all system matrices into dtype-specific arrays
+    and checks whether the compiled statespace and filter objects must be
+    re-created on every call. When the same model is evaluated many times,
+    e.g. to re-estimate it whenever new data arrive, this setup can cost more
+    than running the filter itself.
+
+    The workspace allocates Fortran-ordered float64 buffers for the
+    observations and the system matrices once, creates the compiled
+    statespace and Kalman filter objects on these buffers, and installs the
+    buffers as the system matrices of ``model.ssm``. Since `MLEModel.update`
+    writes the parameters into slices of the system matrices, each call to
+    `loglike` only rewrites the entries that depend on the parameters. A
+    matrix that the model replaces as a whole is copied into its buffer,
+    and the compiled objects are only re-created if the shape of a system
+    matrix or the `loglikelihood_burn` changes.
+
+    The filter settings (filter method, inversion method, etc.) of
+    ``model.ssm`` are read at each call, and only the loglikelihood is
+    stored by the filter. The observations are copied when the workspace is
+    created, so that a workspace must be created again after the data of the
+    model changed.
+
+    Complex-step differentiation is not supported, so that the model must
+    have real-valued data.
+
+    Examples
+    --------
+    >>> mod = sm.tsa.SARIMAX(endog, order=(1, 0, 1))
+    >>> workspace = FilterWorkspace(mod)
+    >>> llf = workspace.loglike(params)
+    """
+
+    def __init__(self, model):
+        ssm = model.ssm
+        if ssm._complex_endog:
+            raise NotImplementedError('The filter workspace is not available'
+                                      ' for complex data.')
+        self.model = model
+        self._obs = np.array(ssm.obs, dtype=np.float64, order='F')
+        self._create()
+
+    def _create(self):
+        ssm = self.model.ssm
+        self._matrices = {}
+        for name in _MATRICES:
+            matrix = np.array(np.real(getattr(ssm, '_' + name)),
+                              dtype=np.float64, order='F')
+            setattr(ssm, '_' + name, matrix)
+            self._matrices[name] = matrix
+
+        self._conserve_memory = MEMORY_CONSERVE ^ MEMORY_NO_LIKELIHOOD
+        self._loglikelihood_burn = ssm.loglikelihood_burn
+        self._statespace = ssm.prefix_statespace_map['d'](
+            self._obs, *[self._matrices[name] for name in _MATRICES])
+        self._kfilter = ssm.prefix_kalman_filter_map['d'](
+            self._statespace, ssm.filter_method, ssm.inversion_method,
+            ssm.stability_method, self._conserve_memory, ssm.filter_timing,
+            ssm.tolerance, self._loglikelihood_burn)
+
+    def _sync(self):
+        # Copy the matrices that were replaced as a whole into the buffers
+        ssm = self.model.ssm
+        for name in _MATRICES:
+            buffer = self._matrices[name]
+            matrix = getattr(ssm, '_' + name)
+            if matrix is buffer:
+                continue
+            if matrix.shape != buffer.shape:
+                self._create()
+                return
+            np.copyto(buffer, np.real(matrix))
+            setattr(ssm, '_' + name, buffer)
+
+        if ssm.loglikelihood_burn != self._loglikelihood_burn:
+            self._create()
+            return
+
+        kfilter = self._kfilter
+        kfilter.set_filter_method(ssm.filter_method, False)
+        kfilter.inversion_method = ssm.inversion_method
+        kfilter.stability_method = ssm.stability_method
+        kfilter.filter_timing = ssm.filter_timing
+        kfilter.tolerance = ssm.tolerance
+
+    def loglike(self, params, transformed=True, includes_fixed=False):
+        """
+        Loglikelihood evaluation
+
+        Parameters
+        ----------
+        params : array_like
+            Array of parameters at which to evaluate the loglikelihood
+            function.
+        transformed : bool, optional
+            Whether or not `params` is already transformed. Default is True.
+        includes_fixed : bool, optional
+            If parameters were previously fixed with the `fix_params` method,
+            this argument describes whether or not `params` also includes
+            the fixed parameters, in addition to the free parameters. Default
+            is False.
+
+        Returns
+        -------
+        float
+            The joint loglikelihood, identical to ``model.loglike(params)``.
+        """
+        model = self.model
+        ssm = model.ssm
+        params = model.handle_params(params, transformed=transformed,
+                                     includes_fixed=includes_fixed)
+        model.update(params, transformed=True, includes_fixed=True)
+        self._sync()
+
+        if ssm.initialization is None:
+            raise RuntimeError('Statespace model not initialized.')
+        if not ssm.initialization.initialized:
+            raise RuntimeError('Initialization is incomplete.')
+        self._statespace.initialize(ssm.initialization)
+        self._kfilter()
+
+        return _filter_loglike(self._kfilter, ssm.filter_method, ssm.k_endog,
+                               self._loglikelihood_burn,
+                               self._conserve_memory)
@@ -749,7 +749,8 @@ class Initialization:
                 init(index=tuple(np.array(index)[block_index, ]),
                      model=model, initial_state_mean=initial_state_mean,
                      initial_diffuse_state_cov=initial_diffuse_state_cov,
-                     initial_stationary_state_cov=initial_stationary_state_cov)
+                     initial_stationary_state_cov=initial_stationary_state_cov,
+                     complex_step=complex_step)
 
         return (initial_state_mean, initial_diffuse_state_cov,
                 initial_stationary_state_cov)
@@ -1001,38 +1001,8 @@ class KalmanFilter(Representation):
         kfilter = self._filter(**kwargs)
         loglikelihood_burn = kwargs.get('loglikelihood_burn',
                                         self.loglikelihood_burn)
-        if not (kwargs['conserve_memory'] & MEMORY_NO_LIKELIHOOD):
-            loglike = np.sum(kfilter.loglikelihood[loglikelihood_burn:])
-        else:
-            loglike = np.sum(kfilter.loglikelihood)
-
-        # Need to modify the computed log-likelihood to incorporate the
-        # MLE scale.
-        if self.filter_method & FILTER_CONCENTRATED:
-            d = max(loglikelihood_burn, kfilter.nobs_diffuse)
-            nobs_k_endog = np.sum(
-                self.k_endog -
-                np.array(self._statespace.nmissing)[d:])
-
-            # In the univariate case, we need to subtract observations
-            # associated with a singular forecast error covariance matrix
-            nobs_k_endog -= kfilter.nobs_kendog_univariate_singular
-
-            if not (kwargs['conserve_memory'] & MEMORY_NO_LIKELIHOOD):
-                scale = np.sum(kfilter.scale[d:]) / nobs_k_endog
-            else:
-                scale = kfilter.scale[0] / nobs_k_endog
-
-            loglike += -0.5 * nobs_k_endog
-
-            # Now need to modify this for diffuse initialization, since for
-            # diffuse periods we only need to add in the scale value part if
-            # the diffuse forecast error covariance matrix element was singular
-            if kfilter.nobs_diffuse > 0:
-                nobs_k_endog -= kfilter.nobs_kendog_diffuse_nonsingular
-
-            loglike += -0.5 * nobs_k_endog * np.log(scale)
-        return loglike
+        return _filter_loglike(kfilter, self.filter_method, self.k_endog,
+                               loglikelihood_burn, kwargs['conserve_memory'])
 
     def loglikeobs(self, **kwargs):
         r"""
@@ -1339,6 +1309,44 @@ class KalmanFilter(Representation):
         return irf[1:]
 
 
+def _filter_loglike(kfilter, filter_method, k_endog, loglikelihood_burn,
+                    conserve_memory):
+    """
+    Joint loglikelihood from a Cython Kalman filter that has been run
+    """
+    if not (conserve_memory & MEMORY_NO_LIKELIHOOD):
+        loglike = np.sum(kfilter.loglikelihood[loglikelihood_burn:])
+    else:
+        loglike = np.sum(kfilter.loglikelihood)
+
+    # Need to modify the computed log-likelihood to incorporate the
+    # MLE scale.
+    if filter_method & FILTER_CONCENTRATED:
+        d = max(loglikelihood_burn, kfilter.nobs_diffuse)
+        nobs_k_endog = np.sum(
+            k_endog - np.array(kfilter.model.nmissing)[d:])
+
+        # In the univariate case, we need to subtract observations
+        # associated with a singular forecast error covariance matrix
+        nobs_k_endog -= kfilter.nobs_kendog_univariate_singular
+
+        if not (conserve_memory & MEMORY_NO_LIKELIHOOD):
+            scale = np.sum(kfilter.scale[d:]) / nobs_k_endog
+        else:
+            scale = kfilter.scale[0] / nobs_k_endog
+
+        loglike += -0.5 * nobs_k_endog
+
+        # Now need to modify this for diffuse initialization, since for
+        # diffuse periods we only need to add in the scale value part if
+        # the diffuse forecast error covariance matrix element was singular
+        if kfilter.nobs_diffuse > 0:
+            nobs_k_endog -= kfilter.nobs_kendog_diffuse_nonsingular
+
+        loglike += -0.5 * nobs_k_endog * np.log(scale)
+    return loglike
+
+
 class FilterResults(FrozenRepresentation):
     """
     Results from applying the Kalman filter to a state space model.
@@ -34,6 +34,7 @@ from .simulation_smoother import SimulationSmoother
 from .kalman_smoother import SmootherResults
 from .kalman_filter import INVERT_UNIVARIATE, SOLVE_LU, MEMORY_CONSERVE
 from .initialization import Initialization
+from ._kalman_score import kalman_score
 from .tools import prepare_exog, concat, _safe_cond, get_impact_dates
 
 
@@ -609,22 +610,26 @@ class MLEModel(tsbase.TimeSeriesModel):
         return_params : bool, optional
             Whether or not to return only the array of maximizing parameters.
             Default is False.
-        optim_score : {'harvey', 'approx'} or None, optional
+        optim_score : {'harvey', 'approx', 'analytic'} or None, optional
             The method by which the score vector is calculated. 'harvey' uses
             the method from Harvey (1989), 'approx' uses either finite
             difference or complex step differentiation depending upon the
-            value of `optim_complex_step`, and None uses the built-in gradient
-            approximation of the optimizer. Default is None. This keyword is
-            only relevant if the optimization method uses the score.
+            value of `optim_complex_step`, 'analytic' differentiates the
+            Kalman filter recursions (see `score`) and None uses the built-in
+            gradient approximation of the optimizer. Default is None. This
+            keyword is only relevant if the optimization method uses the
+            score. With 'analytic' and the 'lbfgs' method, the loglikelihood
+            and the score are computed together in a single pass.
         optim_complex_step : bool, optional
             Whether or not to use complex step differentiation when
             approximating the score; if False, finite difference approximation
             is used. Default is True. This keyword is only relevant if
             `optim_score` is set to 'harvey' or 'approx'.
-        optim_hessian : {'opg', 'oim', 'approx'}, optional
+        optim_hessian : {'opg', 'oim', 'analytic', 'approx'}, optional
             The method by which the Hessian is numerically approximated. 'opg'
             uses outer product of gradients, 'oim' uses the information
-            matrix formula from Harvey (1989), and 'approx' uses numerical
+            matrix formula from Harvey (1989), 'analytic' uses the same
+            formula with analytic derivatives, and 'approx' uses numerical
             approximation. This keyword is only relevant if the
             optimization method uses the Hessian matrix.
         low_memory : bool, optional
@@ -702,6 +707,15 @@ class MLEModel(tsbase.TimeSeriesModel):
             if optim_hessian is not None:
                 flags['hessian_method'] = optim_hessian
             fargs = (flags,)
+            if optim_score == 'analytic' and method == 'lbfgs':
+                # One filter pass for both the objective and the gradient,
+                # with the same scaling as in `LikelihoodModel.fit`
+                nobs = self.endog.shape[0]
+
+                def loglike_and_score(params, *args):
+                    llf, score = self.loglike_and_score(params, *args)
+                    return llf / nobs, score / nobs
+                kwargs.setdefault('loglike_and_score', loglike_and_score)
             mlefit = super().fit(start_params, method=method,
                                  fargs=fargs,
                                  maxiter=maxiter,
@@ -1251,6 +1265,10 @@ class MLEModel(tsbase.TimeSeriesModel):
         return approx_fprime(params, self.loglike, kwargs=kwargs,
                              centered=approx_centered)
 
+    def _score_analytic(self, params, **kwargs):
+        res = kalman_score(self, params)
+        return res.score_obs[self.ssm.loglikelihood_burn:].sum(axis=0)
+
     def _score_harvey(self, params, approx_complex_step=True, **kwargs):
         score_obs = self._score_obs_harvey(
             params, approx_complex_step=approx_complex_step, **kwargs)
@@ -1347,8 +1365,18 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         Notes
         -----
-        This is a numerical approximation, calculated using first-order complex
-        step differentiation on the `loglike` method.
+        By default, this is a numerical approximation, calculated using
+        first-order complex step differentiation on the `loglike` method.
+
+        With `method='analytic'`, the derivatives of the Kalman filter
+        recursions are computed along with the filter itself, so that the
+        score requires a single pass over the data instead of one filter pass
+        per parameter. Only the mapping from parameters to the system
+        matrices, which does not involve filtering, is differentiated by
+        complex step. This is much faster for models with many parameters,
+        but is not available with exact diffuse initialization, the
+        collapsed filter, the alternate filter timing, or when the scale is
+        concentrated out of the likelihood.
 
         Both args and kwargs are necessary because the optimizer from
         `fit` must call this function and only supports passing arguments via
@@ -1382,6 +1410,8 @@ class MLEModel(tsbase.TimeSeriesModel):
             kwargs['includes_fixed'] = True
             score = self._score_harvey(
                 params, approx_complex_step=approx_complex_step, **kwargs)
+        elif method == 'analytic':
+            score = self._score_analytic(params, **kwargs)
         elif method == 'approx' and approx_complex_step:
             kwargs['includes_fixed'] = True
             score = self._score_complex_step(params, **kwargs)
@@ -1400,6 +1430,51 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         return score
 
+    def loglike_and_score(self, params, *args, **kwargs):
+        """
+        Compute the loglikelihood and the score in a single filter pass
+
+        Parameters
+        ----------
+        params : array_like
+            Array of parameters at which to evaluate the loglikelihood and
+            the score.
+        *args
+            Additional positional arguments, as in the `score` method.
+        **kwargs
+            Additional keyword arguments, as in the `score` method.
+
+        Returns
+        -------
+        llf : float
+            The loglikelihood, as returned by `loglike`.
+        score : ndarray
+            The analytic score, see `score` with `method='analytic'`.
+        """
+        (transformed, includes_fixed, _, _, _, kwargs) = (
+            _handle_args(MLEModel._score_param_names,
+                         MLEModel._score_param_defaults, *args, **kwargs))
+
+        out = self.handle_params(
+            params, transformed=transformed, includes_fixed=includes_fixed,
+            return_jacobian=not transformed)
+        if transformed:
+            params = out
+        else:
+            params, transform_score = out
+
+        res = kalman_score(self, params)
+        burn = self.ssm.loglikelihood_burn
+        llf = res.llf_obs[burn:].sum()
+        score = res.score_obs[burn:].sum(axis=0)
+
+        if not transformed:
+            score = np.dot(transform_score, score)
+        if self._has_fixed_params and not includes_fixed:
+            score = score[self._free_params_index]
+
+        return llf, score
+
     def score_obs(self, params, method='approx', transformed=True,
                   includes_fixed=False, approx_complex_step=None,
                   approx_centered=False, **kwargs):
@@ -1420,9 +1495,25 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         Notes
         -----
-        This is a numerical approximation, calculated using first-order complex
-        step differentiation on the `loglikeobs` method.
-        """
+        By default, this is a numerical approximation, calculated using
+        first-order complex step differentiation on the `loglikeobs` method.
+        With `method='analytic'`, the derivatives of the Kalman filter
+        recursions are used instead, see `score`.
+        """
+        if method == 'analytic':
+            out = self.handle_params(params, transformed=transformed,
+                                     includes_fixed=includes_fixed,
+                                     return_jacobian=not transformed)
+            if transformed:
+                params = out
+            else:
+                params, transform_score = out
+            score = kalman_score(self, params).score_obs
+            score[:self.ssm.loglikelihood_burn] = 0
+            if not transformed:
+                score = np.dot(score, transform_score.T)
+            return score
+
         if not transformed and approx_complex_step:
             raise ValueError("Cannot use complex-step approximations to"
                              " calculate the score at each observation"
@@ -1481,7 +1572,10 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         Notes
         -----
-        This is a numerical approximation.
+        This is a numerical approximation. With `method='analytic'`, the
+        information matrix formula of Harvey (1989) is evaluated using the
+        analytic partial derivatives described in `score`, in a single pass
+        of the filter.
 
         Both args and kwargs are necessary because the optimizer from
         `fit` must call this function and only supports passing arguments via
@@ -1513,6 +1607,9 @@ class MLEModel(tsbase.TimeSeriesModel):
                 params, transformed=transformed,
                 approx_complex_step=approx_complex_step,
                 approx_centered=approx_centered, **kwargs)
+        elif method == 'analytic':
+            hessian = self._hessian_analytic(
+                params, transformed=transformed, **kwargs)
         elif method == 'opg':
             hessian = self._hessian_opg(
                 params, transformed=transformed,
@@ -1535,6 +1632,27 @@ class MLEModel(tsbase.TimeSeriesModel):
         """
         return -self.observed_information_matrix(params, **kwargs)
 
+    def _hessian_analytic(self, params, transformed=True,
+                          includes_fixed=False, **kwargs):
+        """
+        Hessian matrix computed using the Harvey (1989) information matrix
+        with analytic partial derivatives, in a single filter pass
+        """
+        if not transformed:
+            raise ValueError('The analytic Hessian is only available for'
+                             ' transformed parameters.')
+        params = self.handle_params(params, transformed=True,
+                                    includes_fixed=includes_fixed)
+        res = kalman_score(self, params, return_information=True)
+        hessian = -res.information_matrix / (
+            self.nobs - self.ssm.loglikelihood_burn)
+
+        if self._has_fixed_params and not includes_fixed:
+            free = self._free_params_index
+            hessian = hessian[np.ix_(free, free)]
+
+        return hessian
+
     def _hessian_opg(self, params, **kwargs):
         """
         Hessian matrix computed using the outer product of gradients
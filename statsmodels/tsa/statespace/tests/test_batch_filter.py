@@ -0,0 +1,123 @@
+"""
+Tests for the batched Kalman filter
+
+License: Simplified-BSD
+"""
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+from statsmodels.tsa.statespace import sarimax, varmax
+from statsmodels.tsa.statespace.batch_filter import BatchKalmanFilter
+from statsmodels.tsa.statespace.structural import UnobservedComponents
+
+
+def simulate_arma(n_series, nobs, seed=1234):
+    rs = np.random.RandomState(seed)
+    eps = rs.standard_normal((n_series, nobs + 1))
+    phi = rs.uniform(-0.8, 0.8, size=n_series)
+    endog = np.zeros((n_series, nobs))
+    for t in range(nobs):
+        prev = endog[:, t - 1] if t > 0 else 0
+        endog[:, t] = phi * prev + eps[:, t + 1] + 0.3 * eps[:, t]
+    return endog
+
+
+def test_sarimax_loglike():
+    endog = simulate_arma(5, 60)
+    endog[1, 10:13] = np.nan
+    mod = sarimax.SARIMAX(endog[0], order=(1, 0, 1))
+    batch = BatchKalmanFilter(mod)
+
+    rs = np.random.RandomState(0)
+    params = np.c_[rs.uniform(-0.7, 0.7, 5), rs.uniform(-0.5, 0.5, 5),
+                   rs.uniform(0.5, 2, 5)]
+
+    llf = batch.loglike(endog, params)
+    llf_obs = batch.loglikeobs(endog, params)
+    for i in range(5):
+        mod_i = sarimax.SARIMAX(endog[i], order=(1, 0, 1))
+        assert_allclose(llf[i], mod_i.loglike(params[i]))
+        assert_allclose(llf_obs[i], mod_i.loglikeobs(params[i]), atol=1e-10)
+
+
+def test_sarimax_score():
+    endog = simulate_arma(3, 80)
+    mod = sarimax.SARIMAX(endog[0], order=(1, 0, 0))
+    batch = BatchKalmanFilter(mod)
+    params = np.array([[0.5, 1.], [-0.2, 0.8], [0.1, 1.5]])
+
+    score = batch.score(endog, params, approx_centered=True)
+    for i in range(3):
+        mod_i = sarimax.SARIMAX(endog[i], order=(1, 0, 0))
+        assert_allclose(score[i], mod_i.score(params[i]), rtol=1e-5)
+
+
+def test_unobserved_components():
+    endog = simulate_arma(4, 50).cumsum(axis=1)
+    mod = UnobservedComponents(endog[0], 'llevel')
+    batch = BatchKalmanFilter(mod)
+    params = np.array([[1., 0.5], [0.5, 1.], [2., 0.1], [0.3, 0.3]])
+
+    llf = batch.loglike(endog, params)
+    for i in range(4):
+        mod_i = UnobservedComponents(endog[i], 'llevel')
+        assert_allclose(llf[i], mod_i.loglike(params[i]))
+
+
+def test_model_unchanged():
+    # building the batch matrices does not leave the last series' params
+    # in the model
+    endog = simulate_arma(3, 50)
+    mod = sarimax.SARIMAX(endog[0], order=(1, 0, 1))
+    mod.update([0.2, 0.1, 1.5])
+    llf = mod.ssm.loglike()
+    design = mod.ssm['design'].copy()
+    transition = mod.ssm['transition'].copy()
+    initial_state_cov = mod.ssm.initialization(model=mod.ssm)[2]
+
+    batch = BatchKalmanFilter(mod)
+    params = np.array([[0.5, -0.3, 1.], [-0.4, 0.2, 0.8], [0.6, 0.4, 2.]])
+    batch.loglike(endog, params)
+
+    assert_allclose(mod.ssm['design'], design)
+    assert_allclose(mod.ssm['transition'], transition)
+    assert_allclose(mod.ssm.initialization(model=mod.ssm)[2],
+                    initial_state_cov)
+    assert_allclose(mod.ssm.loglike(), llf)
+
+
+def test_multivariate_partial_missing():
+    rs = np.random.RandomState(1234)
+    endog = rs.standard_normal((3, 40, 2))
+    endog[0, 5, 0] = np.nan
+    endog[1, 7, 1] = np.nan
+    endog[2, 9] = np.nan
+    mod = varmax.VARMAX(endog[0], order=(1, 0), trend='n')
+    batch = BatchKalmanFilter(mod)
+    params = mod.start_params
+    params = np.array([params, params * 0.9, params * 1.1])
+
+    llf = batch.loglike(endog, params)
+    for i in range(3):
+        mod_i = varmax.VARMAX(endog[i], order=(1, 0), trend='n')
+        assert_allclose(llf[i], mod_i.loglike(params[i]))
+
+
+def test_invalid():
+    endog = simulate_arma(2, 20)
+    mod = sarimax.SARIMAX(endog[0], order=(1, 0, 0))
+    batch = BatchKalmanFilter(mod)
+    with pytest.raises(ValueError, match='Invalid endog shape'):
+        batch.loglike(endog[..., None, None], [0.5, 1.])
+    with pytest.raises(ValueError, match='Invalid params shape'):
+        batch.loglike(endog, np.zeros((3, 2)))
+
+    mod = UnobservedComponents(endog[0], 'llevel', use_exact_diffuse=True)
+    batch = BatchKalmanFilter(mod)
+    with pytest.raises(NotImplementedError, match='exact diffuse'):
+        batch.loglike(endog, [1., 1.])
+
+    mod = sarimax.SARIMAX(endog[0], order=(1, 0, 0), concentrate_scale=True)
+    with pytest.raises(NotImplementedError):
+        BatchKalmanFilter(mod)
@@ -0,0 +1,126 @@
+"""
+Tests for the persistent Kalman filter workspace
+
+License: Simplified-BSD
+"""
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.tsa.statespace import sarimax, varmax
+from statsmodels.tsa.statespace.filter_workspace import FilterWorkspace
+from statsmodels.tsa.statespace.structural import UnobservedComponents
+
+
+@pytest.fixture(scope="module")
+def data():
+    rs = np.random.RandomState(1234)
+    endog = np.cumsum(rs.standard_normal((100, 2)), axis=0) * 0.1
+    endog += rs.standard_normal((100, 2))
+    exog = rs.standard_normal((100, 2))
+    return endog, exog
+
+
+def check_loglike(mod, params):
+    workspace = FilterWorkspace(mod)
+    workspace.loglike(params)
+    buffers = dict(workspace._matrices)
+    for scale in [1., 0.9, 1.1, 1.]:
+        llf = workspace.loglike(params * scale)
+        assert_allclose(llf, mod.loglike(params * scale))
+    # The buffers are reused
+    for name, buffer in buffers.items():
+        assert workspace._matrices[name] is buffer
+
+
+def test_sarimax(data):
+    endog, _ = data
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 1))
+    check_loglike(mod, np.array([0.5, 0.2, 1.5]))
+
+
+def test_sarimax_exog(data):
+    # The regression effects replace obs_intercept at each update
+    endog, exog = data
+    mod = sarimax.SARIMAX(endog[:, 0], exog=exog, order=(1, 0, 0),
+                          trend='c')
+    check_loglike(mod, np.array([0.1, 0.5, -0.2, 0.5, 1.5]))
+
+
+def test_sarimax_concentrated(data):
+    endog, _ = data
+    endog = endog[:, 0].copy()
+    endog[10:15] = np.nan
+    mod = sarimax.SARIMAX(endog, order=(2, 1, 1), concentrate_scale=True)
+    check_loglike(mod, np.array([0.5, -0.2, 0.3]))
+
+
+def test_unobserved_components(data):
+    # Diffuse initialization
+    endog, _ = data
+    mod = UnobservedComponents(endog[:, 0], 'lltrend')
+    check_loglike(mod, np.array([1., 0.5, 0.1]))
+
+
+def test_varmax(data):
+    endog, _ = data
+    mod = varmax.VARMAX(endog, order=(1, 0))
+    params = np.r_[0., 0., 0.5, 0.1, -0.2, 0.4, 1., 0.2, 1.]
+    check_loglike(mod, params)
+
+
+def test_fixed_params(data):
+    endog, _ = data
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 1))
+    workspace = FilterWorkspace(mod)
+    with mod.fix_params({'ma.L1': 0.2}):
+        assert_allclose(workspace.loglike([0.5, 1.5]),
+                        mod.loglike([0.5, 1.5]))
+        assert_allclose(
+            workspace.loglike([0.5, 0.2, 1.5], includes_fixed=True),
+            mod.loglike([0.5, 1.5]))
+
+
+def test_untransformed(data):
+    endog, _ = data
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 1))
+    workspace = FilterWorkspace(mod)
+    params = np.array([2., -1., 0.5])
+    assert_allclose(workspace.loglike(params, transformed=False),
+                    mod.loglike(params, transformed=False))
+
+
+def test_filter_settings(data):
+    # Changes of the filter settings and of the likelihood burn are applied
+    endog, _ = data
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 1))
+    workspace = FilterWorkspace(mod)
+    params = np.array([0.5, 0.2, 1.5])
+    workspace.loglike(params)
+
+    mod.ssm.set_inversion_method(solve_lu=True, invert_lu=True)
+    mod.ssm.filter_univariate = True
+    mod.loglikelihood_burn = 5
+    mod.ssm.loglikelihood_burn = 5
+    assert_allclose(workspace.loglike(params), mod.loglike(params))
+    assert_equal(workspace._kfilter.loglikelihood_burn, 5)
+
+
+def test_model_fit_after_workspace(data):
+    # The model can still be used after it was evaluated by the workspace
+    endog, _ = data
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 1))
+    res_desired = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 1)).fit(
+        disp=False)
+    workspace = FilterWorkspace(mod)
+    workspace.loglike(np.array([0.5, 0.2, 1.5]))
+    res = mod.fit(disp=False)
+    assert_allclose(res.params, res_desired.params)
+    assert_allclose(res.llf, res_desired.llf)
+    assert_allclose(workspace.loglike(res.params), res.llf)
+
+
+def test_complex_data():
+    mod = sarimax.SARIMAX(np.arange(10.) + 1j, order=(1, 0, 0))
+    with pytest.raises(NotImplementedError):
+        FilterWorkspace(mod)
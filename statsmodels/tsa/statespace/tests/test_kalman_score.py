@@ -0,0 +1,120 @@
+"""
+Tests for the analytic Kalman filter score
+
+License: Simplified-BSD
+"""
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+from statsmodels.tsa.statespace import dynamic_factor, sarimax, varmax
+from statsmodels.tsa.statespace._kalman_score import kalman_score
+from statsmodels.tsa.statespace.structural import UnobservedComponents
+
+
+@pytest.fixture(scope='module')
+def endog():
+    rs = np.random.RandomState(1234)
+    eps = rs.standard_normal((200, 2))
+    endog = np.zeros((200, 2))
+    for t in range(1, 200):
+        endog[t] = 0.5 * endog[t - 1] + eps[t] + 0.2 * eps[t - 1, ::-1]
+    return endog
+
+
+def check_score(mod, params, rtol=1e-6):
+    assert_allclose(mod.score(params, method='analytic'),
+                    mod.score(params), rtol=rtol, atol=1e-6)
+    burn = mod.ssm.loglikelihood_burn
+    assert_allclose(mod.score_obs(params, method='analytic')[burn:],
+                    mod.score_obs(params)[burn:], rtol=rtol, atol=1e-6)
+    llf, score = mod.loglike_and_score(params)
+    assert_allclose(llf, mod.loglike(params))
+    assert_allclose(score, mod.score(params, method='analytic'))
+
+
+def test_sarimax(endog):
+    y = endog[:, 0].copy()
+    y[[20, 21, 50]] = np.nan
+    mod = sarimax.SARIMAX(y, order=(2, 1, 1), exog=endog[:, 1])
+    params = np.r_[0.3, 0.2, -0.1, 0.4, 1.2]
+    check_score(mod, params)
+
+    # The existing information matrix formula does not skip missing periods
+    mod = sarimax.SARIMAX(endog[:, 0], order=(2, 1, 1), exog=endog[:, 1])
+    assert_allclose(mod.hessian(params, method='analytic'),
+                    mod.hessian(params, method='oim'), rtol=1e-5,
+                    atol=1e-8)
+
+
+def test_sarimax_untransformed(endog):
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 0))
+    params = mod.untransform_params(np.r_[0.5, 1.5])
+    assert_allclose(mod.score(params, transformed=False, method='analytic'),
+                    mod.score(params, transformed=False), rtol=1e-6)
+    assert_allclose(
+        mod.score_obs(params, transformed=False, method='analytic'),
+        mod.score_obs(params, transformed=False), rtol=1e-5, atol=1e-8)
+
+
+def test_varmax_missing(endog):
+    y = endog.copy()
+    y[10, 0] = np.nan
+    y[30] = np.nan
+    mod = varmax.VARMAX(y, order=(1, 0), trend='c')
+    check_score(mod, mod.start_params)
+
+
+def test_unobserved_components(endog):
+    mod = UnobservedComponents(endog[:, 0].cumsum(), 'lltrend')
+    check_score(mod, [1.0, 0.5, 0.1])
+
+
+def test_dynamic_factor(endog):
+    mod = dynamic_factor.DynamicFactor(endog, k_factors=1, factor_order=1)
+    check_score(mod, mod.start_params)
+
+
+def test_fixed_params(endog):
+    mod = sarimax.SARIMAX(endog[:, 0], order=(2, 0, 0),
+                          enforce_stationarity=False)
+    with mod.fix_params({'ar.L2': 0.1}):
+        assert_allclose(mod.score([0.4, 1.1], method='analytic'),
+                        mod.score([0.4, 1.1]), rtol=1e-6)
+
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 1))
+    hessian = mod.hessian([0.5, 0.2, 1.1], method='oim')
+    with mod.fix_params({'ar.L1': 0.5}):
+        assert_allclose(mod.hessian([0.2, 1.1], method='analytic'),
+                        hessian[1:, 1:], rtol=1e-5, atol=1e-8)
+        assert_allclose(mod.hessian([0.5, 0.2, 1.1], method='analytic',
+                                    includes_fixed=True),
+                        hessian, rtol=1e-5, atol=1e-8)
+
+
+def test_partials(endog):
+    mod = varmax.VARMAX(endog, order=(1, 0), trend='n')
+    params = mod.start_params
+    res = kalman_score(mod, params, return_partials=True)
+    desired_v, desired_F = mod._forecasts_error_partial_derivatives(params)
+    assert_allclose(res.partials_forecasts_error, desired_v, atol=1e-8)
+    assert_allclose(res.partials_forecasts_error_cov, desired_F, atol=1e-8)
+
+
+def test_fit(endog):
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 1))
+    res = mod.fit(disp=False)
+    res_analytic = mod.fit(optim_score='analytic', disp=False)
+    assert_allclose(res_analytic.params, res.params, atol=1e-4)
+    assert_allclose(res_analytic.llf, res.llf, rtol=1e-8)
+
+
+def test_invalid(endog):
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 0),
+                          concentrate_scale=True)
+    with pytest.raises(NotImplementedError):
+        mod.score([0.5], method='analytic')
+
+    mod = UnobservedComponents(endog[:, 0], 'llevel', use_exact_diffuse=True)
+    with pytest.raises(NotImplementedError, match='exact diffuse'):
+        mod.score([1., 1.], method='analytic')
@@ -1849,8 +1849,22 @@ def _safe_arma_fit(y, order, model_kw, trend, fit_kw, start_params=None):
         return
 
 
+def _arma_order_ic(y, order, model_kw, trend, fit_kw, ic):
+    res = _safe_arma_fit(y, order, model_kw, trend, fit_kw)
+    if res is None:
+        return None
+    return [getattr(res, criteria) for criteria in ic]
+
+
 def arma_order_select_ic(
-    y, max_ar=4, max_ma=2, ic="bic", trend="c", model_kw=None, fit_kw=None
+    y,
+    max_ar=4,
+    max_ma=2,
+    ic="bic",
+    trend="c",
+    model_kw=None,
+    fit_kw=None,
+    n_jobs=1,
 ):
     """
     Compute information criteria for many ARMA models.
@@ -1872,6 +1886,9 @@ def arma_order_select_ic(
         Keyword arguments to be passed to the ``ARMA`` model.
     fit_kw : dict
         Keyword arguments to be passed to ``ARMA.fit``.
+    n_jobs : int
+        The number of processes used to fit the models. -1 uses all
+        available cores. Default is 1, which fits the models serially.
 
     Returns
     -------
@@ -1890,6 +1907,10 @@ def arma_order_select_ic(
     will be provided in the future. In the meantime, consider passing
     {method : "css"} to fit_kw.
 
+    See ``statsmodels.tsa.arima.order_selection.arima_select_order`` for a
+    search that warm-starts each model from a nested smaller model and can
+    skip models that cannot improve the information criterion.
+
     Examples
     --------
 
@@ -1925,15 +1946,27 @@ def arma_order_select_ic(
     model_kw = {} if model_kw is None else model_kw
     fit_kw = {} if fit_kw is None else fit_kw
     y_arr = array_like(y, "y", contiguous=True)
-    for ar in ar_range:
-        for ma in ma_range:
-            mod = _safe_arma_fit(y_arr, (ar, 0, ma), model_kw, trend, fit_kw)
-            if mod is None:
-                results[:, ar, ma] = np.nan
-                continue
-
-            for i, criteria in enumerate(ic):
-                results[i, ar, ma] = getattr(mod, criteria)
+    if n_jobs == 1:
+        ics = (
+            _arma_order_ic(y_arr, (ar, 0, ma), model_kw, trend, fit_kw, ic)
+            for ar in ar_range
+            for ma in ma_range
+        )
+    else:
+        from statsmodels.tools.parallel import parallel_func
+
+        parallel, p_func, n_jobs = parallel_func(
+            _arma_order_ic, n_jobs, verbose=0
+        )
+        ics = parallel(
+            p_func(y_arr, (ar, 0, ma), model_kw, trend, fit_kw, ic)
+            for ar in ar_range
+            for ma in ma_range
+        )
+    for (ar, ma), values in zip(
+        ((ar, ma) for ar in ar_range for ma in ma_range), ics
+    ):
+        results[:, ar, ma] = np.nan if values is None else values
 
     dfs = [pd.DataFrame(res, columns=ma_range, index=ar_range) for res in results]
 
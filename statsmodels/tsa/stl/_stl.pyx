@@ -88,6 +88,35 @@ from libc.math cimport fabs, sqrt, isnan, NAN
 from statsmodels.tsa.tsatools import freq_to_period
 from statsmodels.tools.validation import array_like
 
+
+cdef double _select(double[::1] x, Py_ssize_t n, Py_ssize_t k) noexcept nogil:
+    """
+    Return the k-th smallest of the first n values, partially sorting x
+    """
+    cdef Py_ssize_t left = 0, right = n - 1, i, j
+    cdef double pivot, tmp
+    while left < right:
+        pivot = x[k]
+        i = left
+        j = right
+        while i <= j:
+            while x[i] < pivot:
+                i += 1
+            while pivot < x[j]:
+                j -= 1
+            if i <= j:
+                tmp = x[i]
+                x[i] = x[j]
+                x[j] = tmp
+                i += 1
+                j -= 1
+        if j < k:
+            left = i
+        if k < i:
+            right = j
+    return x[k]
+
+
 def _is_pos_int(x, odd):
     valid = (isinstance(x, (int, np.integer))
              and not isinstance(x, np.timedelta64))
@@ -325,27 +354,12 @@ cdef class STL(object):
         DecomposeResult
             Estimation results.
         """
-        cdef Py_ssize_t i
-
         if inner_iter is None:
             inner_iter = 2 if self.robust else 5
         if outer_iter is None:
             outer_iter = 15 if self.robust else 0
 
-        self._use_rw = False
-        k = 0
-        for i in range(self.nobs):
-            self._season[i] = self._trend[i] = 0.0
-            self._rw[i] = 1.0
-        while True:
-            self._onestp(inner_iter)
-            k = k + 1
-            if k > outer_iter:
-                break
-            for i in range(self.nobs):
-                self._work[0, i] = self._trend[i] + self._season[i]
-            self._rwts()
-            self._use_rw = True
+        self._fit(inner_iter, outer_iter)
 
         # Return pandas if pandas
         season = np.asarray(self._season)
@@ -364,7 +378,50 @@ cdef class STL(object):
 
         return DecomposeResult(self.endog, season, trend, resid, rw)
 
-    cdef void _onestp(self, int inner_iter):
+    def _fit_batch(self, double[:, ::1] y, double[:, ::1] season,
+                   double[:, ::1] trend, double[:, ::1] resid,
+                   double[:, ::1] rw, int inner_iter, int outer_iter):
+        """
+        Decompose the rows of y and write the components into the outputs
+
+        The arrays of the instance are used as workspace, and the GIL is
+        released while the rows are decomposed.
+        """
+        cdef Py_ssize_t i, j
+        if y.shape[1] != self.nobs:
+            raise ValueError("The rows of y must have nobs elements")
+        # Do not overwrite the data of endog
+        self._ya = self._ya.copy()
+        with nogil:
+            for i in range(y.shape[0]):
+                for j in range(self.nobs):
+                    self._ya[j] = y[i, j]
+                self._fit(inner_iter, outer_iter)
+                for j in range(self.nobs):
+                    season[i, j] = self._season[j]
+                    trend[i, j] = self._trend[j]
+                    rw[i, j] = self._rw[j]
+                    resid[i, j] = y[i, j] - season[i, j] - trend[i, j]
+
+    cdef void _fit(self, int inner_iter, int outer_iter) noexcept nogil:
+        cdef Py_ssize_t i
+        cdef int k = 0
+
+        self._use_rw = False
+        for i in range(self.nobs):
+            self._season[i] = self._trend[i] = 0.0
+            self._rw[i] = 1.0
+        while True:
+            self._onestp(inner_iter)
+            k = k + 1
+            if k > outer_iter:
+                break
+            for i in range(self.nobs):
+                self._work[0, i] = self._trend[i] + self._season[i]
+            self._rwts()
+            self._use_rw = True
+
+    cdef void _onestp(self, int inner_iter) noexcept nogil:
         """
         y, n, np, ns, nt, nl, isdeg, itdeg, ildeg, nsjump,
                 ntjump, nljump, ni, userw, rw, season, trend, work
@@ -377,6 +434,7 @@ cdef class STL(object):
                          self._work
         """
         cdef Py_ssize_t i, j, np
+        cdef int n, nl, ildeg, nljump, nt, itdeg, ntjump
         cdef double[:, ::1] work
         cdef double[::1] y, season, trend, rw
         # Original variable names
@@ -408,7 +466,7 @@ cdef class STL(object):
 
     cdef double _est(self, double[::1] y, int n, int len_, int ideg, int xs,
                      int nleft, int nright, double[::1] w, bint userw,
-                     double[::1] rw):
+                     double[::1] rw) noexcept nogil:
         cdef double rng, a, b, c, h, h1, h9, r, ys
         cdef Py_ssize_t j
 
@@ -427,7 +485,9 @@ cdef class STL(object):
                 if r <= h1:
                     w[j] = 1.0
                 else:
-                    w[j] = (1.0 - (r / h) ** 3) ** 3
+                    r = r / h
+                    r = 1.0 - r * r * r
+                    w[j] = r * r * r
                 if userw:
                     w[j] = w[j] * rw[j]
                 a = a + w[j]
@@ -454,7 +514,8 @@ cdef class STL(object):
         return ys
 
     cdef void _ess(self, double[::1] y, int n, int len_, int ideg, int njump,
-                   bint userw, double[::1] rw, double[::1] ys, double[::1] res):
+                   bint userw, double[::1] rw, double[::1] ys,
+                   double[::1] res) noexcept nogil:
         # TODO: Try with 1 data point!!? Establish minimums
         cdef Py_ssize_t i, j, k
         cdef double delta
@@ -528,7 +589,8 @@ cdef class STL(object):
                 for j in range(k, n):
                     ys[j] = ys[k - 1] + delta * ((j + 1) - k)
 
-    cdef void _ma(self, double[::1] x, int n, int len_, double[::1] ave):
+    cdef void _ma(self, double[::1] x, int n, int len_,
+                  double[::1] ave) noexcept nogil:
         cdef int newn
         cdef double flen, v
         cdef Py_ssize_t i, j, k, m
@@ -547,7 +609,7 @@ cdef class STL(object):
             k += 1
             m += 1
 
-    cdef void _fts(self):
+    cdef void _fts(self) noexcept nogil:
         """
         Original def:
         _fts(self, x, n, np, trend, work)
@@ -566,7 +628,7 @@ cdef class STL(object):
         self._ma(trend, n - np + 1, np, work)
         self._ma(work, n - 2 * np + 2, 3, trend)
 
-    cdef void _ss(self):
+    cdef void _ss(self) noexcept nogil:
         """
         _ss(self, y, n, np, ns, isdeg, nsjump, userw, rw, season, work1, work2,
             work3, work4)
@@ -575,7 +637,7 @@ cdef class STL(object):
                      work[1, :], work[2, :], work[3, :], work[4, :], season)
         """
         cdef Py_ssize_t i, j, m
-        cdef int n, np, ns, isdef, nsjump, k
+        cdef int n, np, ns, isdeg, nsjump, k, xs, nleft, nright
         cdef bint userw
         cdef double[::1] y, work1, work2, work3, work4, rw, season
 
@@ -618,27 +680,26 @@ cdef class STL(object):
             for m in range(k + 2):
                 season[m * np + j] = work2[m]
 
-    cdef void _rwts(self):
+    cdef void _rwts(self) noexcept nogil:
         """
         y, n, fit, rw ->
         self._ya, self.nobs, self._work[0, :], self._rw
         """
         cdef Py_ssize_t i
-        cdef double [::1] y, fit, rw
-        cdef double cmad, c1, c9
+        cdef double [::1] y, fit, rw, scratch
+        cdef double cmad, c1, c9, u
         cdef int n
         # Original variable names
         y = self._ya
         n = self.nobs
         fit = self._work[0, :]
         rw = self._rw
+        scratch = self._work[5, :]
         for i in range(self.nobs):
             rw[i] = fabs(y[i] - fit[i])
-        mid = np.empty(2, dtype=int)
-        mid[0] = n // 2
-        mid[1] = n - mid[0] - 1
-        rw_part = np.partition(rw, mid)
-        cmad = 3.0 * (rw_part[mid[0]] + rw_part[mid[1]])
+            scratch[i] = rw[i]
+        cmad = 3.0 * (_select(scratch, n, n // 2)
+                      + _select(scratch, n, n - n // 2 - 1))
         if cmad == 0:
             for i in range(self.nobs):
                 rw[i] = 1
@@ -649,6 +710,8 @@ cdef class STL(object):
             if rw[i] <= c1:
                 rw[i] = 1.0
             elif rw[i] <= c9:
-                rw[i] = (1.0 - (rw[i] / cmad) ** 2) ** 2
+                u = rw[i] / cmad
+                u = 1.0 - u * u
+                rw[i] = u * u
             else:
                 rw[i] = 0.0
@@ -0,0 +1,293 @@
+"""
+Batched STL and MSTL decompositions of many series
+
+The series are stored in the rows of a 2-d array and decomposed with the
+same configuration. The compiled STL recursions release the GIL, so that
+blocks of rows are decomposed concurrently by a pool of threads. Each
+thread uses a single STL instance as workspace and writes the components
+directly into preallocated output arrays.
+
+License: BSD-3
+"""
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+import numpy as np
+from scipy import special
+from scipy.stats import boxcox
+
+from statsmodels.tools.validation import array_like, int_like
+from statsmodels.tsa.stl._stl import STL
+from statsmodels.tsa.stl.mstl import MSTL
+
+__all__ = ["stl_batch", "mstl_batch"]
+
+
+def _run_blocks(func, nrows, n_jobs):
+    """Apply func(start, stop) to contiguous blocks of rows in threads"""
+    n_jobs = int_like(n_jobs, "n_jobs")
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be a positive integer or -1.")
+    n_jobs = max(1, min(n_jobs, nrows))
+    if n_jobs == 1:
+        func(0, nrows)
+        return
+    bounds = np.linspace(0, nrows, n_jobs + 1).astype(int)
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        futures = [pool.submit(func, start, stop)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        for future in futures:
+            future.result()
+
+
+def _check_out(out, shape):
+    if out is None:
+        return tuple(np.empty(shape) for _ in range(4))
+    if not isinstance(out, tuple) or len(out) != 4:
+        raise ValueError(
+            "out must be a tuple of four arrays (seasonal, trend, resid, "
+            "weights)."
+        )
+    for arr in out:
+        if (
+            not isinstance(arr, np.ndarray)
+            or arr.shape != shape
+            or arr.dtype != np.double
+            or not arr.flags.c_contiguous
+            or not arr.flags.writeable
+        ):
+            raise ValueError(
+                "The arrays in out must be writeable, C-contiguous float64 "
+                f"arrays with shape {shape}."
+            )
+    return out
+
+
+def stl_batch(
+    endog,
+    period,
+    seasonal=7,
+    trend=None,
+    low_pass=None,
+    seasonal_deg=1,
+    trend_deg=1,
+    low_pass_deg=1,
+    robust=False,
+    seasonal_jump=1,
+    trend_jump=1,
+    low_pass_jump=1,
+    *,
+    inner_iter=None,
+    outer_iter=None,
+    n_jobs=1,
+    out=None,
+):
+    """
+    Season-Trend decomposition using LOESS of many series
+
+    Parameters
+    ----------
+    endog : array_like
+        The series to decompose with shape (nseries, nobs), one series per
+        row.
+    period : int
+        Periodicity of the series.
+    seasonal : int, optional
+        Length of the seasonal smoother, see ``STL``.
+    trend : {int, None}, optional
+        Length of the trend smoother, see ``STL``.
+    low_pass : {int, None}, optional
+        Length of the low-pass filter, see ``STL``.
+    seasonal_deg : int, optional
+        Degree of seasonal LOESS, see ``STL``.
+    trend_deg : int, optional
+        Degree of trend LOESS, see ``STL``.
+    low_pass_deg : int, optional
+        Degree of low pass LOESS, see ``STL``.
+    robust : bool, optional
+        Flag indicating whether to use the robust weighting, see ``STL``.
+    seasonal_jump : int, optional
+        Seasonal LOESS interpolation step, see ``STL``.
+    trend_jump : int, optional
+        Trend LOESS interpolation step, see ``STL``.
+    low_pass_jump : int, optional
+        Low pass LOESS interpolation step, see ``STL``.
+    inner_iter : {int, None}, optional
+        Number of iterations to perform in the inner loop, see ``STL.fit``.
+    outer_iter : {int, None}, optional
+        Number of iterations to perform in the outer loop, see ``STL.fit``.
+    n_jobs : int, optional
+        The number of threads used to decompose the series. -1 uses all
+        available cores. Default is 1.
+    out : tuple[ndarray], optional
+        Preallocated arrays ``(seasonal, trend, resid, weights)`` with shape
+        (nseries, nobs) for the components. Must be writeable, C-contiguous
+        and have dtype float64.
+
+    Returns
+    -------
+    DecomposeResult
+        The decomposition with components of shape (nseries, nobs). If out
+        is given, the components are the arrays in out.
+
+    See Also
+    --------
+    statsmodels.tsa.seasonal.STL
+        Season-Trend decomposition of a single series.
+
+    Notes
+    -----
+    The decomposition of each row is identical to
+    ``STL(endog[i], period, ...).fit(inner_iter, outer_iter)``. No Python
+    objects are created per series, and the GIL is released while the
+    series are decomposed.
+
+    Examples
+    --------
+    >>> res = stl_batch(metrics, period=24, robust=True, n_jobs=-1)
+    >>> anomalies = np.abs(res.resid) > 4 * res.resid.std(1, keepdims=True)
+    """
+    y = array_like(endog, "endog", dtype=np.double, ndim=2, contiguous=True,
+                   writeable=True)
+    nseries, nobs = y.shape
+    # Validates the configuration
+    config = STL(
+        y[0], period, seasonal=seasonal, trend=trend, low_pass=low_pass,
+        seasonal_deg=seasonal_deg, trend_deg=trend_deg,
+        low_pass_deg=low_pass_deg, robust=robust,
+        seasonal_jump=seasonal_jump, trend_jump=trend_jump,
+        low_pass_jump=low_pass_jump,
+    ).config
+    if inner_iter is None:
+        inner_iter = 2 if robust else 5
+    if outer_iter is None:
+        outer_iter = 15 if robust else 0
+    inner_iter = int_like(inner_iter, "inner_iter")
+    outer_iter = int_like(outer_iter, "outer_iter")
+    season, trend_, resid, weights = _check_out(out, (nseries, nobs))
+
+    def decompose(start, stop):
+        workspace = STL(y[start], **config)
+        workspace._fit_batch(
+            y[start:stop], season[start:stop], trend_[start:stop],
+            resid[start:stop], weights[start:stop], inner_iter, outer_iter,
+        )
+
+    _run_blocks(decompose, nseries, n_jobs)
+
+    # Avoid circular imports
+    from statsmodels.tsa.seasonal import DecomposeResult
+
+    return DecomposeResult(y, season, trend_, resid, weights)
+
+
+def mstl_batch(
+    endog,
+    periods,
+    windows=None,
+    lmbda=None,
+    iterate=2,
+    stl_kwargs=None,
+    *,
+    n_jobs=1,
+):
+    """
+    Season-Trend decomposition using LOESS of many series with multiple
+    seasonalities
+
+    Parameters
+    ----------
+    endog : array_like
+        The series to decompose with shape (nseries, nobs), one series per
+        row.
+    periods : {int, array_like}
+        Periodicity of the seasonal components.
+    windows : {int, array_like, None}, optional
+        Length of the seasonal smoothers for each corresponding period, see
+        ``MSTL``.
+    lmbda : {float, str, None}, optional
+        The lambda parameter for the Box-Cox transform to be applied to
+        endog prior to decomposition. If "auto", a value is estimated for
+        each series. See ``MSTL``.
+    iterate : int, optional
+        Number of iterations to use to refine the seasonal component.
+    stl_kwargs : dict, optional
+        Arguments to pass to STL.
+    n_jobs : int, optional
+        The number of threads used to decompose the series. -1 uses all
+        available cores. Default is 1.
+
+    Returns
+    -------
+    DecomposeResult
+        The decomposition. The seasonal component has shape
+        (nseries, nobs, nperiods), or (nseries, nobs) if there is a single
+        period, and all other components have shape (nseries, nobs). If
+        lmbda is "auto", the estimated values are available in the
+        attribute ``est_lmbda``.
+
+    See Also
+    --------
+    statsmodels.tsa.seasonal.MSTL
+        MSTL decomposition of a single series.
+
+    Notes
+    -----
+    The decomposition of each row is identical to
+    ``MSTL(endog[i], periods=periods, ...).fit()``. Each seasonal
+    component is extracted for all series at once with ``stl_batch``.
+    """
+    y = array_like(endog, "endog", dtype=np.double, ndim=2, contiguous=True)
+    nseries, nobs = y.shape
+    # Validates and processes the periods and windows
+    model = MSTL(y[0], periods=periods, windows=windows, lmbda=lmbda,
+                 iterate=iterate, stl_kwargs=stl_kwargs)
+    stl_kwargs = dict(model._stl_kwargs)
+    inner_iter = stl_kwargs.pop("inner_iter", None)
+    outer_iter = stl_kwargs.pop("outer_iter", None)
+    num_seasons = len(model.periods)
+    iterate = 1 if num_seasons == 1 else model.iterate
+
+    est_lmbda = None
+    if lmbda == "auto":
+        est_lmbda = np.empty(nseries)
+        y = y.copy()
+        for i in range(nseries):
+            y[i], est_lmbda[i] = boxcox(y[i], lmbda=None)
+    elif lmbda:
+        y = special.boxcox(y, lmbda)
+
+    seasonal = np.zeros((num_seasons, nseries, nobs))
+    out = (np.empty((nseries, nobs)), np.empty((nseries, nobs)),
+           np.empty((nseries, nobs)), np.empty((nseries, nobs)))
+    deseas = y.copy()
+    for _ in range(iterate):
+        for i in range(num_seasons):
+            deseas += seasonal[i]
+            stl_batch(
+                deseas,
+                model.periods[i],
+                seasonal=model.windows[i],
+                inner_iter=inner_iter,
+                outer_iter=outer_iter,
+                n_jobs=n_jobs,
+                out=out,
+                **stl_kwargs,
+            )
+            seasonal[i] = out[0]
+            deseas -= seasonal[i]
+
+    _, trend, resid, weights = out
+    resid = np.subtract(deseas, trend, out=resid)
+    seasonal = np.moveaxis(seasonal, 0, -1)
+    if num_seasons == 1:
+        seasonal = seasonal[..., 0]
+
+    # Avoid circular imports
+    from statsmodels.tsa.seasonal import DecomposeResult
+
+    res = DecomposeResult(y, seasonal, trend, resid, weights)
+    res.est_lmbda = est_lmbda
+    return res
@@ -1,10 +1,11 @@
 from pathlib import Path
 
+import numpy as np
 from numpy.testing import assert_allclose, assert_equal
 import pandas as pd
 import pytest
 
-from statsmodels.tsa.seasonal import MSTL
+from statsmodels.tsa.seasonal import MSTL, mstl_batch
 
 
 @pytest.fixture(scope="function")
@@ -187,3 +188,26 @@ def test_output_invariant_to_period_order(
     assert_equal(res1.trend, res2.trend)
     assert_equal(res1.seasonal, res2.seasonal)
     assert_equal(res1.resid, res2.resid)
+
+
+@pytest.mark.parametrize("lmbda", [None, 0.5, "auto"])
+def test_mstl_batch(data, lmbda):
+    y = np.stack([data[:500], data[500:1000], data[1000:1500]])
+    res = mstl_batch(y, (24, 48), lmbda=lmbda, n_jobs=2,
+                     stl_kwargs={"seasonal_deg": 0})
+    assert res.seasonal.shape == (3, 500, 2)
+    for i in range(3):
+        mod = MSTL(y[i], periods=(24, 48), lmbda=lmbda,
+                   stl_kwargs={"seasonal_deg": 0})
+        desired = mod.fit()
+        assert_allclose(res.observed[i], desired.observed, rtol=1e-12)
+        assert_allclose(res.seasonal[i], desired.seasonal, rtol=1e-12)
+        assert_allclose(res.trend[i], desired.trend, rtol=1e-12)
+        assert_allclose(res.resid[i], desired.resid, rtol=1e-12)
+        if lmbda == "auto":
+            assert_allclose(res.est_lmbda[i], mod.est_lmbda)
+
+    res = mstl_batch(y, 24)
+    assert res.seasonal.shape == (3, 500)
+    assert_allclose(res.seasonal[1], MSTL(y[1], periods=24).fit().seasonal,
+                    rtol=1e-12)
@@ -9,7 +9,7 @@ import pandas as pd
 import pytest
 
 from statsmodels.datasets import co2
-from statsmodels.tsa.seasonal import STL, DecomposeResult
+from statsmodels.tsa.seasonal import STL, DecomposeResult, stl_batch
 
 cur_dir = os.path.dirname(os.path.abspath(__file__))
 file_path = os.path.join(cur_dir, "results", "stl_test_results.csv")
@@ -341,3 +341,46 @@ def test_squezable_to_1d():
     data = data.resample(MONTH_END).mean().ffill()
     res = STL(data).fit()
     assert isinstance(res, DecomposeResult)
+
+
+@pytest.fixture(scope="module")
+def batch_data():
+    rs = np.random.RandomState(0)
+    t = np.arange(120)
+    y = np.sin(2 * np.pi * t / 12) + 0.01 * t + rs.standard_normal((7, 120))
+    y[:, 30] += 10
+    return y
+
+
+@pytest.mark.parametrize("n_jobs", [1, 3])
+def test_stl_batch(batch_data, robust, n_jobs):
+    y = batch_data.copy()
+    res = stl_batch(y, 12, seasonal=9, robust=robust, seasonal_jump=2,
+                    n_jobs=n_jobs)
+    assert_allclose(y, batch_data)
+    assert res.trend.shape == y.shape
+    for i in range(y.shape[0]):
+        desired = STL(y[i], 12, seasonal=9, robust=robust,
+                      seasonal_jump=2).fit()
+        assert_allclose(res.seasonal[i], desired.seasonal, rtol=1e-12)
+        assert_allclose(res.trend[i], desired.trend, rtol=1e-12)
+        assert_allclose(res.resid[i], desired.resid, rtol=1e-12)
+        assert_allclose(res.weights[i], desired.weights, rtol=1e-12)
+
+
+def test_stl_batch_out(batch_data):
+    out = tuple(np.empty_like(batch_data) for _ in range(4))
+    res = stl_batch(batch_data, 12, inner_iter=1, outer_iter=2, out=out)
+    for arr, component in zip(out, ("seasonal", "trend", "resid", "weights")):
+        assert getattr(res, component) is arr
+    desired = STL(batch_data[4], 12).fit(inner_iter=1, outer_iter=2)
+    assert_allclose(out[1][4], desired.trend, rtol=1e-12)
+
+    with pytest.raises(ValueError, match="out must be a tuple"):
+        stl_batch(batch_data, 12, out=out[:3])
+    with pytest.raises(ValueError, match="C-contiguous float64"):
+        stl_batch(batch_data, 12, out=out[:3] + (out[3].T.copy(),))
+    with pytest.raises(ValueError, match="period must be"):
+        stl_batch(batch_data, 1)
+    with pytest.raises(ValueError, match="n_jobs"):
+        stl_batch(batch_data, 12, n_jobs=0)
@@ -286,16 +286,19 @@ class IRAnalysis(BaseIRAnalysis):
         return covs
 
     def errband_mc(self, orth=False, svar=False, repl=1000,
-                   signif=0.05, seed=None, burn=100):
+                   signif=0.05, seed=None, burn=100, n_jobs=1):
         """
         IRF Monte Carlo integrated error bands
+
+        `n_jobs` is the number of processes used to estimate the structural
+        parameters of the replications if `svar` is True.
         """
         model = self.model
         periods = self.periods
         if svar:
             return model.sirf_errband_mc(orth=orth, repl=repl, steps=periods,
                                          signif=signif, seed=seed,
-                                         burn=burn, cum=False)
+                                         burn=burn, cum=False, n_jobs=n_jobs)
         else:
             return model.irf_errband_mc(orth=orth, repl=repl, steps=periods,
                                         signif=signif, seed=seed,
@@ -349,12 +352,14 @@ class IRAnalysis(BaseIRAnalysis):
                 k = component
 
         # here take the kth column of W, which we determine by finding the largest eigenvalue of the covaraince matrix
+        k = np.asarray(k)
+        W_k = np.take_along_axis(W, k[:, :, None, None], axis=3)[..., 0]
+        eigva_k = np.take_along_axis(eigva, k[:, :, None, None], axis=2)
+        band = (W_k * q * np.sqrt(eigva_k[..., 0])).transpose(2, 0, 1)
         lower = np.copy(irfs)
         upper = np.copy(irfs)
-        for i in range(neqs):
-            for j in range(neqs):
-                lower[1:,i,j] = irfs[1:,i,j] + W[i,j,:,k[i,j]]*q*np.sqrt(eigva[i,j,k[i,j]])
-                upper[1:,i,j] = irfs[1:,i,j] - W[i,j,:,k[i,j]]*q*np.sqrt(eigva[i,j,k[i,j]])
+        lower[1:] = irfs[1:] + band
+        upper[1:] = irfs[1:] - band
 
         return lower, upper
 
@@ -404,21 +409,16 @@ class IRAnalysis(BaseIRAnalysis):
             else:
                 k = component
 
+        k = np.asarray(k)
+        W_k = np.take_along_axis(W, k[:, :, None, None], axis=2)[:, :, 0]
         gamma = np.zeros((repl, periods+1, neqs, neqs))
-        for p in range(repl):
-            for i in range(neqs):
-                for j in range(neqs):
-                    gamma[p,1:,i,j] = W[i,j,k[i,j],:] * irf_resim[p,1:,i,j]
+        gamma[:, 1:] = W_k.transpose(2, 0, 1) * irf_resim[:, 1:]
 
         gamma_sort = np.sort(gamma, axis=0) #sort to get quantiles
         indx = round(signif/2*repl)-1,round((1-signif/2)*repl)-1
 
-        lower = np.copy(irfs)
-        upper = np.copy(irfs)
-        for i in range(neqs):
-            for j in range(neqs):
-                lower[:,i,j] = irfs[:,i,j] + gamma_sort[indx[0],:,i,j]
-                upper[:,i,j] = irfs[:,i,j] + gamma_sort[indx[1],:,i,j]
+        lower = irfs + gamma_sort[indx[0]]
+        upper = irfs + gamma_sort[indx[1]]
 
         return lower, upper
 
@@ -456,13 +456,9 @@ class IRAnalysis(BaseIRAnalysis):
         neqs = self.neqs
         irf_resim = model.irf_resim(orth=orth, repl=repl, steps=periods,
                                     seed=seed, burn=100)
-        stack = np.zeros((neqs, repl, periods*neqs))
-
         #stack left to right, up and down
-
-        for p in range(repl):
-            for i in range(neqs):
-                stack[i, p,:] = np.ravel(irf_resim[p,1:,:,i].T)
+        stack = irf_resim[:, 1:].transpose(3, 0, 2, 1).reshape(
+            neqs, repl, periods*neqs)
 
         stack_cov=np.zeros((neqs, periods*neqs, periods*neqs))
         W = np.zeros((neqs, periods*neqs, periods*neqs))
@@ -482,24 +478,17 @@ class IRAnalysis(BaseIRAnalysis):
             stack_cov[i] = np.cov(stack[i],rowvar=0)
             W[i], eigva[i], k[i] = util.eigval_decomp(stack_cov[i])
 
+        # W_k[j, i*periods:(i+1)*periods] scales the response of i to j
+        W_k = W[np.arange(neqs), np.asarray(k)]
+        W_k = W_k.reshape(neqs, neqs, periods).transpose(2, 1, 0)
         gamma = np.zeros((repl, periods+1, neqs, neqs))
-        for p in range(repl):
-            c = 0
-            for j in range(neqs):
-                for i in range(neqs):
-                    gamma[p,1:,i,j] = W[j,k[j],i*periods:(i+1)*periods] * irf_resim[p,1:,i,j]
-                    if i == neqs-1:
-                        gamma[p,1:,i,j] = W[j,k[j],i*periods:] * irf_resim[p,1:,i,j]
+        gamma[:, 1:] = W_k * irf_resim[:, 1:]
 
         gamma_sort = np.sort(gamma, axis=0) #sort to get quantiles
         indx = round(signif/2*repl)-1,round((1-signif/2)*repl)-1
 
-        lower = np.copy(irfs)
-        upper = np.copy(irfs)
-        for i in range(neqs):
-            for j in range(neqs):
-                lower[:,i,j] = irfs[:,i,j] + gamma_sort[indx[0],:,i,j]
-                upper[:,i,j] = irfs[:,i,j] + gamma_sort[indx[1],:,i,j]
+        lower = irfs + gamma_sort[indx[0]]
+        upper = irfs + gamma_sort[indx[1]]
 
         return lower, upper
 
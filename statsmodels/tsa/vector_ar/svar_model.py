@@ -5,16 +5,24 @@ References
 ----------
 Lütkepohl (2005) New Introduction to Multiple Time Series Analysis
 """
+import copy
+
 import numpy as np
 import numpy.linalg as npl
 from numpy.linalg import slogdet
 
 from statsmodels.tools.decorators import deprecated_alias
 from statsmodels.tools.numdiff import approx_fprime, approx_hess
+from statsmodels.tools.parallel import parallel_func
 import statsmodels.tsa.base.tsa_model as tsbase
 from statsmodels.tsa.vector_ar.irf import IRAnalysis
 import statsmodels.tsa.vector_ar.util as util
-from statsmodels.tsa.vector_ar.var_model import VARProcess, VARResults
+from statsmodels.tsa.vector_ar.var_model import (
+    VARProcess,
+    VARResults,
+    _var_ols_batch,
+    ma_rep,
+)
 
 
 def svar_ckerr(svar_type, A, B):
@@ -25,6 +33,44 @@ def svar_ckerr(svar_type, A, B):
         raise ValueError('SVAR of type B or AB but B array not given.')
 
 
+def _svar_impact_batch(model, sigma_u, nobs, start_params):
+    """
+    Solve for the structural impact matrices of many residual covariances
+
+    Defined at the module level so that it can be sent to worker processes.
+
+    Parameters
+    ----------
+    model : SVAR
+        The model providing the restrictions on A and B. It is not modified.
+    sigma_u : ndarray (repl x neqs x neqs)
+        The residual covariance of each replication.
+    nobs : int
+        The number of observations used to estimate `sigma_u`.
+    start_params : ndarray
+        Starting values of the free parameters in A and B.
+
+    Returns
+    -------
+    P : ndarray (repl x neqs x neqs)
+        The impact matrices inv(A) B of each replication.
+    params : ndarray (repl x len(start_params))
+        The estimated free parameters in A and B of each replication.
+    """
+    model = copy.copy(model)
+    model.A = model.A.copy()
+    model.B = model.B.copy()
+    model.nobs = nobs
+    P = np.empty(sigma_u.shape)
+    params = np.empty((sigma_u.shape[0], len(start_params)))
+    for i in range(sigma_u.shape[0]):
+        model.sigma_u = sigma_u[i]
+        A, B = model._solve_AB(start_params, maxiter=500)
+        P[i] = npl.solve(A, B)
+        params[i] = np.r_[A[model.A_mask], B[model.B_mask]]
+    return P, params
+
+
 class SVAR(tsbase.TimeSeriesModel):
     r"""
     Fit VAR and then estimate structural components of A and B, defined:
@@ -609,7 +655,8 @@ class SVARResults(SVARProcess, VARResults):
         return IRAnalysis(self, P=P, periods=periods, svar=True)
 
     def sirf_errband_mc(self, orth=False, repl=1000, steps=10,
-                        signif=0.05, seed=None, burn=100, cum=False):
+                        signif=0.05, seed=None, burn=100, cum=False,
+                        n_jobs=1):
         """
         Compute Monte Carlo integrated error bands assuming normally
         distributed for impulse response functions
@@ -630,63 +677,53 @@ class SVARResults(SVARProcess, VARResults):
             number of initial observations to discard for simulation
         cum : bool, default False
             produce cumulative irf error bands
+        n_jobs : int, default 1
+            Number of processes used to estimate the structural parameters
+            of the replications. -1 uses all available cores. Requires
+            joblib.
 
         Notes
         -----
         Lütkepohl (2005) Appendix D
 
+        All replications are simulated at once and their reduced form VARs
+        are estimated with a single stacked least squares solve. Only the
+        structural parameters A and B are estimated separately for each
+        replication.
+
         Returns
         -------
         Tuple of lower and upper arrays of ma_rep monte carlo standard errors
         """
-        neqs = self.neqs
-        mean = self.mean()
         k_ar = self.k_ar
-        coefs = self.coefs
-        sigma_u = self.sigma_u
-        intercept = self.intercept
-        df_model = self.df_model
-        nobs = self.nobs
-
-        ma_coll = np.zeros((repl, steps + 1, neqs, neqs))
-        A = self.A
-        B = self.B
         A_mask = self.A_mask
         B_mask = self.B_mask
-        A_pass = self.model.A_original
-        B_pass = self.model.B_original
-        s_type = self.model.svar_type
-
-        g_list = []
-
-        def agg(impulses):
-            if cum:
-                return impulses.cumsum(axis=0)
-            return impulses
-
-        opt_A = A[A_mask]
-        opt_B = B[B_mask]
-        for i in range(repl):
-            # discard first hundred to correct for starting bias
-            sim = util.varsim(coefs, intercept, sigma_u, seed=seed,
-                              steps=nobs + burn)
-            sim = sim[burn:]
-
-            smod = SVAR(sim, svar_type=s_type, A=A_pass, B=B_pass)
-            if i == 10:
-                # Use first 10 to update starting val for remainder of fits
-                mean_AB = np.mean(g_list, axis=0)
-                split = len(A[A_mask])
-                opt_A = mean_AB[:split]
-                opt_B = mean_AB[split:]
-
-            sres = smod.fit(maxlags=k_ar, A_guess=opt_A, B_guess=opt_B)
-
-            if i < 10:
-                # save estimates for starting val if in first 10
-                g_list.append(np.append(sres.A[A_mask].tolist(),
-                                        sres.B[B_mask].tolist()))
-            ma_coll[i] = agg(sres.svar_ma_rep(maxn=steps))
+
+        # discard first hundred to correct for starting bias
+        sims = util.varsim(self.coefs, self.intercept, self.sigma_u,
+                           seed=seed, steps=self.nobs + burn,
+                           nsimulations=repl)
+        sims = sims[:, burn:]
+        deterministic = np.ones((sims.shape[1] - k_ar, 1))
+        coefs, sigma_u = _var_ols_batch(sims, k_ar, deterministic)
+        nobs = sims.shape[1] - k_ar
+
+        # Use first 10 to update starting val for remainder of fits
+        start_params = np.r_[self.A[A_mask], self.B[B_mask]]
+        P, params = _svar_impact_batch(self.model, sigma_u[:10], nobs,
+                                       start_params)
+        if repl > 10:
+            start_params = params.mean(0)
+            parallel, p_func, n_jobs = parallel_func(_svar_impact_batch,
+                                                     n_jobs, verbose=0)
+            chunks = np.array_split(sigma_u[10:], min(n_jobs, repl - 10))
+            out = parallel(p_func(self.model, chunk, nobs, start_params)
+                           for chunk in chunks)
+            P = np.concatenate([P] + [chunk_P for chunk_P, _ in out])
+
+        ma_coll = ma_rep(coefs, maxn=steps) @ P[:, None]
+        if cum:
+            ma_coll = ma_coll.cumsum(axis=1)
 
         ma_sort = np.sort(ma_coll, axis=0)  # sort to get quantiles
         index = (int(round(signif / 2 * repl) - 1),
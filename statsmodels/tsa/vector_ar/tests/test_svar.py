@@ -8,7 +8,9 @@ from numpy.testing import assert_allclose, assert_almost_equal
 import pytest
 
 import statsmodels.datasets.macrodata
+from statsmodels.tsa.vector_ar import util
 from statsmodels.tsa.vector_ar.svar_model import SVAR
+from statsmodels.tsa.vector_ar.var_model import VAR, _var_ols_batch
 
 DECIMAL_6 = 6
 DECIMAL_5 = 5
@@ -74,3 +76,22 @@ class TestSVAR:
         # Windows precision limits require non-zero atol
         atol = 1e-6 if PLATFORM_WIN else 1e-8
         assert_allclose(errband1, errband2, rtol=1e-8, atol=atol)
+
+    @pytest.mark.filterwarnings("ignore::statsmodels.tools."
+                                "sm_exceptions.ConvergenceWarning")
+    def test_irf_errband_mc_batch(self):
+        res1 = self.res1
+        errband1 = res1.sirf_errband_mc(repl=12, steps=5, seed=1, burn=50)
+        errband2 = res1.irf(5).errband_mc(svar=True, repl=12, seed=1,
+                                          burn=50, n_jobs=2)
+        assert_allclose(errband1, errband2, rtol=1e-8, atol=1e-8)
+
+        # reduced form re-estimation matches fitting each replication
+        sims = util.varsim(res1.coefs, res1.intercept, res1.sigma_u,
+                           seed=1, steps=res1.nobs + 50, nsimulations=2)
+        coefs, sigma_u = _var_ols_batch(
+            sims[:, 50:], 3, np.ones((res1.nobs - 3, 1)))
+        for i in range(2):
+            res = VAR(sims[i, 50:]).fit(maxlags=3)
+            assert_allclose(coefs[i], res.coefs, rtol=1e-8)
+            assert_allclose(sigma_u[i], res.sigma_u, rtol=1e-8)
@@ -966,6 +966,24 @@ def test_correct_nobs():
     assert irf.shape == (100, 11, 3, 3)
 
 
+@pytest.mark.parametrize("trend, exog", [("c", False), ("ct", True)])
+@pytest.mark.parametrize("orth", [False, True])
+def test_irf_resim_batch(trend, exog, orth):
+    data = get_macrodata().view((float, 3))
+    exog = np.random.RandomState(0).standard_normal((len(data), 1)) if exog else None
+    results = VAR(data, exog=exog).fit(maxlags=2, trend=trend)
+    irf = results.irf_resim(orth=orth, repl=5, steps=6, seed=1, burn=50, cum=True)
+
+    sims = util.varsim(results.coefs, results.intercept, results.sigma_u,
+                       seed=1, steps=len(data) + 50, nsimulations=5)
+    for i in range(5):
+        res = VAR(sims[i, 50:], exog=exog).fit(maxlags=2, trend=trend)
+        ma = res.orth_ma_rep(maxn=6) if orth else res.ma_rep(maxn=6)
+        assert_allclose(irf[i], ma.cumsum(axis=0), rtol=1e-7, atol=1e-12)
+    # replications are distinct draws
+    assert not np.allclose(irf[0], irf[1])
+
+
 @pytest.mark.slow
 def test_irf_err_bands():
     # smoke tests
@@ -49,6 +49,8 @@ def ma_rep(coefs, maxn=10):
     Parameters
     ----------
     coefs : ndarray (p x k x k)
+        The VAR coefficient matrices. A stack of coefficient matrices with
+        shape (..., p, k, k) computes the MA representations of all of them.
     maxn : int
         Number of MA matrices to compute
 
@@ -67,10 +69,13 @@ def ma_rep(coefs, maxn=10):
     Returns
     -------
     phis : ndarray (maxn + 1 x k x k)
+        The MA matrices, with shape (..., maxn + 1, k, k) if `coefs` is a
+        stack of coefficient matrices.
     """
-    p, k, k = coefs.shape
-    phis = np.zeros((maxn + 1, k, k))
-    phis[0] = np.eye(k)
+    coefs = np.asarray(coefs)
+    p, k, k = coefs.shape[-3:]
+    phis = np.zeros(coefs.shape[:-3] + (maxn + 1, k, k))
+    phis[..., 0, :, :] = np.eye(k)
 
     # recursively compute Phi matrices
     for i in range(1, maxn + 1):
@@ -78,11 +83,60 @@ def ma_rep(coefs, maxn=10):
             if j > p:
                 break
 
-            phis[i] += np.dot(phis[i - j], coefs[j - 1])
+            phis[..., i, :, :] += phis[..., i - j, :, :] @ coefs[..., j - 1, :, :]
 
     return phis
 
 
+def _var_ols_batch(endog, lags, deterministic=None):
+    """
+    Least squares estimates of many VAR(p) processes with the same design
+
+    Parameters
+    ----------
+    endog : ndarray (repl x nobs x k)
+        The stacked time series, one for each replication.
+    lags : int
+        The number of lags.
+    deterministic : ndarray (nobs - lags x d), optional
+        The deterministic regressors (trend and exog), which are shared by
+        all replications and placed before the lags.
+
+    Returns
+    -------
+    coefs : ndarray (repl x lags x k x k)
+        The coefficient matrices of each replication.
+    sigma_u : ndarray (repl x k x k)
+        The degrees of freedom corrected residual covariance of each
+        replication.
+
+    Notes
+    -----
+    The cross products of all replications are formed with a single
+    stacked matrix product and solved together, which avoids creating and
+    fitting a VAR model for each replication.
+    """
+    repl, nobs, neqs = endog.shape
+    y_sample = endog[:, lags:]
+    k_det = 0 if deterministic is None else deterministic.shape[1]
+    z = np.empty((repl, nobs - lags, k_det + neqs * lags))
+    if k_det:
+        z[..., :k_det] = deterministic
+    for i in range(1, lags + 1):
+        start = k_det + (i - 1) * neqs
+        z[..., start:start + neqs] = endog[:, lags - i:nobs - i]
+
+    ztz = z.transpose(0, 2, 1) @ z
+    zty = z.transpose(0, 2, 1) @ y_sample
+    params = np.linalg.solve(ztz, zty)
+    resid = y_sample - z @ params
+    df_resid = y_sample.shape[1] - z.shape[-1]
+    sigma_u = resid.transpose(0, 2, 1) @ resid / df_resid
+
+    coefs = params[:, k_det:].reshape(repl, lags, neqs, neqs)
+    return coefs.swapaxes(2, 3), sigma_u
+
+
 def is_stable(coefs, verbose=False):
     """
     Determine stability of VAR(p) system by examining the eigenvalues of the
@@ -1720,6 +1774,11 @@ class VARResults(VARProcess):
 
         Notes
         -----
+        All replications are simulated as a single (repl x nobs x neqs)
+        array and the VAR of each replication is re-estimated by a stacked
+        least squares solve, using the deterministic terms and exog of the
+        original model.
+
         .. [*] Sims, Christoper A., and Tao Zha. 1999. "Error Bands for Impulse
            Response." Econometrica 67: 1113-1155.
 
@@ -1727,34 +1786,26 @@ class VARResults(VARProcess):
         -------
         Array of simulated impulse response functions
         """
-        neqs = self.neqs
         k_ar = self.k_ar
-        coefs = self.coefs
-        sigma_u = self.sigma_u
-        intercept = self.intercept
-        nobs = self.nobs
-        nobs_original = nobs + k_ar
-
-        ma_coll = np.zeros((repl, steps + 1, neqs, neqs))
-
-        def fill_coll(sim):
-            ret = VAR(sim, exog=self.exog).fit(maxlags=k_ar, trend=self.trend)
-            ret = ret.orth_ma_rep(maxn=steps) if orth else ret.ma_rep(maxn=steps)
-            return ret.cumsum(axis=0) if cum else ret
-
-        for i in range(repl):
-            # discard first burn to eliminate correct for starting bias
-            sim = util.varsim(
-                coefs,
-                intercept,
-                sigma_u,
-                seed=seed,
-                steps=nobs_original + burn,
-            )
-            sim = sim[burn:]
-            ma_coll[i, :, :, :] = fill_coll(sim)
+        nobs_original = self.nobs + k_ar
 
-        return ma_coll
+        # discard first burn to eliminate correct for starting bias
+        sims = util.varsim(
+            self.coefs,
+            self.intercept,
+            self.sigma_u,
+            seed=seed,
+            steps=nobs_original + burn,
+            nsimulations=repl,
+        )
+        sims = sims[:, burn:]
+
+        deterministic = self.endog_lagged[:, : self.k_exog]
+        coefs, sigma_u = _var_ols_batch(sims, k_ar, deterministic)
+        ma_coll = ma_rep(coefs, maxn=steps)
+        if orth:
+            ma_coll = ma_coll @ np.linalg.cholesky(sigma_u)[:, None]
+        return ma_coll.cumsum(axis=1) if cum else ma_coll
 
     def _omega_forc_cov(self, steps):
         # Approximate MSE matrix \Omega(h) as defined in Lut p97
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""
+Benchmark the time needed to import the statsmodels api modules
+
+Each module is imported in a fresh interpreter. The reported time is the
+best of several runs, so that the noise of the first, cold run does not
+dominate.
+
+usage
+
+python tools/import_time.py [--repeat 5] [module ...]
+"""
+import argparse
+import subprocess
+import sys
+
+MODULES = [
+    "statsmodels",
+    "statsmodels.api",
+    "statsmodels.tsa.api",
+    "statsmodels.stats.api",
+    "statsmodels.formula.api",
+]
+
+CODE = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(module, repeat):
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", CODE.format(module=module)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times.append(float(out.stdout))
+    return min(times)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for module in args.modules:
+        print(f"{module:<28}{import_time(module, args.repeat):8.3f}s")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Benchmark the kernel sums of KDEMultivariate and KernelReg
+
+For each sample size, times the density at a fixed set of prediction
+points, the leave-one-out likelihood used by bw="cv_ml", and the local
+constant regression at the prediction points. The exact evaluation is
+compared with the tree and binned approximations. Leave-one-out sums are
+quadratic in the sample size unless the data are binned, so they are only
+timed for the exact and tree evaluations up to --max-exact observations.
+
+The number of bins grows quickly with the number of continuous variables
+and with a smaller tolerance, so that the binned approximation pays off for
+one or two variables and large samples.
+
+usage
+
+python tools/kernel_engine.py [--sizes 1000 10000 100000 1000000] [--k-vars 1]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from statsmodels.nonparametric.api import (
+    EstimatorSettings,
+    KDEMultivariate,
+    KernelReg,
+)
+
+MODES = [None, "tree", "binned"]
+
+
+def best_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def simulate(nobs, k_vars, seed=0):
+    rs = np.random.RandomState(seed)
+    exog = rs.standard_normal((nobs, k_vars))
+    endog = np.sin(exog[:, 0]) + exog[:, 1:].sum(1) + rs.standard_normal(nobs)
+    return endog, exog
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="*",
+                        default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--k-vars", type=int, default=1)
+    parser.add_argument("--npredict", type=int, default=1000)
+    parser.add_argument("--max-exact", type=int, default=20000)
+    parser.add_argument("--tol", type=float, default=1e-4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    var_type = "c" * args.k_vars
+    predict = simulate(args.npredict, args.k_vars, seed=1)[1]
+    print(f"{'nobs':>8} {'approx':>7} {'pdf':>9} {'loo':>9} {'reg lc':>9}")
+    for nobs in args.sizes:
+        endog, exog = simulate(nobs, args.k_vars)
+        # Normal reference bandwidth
+        bw = 1.06 * exog.std(0) * nobs ** (-1. / (4 + args.k_vars))
+        for approx in MODES:
+            settings = EstimatorSettings(approx=approx, approx_tol=args.tol)
+            dens = KDEMultivariate(exog, var_type, bw=bw, defaults=settings)
+            reg = KernelReg(endog, exog, var_type, reg_type="lc", bw=bw,
+                            defaults=settings)
+            pdf = best_time(lambda: dens.pdf(predict), args.repeat)
+            fit = best_time(lambda: reg.fit(predict), args.repeat)
+            if approx != "binned" and nobs > args.max_exact:
+                loo = "-"
+            else:
+                loo = best_time(lambda: dens.loo_likelihood(bw, np.log), 1)
+                loo = f"{loo:8.3f}s"
+            print(f"{nobs:>8} {str(approx):>7} {pdf:8.3f}s {loo:>9} "
+                  f"{fit:8.3f}s")
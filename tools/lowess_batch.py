@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Benchmark LOWESS of many series with lowess_batch
+
+Compares a Python loop of lowess over the series with lowess_batch run on
+an increasing number of threads. The series are smoothed without holding
+the GIL, so that the speed-up is bounded by the number of available cores.
+The time is the best of several repeats.
+
+usage
+
+python tools/lowess_batch.py [--nseries 20000] [--nobs 200] [--threads 1 2 4]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from statsmodels.nonparametric.smoothers_lowess import lowess, lowess_batch
+
+
+def best_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--nseries", type=int, default=20000)
+    parser.add_argument("--nobs", type=int, default=200)
+    parser.add_argument("--frac", type=float, default=0.3)
+    parser.add_argument("--it", type=int, default=3)
+    parser.add_argument("--threads", type=int, nargs="*",
+                        default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rs = np.random.RandomState(0)
+    exog = np.sort(rs.uniform(0, 10, (args.nseries, args.nobs)), axis=1)
+    endog = np.sin(exog) + rs.standard_normal(exog.shape)
+    out = np.empty_like(endog)
+    print(f"{args.nseries} series of {args.nobs} observations, "
+          f"{os.cpu_count()} cores")
+
+    def loop():
+        for i in range(args.nseries):
+            lowess(endog[i], exog[i], frac=args.frac, it=args.it,
+                   is_sorted=True, return_sorted=False)
+
+    base = best_time(loop, 1)
+    print(f"{'lowess loop':<16}{base:8.3f}s")
+    for n_jobs in args.threads:
+        elapsed = best_time(
+            lambda: lowess_batch(endog, exog, frac=args.frac, it=args.it,
+                                 is_sorted=True, out=out, n_jobs=n_jobs),
+            args.repeat)
+        print(f"{'threads ' + str(n_jobs):<16}{elapsed:8.3f}s"
+              f"{base / elapsed:8.1f}x")
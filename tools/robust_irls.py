@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Benchmark the IRLS fit of RLM and the robust scale estimators
+
+For each sample size, times the setup of RLM, the fit with the default
+HuberT norm and MAD scale, and the fit with TukeyBiweight and Huber's
+proposal 2 scale. The scale estimators are timed on a batch of columns.
+The time is the best of several repeats.
+
+usage
+
+python tools/robust_irls.py [--sizes 10000 100000 1000000] [--k-vars 5]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from statsmodels.robust import norms
+from statsmodels.robust.robust_linear_model import RLM
+from statsmodels.robust.scale import HuberScale, mad, qn_scale
+
+
+def best_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def simulate(nobs, k_vars, seed=0):
+    rs = np.random.RandomState(seed)
+    exog = np.column_stack((np.ones(nobs),
+                            rs.standard_normal((nobs, k_vars))))
+    endog = exog.sum(1) + rs.standard_t(2, nobs)
+    return endog, exog
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="*",
+                        default=[10000, 100000, 1000000])
+    parser.add_argument("--k-vars", type=int, default=5)
+    parser.add_argument("--columns", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'nobs':>8} {'setup':>9} {'huber':>9} {'bisquare':>9} "
+          f"{'mad':>9} {'qn':>9}")
+    for nobs in args.sizes:
+        endog, exog = simulate(nobs, args.k_vars)
+        setup = best_time(lambda: RLM(endog, exog), args.repeat)
+        mod = RLM(endog, exog)
+        huber = best_time(mod.fit, args.repeat)
+        mod = RLM(endog, exog, M=norms.TukeyBiweight())
+        bisquare = best_time(lambda: mod.fit(scale_est=HuberScale()),
+                             args.repeat)
+        # batch of columns with nobs values in total
+        batch = np.random.RandomState(1).standard_normal(
+            (max(nobs // args.columns, 2), args.columns))
+        mad_time = best_time(lambda: mad(batch), args.repeat)
+        qn_time = best_time(lambda: qn_scale(batch), args.repeat)
+        print(f"{nobs:>8} {setup:8.3f}s {huber:8.3f}s {bisquare:8.3f}s "
+              f"{mad_time:8.3f}s {qn_time:8.3f}s")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Benchmark the analytic score of state space models
+
+Compares score(method='analytic'), which differentiates the Kalman filter
+recursions in a single pass, with the default complex-step score, which
+runs one filter pass per parameter, for VARMAX, DynamicFactor and SARIMAX.
+The time is the best of several repeats.
+
+usage
+
+python tools/statespace_score.py [--nobs 1000] [--k-endog 3] [--repeat 5]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from statsmodels.tsa.statespace.dynamic_factor import DynamicFactor
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.statespace.varmax import VARMAX
+
+
+def best_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def simulate(nobs, k_endog, seed=0):
+    rs = np.random.RandomState(seed)
+    eps = rs.standard_normal((nobs, k_endog))
+    endog = np.zeros((nobs, k_endog))
+    for t in range(1, nobs):
+        endog[t] = 0.5 * endog[t - 1] + eps[t] + 0.2 * eps[t - 1, ::-1]
+    return endog
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--nobs", type=int, default=1000)
+    parser.add_argument("--k-endog", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    endog = simulate(args.nobs, args.k_endog)
+    models = {
+        "VARMAX(1, 1)": VARMAX(endog, order=(1, 1), trend="c"),
+        "DynamicFactor": DynamicFactor(endog, k_factors=1, factor_order=2),
+        "SARIMAX(2, 1, 2)": SARIMAX(endog[:, 0], order=(2, 1, 2),
+                                    exog=endog[:, 1:]),
+    }
+
+    print(f"nobs={args.nobs}")
+    print(f"{'model':<18}{'k_params':>9}{'approx':>11}{'analytic':>11}"
+          f"{'speed-up':>10}")
+    for name, mod in models.items():
+        params = mod.start_params
+        approx = best_time(lambda: mod.score(params), args.repeat)
+        analytic = best_time(lambda: mod.score(params, method="analytic"),
+                             args.repeat)
+        print(f"{name:<18}{len(params):>9}{approx:10.4f}s{analytic:10.4f}s"
+              f"{approx / analytic:9.1f}x")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Benchmark repeated loglikelihood evaluations of state space models
+
+Compares MLEModel.loglike with FilterWorkspace.loglike for a few models. The
+time is the best of several repeats, and the memory is the peak of the
+memory traced by tracemalloc during a single call, above the memory in use
+before the call.
+
+usage
+
+python tools/statespace_workspace.py [--nobs 100] [--number 1000]
+"""
+import argparse
+import timeit
+import tracemalloc
+import warnings
+
+import numpy as np
+
+from statsmodels.tsa.statespace.filter_workspace import FilterWorkspace
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.statespace.structural import UnobservedComponents
+
+
+def models(nobs):
+    rs = np.random.RandomState(0)
+    endog = np.cumsum(rs.standard_normal(nobs)) + rs.standard_normal(nobs)
+    exog = rs.standard_normal((nobs, 2))
+    return {
+        "SARIMAX(1,0,1)": SARIMAX(endog, order=(1, 0, 1)),
+        "SARIMAX(1,0,1) + exog": SARIMAX(endog, exog=exog, order=(1, 0, 1)),
+        "SARIMAX(2,1,1) conc.": SARIMAX(endog, order=(2, 1, 1),
+                                        concentrate_scale=True),
+        "UnobservedComponents": UnobservedComponents(endog, "lltrend"),
+    }
+
+
+def peak_memory(func):
+    func()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak - start
+
+
+def run_time(func, number, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--nobs", type=int, default=100)
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    print(f"{'':<24}{'loglike':>10}{'workspace':>11}"
+          f"{'loglike':>12}{'workspace':>11}")
+    for name, mod in models(args.nobs).items():
+        params = np.asarray(mod.start_params)
+        workspace = FilterWorkspace(mod)
+
+        def base():
+            return mod.loglike(params)
+
+        def reuse():
+            return workspace.loglike(params)
+
+        times = [run_time(func, args.number) * 1e6 for func in (base, reuse)]
+        memory = [peak_memory(func) for func in (base, reuse)]
+        print(f"{name:<24}{times[0]:8.1f}us{times[1]:9.1f}us"
+              f"{memory[0]:11d}B{memory[1]:10d}B")
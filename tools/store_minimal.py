@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Benchmark the memory of results estimated with store="minimal"
+
+For OLS, WLS and a Poisson GLM, fits the model with store="full" and with
+store="minimal", drops the model and reports the memory that the results
+keep alive, measured with tracemalloc, the size of the pickled results and
+the time of the fit. The exog array is shared by the models and not
+included in the retained memory.
+
+usage
+
+python tools/store_minimal.py [--sizes 10000 100000 1000000] [--k-vars 10]
+"""
+import argparse
+import gc
+import pickle
+import time
+import tracemalloc
+
+import numpy as np
+
+import statsmodels.api as sm
+
+
+def simulate(nobs, k_vars, seed=0):
+    rs = np.random.RandomState(seed)
+    exog = sm.add_constant(rs.standard_normal((nobs, k_vars)))
+    linpred = exog @ np.linspace(-0.1, 0.1, k_vars + 1)
+    weights = rs.uniform(0.5, 2, nobs)
+    return exog, linpred, weights, rs
+
+
+def make_models(nobs, k_vars):
+    exog, linpred, weights, rs = simulate(nobs, k_vars)
+    return {
+        "OLS": lambda: sm.OLS(linpred + rs.standard_normal(nobs), exog),
+        "WLS": lambda: sm.WLS(linpred + rs.standard_normal(nobs), exog,
+                              weights=weights),
+        "GLM Poisson": lambda: sm.GLM(rs.poisson(np.exp(linpred)), exog,
+                                      family=sm.families.Poisson()),
+    }
+
+
+def fit(make_model, store):
+    res = make_model().fit(store=store)
+    # compute the summary statistics a user would look at
+    for attr in ["bse", "llf"]:
+        getattr(res, attr)
+    return res
+
+
+def measure(make_model, store):
+    """retained memory in MB, pickle size in MB and fit time"""
+    # the first fit fills the import and docstring caches
+    fit(make_model, store)
+    start = time.perf_counter()
+    fit(make_model, store)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    res = fit(make_model, store)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    size = len(pickle.dumps(res))
+    return retained / 2**20, size / 2**20, elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="*",
+                        default=[10000, 100000, 1000000])
+    parser.add_argument("--k-vars", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'model':<12}{'nobs':>9}{'store':>9}{'retained':>12}"
+          f"{'pickle':>12}{'fit':>9}")
+    for nobs in args.sizes:
+        for name, make_model in make_models(nobs, args.k_vars).items():
+            for store in ["full", "minimal"]:
+                retained, size, elapsed = measure(make_model, store)
+                print(f"{name:<12}{nobs:>9}{store:>9}{retained:9.2f} MB"
+                      f"{size:9.2f} MB{elapsed:8.3f}s")